@@ -18,8 +18,6 @@ from hummingbot.client.config.config_helpers import (
 from hummingbot.client.config.security import Security
 from hummingbot.client.hummingbot_application import HummingbotApplication
 from hummingbot.client.settings import AllConnectorSettings
-from hummingbot.client.ui import login_prompt
-from hummingbot.client.ui.style import load_style
 from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.events import HummingbotUIEvent
 from hummingbot.core.utils import detect_available_port
@@ -89,6 +87,10 @@ def main():
         ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
         asyncio.set_event_loop(ev_loop)
 
+    # Imported here, so bin/hummingbot_quickstart.py does not load the TUI when it runs headless
+    from hummingbot.client.ui import login_prompt
+    from hummingbot.client.ui.style import load_style
+
     # We need to load a default style for the login screen because the password is required to load the
     # real configuration now that it can include secret parameters
     style = load_style(ClientConfigAdapter(ClientConfigMap()))
@@ -7,6 +7,7 @@ import logging
 import os
 import pwd
 import subprocess
+import sys
 from pathlib import Path
 from typing import Coroutine, List
 
@@ -32,11 +33,9 @@ from hummingbot.client.settings import (
     STRATEGIES_CONF_DIR_PATH,
     AllConnectorSettings,
 )
-from hummingbot.client.ui import login_prompt
-from hummingbot.client.ui.style import load_style
 from hummingbot.core.event.events import HummingbotUIEvent
-from hummingbot.core.management.console import start_management_console
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.import_profiler import PROFILE_IMPORTS_ARG, run_with_import_profile
 
 
 class CmdlineParser(argparse.ArgumentParser):
@@ -66,6 +65,10 @@ class CmdlineParser(argparse.ArgumentParser):
                           const=True,
                           default=None,
                           help="Run in headless mode without CLI interface.")
+        self.add_argument(PROFILE_IMPORTS_ARG,
+                          action="store_true",
+                          help="Run Hummingbot in a child process with import time profiling, and print the "
+                               "cumulative import time per module once it exits.")
 
 
 def autofix_permissions(user_group_spec: str):
@@ -259,6 +262,7 @@ async def run_application(hb: HummingbotApplication, args: argparse.Namespace, c
 
         tasks: List[Coroutine] = [hb.run()]
         if client_config_map.debug_console:
+            from hummingbot.core.management.console import start_management_console
             management_port: int = detect_available_port(8211)
             tasks.append(start_management_console(locals(), host="localhost", port=management_port))
 
@@ -268,6 +272,9 @@ async def run_application(hb: HummingbotApplication, args: argparse.Namespace, c
 def main():
     args = CmdlineParser().parse_args()
 
+    if args.profile_imports:
+        sys.exit(run_with_import_profile([__file__] + [arg for arg in sys.argv[1:] if arg != PROFILE_IMPORTS_ARG]))
+
     # Parse environment variables from Dockerfile.
     # If an environment variable is not empty and it's not defined in the arguments, then we'll use the environment
     # variable.
@@ -287,6 +294,9 @@ def main():
     secrets_manager_cls = ETHKeyFileSecretManger
     client_config_map = load_client_config_map_from_file()
     if args.config_password is None:
+        from hummingbot.client.ui import login_prompt
+        from hummingbot.client.ui.style import load_style
+
         secrets_manager = login_prompt(secrets_manager_cls, style=load_style(client_config_map))
         if not secrets_manager:
             return
@@ -3,7 +3,6 @@ from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
-from prompt_toolkit.utils import is_windows
 
 from hummingbot.client.command.gateway_command import GatewayCommand
 from hummingbot.client.config.config_helpers import (
@@ -17,8 +16,6 @@ from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.config.security import Security
 from hummingbot.client.config.strategy_config_data_types import BaseTradingStrategyConfigMap
 from hummingbot.client.settings import CLIENT_CONFIG_PATH, STRATEGIES_CONF_DIR_PATH
-from hummingbot.client.ui.interface_utils import format_df_for_printout
-from hummingbot.client.ui.style import load_style
 from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.utils import map_df_to_str
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -85,6 +82,7 @@ client_configs_to_display = ["autofill_import",
                              "market_data_collection_enabled",
                              "market_data_collection_interval",
                              "market_data_collection_depth",
+                             "market_data_collection_storage",
                              ]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
@@ -117,6 +115,7 @@ class ConfigCommand:
     def list_client_configs(
             self,  # type: HummingbotApplication
     ):
+        from hummingbot.client.ui.interface_utils import format_df_for_printout
         data = self.build_model_df_data(self.client_config_map, to_print=client_configs_to_display)
         df = map_df_to_str(pd.DataFrame(data=data, columns=columns))
         self.notify("\nGlobal Configurations:")
@@ -138,6 +137,7 @@ class ConfigCommand:
     def list_strategy_configs(
             self,  # type: HummingbotApplication
     ):
+        from hummingbot.client.ui.interface_utils import format_df_for_printout
         if self.strategy_name is not None:
             config_map = self.strategy_config_map
             data = self.build_df_data_from_config_map(config_map)
@@ -164,6 +164,8 @@ class ConfigCommand:
     def build_model_df_data(
             config_map: ClientConfigAdapter, to_print: Optional[List[str]] = None
     ) -> List[Tuple[str, Any]]:
+        from prompt_toolkit.utils import is_windows
+
         model_data = []
         for traversal_item in config_map.traverse():
             if to_print is not None and traversal_item.attr not in to_print:
@@ -227,6 +229,7 @@ class ConfigCommand:
         Configure a single variable only.
         Prompt the user to finish all configurations if there are remaining empty configs at the end.
         """
+        from hummingbot.client.ui.style import load_style
 
         self.placeholder_mode = True
         self.app.hide_input = True
@@ -285,6 +288,7 @@ class ConfigCommand:
             key: str,
             input_value: Any,
     ):  # pragma: no cover
+        from hummingbot.client.ui.style import load_style
         config_var, config_map, file_path = None, None, None
         if self.strategy_config_map is not None and key in self.strategy_config_map:
             config_map = self.strategy_config_map
@@ -6,7 +6,6 @@ import pandas as pd
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import AllConnectorSettings
-from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 from hummingbot.user.user_balances import UserBalances
@@ -64,6 +63,7 @@ class ConnectCommand:
 
     async def show_connections(self  # type: HummingbotApplication
                                ):
+        from hummingbot.client.ui.interface_utils import format_df_for_printout
         self.notify("\nTesting connections, please wait...")
         df, failed_msgs = await self.connection_df()
         lines = ["    " + line for line in format_df_for_printout(
@@ -29,7 +29,6 @@ from hummingbot.client.config.config_helpers import (
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.config.strategy_config_data_types import BaseStrategyConfigMap
 from hummingbot.client.settings import SCRIPT_STRATEGY_CONF_DIR_PATH, STRATEGIES_CONF_DIR_PATH, required_exchanges
-from hummingbot.client.ui.completer import load_completer
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.exceptions import InvalidController, InvalidScriptModule
 from hummingbot.strategy.strategy_v2_base import StrategyV2ConfigBase
@@ -67,6 +66,7 @@ class CreateCommand:
 
     async def prompt_for_controller_config(self,  # type: HummingbotApplication
                                            controller_name: str):
+        from hummingbot.client.ui.completer import load_completer
         try:
 
             # Attempt to find and load the correct module
@@ -111,6 +111,7 @@ class CreateCommand:
 
     async def prompt_for_configuration_v2(self,  # type: HummingbotApplication
                                           script_to_config: str):
+        from hummingbot.client.ui.completer import load_completer
         try:
             module = sys.modules.get(f"{settings.SCRIPT_STRATEGIES_MODULE}.{script_to_config}")
             script_module = importlib.reload(module)
@@ -165,6 +166,7 @@ class CreateCommand:
     async def prompt_for_configuration(
         self,  # type: HummingbotApplication
     ):
+        from hummingbot.client.ui.completer import load_completer
         strategy = await self.get_strategy_name()
 
         if self.app.to_stop_config:
@@ -371,6 +373,7 @@ class CreateCommand:
             config_map[key] = config_map_backup[key]
 
     def reset_application_state(self):
+        from hummingbot.client.ui.completer import load_completer
         self.app.change_prompt(prompt=">>> ")
         self.app.input_field.completer = load_completer(self)
         self.placeholder_mode = False
@@ -1,8 +1,6 @@
 import os
 from typing import TYPE_CHECKING, List
 
-import pandas as pd
-
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import DEFAULT_LOG_FILE_PATH
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -62,11 +60,13 @@ class ExportCommand:
 
     async def export_trades(self,  # type: HummingbotApplication
                             ):
+        start_timestamp = int(self.init_time * 1e3)
         with self.trading_core.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(self.init_time * 1e3),
-                session=session)
-            if len(trades) == 0:
+            last_trades: List[TradeFill] = self._get_trades_from_session(
+                start_timestamp,
+                session=session,
+                number_of_rows=1)
+            if len(last_trades) == 0:
                 self.notify("No past trades to export.")
                 return
             self.placeholder_mode = True
@@ -79,8 +79,11 @@ class ExportCommand:
                 return
             file_path = os.path.join(path, file_name)
             try:
-                df: pd.DataFrame = TradeFill.to_pandas(trades)
-                df.to_csv(file_path, header=True)
+                # The trades are written by chunks, newest first, so long sessions are not loaded in memory at once
+                chunks = TradeFill.iter_pandas_chunks(session, TradeFill.filters(start_time=start_timestamp),
+                                                      descending=True)
+                for i, df in enumerate(chunks):
+                    df.to_csv(file_path, header=i == 0, mode="w" if i == 0 else "a")
                 self.notify(f"Successfully exported trades to {file_path}")
             except Exception as e:
                 self.notify(f"Error exporting trades to {path}: {e}")
@@ -14,7 +14,6 @@ from hummingbot.client.config.config_helpers import get_connector_class  # noqa:
 from hummingbot.client.config.security import Security
 from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.client.settings import AllConnectorSettings, gateway_connector_trading_pairs  # noqa: F401
-from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.gateway import get_gateway_paths
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient, GatewayStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -585,6 +584,7 @@ Use 'gateway <command> --help' for more information about a command.""")
     async def _gateway_list(
         self           # type: HummingbotApplication
     ):
+        from hummingbot.client.ui.interface_utils import format_df_for_printout
         connector_list: List[Dict[str, Any]] = await self._get_gateway_instance().get_connectors()
         connectors_tiers: List[Dict[str, Any]] = []
 
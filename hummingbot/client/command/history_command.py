@@ -3,13 +3,12 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, List, Optional
 
 import pandas as pd
 
 from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
-from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.model.trade_fill import TradeFill
 
@@ -40,49 +39,48 @@ class HistoryCommand:
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
         with self.trading_core.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
+            last_trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
                 session=session,
+                number_of_rows=1,
                 config_file_path=self.strategy_file_name)
-            if not trades:
-                self.notify("\n  No past trades to report.")
-                return
-            if verbose:
-                self.list_trades(start_time)
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+        if not last_trades:
+            self.notify("\n  No past trades to report.")
+            return
+        if verbose:
+            self.list_trades(start_time)
+        safe_ensure_future(self.history_report(start_time, precision))
 
     def get_history_trades_json(self,  # type: HummingbotApplication
                                 days: float = 0):
         if self.strategy_file_name is None:
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        filters = [TradeFill.timestamp >= int(start_time * 1e3),
+                   TradeFill.config_file_path.like(f"%{self.strategy_file_name}%")]
+        columns = ["market", "exchange_trade_id", "price", "amount", "symbol", "timestamp", "trade_type",
+                   "base_asset", "quote_asset", "trade_fee"]
         with self.trading_core.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            return list([TradeFill.to_bounty_api_json(t) for t in trades])
+            return [TradeFill.to_bounty_api_json(t)
+                    for chunk in TradeFill.iter_trade_chunks(session, filters, columns, descending=True)
+                    for t in chunk]
 
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
-                             trades: List[TradeFill],
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        try:
+            performance_metrics = await self.trading_core.performance_metrics_since(start_time,
+                                                                                    self.strategy_file_name)
+        except asyncio.TimeoutError:
+            self.notify(
+                "\nA network error prevented the balances retrieval to complete. See logs for more details."
+            )
+            raise
         if display_report:
             self.report_header(start_time)
         return_pcts = []
-        for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
-            network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
-            try:
-                cur_balances = await asyncio.wait_for(self.trading_core.get_current_balances(market), network_timeout)
-            except asyncio.TimeoutError:
-                self.notify(
-                    "\nA network error prevented the balances retrieval to complete. See logs for more details."
-                )
-                raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+        for (market, symbol), perf in performance_metrics.items():
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -177,6 +175,7 @@ class HistoryCommand:
 
     def list_trades(self,  # type: HummingbotApplication
                     start_time: float):
+        from hummingbot.client.ui.interface_utils import format_df_for_printout
         if threading.current_thread() != threading.main_thread():
             self.ev_loop.call_soon_threadsafe(self.list_trades, start_time)
             return
@@ -4,7 +4,6 @@ import time
 from typing import TYPE_CHECKING
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from hummingbot.remote_iface.mqtt import MQTTGateway
 
 if TYPE_CHECKING:
     from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
@@ -46,6 +45,7 @@ class MQTTCommand:
     async def start_mqtt_async(self,  # type: HummingbotApplication
                                timeout: float = 30.0
                                ):
+        from hummingbot.remote_iface.mqtt import MQTTGateway
         if self._mqtt is None:
             while True:
                 try:
@@ -2,7 +2,6 @@ from typing import TYPE_CHECKING
 
 import pandas as pd
 
-from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
 if TYPE_CHECKING:
@@ -47,10 +46,10 @@ class OrderBookCommand:
             trading_pair, order_book = next(iter(market_connector.order_books.items()))
 
         def get_order_book(lines):
-            bids = order_book.snapshot[0][['price', 'amount']].head(lines)
-            bids.rename(columns={'price': 'bid_price', 'amount': 'bid_volume'}, inplace=True)
-            asks = order_book.snapshot[1][['price', 'amount']].head(lines)
-            asks.rename(columns={'price': 'ask_price', 'amount': 'ask_volume'}, inplace=True)
+            from hummingbot.client.ui.interface_utils import format_df_for_printout
+            bids_array, asks_array = order_book.to_numpy(depth=lines)
+            bids = pd.DataFrame(data=bids_array[:, :2], columns=['bid_price', 'bid_volume'])
+            asks = pd.DataFrame(data=asks_array[:, :2], columns=['ask_price', 'ask_volume'])
             joined_df = pd.concat([bids, asks], axis=1)
             text_lines = [
                 "    " + line
@@ -3,7 +3,6 @@ from typing import TYPE_CHECKING
 
 import pandas as pd
 
-from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
@@ -45,6 +44,7 @@ class TickerCommand:
             trading_pair, order_book = next(iter(market_connector.order_books.items()))
 
         def get_ticker():
+            from hummingbot.client.ui.interface_utils import format_df_for_printout
             columns = ["Best Bid", "Best Ask", "Mid Price", "Last Trade"]
             data = [[
                 float(market_connector.get_price_by_type(trading_pair, PriceType.BestBid)),
@@ -89,6 +89,9 @@ class MQTTBridgeConfigMap(BaseClientModel):
     model_config = ConfigDict(title="mqtt_bridge")
 
 
+MARKET_DATA_COLLECTION_STORAGES = ["sql", "chunks"]
+
+
 class MarketDataCollectionConfigMap(BaseClientModel):
     market_data_collection_enabled: bool = Field(
         default=False,
@@ -104,8 +107,26 @@ class MarketDataCollectionConfigMap(BaseClientModel):
         ge=2,
         json_schema_extra={"prompt": lambda cm: "Set the order book collection depth (Default=20)"},
     )
+    market_data_collection_storage: str = Field(
+        default="sql",
+        description="Where the market data is stored, sql for MarketData rows in the trades database, chunks for "
+                    "compressed columnar files under data/market_data.",
+        json_schema_extra={"prompt": lambda cm: (
+            f"Where to store the market data? ({'/'.join(MARKET_DATA_COLLECTION_STORAGES)})"
+        )},
+    )
     model_config = ConfigDict(title="market_data_collection")
 
+    @field_validator("market_data_collection_storage", mode="before")
+    @classmethod
+    def validate_market_data_collection_storage(cls, v: str):
+        """Used for client-friendly error output."""
+        if v not in MARKET_DATA_COLLECTION_STORAGES:
+            raise ValueError(
+                f"Invalid market data storage, please choose a value from {MARKET_DATA_COLLECTION_STORAGES}."
+            )
+        return v
+
 
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
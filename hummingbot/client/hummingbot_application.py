@@ -2,7 +2,7 @@ import asyncio
 import logging
 import time
 from collections import deque
-from typing import Deque, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional, Union
 
 from sqlalchemy.orm import Session
 
@@ -18,12 +18,6 @@ from hummingbot.client.config.config_helpers import (
 from hummingbot.client.config.gateway_ssl_config_map import SSLConfigMap
 from hummingbot.client.config.strategy_config_data_types import BaseStrategyConfigMap
 from hummingbot.client.settings import CLIENT_CONFIG_PATH
-from hummingbot.client.tab import __all__ as tab_classes
-from hummingbot.client.tab.data_types import CommandTab
-from hummingbot.client.ui.completer import load_completer
-from hummingbot.client.ui.hummingbot_cli import HummingbotCLI
-from hummingbot.client.ui.keybindings import load_key_bindings
-from hummingbot.client.ui.parser import ThrowingArgumentParser, load_parser
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.trading_core import TradingCore
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
@@ -31,7 +25,12 @@ from hummingbot.exceptions import ArgumentParserError
 from hummingbot.logger import HummingbotLogger
 from hummingbot.logger.application_warning import ApplicationWarning
 from hummingbot.model.trade_fill import TradeFill
-from hummingbot.remote_iface.mqtt import MQTTGateway
+
+if TYPE_CHECKING:
+    # The TUI and the MQTT bridge are only imported once used, so a headless start never loads prompt_toolkit
+    from hummingbot.client.tab.data_types import CommandTab
+    from hummingbot.client.ui.parser import ThrowingArgumentParser
+    from hummingbot.remote_iface.mqtt import MQTTGateway
 
 s_logger = None
 
@@ -74,7 +73,7 @@ class HummingbotApplication(*commands):
         self._app_warnings: Deque[ApplicationWarning] = deque()
 
         # MQTT management
-        self._mqtt: Optional[MQTTGateway] = None
+        self._mqtt: Optional["MQTTGateway"] = None
 
         # Script configuration support
         self.script_config: Optional[str] = None
@@ -94,8 +93,13 @@ class HummingbotApplication(*commands):
 
     def _init_ui_components(self):
         """Initialize UI components (CLI, parser, etc.) for non-headless mode."""
+        from hummingbot.client.ui.completer import load_completer
+        from hummingbot.client.ui.hummingbot_cli import HummingbotCLI
+        from hummingbot.client.ui.keybindings import load_key_bindings
+        from hummingbot.client.ui.parser import load_parser
+
         command_tabs = self.init_command_tabs()
-        self.parser: ThrowingArgumentParser = load_parser(self, command_tabs)
+        self.parser: "ThrowingArgumentParser" = load_parser(self, command_tabs)
         self.app = HummingbotCLI(
             self.client_config_map,
             input_handler=self._handle_command,
@@ -261,11 +265,14 @@ class HummingbotApplication(*commands):
         for notifier in self.trading_core.notifiers:
             notifier.start()
 
-    def init_command_tabs(self) -> Dict[str, CommandTab]:
+    def init_command_tabs(self) -> Dict[str, "CommandTab"]:
         """
         Initiates and returns a CommandTab dictionary with mostly defaults and None values, These values will be
         populated later on by HummingbotCLI
         """
+        from hummingbot.client.tab import __all__ as tab_classes
+        from hummingbot.client.tab.data_types import CommandTab
+
         command_tabs: Dict[str, CommandTab] = {}
         for tab_class in tab_classes:
             name = tab_class.get_command_name()
@@ -1,15 +1,20 @@
+import hashlib
 import importlib
+import importlib.util
+import json
+import os
+import tempfile
 from decimal import Decimal
 from enum import Enum
 from os import DirEntry, scandir
 from os.path import exists, join
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from pydantic import SecretStr
 
 from hummingbot import get_strategy_list, root_path
 from hummingbot.connector.gateway.common_types import ConnectorType as GatewayConnectorType, get_connector_type
-from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
 
 if TYPE_CHECKING:
     from hummingbot.client.config.client_config_map import GatewayConfigMap
@@ -54,6 +59,10 @@ GATEAWAY_CLIENT_KEY_PATH = DEFAULT_GATEWAY_CERTS_PATH / "client_key.pem"
 
 CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES = ["test_support", "utilities", "gateway"]
 
+# Generated on the first start after the connector sources change, see AllConnectorSettings.create_connector_settings
+CONNECTOR_MANIFEST_PATH = root_path() / "hummingbot" / "connector" / "connector_manifest.json"
+CONNECTOR_MANIFEST_VERSION = 1
+
 
 class ConnectorType(Enum):
     """
@@ -234,6 +243,30 @@ class ConnectorSetting(NamedTuple):
         return self.type.name.lower()
 
 
+class ConnectorConfigKeysLocation(NamedTuple):
+    utils_module: str
+    domain: Optional[str]
+
+
+class LazyConnectorSetting(ConnectorSetting):
+    """
+    ConnectorSetting loaded from the connector manifest. Its config_keys field holds the location of the config keys,
+    which are only imported from the connector utils module when they are first read.
+    """
+    __slots__ = ()
+
+    @property
+    def config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        location: ConnectorConfigKeysLocation = tuple.__getitem__(self, _CONFIG_KEYS_INDEX)
+        util_module = importlib.import_module(location.utils_module)
+        if location.domain is None:
+            return getattr(util_module, "KEYS", None)
+        return getattr(util_module, "OTHER_DOMAINS_KEYS")[location.domain]
+
+
+_CONFIG_KEYS_INDEX = ConnectorSetting._fields.index("config_keys")
+
+
 class AllConnectorSettings:
     paper_trade_connectors_names: List[str] = []
     all_connector_settings: Dict[str, ConnectorSetting] = {}
@@ -241,75 +274,189 @@ class AllConnectorSettings:
     @classmethod
     def create_connector_settings(cls):
         """
-        Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+        Creates the dictionary of connector names to ConnectorSetting from the connector manifest, without importing
+        any connector code. Each connector utils module is only imported when its config keys are first read.
+
+        When the manifest is missing, or was generated from different connector sources, it is rebuilt by importing
+        the utils module of every connector.
         """
         cls.all_connector_settings = {}  # reset
+        fingerprint = cls._connector_sources_fingerprint()
+        manifest = cls._read_connector_manifest(fingerprint)
+        if manifest is None:
+            manifest = cls._build_connector_manifest(fingerprint)
+            cls._write_connector_manifest(manifest)
+        for entry in manifest["connectors"]:
+            cls.all_connector_settings[entry["name"]] = cls._connector_setting_from_manifest_entry(entry)
+
+        # add gateway connectors dynamically from Gateway API
+        # Gateway connectors are now configured in Gateway, not in Hummingbot
+        # Gateway connectors will be added by GatewayHttpClient when it connects to Gateway
+
+        return cls.all_connector_settings
+
+    @staticmethod
+    def _connector_dirs() -> Iterator[Tuple[str, DirEntry]]:
+        """
+        Yields the (type directory name, connector directory) of every connector package.
+        """
         connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
 
-        type_dirs: List[DirEntry] = [
+        type_dirs: List[DirEntry] = sorted([
             cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
             if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
-        ]
+        ], key=lambda f: f.name)
         for type_dir in type_dirs:
             if type_dir.name == 'gateway':
                 continue
-            connector_dirs: List[DirEntry] = [
+            connector_dirs: List[DirEntry] = sorted([
                 cast(DirEntry, f) for f in scandir(type_dir.path)
                 if f.is_dir() and exists(join(f.path, "__init__.py"))
-            ]
+            ], key=lambda f: f.name)
             for connector_dir in connector_dirs:
                 if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
                     continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
+                yield type_dir.name, connector_dir
 
-        # add gateway connectors dynamically from Gateway API
-        # Gateway connectors are now configured in Gateway, not in Hummingbot
-        # Gateway connectors will be added by GatewayHttpClient when it connects to Gateway
+    @classmethod
+    def _connector_sources_fingerprint(cls) -> str:
+        """
+        Hash of the name, size and modification time of the Python files of every connector package. It only stats
+        the files, so it is cheap enough to check on every start.
+        """
+        fingerprint = hashlib.sha256()
+        for type_dir_name, connector_dir in cls._connector_dirs():
+            for source in sorted(f.name for f in scandir(connector_dir.path) if f.name.endswith(".py")):
+                stat = os.stat(join(connector_dir.path, source))
+                fingerprint.update(f"{type_dir_name}/{connector_dir.name}/{source}:{stat.st_size}:"
+                                   f"{stat.st_mtime_ns};".encode())
+        return fingerprint.hexdigest()
 
-        return cls.all_connector_settings
+    @staticmethod
+    def _read_connector_manifest(fingerprint: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the connector manifest if it is up to date, or None if it has to be rebuilt.
+        """
+        try:
+            with open(CONNECTOR_MANIFEST_PATH) as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            return None
+        if manifest.get("version") != CONNECTOR_MANIFEST_VERSION or manifest.get("fingerprint") != fingerprint:
+            return None
+        # Connectors skipped for a missing dependency are included again once it is installed.
+        for missing_module in manifest["missing_dependencies"]:
+            try:
+                if importlib.util.find_spec(missing_module) is not None:
+                    return None
+            except (ImportError, ValueError):
+                continue
+        return manifest
+
+    @staticmethod
+    def _write_connector_manifest(manifest: Dict[str, Any]):
+        try:
+            with tempfile.NamedTemporaryFile("w", dir=CONNECTOR_MANIFEST_PATH.parent, suffix=".tmp",
+                                             delete=False) as manifest_file:
+                json.dump(manifest, manifest_file, indent=1)
+            # Atomic, so concurrent starts never read a partially written manifest
+            os.replace(manifest_file.name, CONNECTOR_MANIFEST_PATH)
+        except OSError:
+            # A read only installation keeps working, it just rebuilds the manifest on every start.
+            pass
+
+    @classmethod
+    def _build_connector_manifest(cls, fingerprint: str) -> Dict[str, Any]:
+        """
+        Imports the utils module of every connector to collect its settings.
+        """
+        entries: Dict[str, Dict[str, Any]] = {}
+        missing_dependencies: Set[str] = set()
+        for type_dir_name, connector_dir in cls._connector_dirs():
+            if connector_dir.name in entries:
+                raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
+            util_module_path: str = f"hummingbot.connector.{type_dir_name}." \
+                                    f"{connector_dir.name}.{connector_dir.name}_utils"
+            try:
+                util_module = importlib.import_module(util_module_path)
+            except ModuleNotFoundError as e:
+                if e.name is not None and not e.name.startswith(util_module_path.rsplit(".", 1)[0]):
+                    missing_dependencies.add(e.name)
+                continue
+            trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+            trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
+                connector_dir.name, trade_fee_settings
+            )
+            parent = entries[connector_dir.name] = {
+                "name": connector_dir.name,
+                "type": ConnectorType[type_dir_name.capitalize()].name,
+                "centralised": getattr(util_module, "CENTRALIZED", True),
+                "example_pair": getattr(util_module, "EXAMPLE_PAIR", ""),
+                "use_ethereum_wallet": getattr(util_module, "USE_ETHEREUM_WALLET", False),
+                "trade_fee_schema": cls._trade_fee_schema_to_json(trade_fee_schema),
+                "config_keys_module": util_module_path,
+                "config_keys_domain": None,
+                "is_sub_domain": False,
+                "parent_name": None,
+                "domain_parameter": None,
+                "use_eth_gas_lookup": getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            }
+            # Adds other domains of connector
+            other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+            for domain in other_domains:
+                trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+                trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
+                entries[domain] = {
+                    **parent,
+                    "name": domain,
+                    "example_pair": getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                    "trade_fee_schema": cls._trade_fee_schema_to_json(trade_fee_schema),
+                    "config_keys_domain": domain,
+                    "is_sub_domain": True,
+                    "parent_name": parent["name"],
+                    "domain_parameter": getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                }
+        return {
+            "version": CONNECTOR_MANIFEST_VERSION,
+            "fingerprint": fingerprint,
+            "connectors": list(entries.values()),
+            "missing_dependencies": sorted(missing_dependencies),
+        }
+
+    @staticmethod
+    def _connector_setting_from_manifest_entry(entry: Dict[str, Any]) -> LazyConnectorSetting:
+        fee_schema = entry["trade_fee_schema"]
+        return LazyConnectorSetting(
+            name=entry["name"],
+            type=ConnectorType[entry["type"]],
+            centralised=entry["centralised"],
+            example_pair=entry["example_pair"],
+            use_ethereum_wallet=entry["use_ethereum_wallet"],
+            trade_fee_schema=TradeFeeSchema(
+                percent_fee_token=fee_schema["percent_fee_token"],
+                maker_percent_fee_decimal=Decimal(fee_schema["maker_percent_fee_decimal"]),
+                taker_percent_fee_decimal=Decimal(fee_schema["taker_percent_fee_decimal"]),
+                buy_percent_fee_deducted_from_returns=fee_schema["buy_percent_fee_deducted_from_returns"],
+                maker_fixed_fees=[TokenAmount.from_json(fee) for fee in fee_schema["maker_fixed_fees"]],
+                taker_fixed_fees=[TokenAmount.from_json(fee) for fee in fee_schema["taker_fixed_fees"]],
+            ),
+            config_keys=ConnectorConfigKeysLocation(entry["config_keys_module"], entry["config_keys_domain"]),
+            is_sub_domain=entry["is_sub_domain"],
+            parent_name=entry["parent_name"],
+            domain_parameter=entry["domain_parameter"],
+            use_eth_gas_lookup=entry["use_eth_gas_lookup"],
+        )
+
+    @staticmethod
+    def _trade_fee_schema_to_json(trade_fee_schema: TradeFeeSchema) -> Dict[str, Any]:
+        return {
+            "percent_fee_token": trade_fee_schema.percent_fee_token,
+            "maker_percent_fee_decimal": str(trade_fee_schema.maker_percent_fee_decimal),
+            "taker_percent_fee_decimal": str(trade_fee_schema.taker_percent_fee_decimal),
+            "buy_percent_fee_deducted_from_returns": trade_fee_schema.buy_percent_fee_deducted_from_returns,
+            "maker_fixed_fees": [fee.to_json() for fee in trade_fee_schema.maker_fixed_fees],
+            "taker_fixed_fees": [fee.to_json() for fee in trade_fee_schema.taker_fixed_fees],
+        }
 
     @classmethod
     def initialize_paper_trade_settings(cls, paper_trade_exchanges: List[str]):
@@ -317,18 +464,12 @@ class AllConnectorSettings:
         for e in paper_trade_exchanges:
             base_connector_settings: Optional[ConnectorSetting] = cls.all_connector_settings.get(e, None)
             if base_connector_settings:
-                paper_trade_settings = ConnectorSetting(
+                # _replace keeps the class, and the config keys location of settings loaded from the manifest
+                paper_trade_settings = base_connector_settings._replace(
                     name=f"{e}_paper_trade",
-                    type=base_connector_settings.type,
-                    centralised=base_connector_settings.centralised,
-                    example_pair=base_connector_settings.example_pair,
-                    use_ethereum_wallet=base_connector_settings.use_ethereum_wallet,
-                    trade_fee_schema=base_connector_settings.trade_fee_schema,
-                    config_keys=base_connector_settings.config_keys,
                     is_sub_domain=False,
                     parent_name=base_connector_settings.name,
                     domain_parameter=None,
-                    use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
                 )
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
 
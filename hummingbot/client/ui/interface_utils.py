@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import Any, List, Optional, Set, Tuple
+from typing import Any, Optional
 
 import pandas as pd
 import psutil
@@ -8,7 +8,6 @@ import tabulate
 
 from hummingbot.client.config.config_data_types import ClientConfigEnum
 from hummingbot.client.performance import PerformanceMetrics
-from hummingbot.model.trade_fill import TradeFill
 
 s_decimal_0 = Decimal("0")
 
@@ -64,29 +63,20 @@ async def start_trade_monitor(trade_monitor):
         try:
             if hb.trading_core._strategy_running and hb.trading_core.strategy is not None:
                 if all(market.ready for market in hb.trading_core.markets.values()):
-                    with hb.trading_core.trade_fill_db.get_new_session() as session:
-                        trades: List[TradeFill] = hb._get_trades_from_session(
-                            int(hb.init_time * 1e3),
-                            session=session,
-                            config_file_path=hb.strategy_file_name)
-                        if len(trades) > 0:
-                            return_pcts = []
-                            pnls = []
-                            market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
-                            for market, symbol in market_info:
-                                cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
-                                cur_balances = await hb.trading_core.get_current_balances(market)
-                                perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
-                                return_pcts.append(perf.return_pct)
-                                pnls.append(perf.total_pnl)
-                            avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
-                            quote_assets = set(t.symbol.split("-")[1] for t in trades)
-                            if len(quote_assets) == 1:
-                                total_pnls = f"{PerformanceMetrics.smart_round(sum(pnls))} {list(quote_assets)[0]}"
-                            else:
-                                total_pnls = "N/A"
-                            trade_monitor.log(f"Trades: {len(trades)}, Total P&L: {total_pnls}, "
-                                              f"Return %: {avg_return:.2%}")
+                    performance_metrics = await hb.trading_core.performance_metrics_since(hb.init_time,
+                                                                                          hb.strategy_file_name)
+                    if len(performance_metrics) > 0:
+                        return_pcts = [perf.return_pct for perf in performance_metrics.values()]
+                        pnls = [perf.total_pnl for perf in performance_metrics.values()]
+                        num_trades = sum(perf.num_trades for perf in performance_metrics.values())
+                        avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
+                        quote_assets = set(symbol.split("-")[1] for _, symbol in performance_metrics)
+                        if len(quote_assets) == 1:
+                            total_pnls = f"{PerformanceMetrics.smart_round(sum(pnls))} {list(quote_assets)[0]}"
+                        else:
+                            total_pnls = "N/A"
+                        trade_monitor.log(f"Trades: {num_trades}, Total P&L: {total_pnls}, "
+                                          f"Return %: {avg_return:.2%}")
             await _sleep(2.0)  # sleeping for longer to manage resources
         except asyncio.CancelledError:
             raise
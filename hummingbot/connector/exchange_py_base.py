@@ -16,6 +16,7 @@ from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.request_priority import RequestPriority, request_priority
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
@@ -467,15 +468,16 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
-        exchange_order_id, update_timestamp = await self._place_order(
-            order_id=order.client_order_id,
-            trading_pair=order.trading_pair,
-            amount=order.amount,
-            trade_type=order.trade_type,
-            order_type=order.order_type,
-            price=order.price,
-            **kwargs,
-        )
+        with request_priority(RequestPriority.CREATE):
+            exchange_order_id, update_timestamp = await self._place_order(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+                **kwargs,
+            )
 
         order_update: OrderUpdate = OrderUpdate(
             client_order_id=order.client_order_id,
@@ -545,7 +547,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         return None
 
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
-        cancelled = await self._place_cancel(order.client_order_id, order)
+        with request_priority(RequestPriority.CANCEL):
+            cancelled = await self._place_cancel(order.client_order_id, order)
         if cancelled:
             update_timestamp = self.current_timestamp
             if update_timestamp is None or math.isnan(update_timestamp):
@@ -760,7 +763,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_rules())
+                with request_priority(RequestPriority.BACKGROUND):
+                    await safe_gather(self._update_trading_rules())
                 await self._sleep(self.TRADING_RULES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -780,7 +784,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_fees())
+                with request_priority(RequestPriority.BACKGROUND):
+                    await safe_gather(self._update_trading_fees())
                 await self._sleep(self.TRADING_FEES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -805,10 +810,11 @@ class ExchangePyBase(ExchangeBase, ABC):
         while True:
             try:
                 await self._poll_notifier.wait()
-                await self._update_time_synchronizer()
+                with request_priority(RequestPriority.POLLING):
+                    await self._update_time_synchronizer()
 
-                # the following method is implementation-specific
-                await self._status_polling_loop_fetch_updates()
+                    # the following method is implementation-specific
+                    await self._status_polling_loop_fetch_updates()
 
                 self._last_poll_timestamp = self.current_timestamp
                 self._poll_notifier = asyncio.Event()
@@ -847,7 +853,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         while True:
             try:
                 await self._cancel_lost_orders()
-                await self._update_lost_orders_status()
+                with request_priority(RequestPriority.BACKGROUND):
+                    await self._update_lost_orders_status()
                 await self._sleep(self.SHORT_POLL_INTERVAL)
             except NotImplementedError:
                 raise
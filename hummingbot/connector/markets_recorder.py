@@ -1,4 +1,5 @@
 import asyncio
+import itertools
 import json
 import logging
 import os.path
@@ -6,9 +7,10 @@ import threading
 import time
 from decimal import Decimal
 from shutil import move
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import pandas as pd
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
@@ -37,13 +39,16 @@ from hummingbot.model.controllers import Controllers
 from hummingbot.model.executors import Executors
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_data_chunk_store import MarketDataChunkWriter, MarketDataSnapshot
 from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.position import Position
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
-from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.sql_write_queue import SQLWriteQueue, SQLWriteQueueMetrics
+from hummingbot.model.trade_fill import DEFAULT_CHUNK_SIZE, TradeFill
+from hummingbot.model.trade_performance import TradePerformance
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
@@ -51,6 +56,7 @@ from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 class MarketsRecorder:
     _logger = None
     _shared_instance: "MarketsRecorder" = None
+    FLUSH_WRITES_TIMEOUT: float = 5.0
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
@@ -73,7 +79,18 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 write_behind: bool = False,
+                 write_batch_size: Optional[int] = None,
+                 write_batch_latency: Optional[float] = None,
+                 market_data_directory: Optional[str] = None):
+        """
+        :param write_behind: If True, the event records are written by a background thread in batched transactions
+            instead of on the event loop, see SQLWriteQueue
+        :param write_batch_size: Maximum number of event records written in one transaction
+        :param write_batch_latency: Maximum time in seconds an event record waits before it is written
+        :param market_data_directory: Directory of the market data chunk files, data/market_data by default
+        """
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -84,12 +101,19 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._market_data_directory: Optional[str] = market_data_directory
+        self._market_data_writer: Optional[MarketDataChunkWriter] = None
+        self._write_queue: Optional[SQLWriteQueue] = (
+            SQLWriteQueue(sql, max_batch_size=write_batch_size, max_batch_latency=write_batch_latency)
+            if write_behind else None
+        )
+        # Sequence number of the last market states captured per (config file, market), only that write saves them
+        self._market_states_sequence: Iterator[int] = itertools.count()
+        self._latest_market_states: Dict[Tuple[str, str], int] = {}
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
+        trade_fill_details = self._recent_trade_fill_details(self._config_file_path, 2000) if self._markets else []
         for market in self._markets:
-            trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
-            market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(tf.market,
-                                                                               tf.exchange_trade_id,
-                                                                               tf.symbol) for tf in trade_fills})
+            market.add_trade_fills_from_market_recorder(set(trade_fill_details))
 
             exchange_order_ids = self.get_orders_for_config_and_market(self._config_file_path, market, True, 2000)
             market.add_exchange_order_ids_from_market_recorder({o.exchange_order_id: o.id for o in exchange_order_ids})
@@ -119,34 +143,22 @@ class MarketsRecorder:
         MarketsRecorder._shared_instance = self
 
     def _start_market_data_recording(self):
+        if self._market_data_collection_config.market_data_collection_storage == "chunks":
+            self._market_data_writer = MarketDataChunkWriter(
+                self._market_data_directory or os.path.join(data_path(), "market_data"),
+                depth=self._market_data_collection_config.market_data_collection_depth,
+            )
+            self._market_data_writer.start()
         self._market_data_collection_task = self._ev_loop.create_task(self._record_market_data())
 
     async def _record_market_data(self):
         while True:
             try:
                 if all(ex.ready for ex in self._markets):
-                    with self._sql_manager.get_new_session() as session:
-                        with session.begin():
-                            for market in self._markets:
-                                exchange = market.display_name
-                                for trading_pair in market.trading_pairs:
-                                    mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
-                                    best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
-                                    best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
-                                    order_book = market.get_order_book(trading_pair)
-                                    depth = self._market_data_collection_config.market_data_collection_depth + 1
-                                    market_data = MarketData(
-                                        timestamp=self.db_timestamp,
-                                        exchange=exchange,
-                                        trading_pair=trading_pair,
-                                        mid_price=mid_price,
-                                        best_bid=best_bid,
-                                        best_ask=best_ask,
-                                        order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
-                                    )
-                                    session.add(market_data)
+                    if self._market_data_writer is not None:
+                        self._record_market_data_snapshots()
+                    else:
+                        self._record_market_data_rows()
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -154,6 +166,46 @@ class MarketsRecorder:
             finally:
                 await self._sleep(self._market_data_collection_config.market_data_collection_interval)
 
+    def _record_market_data_snapshots(self):
+        """
+        Hands the top of book and book levels of every market to the chunk writer, which compresses and writes them
+        from its own thread.
+        """
+        timestamp = self.db_timestamp / 1e3
+        depth = self._market_data_collection_config.market_data_collection_depth
+        for market in self._markets:
+            for trading_pair in market.trading_pairs:
+                bids, asks = market.get_order_book(trading_pair).to_numpy(depth=depth)
+                self._market_data_writer.put(MarketDataSnapshot(
+                    timestamp=timestamp,
+                    exchange=market.display_name,
+                    trading_pair=trading_pair,
+                    mid_price=float(market.get_price_by_type(trading_pair, PriceType.MidPrice)),
+                    best_bid=float(market.get_price_by_type(trading_pair, PriceType.BestBid)),
+                    best_ask=float(market.get_price_by_type(trading_pair, PriceType.BestAsk)),
+                    bids=bids,
+                    asks=asks,
+                ))
+
+    def _record_market_data_rows(self):
+        depth = self._market_data_collection_config.market_data_collection_depth + 1
+        market_data_rows = []
+        for market in self._markets:
+            for trading_pair in market.trading_pairs:
+                order_book = market.get_order_book(trading_pair)
+                market_data_rows.append(MarketData(
+                    timestamp=self.db_timestamp,
+                    exchange=market.display_name,
+                    trading_pair=trading_pair,
+                    mid_price=market.get_price_by_type(trading_pair, PriceType.MidPrice),
+                    best_bid=market.get_price_by_type(trading_pair, PriceType.BestBid),
+                    best_ask=market.get_price_by_type(trading_pair, PriceType.BestAsk),
+                    order_book={
+                        "bid": list(itertools.islice(order_book.bid_entries(), depth)),
+                        "ask": list(itertools.islice(order_book.ask_entries(), depth))}
+                ))
+        self._write(lambda session: session.add_all(market_data_rows))
+
     @property
     def sql_manager(self) -> SQLConnectionManager:
         return self._sql_manager
@@ -170,7 +222,41 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_queue_metrics(self) -> Optional[SQLWriteQueueMetrics]:
+        """Queue depth and flush latency of the background writer, None when writes are done on the event loop."""
+        return self._write_queue.metrics if self._write_queue is not None else None
+
+    def flush_writes(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until all the event records queued for the background writer are committed, or until the timeout
+        expires, so a slow database never blocks the event loop indefinitely.
+        :param timeout: Maximum time in seconds to wait, FLUSH_WRITES_TIMEOUT if None
+        :return: False if the timeout expired first
+        """
+        if self._write_queue is None or not self._write_queue.is_running:
+            return True
+        timeout = self.FLUSH_WRITES_TIMEOUT if timeout is None else timeout
+        flushed = self._write_queue.flush(timeout)
+        if not flushed:
+            self.logger().warning(f"The queued database writes were not committed within {timeout} seconds, the "
+                                  f"records read may not include them.")
+        return flushed
+
+    def _write(self, write: Callable[[Session], None]):
+        """
+        Runs a database write in its own transaction, or queues it for the background writer when it is enabled.
+        """
+        if self._write_queue is not None and self._write_queue.is_running:
+            self._write_queue.put(write)
+        else:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    write(session)
+
     def start(self):
+        if self._write_queue is not None:
+            self._write_queue.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
@@ -183,11 +269,9 @@ class MarketsRecorder:
             self._markets.append(market)
 
             # Add trade fills from recorder
-            trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
-            market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(tf.market,
-                                                                               tf.exchange_trade_id,
-                                                                               tf.symbol) for tf in trade_fills
-                                                         if tf.market == market.name})
+            trade_fill_details = self._recent_trade_fill_details(self._config_file_path, 2000)
+            market.add_trade_fills_from_market_recorder({details for details in trade_fill_details
+                                                         if details.market == market.name})
 
             # Add exchange order IDs
             exchange_order_ids = self.get_orders_for_config_and_market(self._config_file_path, market, True, 2000)
@@ -213,12 +297,19 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        if self._market_data_writer is not None:
+            # Writes the snapshots still buffered before returning.
+            self._market_data_writer.stop()
+        if self._write_queue is not None:
+            # Commits everything still queued before returning.
+            self._write_queue.stop()
 
     def store_or_update_executor(self, executor):
-        with self._sql_manager.get_new_session() as session:
-            existing_executor = session.query(Executors).filter(Executors.id == executor.config.id).one_or_none()
-            serialized_config = executor.executor_info.model_dump_json()
-            executor_dict = json.loads(serialized_config)
+        executor_id: str = executor.config.id
+        executor_dict: Dict[str, Any] = json.loads(executor.executor_info.model_dump_json())
+
+        def write(session: Session):
+            existing_executor = session.query(Executors).filter(Executors.id == executor_id).one_or_none()
             if existing_executor:
                 # Update existing executor
                 for attr, value in executor_dict.items():
@@ -227,15 +318,14 @@ class MarketsRecorder:
                 # Insert new executor
                 new_executor = Executors(**executor_dict)
                 session.add(new_executor)
-            session.commit()
+
+        self._write(write)
 
     def store_position(self, position: Position):
-        with self._sql_manager.get_new_session() as session:
-            session.add(position)
-            session.commit()
+        self._write(lambda session: session.add(position))
 
     def update_or_store_position(self, position: Position):
-        with self._sql_manager.get_new_session() as session:
+        def write(session: Session):
             # Check if a position already exists for this controller, connector, trading pair, and side
             existing_position = session.query(Position).filter(
                 Position.controller_id == position.controller_id,
@@ -256,30 +346,31 @@ class MarketsRecorder:
                 # Insert new position
                 session.add(position)
 
-            session.commit()
+        self._write(write)
 
     def store_controller_config(self, controller_config: ControllerConfigBase):
-        with self._sql_manager.get_new_session() as session:
-            config = json.loads(controller_config.json())
-            base_columns = ["id", "timestamp", "type"]
-            controller = Controllers(id=config["id"],
-                                     timestamp=time.time(),
-                                     type=config["controller_type"],
-                                     config={k: v for k, v in config.items() if k not in base_columns})
-            session.add(controller)
-            session.commit()
+        config = json.loads(controller_config.json())
+        base_columns = ["id", "timestamp", "type"]
+        controller = Controllers(id=config["id"],
+                                 timestamp=time.time(),
+                                 type=config["controller_type"],
+                                 config={k: v for k, v in config.items() if k not in base_columns})
+        self._write(lambda session: session.add(controller))
 
     def get_executors_by_ids(self, executor_ids: List[str]):
+        self.flush_writes()
         with self._sql_manager.get_new_session() as session:
             executors = session.query(Executors).filter(Executors.id.in_(executor_ids)).all()
             return executors
 
     def get_executors_by_controller(self, controller_id: str = None) -> List[ExecutorInfo]:
+        self.flush_writes()
         with self._sql_manager.get_new_session() as session:
             executors = session.query(Executors).filter(Executors.controller_id == controller_id).all()
             return [executor.to_executor_info() for executor in executors]
 
     def get_all_executors(self) -> List[ExecutorInfo]:
+        self.flush_writes()
         with self._sql_manager.get_new_session() as session:
             executors = session.query(Executors).all()
             return [executor.to_executor_info() for executor in executors]
@@ -290,6 +381,7 @@ class MarketsRecorder:
         Returns the custom_info dict if found, None otherwise.
         Used to restore reward claim history when resuming a position after restart.
         """
+        self.flush_writes()
         with self._sql_manager.get_new_session() as session:
             executors = (
                 session.query(Executors)
@@ -310,16 +402,19 @@ class MarketsRecorder:
             return None
 
     def get_positions_by_ids(self, position_ids: List[str]) -> List[Position]:
+        self.flush_writes()
         with self._sql_manager.get_new_session() as session:
             positions = session.query(Position).filter(Position.id.in_(position_ids)).all()
             return positions
 
     def get_positions_by_controller(self, controller_id: str = None) -> List[Position]:
+        self.flush_writes()
         with self._sql_manager.get_new_session() as session:
             positions = session.query(Position).filter(Position.controller_id == controller_id).all()
             return positions
 
     def get_all_positions(self) -> List[Position]:
+        self.flush_writes()
         with self._sql_manager.get_new_session() as session:
             positions = session.query(Position).all()
             return positions
@@ -327,6 +422,7 @@ class MarketsRecorder:
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
+        self.flush_writes()
         with self._sql_manager.get_new_session() as session:
             filters = [Order.config_file_path == config_file_path,
                        Order.market == market.display_name]
@@ -342,6 +438,7 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        self.flush_writes()
         with self._sql_manager.get_new_session() as session:
             query: Query = (session
                             .query(TradeFill)
@@ -352,21 +449,79 @@ class MarketsRecorder:
             else:
                 return query.limit(number_of_rows).all()
 
+    def iter_trades_for_config(self,
+                               config_file_path: str,
+                               columns: Optional[Sequence[str]] = None,
+                               chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Row]]:
+        """
+        Streams the trades of a config in timestamp order, see TradeFill.iter_trade_chunks.
+        """
+        self.flush_writes()
+        with self._sql_manager.get_new_session() as session:
+            yield from TradeFill.iter_trade_chunks(session,
+                                                   [TradeFill.config_file_path == config_file_path],
+                                                   columns,
+                                                   chunk_size)
+
+    def _recent_trade_fill_details(self, config_file_path: str, number_of_rows: int) -> List[TradeFillOrderDetails]:
+        self.flush_writes()
+        with self._sql_manager.get_new_session() as session:
+            query: Query = (session
+                            .query(TradeFill.market, TradeFill.exchange_trade_id, TradeFill.symbol)
+                            .filter(TradeFill.config_file_path == config_file_path)
+                            .order_by(TradeFill.timestamp.desc())
+                            .limit(number_of_rows))
+            return [TradeFillOrderDetails(market, exchange_trade_id, symbol)
+                    for market, exchange_trade_id, symbol in query]
+
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
+        self._save_market_states(config_file_path, market.display_name, market.tracking_states, self.db_timestamp,
+                                 session=session)
+
+    def _save_market_states(self,
+                            config_file_path: str,
+                            market_name: str,
+                            saved_state: Dict[str, Any],
+                            timestamp: int,
+                            session: Session):
+        market_states: Optional[MarketState] = (session
+                                                .query(MarketState)
+                                                .filter(MarketState.config_file_path == config_file_path,
+                                                        MarketState.market == market_name)
+                                                .one_or_none())
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = saved_state
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=saved_state)
             session.add(market_states)
 
+    def _market_states_writer(self, market: ConnectorBase) -> Callable[[Session], None]:
+        """
+        Captures the market tracking states now, on the event loop, and returns the write that saves them. The write
+        is skipped when newer states of the market were captured since, so the events queued together save the states
+        of each market once.
+        """
+        config_file_path: str = self._config_file_path
+        market_name: str = market.display_name
+        saved_state: Dict[str, Any] = market.tracking_states
+        timestamp: int = self.db_timestamp
+        key: Tuple[str, str] = (config_file_path, market_name)
+        sequence: int = next(self._market_states_sequence)
+        self._latest_market_states[key] = sequence
+
+        def write(session: Session):
+            if self._latest_market_states.get(key) == sequence:
+                self._save_market_states(config_file_path, market_name, saved_state, timestamp, session=session)
+
+        return write
+
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
+        self.flush_writes()
         with self._sql_manager.get_new_session() as session:
             market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
 
@@ -395,63 +550,68 @@ class MarketsRecorder:
         base_asset, quote_asset = evt.trading_pair.split("-")
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
+        config_file_path: str = self._config_file_path
+        strategy_name: str = self._strategy_name
+        market_name: str = market.display_name
+        save_market_states = self._market_states_writer(market)
+
+        def write(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == evt.order_id).one_or_none()
+            event_price = Decimal(evt.price) if evt.price == evt.price else Decimal(0)
+
+            if order_record is None:
+                order_record = Order(id=evt.order_id,
+                                     config_file_path=config_file_path,
+                                     strategy=strategy_name,
+                                     market=market_name,
+                                     symbol=evt.trading_pair,
+                                     base_asset=base_asset,
+                                     quote_asset=quote_asset,
+                                     creation_timestamp=timestamp,
+                                     order_type=evt.type.name,
+                                     amount=Decimal(evt.amount),
+                                     leverage=evt.leverage if evt.leverage else 1,
+                                     price=event_price,
+                                     position=evt.position if evt.position else PositionAction.NIL.value,
+                                     last_status=event_type.name,
+                                     last_update_timestamp=timestamp,
+                                     exchange_order_id=evt.exchange_order_id)
+                session.add(order_record)
+            else:
+                # A create event can arrive after a placeholder or after a delayed exchange update.
+                # Treat it as an upsert and never insert a second Order row for the same order_id.
+                order_record.config_file_path = config_file_path
+                order_record.strategy = strategy_name
+                order_record.market = market_name
+                order_record.symbol = evt.trading_pair
+                order_record.base_asset = base_asset
+                order_record.quote_asset = quote_asset
+                order_record.creation_timestamp = min(order_record.creation_timestamp, timestamp)
+                order_record.order_type = evt.type.name
+                order_record.amount = Decimal(evt.amount)
+                order_record.leverage = evt.leverage if evt.leverage else 1
+                order_record.price = event_price
+                order_record.position = evt.position if evt.position else PositionAction.NIL.value
+                if evt.exchange_order_id is not None:
+                    order_record.exchange_order_id = evt.exchange_order_id
+                if order_record.last_update_timestamp < timestamp:
+                    order_record.last_status = event_type.name
+                    order_record.last_update_timestamp = timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == evt.order_id).one_or_none()
-                event_price = Decimal(evt.price) if evt.price == evt.price else Decimal(0)
-
-                if order_record is None:
-                    order_record = Order(id=evt.order_id,
-                                         config_file_path=self._config_file_path,
-                                         strategy=self._strategy_name,
-                                         market=market.display_name,
-                                         symbol=evt.trading_pair,
-                                         base_asset=base_asset,
-                                         quote_asset=quote_asset,
-                                         creation_timestamp=timestamp,
-                                         order_type=evt.type.name,
-                                         amount=Decimal(evt.amount),
-                                         leverage=evt.leverage if evt.leverage else 1,
-                                         price=event_price,
-                                         position=evt.position if evt.position else PositionAction.NIL.value,
-                                         last_status=event_type.name,
-                                         last_update_timestamp=timestamp,
-                                         exchange_order_id=evt.exchange_order_id)
-                    session.add(order_record)
-                else:
-                    # A create event can arrive after a placeholder or after a delayed exchange update.
-                    # Treat it as an upsert and never insert a second Order row for the same order_id.
-                    order_record.config_file_path = self._config_file_path
-                    order_record.strategy = self._strategy_name
-                    order_record.market = market.display_name
-                    order_record.symbol = evt.trading_pair
-                    order_record.base_asset = base_asset
-                    order_record.quote_asset = quote_asset
-                    order_record.creation_timestamp = min(order_record.creation_timestamp, timestamp)
-                    order_record.order_type = evt.type.name
-                    order_record.amount = Decimal(evt.amount)
-                    order_record.leverage = evt.leverage if evt.leverage else 1
-                    order_record.price = event_price
-                    order_record.position = evt.position if evt.position else PositionAction.NIL.value
-                    if evt.exchange_order_id is not None:
-                        order_record.exchange_order_id = evt.exchange_order_id
-                    if order_record.last_update_timestamp < timestamp:
-                        order_record.last_status = event_type.name
-                        order_record.last_update_timestamp = timestamp
-
-                existing_status = session.query(OrderStatus).filter(
-                    OrderStatus.order_id == evt.order_id,
-                    OrderStatus.timestamp == timestamp,
-                    OrderStatus.status == event_type.name,
-                ).one_or_none()
-                if existing_status is None:
-                    order_status: OrderStatus = OrderStatus(order=order_record,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+            existing_status = session.query(OrderStatus).filter(
+                OrderStatus.order_id == evt.order_id,
+                OrderStatus.timestamp == timestamp,
+                OrderStatus.status == event_type.name,
+            ).one_or_none()
+            if existing_status is None:
+                order_status: OrderStatus = OrderStatus(order=order_record,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+            save_market_states(session)
+
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        self._write(write)
 
     @staticmethod
     def _get_tracked_order_from_market(market: ConnectorBase, order_id: str) -> Optional[Any]:
@@ -476,7 +636,7 @@ class MarketsRecorder:
     def _create_placeholder_order_record(
         self,
         session: Session,
-        market: ConnectorBase,
+        market_name: str,
         tracked_order: Any,
         order_id: str,
         event_type: MarketEvent,
@@ -500,7 +660,7 @@ class MarketsRecorder:
             id=order_id,
             config_file_path=self._config_file_path,
             strategy=self._strategy_name,
-            market=market.display_name,
+            market=market_name,
             symbol=trading_pair,
             base_asset=base_asset,
             quote_asset=quote_asset,
@@ -530,56 +690,58 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                try:
-                    fee_in_quote = evt.trade_fee.fee_amount_in_token(
-                        trading_pair=evt.trading_pair,
-                        price=evt.price,
-                        order_amount=evt.amount,
-                        token=quote_asset,
-                        exchange=market
-                    )
-                except Exception as e:
-                    self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
-                    fee_in_quote = 0
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    trade_fee_in_quote=fee_in_quote,
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
+        # Order status and trade fill record should be added even if the order record is not found, because it's
+        # possible for fill event to come in before the order created event for market orders.
+        order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        try:
+            fee_in_quote = evt.trade_fee.fee_amount_in_token(
+                trading_pair=evt.trading_pair,
+                price=evt.price,
+                order_amount=evt.amount,
+                token=quote_asset,
+                exchange=market
+            )
+        except Exception as e:
+            self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
+            fee_in_quote = 0
+        trade_fill_record: TradeFill = TradeFill(
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=market.display_name,
+            symbol=evt.trading_pair,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=evt.trade_type.name,
+            order_type=evt.order_type.name,
+            price=evt.price,
+            amount=evt.amount,
+            leverage=evt.leverage if evt.leverage else 1,
+            trade_fee=evt.trade_fee.to_json(),
+            trade_fee_in_quote=fee_in_quote,
+            exchange_trade_id=evt.exchange_trade_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+        )
+        save_market_states = self._market_states_writer(market)
+
+        def write(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+            session.add(order_status)
+            session.add(trade_fill_record)
+            TradePerformance.add_trade_fill(session, trade_fill_record)
+            save_market_states(session)
+
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
+                                                                           trade_fill_record.exchange_trade_id,
+                                                                           trade_fill_record.symbol)})
+        self._write(write)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -590,20 +752,21 @@ class MarketsRecorder:
             return
 
         timestamp: float = evt.timestamp
-
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
+        funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                config_file_path=self.config_file_path,
+                                                                market=market.display_name,
+                                                                rate=evt.funding_rate,
+                                                                symbol=evt.trading_pair,
+                                                                amount=float(evt.amount))
+
+        def write(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                session.add(funding_payment_record)
+
+        self._write(write)
 
     @staticmethod
     def _csv_matches_header(file_path: str, header: tuple) -> bool:
@@ -649,30 +812,34 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-                if order_record is None:
-                    tracked_order = self._get_tracked_order_from_market(market, order_id)
-                    if tracked_order is not None:
-                        order_record = self._create_placeholder_order_record(
-                            session=session,
-                            market=market,
-                            tracked_order=tracked_order,
-                            order_id=order_id,
-                            event_type=event_type,
-                            timestamp=timestamp,
-                        )
-
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        market_name: str = market.display_name
+        # Only used when the order was never recorded, but the connector has to be queried from the event loop.
+        tracked_order = self._get_tracked_order_from_market(market, order_id)
+        save_market_states = self._market_states_writer(market)
+
+        def write(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is None and tracked_order is not None:
+                order_record = self._create_placeholder_order_record(
+                    session=session,
+                    market_name=market_name,
+                    tracked_order=tracked_order,
+                    order_id=order_id,
+                    event_type=event_type,
+                    timestamp=timestamp,
+                )
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+                save_market_states(session)
+
+        self._write(write)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -735,34 +902,37 @@ class MarketsRecorder:
                 self.logger().error(f"Error calculating fee in quote for LP position: {e}, will be stored as 0.")
                 fee_in_quote = Decimal("0")
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(
-                    hb_id=evt.order_id,
-                    timestamp=timestamp,
-                    tx_hash=evt.exchange_order_id,
-                    token_id=getattr(evt, 'token_id', 0) or 0,
-                    trade_fee=evt.trade_fee.to_json(),
-                    trade_fee_in_quote=float(fee_in_quote),
-                    # P&L tracking fields
-                    config_file_path=self._config_file_path,
-                    market=connector.display_name,
-                    order_action=order_action,
-                    trading_pair=trading_pair,
-                    position_address=getattr(evt, 'position_address', None),
-                    lower_price=float(getattr(evt, 'lower_price', 0) or 0),
-                    upper_price=float(getattr(evt, 'upper_price', 0) or 0),
-                    mid_price=float(mid_price),
-                    base_amount=float(base_amount),
-                    quote_amount=float(getattr(evt, 'quote_amount', 0) or 0),
-                    base_fee=float(getattr(evt, 'base_fee', 0) or 0),
-                    quote_fee=float(getattr(evt, 'quote_fee', 0) or 0),
-                    # Rent tracking: position_rent on ADD, position_rent_refunded on REMOVE
-                    position_rent=float(getattr(evt, 'position_rent', 0) or 0),
-                    position_rent_refunded=float(getattr(evt, 'position_rent_refunded', 0) or 0),
-                )
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_update: RangePositionUpdate = RangePositionUpdate(
+            hb_id=evt.order_id,
+            timestamp=timestamp,
+            tx_hash=evt.exchange_order_id,
+            token_id=getattr(evt, 'token_id', 0) or 0,
+            trade_fee=evt.trade_fee.to_json(),
+            trade_fee_in_quote=float(fee_in_quote),
+            # P&L tracking fields
+            config_file_path=self._config_file_path,
+            market=connector.display_name,
+            order_action=order_action,
+            trading_pair=trading_pair,
+            position_address=getattr(evt, 'position_address', None),
+            lower_price=float(getattr(evt, 'lower_price', 0) or 0),
+            upper_price=float(getattr(evt, 'upper_price', 0) or 0),
+            mid_price=float(mid_price),
+            base_amount=float(base_amount),
+            quote_amount=float(getattr(evt, 'quote_amount', 0) or 0),
+            base_fee=float(getattr(evt, 'base_fee', 0) or 0),
+            quote_fee=float(getattr(evt, 'quote_fee', 0) or 0),
+            # Rent tracking: position_rent on ADD, position_rent_refunded on REMOVE
+            position_rent=float(getattr(evt, 'position_rent', 0) or 0),
+            position_rent_refunded=float(getattr(evt, 'position_rent_refunded', 0) or 0),
+        )
+        save_market_states = self._market_states_writer(connector)
+
+        def write(session: Session):
+            session.add(rp_update)
+            save_market_states(session)
+
+        self._write(write)
 
     @staticmethod
     async def _sleep(delay):
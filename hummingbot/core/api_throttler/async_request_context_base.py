@@ -3,9 +3,10 @@ import logging
 import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import List, Tuple
+from typing import FrozenSet, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.request_priority import PriorityLanes, RequestPriority, current_request_priority
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
@@ -34,6 +35,8 @@ class AsyncRequestContextBase(ABC):
                  lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 priority: Optional[RequestPriority] = None,
+                 priority_lanes: Optional[PriorityLanes] = None,
                  ):
         """
         Asynchronous context associated with each API request.
@@ -42,6 +45,8 @@ class AsyncRequestContextBase(ABC):
         :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
         :param retry_interval: Time between each limit check
+        :param priority: Priority lane of the request, defaults to the one set with `request_priority` by the caller
+        :param priority_lanes: Waiting requests shared between all the contexts of a throttler, None to ignore priorities
         """
         self._task_logs: List[TaskLog] = task_logs
         self._rate_limit: RateLimit = rate_limit
@@ -49,6 +54,19 @@ class AsyncRequestContextBase(ABC):
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._priority: RequestPriority = current_request_priority() if priority is None else priority
+        self._priority_lanes: Optional[PriorityLanes] = priority_lanes
+        self._limit_ids: FrozenSet[str] = frozenset(
+            ([] if rate_limit is None else [rate_limit.limit_id]) + [limit.limit_id for limit, _ in related_limits]
+        )
+
+    @property
+    def priority(self) -> RequestPriority:
+        return self._priority
+
+    @property
+    def limit_ids(self) -> FrozenSet[str]:
+        return self._limit_ids
 
     def flush(self):
         """
@@ -65,14 +83,31 @@ class AsyncRequestContextBase(ABC):
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    def _has_waiter_ahead(self) -> bool:
+        return self._priority_lanes is not None and self._priority_lanes.has_waiter_ahead(self._limit_ids, self._priority)
+
+    def _usable_capacity(self, rate_limit: RateLimit, weight: int) -> float:
+        if self._priority_lanes is None:
+            return rate_limit.limit
+        return self._priority_lanes.usable_capacity(rate_limit.limit, weight, self._priority)
+
     async def acquire(self):
-        while True:
-            async with self._lock:
-                self.flush()
+        waiting = False
+        try:
+            while True:
+                async with self._lock:
+                    self.flush()
 
-                if self.within_capacity():
-                    break
-            await asyncio.sleep(self._retry_interval)
+                    if self.within_capacity():
+                        break
+                if not waiting and self._priority_lanes is not None:
+                    # Let lower priority requests on the same limits know that this one is waiting.
+                    self._priority_lanes.add_waiter(self._limit_ids, self._priority)
+                    waiting = True
+                await asyncio.sleep(self._retry_interval)
+        finally:
+            if waiting:
+                self._priority_lanes.remove_waiter(self._limit_ids, self._priority)
         async with self._lock:
             now = time.time()
             # Each related limit is represented as it own individual TaskLog
@@ -0,0 +1,264 @@
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+    AsyncRequestContextBase,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.request_priority import RequestPriority
+
+
+class LimitWindow:
+    """
+    Sliding window of the (timestamp, weight) entries logged against one rate limit, with the running sum of the
+    weights still inside the window. Entries are appended in time order, so expired ones are always at the front.
+    """
+
+    __slots__ = ("entries", "used")
+
+    def __init__(self):
+        self.entries: Deque[Tuple[float, float]] = deque()
+        self.used: float = 0.0
+
+    def evict(self, expiry: float):
+        """
+        Drops the entries logged at or before `expiry`.
+        """
+        entries = self.entries
+        while entries and entries[0][0] <= expiry:
+            self.used -= entries.popleft()[1]
+        if not entries:
+            self.used = 0.0
+
+    def append(self, timestamp: float, weight: float):
+        self.entries.append((timestamp, weight))
+        self.used += weight
+
+    def time_freeing(self, excess: float) -> float:
+        """
+        Returns the timestamp of the entry whose expiry frees at least `excess` weight, or infinity if the whole window
+        is not enough.
+        """
+        freed = 0.0
+        for timestamp, weight in self.entries:
+            freed += weight
+            if freed >= excess:
+                return timestamp
+        return math.inf
+
+
+class AsyncSlidingWindowRequestContext(AsyncRequestContextBase):
+    """
+    An async context class ('async with' syntax) that waits in the queue of its AsyncSlidingWindowThrottler until all
+    the rate limits of the request have capacity for it.
+    """
+
+    def __init__(self,
+                 throttler: "AsyncSlidingWindowThrottler",
+                 rate_limit: Optional[RateLimit],
+                 related_limits: List[Tuple[RateLimit, int]],
+                 safety_margin_pct: float,
+                 priority: Optional[RequestPriority] = None,
+                 limits: Optional[List[Tuple[RateLimit, int]]] = None,
+                 ):
+        """
+        :param throttler: The throttler holding the limit windows and the queue of waiting requests
+        :param rate_limit: The RateLimit associated with this API Request
+        :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
+        :param safety_margin_pct: Percentage of the time interval added to each rate limit window
+        :param priority: Priority lane of the request, defaults to the one set with `request_priority` by the caller
+        :param limits: The (rate limit, weight) pairs the request is logged against, the rate limit with its own weight
+            and the related limits by default
+        """
+        super().__init__(
+            task_logs=throttler._task_logs,
+            rate_limit=rate_limit,
+            related_limits=related_limits,
+            lock=throttler._lock,
+            safety_margin_pct=safety_margin_pct,
+            priority=priority,
+            priority_lanes=throttler._priority_lanes,
+        )
+        self._throttler: AsyncSlidingWindowThrottler = throttler
+        if limits is None:
+            limits = [] if rate_limit is None else [(rate_limit, rate_limit.weight)] + related_limits
+        self._limits: List[Tuple[RateLimit, int]] = limits
+
+    def flush(self):
+        """
+        Remove the logged requests that have left the windows of this request's rate limits
+        """
+        now = self._throttler._time()
+        for rate_limit, _ in self._limits:
+            self._throttler._window(rate_limit.limit_id).evict(now - self._horizon(rate_limit))
+
+    def within_capacity(self) -> bool:
+        """
+        Checks if an additional task is within the defined RateLimit(s). Logs a warning message if a limit is reached.
+        :return: True if it is within capacity to add a new task
+        """
+        return self.seconds_until_capacity(self._throttler._time()) <= 0
+
+    def seconds_until_capacity(self, now: float) -> float:
+        """
+        Returns how long the request has to wait for all its rate limits to have capacity for it, 0 if it fits now,
+        or infinity if its weight exceeds one of the limits, which execute_task prevents by capping the weights.
+        """
+        delay = 0.0
+        for rate_limit, weight in self._limits:
+            window = self._throttler._window(rate_limit.limit_id)
+            horizon = self._horizon(rate_limit)
+            window.evict(now - horizon)
+            excess = window.used + weight - float(self._usable_capacity(rate_limit, weight))
+            if excess > 0:
+                self._notify_capacity_reached(rate_limit, window.used, now)
+                delay = max(delay, window.time_freeing(excess) + horizon - now)
+        return delay
+
+    def log_task(self, now: float):
+        """
+        Logs the request against its rate limit and each of its linked limits.
+        """
+        for rate_limit, weight in self._limits:
+            self._throttler._window(rate_limit.limit_id).append(now, weight)
+
+    async def acquire(self):
+        await self._throttler.acquire(self)
+
+    def _horizon(self, rate_limit: RateLimit) -> float:
+        return rate_limit.time_interval * (1 + self._safety_margin_pct)
+
+    def _notify_capacity_reached(self, rate_limit: RateLimit, capacity_used: float, now: float):
+        if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                  f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                  f"is {capacity_used} in the last " \
+                  f"{rate_limit.time_interval} seconds"
+            self.logger().notify(msg)
+            AsyncRequestContextBase._last_max_cap_warning_ts = now
+
+
+class AsyncSlidingWindowThrottler(AsyncThrottlerBase):
+    """
+    Drop-in alternative to AsyncThrottler that keeps a sliding window with a running weight sum per rate limit, so a
+    capacity check only touches the limits of the request and costs amortized O(1) per limit.
+
+    Requests that do not fit wait in a heap ordered by priority, then arrival, and are woken by a timer set to the
+    exact moment the oldest blocking entry leaves its window, instead of polling every `retry_interval`. A waiting
+    request only holds back the requests queued after it that share one of its rate limits. All the bookkeeping runs
+    synchronously on the event loop, so no lock is needed.
+
+    A request weighing more than one of its limits could never run, so its weight is capped to the limit, with a
+    warning, and it runs once the window is empty.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,
+                 limits_share_percentage: Optional[Decimal] = None
+                 ):
+        super().__init__(
+            rate_limits=rate_limits,
+            retry_interval=retry_interval,
+            safety_margin_pct=safety_margin_pct,
+            limits_share_percentage=limits_share_percentage,
+        )
+        self._windows: Dict[str, LimitWindow] = {}
+        # (priority, arrival sequence, context, future) heap of the requests waiting for capacity
+        self._waiters: List[Tuple[int, int, AsyncSlidingWindowRequestContext, asyncio.Future]] = []
+        self._waiter_sequence = itertools.count()
+        self._wake_up_handle: Optional[asyncio.TimerHandle] = None
+        self._capped_limit_ids: Set[str] = set()
+
+    @property
+    def waiting_requests(self) -> int:
+        return len(self._waiters)
+
+    def execute_task(self, limit_id: str) -> AsyncSlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        limits = [] if rate_limit is None else [(rate_limit, rate_limit.weight)] + related_rate_limits
+        return AsyncSlidingWindowRequestContext(
+            throttler=self,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+            safety_margin_pct=self._safety_margin_pct,
+            limits=[(limit, self._capped_weight(limit, weight)) for limit, weight in limits],
+        )
+
+    async def acquire(self, context: AsyncSlidingWindowRequestContext):
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (context.priority, next(self._waiter_sequence), context, future))
+        self._process_waiters()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if not future.done() or future.cancelled():
+                # The request gives up its place, which can unblock the requests queued after it. Its cancelled
+                # future is dropped from the heap by the pass.
+                self._process_waiters()
+            raise
+
+    def _process_waiters(self):
+        """
+        Grants the queued requests that fit, in order, and schedules the next wake up for the ones left waiting.
+        """
+        if self._wake_up_handle is not None:
+            self._wake_up_handle.cancel()
+            self._wake_up_handle = None
+        now = self._time()
+        blocked_limit_ids = set()
+        next_wake_up = math.inf
+        waiters = self._waiters
+        # Popped in order, so the requests left waiting are appended sorted, which keeps the list a valid heap.
+        still_waiting = []
+        while waiters:
+            waiter = heapq.heappop(waiters)
+            _, _, context, future = waiter
+            if future.done():
+                continue
+            if blocked_limit_ids.isdisjoint(context.limit_ids):
+                delay = context.seconds_until_capacity(now)
+                if delay <= 0:
+                    context.log_task(now)
+                    future.set_result(None)
+                    continue
+                next_wake_up = min(next_wake_up, delay)
+            blocked_limit_ids.update(context.limit_ids)
+            still_waiting.append(waiter)
+        self._waiters = still_waiting
+        if next_wake_up != math.inf:
+            self._wake_up_handle = asyncio.get_running_loop().call_later(next_wake_up, self._process_waiters)
+
+    def _capped_weight(self, rate_limit: RateLimit, weight: int) -> int:
+        limit = int(rate_limit.limit)
+        if weight <= limit:
+            return weight
+        if rate_limit.limit_id not in self._capped_limit_ids:
+            self._capped_limit_ids.add(rate_limit.limit_id)
+            self.logger().warning(f"The request weight {weight} exceeds the rate limit on {rate_limit.limit_id} "
+                                  f"({limit} calls per {rate_limit.time_interval}s), it is capped to the limit.")
+        return limit
+
+    def _window(self, limit_id: str) -> LimitWindow:
+        window = self._windows.get(limit_id)
+        if window is None:
+            window = self._windows[limit_id] = LimitWindow()
+        return window
+
+    def _time(self) -> float:
+        return time.time()
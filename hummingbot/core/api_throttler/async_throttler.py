@@ -24,6 +24,8 @@ class AsyncRequestContext(AsyncRequestContextBase):
         :return: True if it is within capacity to add a new task
         """
         if self._rate_limit is not None:
+            if self._has_waiter_ahead():
+                return False
             list_of_limits: List[Tuple[RateLimit, int]] = [(self._rate_limit,
                                                             self._rate_limit.weight)] + self._related_limits
             limit_id_to_task_log_map = collections.defaultdict(list)
@@ -36,7 +38,7 @@ class AsyncRequestContext(AsyncRequestContextBase):
                                           if
                                           Decimal(str(now)) - Decimal(str(task.timestamp)) - Decimal(str(task.rate_limit.time_interval * self._safety_margin_pct)) <= task.rate_limit.time_interval])
 
-                if capacity_used + weight > rate_limit.limit:
+                if capacity_used + weight > self._usable_capacity(rate_limit, weight):
                     if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
                         msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
                               f"{rate_limit.time_interval}s) has almost reached. Limits used " \
@@ -55,7 +57,9 @@ class AsyncThrottler(AsyncThrottlerBase):
     """
     Handles call rate limits by providing async context (async with), it delays as needed to make sure calls stay
     within defined limits.
-    A task can have multiple call rates (weight), though tasks are still ordered in sequence as they come (FIFO).
+    A task can have multiple call rates (weight), though tasks are still ordered in sequence as they come (FIFO)
+    within a priority lane. A task waits while a higher priority task is waiting on one of its limits, see
+    `request_priority`.
     (i.e)
         Pool 0 - rate limit is 100 calls per second
         Pool 1 - rate limit is 10 calls per second
@@ -78,4 +82,5 @@ class AsyncThrottler(AsyncThrottlerBase):
             lock=self._lock,
             safety_margin_pct=self._safety_margin_pct,
             retry_interval=self._retry_interval,
+            priority_lanes=self._priority_lanes,
         )
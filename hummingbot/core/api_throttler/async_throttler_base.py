@@ -8,6 +8,7 @@ from typing import Dict, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
 from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.request_priority import PriorityLanes
 from hummingbot.logger.logger import HummingbotLogger
 
 
@@ -56,6 +57,9 @@ class AsyncThrottlerBase(ABC):
         # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
         self._lock = asyncio.Lock()
 
+        # Requests waiting for capacity per rate limit and priority, shared by all the request contexts
+        self._priority_lanes: PriorityLanes = PriorityLanes()
+
     def set_rate_limits(self, rate_limits: List[RateLimit]):
         # Rate Limit Definitions
         self._rate_limits: List[RateLimit] = copy.deepcopy(rate_limits)
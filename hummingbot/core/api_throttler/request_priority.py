@@ -0,0 +1,98 @@
+import math
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Dict, Iterable, List, Optional
+
+
+class RequestPriority(IntEnum):
+    """
+    Priority lane of an API request, lower values go first. Requests that are not labelled get DEFAULT, so they keep
+    their previous behaviour apart from yielding to waiting cancels and order creations.
+    """
+    CANCEL = 0
+    CREATE = 1
+    DEFAULT = 2
+    POLLING = 3
+    BACKGROUND = 4
+
+
+_current_request_priority: ContextVar[RequestPriority] = ContextVar(
+    "current_request_priority", default=RequestPriority.DEFAULT
+)
+
+
+def current_request_priority() -> RequestPriority:
+    return _current_request_priority.get()
+
+
+@contextmanager
+def request_priority(priority: RequestPriority):
+    """
+    Labels every throttled request made within the block, including the ones made by tasks created in it, with the
+    given priority.
+
+    (i.e)
+        with request_priority(RequestPriority.CANCEL):
+            await self._place_cancel(order_id, tracked_order)
+    """
+    token = _current_request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_request_priority.reset(token)
+
+
+class PriorityLanes:
+    """
+    Shared by the request contexts of one throttler. It counts the requests waiting for capacity per rate limit and
+    priority, so that a request defers to higher priority requests waiting on any of its limits, and keeps part of
+    each limit free for higher priorities by giving low priority requests a smaller share of it.
+    """
+
+    DEFAULT_HEADROOM_PCT: Dict[RequestPriority, float] = {
+        RequestPriority.POLLING: 0.1,
+        RequestPriority.BACKGROUND: 0.25,
+    }
+
+    def __init__(self, headroom_pct: Optional[Dict[RequestPriority, float]] = None):
+        """
+        :param headroom_pct: Share of each rate limit that requests of a priority can not use, kept for higher ones
+        """
+        self._headroom_pct: Dict[RequestPriority, float] = (
+            self.DEFAULT_HEADROOM_PCT if headroom_pct is None else headroom_pct
+        )
+        self._waiting: Dict[str, List[int]] = {}
+
+    def add_waiter(self, limit_ids: Iterable[str], priority: RequestPriority):
+        for limit_id in limit_ids:
+            counts = self._waiting.get(limit_id)
+            if counts is None:
+                counts = self._waiting[limit_id] = [0] * len(RequestPriority)
+            counts[priority] += 1
+
+    def remove_waiter(self, limit_ids: Iterable[str], priority: RequestPriority):
+        for limit_id in limit_ids:
+            counts = self._waiting[limit_id]
+            counts[priority] -= 1
+            if not any(counts):
+                del self._waiting[limit_id]
+
+    def has_waiter_ahead(self, limit_ids: Iterable[str], priority: RequestPriority) -> bool:
+        """
+        True if a request with a higher priority is waiting on any of the given rate limits.
+        """
+        for limit_id in limit_ids:
+            counts = self._waiting.get(limit_id)
+            if counts is not None and any(counts[:priority]):
+                return True
+        return False
+
+    def usable_capacity(self, limit: float, weight: float, priority: RequestPriority) -> float:
+        """
+        Share of the limit available to a request of the given priority. It is never below the request weight, so a
+        low priority request can always run once the limit is idle.
+        """
+        headroom_pct = self._headroom_pct.get(priority, 0.0)
+        limit = float(limit)
+        return max(limit - math.floor(limit * headroom_pct), weight)
@@ -1,8 +1,28 @@
 # distutils: language=c++
 from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
+cimport numpy as np
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
 
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef Py_ssize_t c_fill_side(self, bint is_bid, np.ndarray[np.float64_t, ndim=2] out) except -1
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
+    cdef c_fill_for_volumes(self,
+                            bint is_buy,
+                            bint vwap,
+                            np.ndarray[np.float64_t, ndim=1] volumes,
+                            np.ndarray[np.int64_t, ndim=1] order,
+                            np.ndarray[np.float64_t, ndim=1] result)
+    cdef c_fill_volumes_for_prices(self,
+                                   bint is_buy,
+                                   np.ndarray[np.float64_t, ndim=1] prices,
+                                   np.ndarray[np.int64_t, ndim=1] order,
+                                   np.ndarray[np.float64_t, ndim=1] result)
@@ -3,10 +3,22 @@
 
 from typing import Iterator
 
+import numpy as np
+
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from libcpp.set cimport set
 from libcpp.vector cimport vector
+from hummingbot.core.data_type.order_book cimport (
+    price_for_quote_volume_from_rows,
+    price_for_volume_from_rows,
+    quote_volume_for_base_amount_from_rows,
+    quote_volume_for_price_from_rows,
+    volume_for_price_from_rows,
+    vwap_for_volume_from_rows,
+)
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
+cimport numpy as np
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
@@ -192,3 +204,63 @@ cdef class CompositeOrderBook(OrderBook):
                 return best_bid.price
         except Exception:
             raise
+
+    cdef Py_ssize_t c_fill_side(self, bint is_bid, np.ndarray[np.float64_t, ndim=2] out) except -1:
+        cdef:
+            Py_ssize_t count = 0
+        for row in (self.bid_entries() if is_bid else self.ask_entries()):
+            if count == out.shape[0]:
+                break
+            out[count, 0] = row.price
+            out[count, 1] = row.amount
+            out[count, 2] = row.update_id
+            count += 1
+        return count
+
+    # The depth queries below walk the composite entries rather than the raw C++ books, so that recorded fills are
+    # taken into account.
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        return price_for_volume_from_rows(self.ask_entries() if is_buy else self.bid_entries(), volume)
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        return vwap_for_volume_from_rows(self.ask_entries() if is_buy else self.bid_entries(), volume)
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        return price_for_quote_volume_from_rows(self.ask_entries() if is_buy else self.bid_entries(), quote_volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        return quote_volume_for_base_amount_from_rows(self.ask_entries() if is_buy else self.bid_entries(), base_amount)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        return volume_for_price_from_rows(self.ask_entries() if is_buy else self.bid_entries(), is_buy, price)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        return quote_volume_for_price_from_rows(self.ask_entries() if is_buy else self.bid_entries(), is_buy, price)
+
+    cdef c_fill_for_volumes(self,
+                            bint is_buy,
+                            bint vwap,
+                            np.ndarray[np.float64_t, ndim=1] volumes,
+                            np.ndarray[np.int64_t, ndim=1] order,
+                            np.ndarray[np.float64_t, ndim=1] result):
+        cdef:
+            Py_ssize_t i
+            OrderBookQueryResult query_result
+        for i in range(volumes.shape[0]):
+            if vwap:
+                query_result = self.c_get_vwap_for_volume(is_buy, volumes[i])
+            else:
+                query_result = self.c_get_price_for_volume(is_buy, volumes[i])
+            result[i] = query_result.result_price
+
+    cdef c_fill_volumes_for_prices(self,
+                                   bint is_buy,
+                                   np.ndarray[np.float64_t, ndim=1] prices,
+                                   np.ndarray[np.int64_t, ndim=1] order,
+                                   np.ndarray[np.float64_t, ndim=1] result):
+        cdef:
+            Py_ssize_t i
+            OrderBookQueryResult query_result
+        for i in range(prices.shape[0]):
+            query_result = self.c_get_volume_for_price(is_buy, prices[i])
+            result[i] = query_result.result_volume
@@ -9,6 +9,13 @@ from .order_book_query_result cimport OrderBookQueryResult
 cimport numpy as np
 
 
+cdef OrderBookQueryResult price_for_volume_from_rows(object rows, double volume)
+cdef OrderBookQueryResult vwap_for_volume_from_rows(object rows, double volume)
+cdef OrderBookQueryResult price_for_quote_volume_from_rows(object rows, double quote_volume)
+cdef OrderBookQueryResult quote_volume_for_base_amount_from_rows(object rows, double base_amount)
+cdef OrderBookQueryResult volume_for_price_from_rows(object rows, bint is_buy, double price)
+cdef OrderBookQueryResult quote_volume_for_price_from_rows(object rows, bint is_buy, double price)
+
 cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _bid_book
     cdef set[OrderBookEntry] _ask_book
@@ -20,10 +27,23 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef bint _depth_index_enabled
+    cdef vector[double] _bid_index_prices
+    cdef vector[double] _bid_index_base
+    cdef vector[double] _bid_index_quote
+    cdef vector[double] _ask_index_prices
+    cdef vector[double] _ask_index_base
+    cdef vector[double] _ask_index_quote
+    cdef double _bid_index_from_price
+    cdef double _ask_index_from_price
+    cdef object _top_bids_buffer
+    cdef object _top_asks_buffer
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_refresh_depth_index(self)
+    cdef Py_ssize_t c_fill_side(self, bint is_bid, np.ndarray[np.float64_t, ndim=2] out) except -1
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
@@ -37,3 +57,14 @@ cdef class OrderBook(PubSub):
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
+    cdef c_fill_for_volumes(self,
+                            bint is_buy,
+                            bint vwap,
+                            np.ndarray[np.float64_t, ndim=1] volumes,
+                            np.ndarray[np.int64_t, ndim=1] order,
+                            np.ndarray[np.float64_t, ndim=1] result)
+    cdef c_fill_volumes_for_prices(self,
+                                   bint is_buy,
+                                   np.ndarray[np.float64_t, ndim=1] prices,
+                                   np.ndarray[np.int64_t, ndim=1] order,
+                                   np.ndarray[np.float64_t, ndim=1] result)
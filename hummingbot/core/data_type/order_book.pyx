@@ -18,7 +18,9 @@ from cython.operator cimport(
     address as ref,
     dereference as deref,
     postincrement as inc,
+    predecrement as dec,
 )
+from libc.math cimport INFINITY, isnan
 
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
@@ -36,6 +38,144 @@ ob_logger = None
 NaN = float("nan")
 
 
+cdef inline size_t _count_before(const vector[double] &values, double target, bint descending):
+    """
+    Binary search over a sorted vector. Returns the number of leading values strictly before `target`, i.e. smaller
+    than it for an ascending vector, or larger than it for a descending one. A NaN target is never reached.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = values.size()
+        size_t middle
+    if isnan(target):
+        return high
+    while low < high:
+        middle = (low + high) // 2
+        if (values[middle] > target) if descending else (values[middle] < target):
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+cdef inline size_t _count_through(const vector[double] &values, double target, bint descending):
+    """
+    Binary search over a sorted vector. Returns the number of leading values before or equal to `target`. A NaN
+    target is never reached.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = values.size()
+        size_t middle
+    if isnan(target):
+        return high
+    while low < high:
+        middle = (low + high) // 2
+        if (values[middle] >= target) if descending else (values[middle] <= target):
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+cdef inline double _last_or_zero(const vector[double] &values):
+    return values.back() if values.size() > 0 else 0
+
+
+cdef int _parse_raw_levels(object levels, int64_t update_id, vector[OrderBookEntry] &entries) except -1:
+    """
+    Parses exchange [price, amount, ...] levels (strings or numbers) straight into C++ entries.
+    """
+    entries.reserve(entries.size() + len(levels))
+    for level in levels:
+        entries.push_back(OrderBookEntry(float(level[0]), float(level[1]), update_id))
+    return 0
+
+
+# Row-based forms of the depth queries, for order books that expose their levels through bid_entries()/ask_entries()
+# overrides rather than through the C++ books (see CompositeOrderBook). `rows` must yield OrderBookRow objects from the
+# best level to the worst.
+
+cdef OrderBookQueryResult price_for_volume_from_rows(object rows, double volume):
+    cdef:
+        double cumulative_volume = 0
+        double result_price = NaN
+    for row in rows:
+        cumulative_volume += row.amount
+        if cumulative_volume >= volume:
+            result_price = row.price
+            break
+    return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+
+
+cdef OrderBookQueryResult vwap_for_volume_from_rows(object rows, double volume):
+    cdef:
+        double total_cost = 0
+        double total_volume = 0
+        double result_vwap = NaN
+    for row in rows:
+        if total_volume + row.amount >= volume:
+            total_cost += (volume - total_volume) * row.price
+            total_volume = volume
+            result_vwap = total_cost / total_volume
+            break
+        total_cost += row.amount * row.price
+        total_volume += row.amount
+    return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+
+cdef OrderBookQueryResult price_for_quote_volume_from_rows(object rows, double quote_volume):
+    cdef:
+        double cumulative_volume = 0
+        double result_price = NaN
+    for row in rows:
+        cumulative_volume += row.amount * row.price
+        if cumulative_volume >= quote_volume:
+            result_price = row.price
+            break
+    return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+
+
+cdef OrderBookQueryResult quote_volume_for_base_amount_from_rows(object rows, double base_amount):
+    cdef:
+        double cumulative_volume = 0
+        double cumulative_base_amount = 0
+        double row_amount = 0
+    for row in rows:
+        row_amount = row.amount
+        if row_amount + cumulative_base_amount >= base_amount:
+            row_amount = base_amount - cumulative_base_amount
+        cumulative_base_amount += row_amount
+        cumulative_volume += row_amount * row.price
+        if cumulative_base_amount >= base_amount:
+            break
+    return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+
+cdef OrderBookQueryResult volume_for_price_from_rows(object rows, bint is_buy, double price):
+    cdef:
+        double cumulative_volume = 0
+        double result_price = NaN
+    for row in rows:
+        if (is_buy and row.price > price) or (not is_buy and row.price < price):
+            break
+        cumulative_volume += row.amount
+        result_price = row.price
+    return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+
+cdef OrderBookQueryResult quote_volume_for_price_from_rows(object rows, bint is_buy, double price):
+    cdef:
+        double cumulative_volume = 0
+        double result_price = NaN
+    for row in rows:
+        if (is_buy and row.price > price) or (not is_buy and row.price < price):
+            break
+        cumulative_volume += row.amount * row.price
+        result_price = row.price
+    return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
 
@@ -46,7 +186,7 @@ cdef class OrderBook(PubSub):
             ob_logger = logging.getLogger(__name__)
         return ob_logger
 
-    def __init__(self, dex=False):
+    def __init__(self, dex=False, depth_index=False):
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
@@ -55,6 +195,11 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._depth_index_enabled = depth_index
+        self._bid_index_from_price = INFINITY
+        self._ask_index_from_price = -INFINITY
+        self._top_bids_buffer = np.empty((0, 3), dtype=np.float64)
+        self._top_asks_buffer = np.empty((0, 3), dtype=np.float64)
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -65,6 +210,10 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double bid_index_from_price = -INFINITY
+            double ask_index_from_price = INFINITY
+            size_t bid_book_size
+            size_t ask_book_size
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -73,15 +222,29 @@ cdef class OrderBook(PubSub):
                 self._bid_book.erase(result)
             if bid.getAmount() > 0:
                 self._bid_book.insert(bid)
+            if bid.getPrice() > bid_index_from_price:
+                bid_index_from_price = bid.getPrice()
         for ask in asks:
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
             if ask.getAmount() > 0:
                 self._ask_book.insert(ask)
+            if ask.getPrice() < ask_index_from_price:
+                ask_index_from_price = ask.getPrice()
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
+        bid_book_size = self._bid_book.size()
+        ask_book_size = self._ask_book.size()
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+        if self._bid_book.size() != bid_book_size or self._ask_book.size() != ask_book_size:
+            # Truncation removes levels from the top of the book, so the whole index has to be rebuilt.
+            bid_index_from_price = INFINITY
+            ask_index_from_price = -INFINITY
+
+        # The depth index is only marked stale here, and brought up to date by the first query that needs it.
+        self._bid_index_from_price = max(self._bid_index_from_price, bid_index_from_price)
+        self._ask_index_from_price = min(self._ask_index_from_price, ask_index_from_price)
 
         # Record the current best prices, for faster c_get_price() calls.
         bid_iterator = self._bid_book.rbegin()
@@ -133,9 +296,85 @@ cdef class OrderBook(PubSub):
         self._best_bid = best_bid_price
         self._best_ask = best_ask_price
 
+        self._bid_index_from_price = INFINITY
+        self._ask_index_from_price = -INFINITY
+
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+    cdef c_refresh_depth_index(self):
+        """
+        Brings the cumulative depth index up to date with the changes applied since the last query. Levels better than
+        the best changed price on each side (_bid_index_from_price, _ask_index_from_price) keep their cumulative sums,
+        so only the rest of the side is recomputed, once for however many diffs arrived in between.
+        """
+        cdef:
+            size_t keep
+            double cumulative_base
+            double cumulative_quote
+            double bid_from_price = self._bid_index_from_price
+            double ask_from_price = self._ask_index_from_price
+            set[OrderBookEntry].iterator it
+            OrderBookEntry entry
+
+        self._bid_index_from_price = -INFINITY
+        self._ask_index_from_price = INFINITY
+
+        keep = _count_before(self._bid_index_prices, bid_from_price, True)
+        if bid_from_price > -INFINITY:
+            self._bid_index_prices.resize(keep)
+            self._bid_index_base.resize(keep)
+            self._bid_index_quote.resize(keep)
+            cumulative_base = _last_or_zero(self._bid_index_base)
+            cumulative_quote = _last_or_zero(self._bid_index_quote)
+            it = self._bid_book.upper_bound(OrderBookEntry(bid_from_price, 0, 0))
+            while it != self._bid_book.begin():
+                dec(it)
+                entry = deref(it)
+                cumulative_base += entry.getAmount()
+                cumulative_quote += entry.getAmount() * entry.getPrice()
+                self._bid_index_prices.push_back(entry.getPrice())
+                self._bid_index_base.push_back(cumulative_base)
+                self._bid_index_quote.push_back(cumulative_quote)
+
+        keep = _count_before(self._ask_index_prices, ask_from_price, False)
+        if ask_from_price < INFINITY:
+            self._ask_index_prices.resize(keep)
+            self._ask_index_base.resize(keep)
+            self._ask_index_quote.resize(keep)
+            cumulative_base = _last_or_zero(self._ask_index_base)
+            cumulative_quote = _last_or_zero(self._ask_index_quote)
+            it = self._ask_book.lower_bound(OrderBookEntry(ask_from_price, 0, 0))
+            while it != self._ask_book.end():
+                entry = deref(it)
+                cumulative_base += entry.getAmount()
+                cumulative_quote += entry.getAmount() * entry.getPrice()
+                self._ask_index_prices.push_back(entry.getPrice())
+                self._ask_index_base.push_back(cumulative_base)
+                self._ask_index_quote.push_back(cumulative_quote)
+                inc(it)
+
+    @property
+    def depth_index_enabled(self) -> bool:
+        """
+        When enabled, cumulative base and quote depth are kept per side, turning the volume and price queries into
+        binary searches. The index is refreshed lazily by the first query after a diff or snapshot, so it pays off for
+        books that are queried several times between updates.
+        """
+        return self._depth_index_enabled
+
+    @depth_index_enabled.setter
+    def depth_index_enabled(self, value: bool):
+        self._depth_index_enabled = value
+        self._bid_index_prices.clear()
+        self._bid_index_base.clear()
+        self._bid_index_quote.clear()
+        self._ask_index_prices.clear()
+        self._ask_index_base.clear()
+        self._ask_index_quote.clear()
+        self._bid_index_from_price = INFINITY
+        self._ask_index_from_price = -INFINITY
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
@@ -171,12 +410,82 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        bids_array, asks_array = self.to_numpy()
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, dtype="float64")
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, dtype="float64")
         return bids_df, asks_df
 
+    cdef Py_ssize_t c_fill_side(self, bint is_bid, np.ndarray[np.float64_t, ndim=2] out) except -1:
+        """
+        Writes up to `out.shape[0]` levels of one side of the book, best level first, as (price, amount, update_id)
+        rows of `out`. Returns the number of rows written.
+        """
+        cdef:
+            Py_ssize_t rows = out.shape[0]
+            Py_ssize_t count = 0
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
+
+        while count < rows:
+            if is_bid:
+                if bid_it == self._bid_book.rend():
+                    break
+                entry = deref(bid_it)
+                inc(bid_it)
+            else:
+                if ask_it == self._ask_book.end():
+                    break
+                entry = deref(ask_it)
+                inc(ask_it)
+            out[count, 0] = entry.getPrice()
+            out[count, 1] = entry.getAmount()
+            out[count, 2] = entry.getUpdateId()
+            count += 1
+        return count
+
+    def to_numpy(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Exports the order book as two contiguous float64 arrays of (price, amount, update_id) rows, filled directly
+        from the C++ books with the best level first.
+
+        :param depth: the maximum number of levels to export per side, or None to export the whole book
+        :return: a tuple of the bids and asks arrays
+        """
+        cdef:
+            Py_ssize_t bids_rows = self._bid_book.size()
+            Py_ssize_t asks_rows = self._ask_book.size()
+        if depth is not None and depth < 0:
+            raise ValueError(f"depth must be non-negative, got {depth}.")
+        if depth is not None:
+            bids_rows = min(bids_rows, depth)
+            asks_rows = min(asks_rows, depth)
+        bids_array = np.empty((bids_rows, 3), dtype=np.float64)
+        asks_array = np.empty((asks_rows, 3), dtype=np.float64)
+        bids_rows = self.c_fill_side(True, bids_array)
+        asks_rows = self.c_fill_side(False, asks_array)
+        return bids_array[:bids_rows], asks_array[:asks_rows]
+
+    def top_levels(self, depth: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the first `depth` levels of each side as (price, amount, update_id) rows, without allocating new
+        arrays on every call.
+
+        The arrays are views over buffers owned by the order book that are overwritten by the next call to this
+        method; copy them if they need to outlive the current tick.
+
+        :param depth: the number of levels per side
+        :return: a tuple of views over the bids and asks buffers
+        """
+        if depth < 0:
+            raise ValueError(f"depth must be non-negative, got {depth}.")
+        if self._top_bids_buffer.shape[0] < depth:
+            self._top_bids_buffer = np.empty((depth, 3), dtype=np.float64)
+            self._top_asks_buffer = np.empty((depth, 3), dtype=np.float64)
+        bids_rows = self.c_fill_side(True, self._top_bids_buffer[:depth])
+        asks_rows = self.c_fill_side(False, self._top_asks_buffer[:depth])
+        return self._top_bids_buffer[:bids_rows], self._top_asks_buffer[:asks_rows]
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -197,6 +506,48 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_raw_diffs(self, bids: List[List], asks: List[List], update_id: int):
+        """
+        Applies diffs given as raw exchange levels, i.e. [price, amount, ...] lists of strings or numbers, parsing
+        them straight into C++ entries without building OrderBookRow objects.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        _parse_raw_levels(bids, update_id, cpp_bids)
+        _parse_raw_levels(asks, update_id, cpp_asks)
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+
+    def apply_raw_snapshot(self, bids: List[List], asks: List[List], update_id: int):
+        """
+        Applies a snapshot given as raw exchange levels, i.e. [price, amount, ...] lists of strings or numbers,
+        parsing them straight into C++ entries without building OrderBookRow objects.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        _parse_raw_levels(bids, update_id, cpp_bids)
+        _parse_raw_levels(asks, update_id, cpp_asks)
+        self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
+
+    def apply_diff_message(self, message: OrderBookMessage):
+        """
+        Applies a diff message, taking the raw levels fast path when the message type allows it.
+        """
+        if message.has_raw_levels:
+            self.apply_raw_diffs(message.content["bids"], message.content["asks"], message.update_id)
+        else:
+            self.apply_diffs(message.bids, message.asks, message.update_id)
+
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        """
+        Applies a snapshot message, taking the raw levels fast path when the message type allows it.
+        """
+        if message.has_raw_levels:
+            self.apply_raw_snapshot(message.content["bids"], message.content["asks"], message.update_id)
+        else:
+            self.apply_snapshot(message.bids, message.asks, message.update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -226,13 +577,19 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            int64_t update_id
+            Py_ssize_t i
+
+        cpp_bids.reserve(bids_array.shape[0])
+        cpp_asks.reserve(asks_array.shape[0])
+        for i in range(bids_array.shape[0]):
+            update_id = <int64_t>bids_array[i, 2]
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], update_id))
+            last_update_id = max(last_update_id, update_id)
+        for i in range(asks_array.shape[0]):
+            update_id = <int64_t>asks_array[i, 2]
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], update_id))
+            last_update_id = max(last_update_id, update_id)
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
     def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
@@ -253,13 +610,19 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            int64_t update_id
+            Py_ssize_t i
+
+        cpp_bids.reserve(bids_array.shape[0])
+        cpp_asks.reserve(asks_array.shape[0])
+        for i in range(bids_array.shape[0]):
+            update_id = <int64_t>bids_array[i, 2]
+            cpp_bids.push_back(OrderBookEntry(bids_array[i, 0], bids_array[i, 1], update_id))
+            last_update_id = max(last_update_id, update_id)
+        for i in range(asks_array.shape[0]):
+            update_id = <int64_t>asks_array[i, 2]
+            cpp_asks.push_back(OrderBookEntry(asks_array[i, 0], asks_array[i, 1], update_id))
+            last_update_id = max(last_update_id, update_id)
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
@@ -322,19 +685,38 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            OrderBookEntry entry
+            vector[double] *prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+            vector[double] *base = ref(self._ask_index_base) if is_buy else ref(self._bid_index_base)
+            size_t i
+
+        if self._depth_index_enabled:
+            self.c_refresh_depth_index()
+            i = _count_before(deref(base), volume, False)
+            if i < deref(base).size():
+                return OrderBookQueryResult(NaN, volume, deref(prices)[i], volume)
+            return OrderBookQueryResult(NaN, volume, NaN, min(_last_or_zero(deref(base)), volume))
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                cumulative_volume += entry.getAmount()
                 if cumulative_volume >= volume:
-                    result_price = order_book_row.price
+                    result_price = entry.getPrice()
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                cumulative_volume += entry.getAmount()
                 if cumulative_volume >= volume:
-                    result_price = order_book_row.price
+                    result_price = entry.getPrice()
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
@@ -343,30 +725,52 @@ cdef class OrderBook(PubSub):
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            OrderBookEntry entry
+            vector[double] *prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+            vector[double] *base = ref(self._ask_index_base) if is_buy else ref(self._bid_index_base)
+            vector[double] *quote = ref(self._ask_index_quote) if is_buy else ref(self._bid_index_quote)
+            size_t i
+
+        if self._depth_index_enabled:
+            self.c_refresh_depth_index()
+            i = _count_before(deref(base), volume, False)
+            if i < deref(base).size():
+                if i > 0:
+                    total_cost = deref(quote)[i - 1]
+                    total_volume = deref(base)[i - 1]
+                total_cost += (volume - total_volume) * deref(prices)[i]
+                total_volume = volume
+                result_vwap = total_cost / total_volume
+            else:
+                total_volume = _last_or_zero(deref(base))
+            return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
         if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                if total_volume + entry.getAmount() >= volume:
+                    total_cost += (volume - total_volume) * entry.getPrice()
+                    total_volume = volume
                     result_vwap = total_cost / total_volume
                     break
+                total_cost += entry.getAmount() * entry.getPrice()
+                total_volume += entry.getAmount()
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                if total_volume + entry.getAmount() >= volume:
+                    total_cost += (volume - total_volume) * entry.getPrice()
+                    total_volume = volume
                     result_vwap = total_cost / total_volume
                     break
+                total_cost += entry.getAmount() * entry.getPrice()
+                total_volume += entry.getAmount()
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
@@ -374,19 +778,38 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            OrderBookEntry entry
+            vector[double] *prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+            vector[double] *quote = ref(self._ask_index_quote) if is_buy else ref(self._bid_index_quote)
+            size_t i
+
+        if self._depth_index_enabled:
+            self.c_refresh_depth_index()
+            i = _count_before(deref(quote), quote_volume, False)
+            if i < deref(quote).size():
+                return OrderBookQueryResult(NaN, quote_volume, deref(prices)[i], quote_volume)
+            return OrderBookQueryResult(NaN, quote_volume, NaN, min(_last_or_zero(deref(quote)), quote_volume))
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                cumulative_volume += entry.getAmount() * entry.getPrice()
                 if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+                    result_price = entry.getPrice()
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                cumulative_volume += entry.getAmount() * entry.getPrice()
                 if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+                    result_price = entry.getPrice()
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
@@ -395,25 +818,50 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            OrderBookEntry entry
+            vector[double] *prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+            vector[double] *base = ref(self._ask_index_base) if is_buy else ref(self._bid_index_base)
+            vector[double] *quote = ref(self._ask_index_quote) if is_buy else ref(self._bid_index_quote)
+            size_t i
+
+        if self._depth_index_enabled:
+            self.c_refresh_depth_index()
+            i = _count_before(deref(base), base_amount, False)
+            if i < deref(base).size():
+                if i > 0:
+                    cumulative_volume = deref(quote)[i - 1]
+                    cumulative_base_amount = deref(base)[i - 1]
+                cumulative_volume += (base_amount - cumulative_base_amount) * deref(prices)[i]
+            else:
+                cumulative_volume = _last_or_zero(deref(quote))
+            return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                row_amount = entry.getAmount()
                 if row_amount + cumulative_base_amount >= base_amount:
                     row_amount = base_amount - cumulative_base_amount
                 cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
+                cumulative_volume += row_amount * entry.getPrice()
                 if cumulative_base_amount >= base_amount:
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                row_amount = entry.getAmount()
                 if row_amount + cumulative_base_amount >= base_amount:
                     row_amount = base_amount - cumulative_base_amount
                 cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
+                cumulative_volume += row_amount * entry.getPrice()
                 if cumulative_base_amount >= base_amount:
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
@@ -421,19 +869,39 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            OrderBookEntry entry
+            vector[double] *prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+            vector[double] *base = ref(self._ask_index_base) if is_buy else ref(self._bid_index_base)
+            size_t i
+
+        if self._depth_index_enabled:
+            self.c_refresh_depth_index()
+            i = _count_through(deref(prices), price, not is_buy)
+            if i > 0:
+                cumulative_volume = deref(base)[i - 1]
+                result_price = deref(prices)[i - 1]
+            return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                if entry.getPrice() > price:
                     break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+                cumulative_volume += entry.getAmount()
+                result_price = entry.getPrice()
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                if entry.getPrice() < price:
                     break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+                cumulative_volume += entry.getAmount()
+                result_price = entry.getPrice()
+                inc(bid_it)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -441,22 +909,133 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            OrderBookEntry entry
+            vector[double] *prices = ref(self._ask_index_prices) if is_buy else ref(self._bid_index_prices)
+            vector[double] *quote = ref(self._ask_index_quote) if is_buy else ref(self._bid_index_quote)
+            size_t i
+
+        if self._depth_index_enabled:
+            self.c_refresh_depth_index()
+            i = _count_through(deref(prices), price, not is_buy)
+            if i > 0:
+                cumulative_volume = deref(quote)[i - 1]
+                result_price = deref(prices)[i - 1]
+            return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
         if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                entry = deref(ask_it)
+                if entry.getPrice() > price:
                     break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+                cumulative_volume += entry.getAmount() * entry.getPrice()
+                result_price = entry.getPrice()
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                entry = deref(bid_it)
+                if entry.getPrice() < price:
                     break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+                cumulative_volume += entry.getAmount() * entry.getPrice()
+                result_price = entry.getPrice()
+                inc(bid_it)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
+    cdef c_fill_for_volumes(self,
+                            bint is_buy,
+                            bint vwap,
+                            np.ndarray[np.float64_t, ndim=1] volumes,
+                            np.ndarray[np.int64_t, ndim=1] order,
+                            np.ndarray[np.float64_t, ndim=1] result):
+        """
+        Walks one side of the book once, answering every volume in `volumes` in ascending order (given by `order`).
+        Writes either the marginal price or the VWAP reached for each volume into `result`; unfilled volumes stay NaN.
+        """
+        cdef:
+            Py_ssize_t n = volumes.shape[0]
+            Py_ssize_t i = 0
+            Py_ssize_t idx
+            double total_cost = 0
+            double total_volume = 0
+            double volume
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
+
+        while i < n:
+            if is_buy:
+                if ask_it == self._ask_book.end():
+                    break
+                entry = deref(ask_it)
+                inc(ask_it)
+            else:
+                if bid_it == self._bid_book.rend():
+                    break
+                entry = deref(bid_it)
+                inc(bid_it)
+            while i < n:
+                idx = order[i]
+                volume = volumes[idx]
+                if isnan(volume):
+                    # NaN volumes sort last and, as in the scalar query, are never filled.
+                    return
+                if total_volume + entry.getAmount() < volume:
+                    break
+                if not vwap:
+                    result[idx] = entry.getPrice()
+                else:
+                    result[idx] = (total_cost + (volume - total_volume) * entry.getPrice()) / volume
+                i += 1
+            total_cost += entry.getAmount() * entry.getPrice()
+            total_volume += entry.getAmount()
+
+    cdef c_fill_volumes_for_prices(self,
+                                   bint is_buy,
+                                   np.ndarray[np.float64_t, ndim=1] prices,
+                                   np.ndarray[np.int64_t, ndim=1] order,
+                                   np.ndarray[np.float64_t, ndim=1] result):
+        """
+        Walks one side of the book once, writing into `result` the cumulative base volume available at or better than
+        each price in `prices`. `order` must sort the prices from the best to the worst for the side being walked.
+        """
+        cdef:
+            Py_ssize_t n = prices.shape[0]
+            Py_ssize_t i = 0
+            Py_ssize_t idx
+            double cumulative_volume = 0
+            double price
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            OrderBookEntry entry
+
+        while i < n:
+            if is_buy:
+                if ask_it == self._ask_book.end():
+                    break
+                entry = deref(ask_it)
+                inc(ask_it)
+            else:
+                if bid_it == self._bid_book.rend():
+                    break
+                entry = deref(bid_it)
+                inc(bid_it)
+            while i < n:
+                idx = order[i]
+                price = prices[idx]
+                # NaN prices sort last and, as in the scalar query, are answered with the whole side.
+                if isnan(price) or (is_buy and entry.getPrice() <= price) or (not is_buy and entry.getPrice() >= price):
+                    break
+                result[idx] = cumulative_volume
+                i += 1
+            cumulative_volume += entry.getAmount()
+        while i < n:
+            result[order[i]] = cumulative_volume
+            i += 1
+
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
 
@@ -475,9 +1054,49 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    def get_prices_for_volumes(self, is_buy: bool, volumes: np.ndarray) -> np.ndarray:
+        """
+        Batched form of `get_price_for_volume`. Answers every volume with a single walk of one side of the book.
+
+        :param is_buy: True to walk the asks, False to walk the bids
+        :param volumes: the base volumes to query, in any order
+        :return: the price reached for each volume (NaN where the book is not deep enough)
+        """
+        query = np.ascontiguousarray(volumes, dtype=np.float64)
+        result = np.full(query.shape[0], NaN, dtype=np.float64)
+        self.c_fill_for_volumes(is_buy, False, query, np.argsort(query, kind="stable").astype(np.int64), result)
+        return result
+
+    def get_vwaps_for_volumes(self, is_buy: bool, volumes: np.ndarray) -> np.ndarray:
+        """
+        Batched form of `get_vwap_for_volume`. Answers every volume with a single walk of one side of the book.
+
+        :param is_buy: True to walk the asks, False to walk the bids
+        :param volumes: the base volumes to query, in any order
+        :return: the VWAP for each volume (NaN where the book is not deep enough)
+        """
+        query = np.ascontiguousarray(volumes, dtype=np.float64)
+        result = np.full(query.shape[0], NaN, dtype=np.float64)
+        self.c_fill_for_volumes(is_buy, True, query, np.argsort(query, kind="stable").astype(np.int64), result)
+        return result
+
+    def get_volumes_for_prices(self, is_buy: bool, prices: np.ndarray) -> np.ndarray:
+        """
+        Batched form of `get_volume_for_price`. Answers every price with a single walk of one side of the book.
+
+        :param is_buy: True to walk the asks, False to walk the bids
+        :param prices: the limit prices to query, in any order
+        :return: the cumulative base volume available at or better than each price
+        """
+        query = np.ascontiguousarray(prices, dtype=np.float64)
+        result = np.zeros(query.shape[0], dtype=np.float64)
+        order = np.argsort(query if is_buy else -query, kind="stable").astype(np.int64)
+        self.c_fill_volumes_for_prices(is_buy, query, order, result)
+        return result
+
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_message(diff)
@@ -1,6 +1,6 @@
 from collections import namedtuple
 from enum import Enum
-from functools import total_ordering
+from functools import cached_property, total_ordering
 from typing import Dict, List, Optional
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
@@ -52,18 +52,27 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     def trading_pair(self) -> str:
         return self.content["trading_pair"]
 
-    @property
+    @cached_property
     def asks(self) -> List[OrderBookRow]:
         return [
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["asks"]
         ]
 
-    @property
+    @cached_property
     def bids(self) -> List[OrderBookRow]:
         return [
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @property
+    def has_raw_levels(self) -> bool:
+        """
+        True when bids and asks are the [price, amount, ...] lists in content, parsed with the message update id. The
+        lists can then be handed to OrderBook.apply_raw_diffs directly. Subclasses overriding bids or asks opt out.
+        """
+        message_class = type(self)
+        return message_class.bids is OrderBookMessage.bids and message_class.asks is OrderBookMessage.asks
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
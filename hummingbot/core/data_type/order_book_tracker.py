@@ -102,6 +102,12 @@ class OrderBookPairMetrics:
     trades_processed: int = 0
     trades_rejected: int = 0
 
+    # Diff coalescing, see OrderBookTracker.DIFF_COALESCING_MIN_BACKLOG
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    diffs_coalesced: int = 0
+    coalesced_batches: int = 0
+
     # Timestamps (perf_counter for internal timing)
     last_diff_timestamp: float = 0.0
     last_snapshot_timestamp: float = 0.0
@@ -130,6 +136,11 @@ class OrderBookPairMetrics:
             "total": diffs_per_min + snapshots_per_min + trades_per_min,
         }
 
+    @property
+    def coalescing_ratio(self) -> float:
+        """Average number of diff messages merged into each coalesced diff, 0 when nothing was coalesced."""
+        return self.diffs_coalesced / self.coalesced_batches if self.coalesced_batches > 0 else 0.0
+
     def to_dict(self, current_time: float) -> Dict:
         """Convert to dictionary for serialization."""
         return {
@@ -139,6 +150,11 @@ class OrderBookPairMetrics:
             "snapshots_processed": self.snapshots_processed,
             "trades_processed": self.trades_processed,
             "trades_rejected": self.trades_rejected,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "diffs_coalesced": self.diffs_coalesced,
+            "coalesced_batches": self.coalesced_batches,
+            "coalescing_ratio": self.coalescing_ratio,
             "last_diff_timestamp": self.last_diff_timestamp,
             "last_snapshot_timestamp": self.last_snapshot_timestamp,
             "last_trade_timestamp": self.last_trade_timestamp,
@@ -162,6 +178,8 @@ class OrderBookTrackerMetrics:
     total_snapshots_rejected: int = 0
     total_trades_processed: int = 0
     total_trades_rejected: int = 0
+    total_diffs_coalesced: int = 0
+    total_coalesced_batches: int = 0
 
     # Timing
     tracker_start_time: float = 0.0
@@ -204,6 +222,16 @@ class OrderBookTrackerMetrics:
             "total": diffs_per_min + snapshots_per_min + trades_per_min,
         }
 
+    @property
+    def coalescing_ratio(self) -> float:
+        """Average number of diff messages merged into each coalesced diff, across all pairs."""
+        return self.total_diffs_coalesced / self.total_coalesced_batches if self.total_coalesced_batches > 0 else 0.0
+
+    @property
+    def total_queue_depth(self) -> int:
+        """Messages waiting in the tracking queues of all pairs, as last observed by each tracking task."""
+        return sum(metrics.queue_depth for metrics in self.per_pair_metrics.values())
+
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
         current_time = time.perf_counter()
@@ -215,6 +243,10 @@ class OrderBookTrackerMetrics:
             "total_snapshots_rejected": self.total_snapshots_rejected,
             "total_trades_processed": self.total_trades_processed,
             "total_trades_rejected": self.total_trades_rejected,
+            "total_diffs_coalesced": self.total_diffs_coalesced,
+            "total_coalesced_batches": self.total_coalesced_batches,
+            "coalescing_ratio": self.coalescing_ratio,
+            "total_queue_depth": self.total_queue_depth,
             "tracker_start_time": self.tracker_start_time,
             "uptime_seconds": current_time - self.tracker_start_time if self.tracker_start_time > 0 else 0,
             "messages_per_minute": self.messages_per_minute(current_time),
@@ -230,6 +262,9 @@ class OrderBookTrackerMetrics:
 
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # When a diff is taken from a tracking queue with at least this many messages still waiting behind it, all the
+    # queued diffs are merged into one net diff and applied at once. None disables coalescing.
+    DIFF_COALESCING_MIN_BACKLOG: Optional[int] = 1
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -636,23 +671,55 @@ class OrderBookTracker:
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
         order_book: OrderBook = self._order_books[trading_pair]
+        pair_metrics: OrderBookPairMetrics = self._metrics.get_or_create_pair_metrics(trading_pair)
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        pending_message: Optional[OrderBookMessage] = None
 
         while True:
             try:
                 saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+                from_queue: bool = False
 
                 # Process saved messages first if there are any
                 if len(saved_messages) > 0:
                     message = saved_messages.popleft()
+                elif pending_message is not None:
+                    message, pending_message = pending_message, None
                 else:
                     message = await message_queue.get()
+                    from_queue = True
+
+                queue_depth: int = message_queue.qsize()
+                pair_metrics.queue_depth = queue_depth
+                if queue_depth > pair_metrics.max_queue_depth:
+                    pair_metrics.max_queue_depth = queue_depth
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    if (from_queue
+                            and self.DIFF_COALESCING_MIN_BACKLOG is not None
+                            and queue_depth >= self.DIFF_COALESCING_MIN_BACKLOG):
+                        diffs: List[OrderBookMessage] = [message]
+                        while not message_queue.empty():
+                            queued_message: OrderBookMessage = message_queue.get_nowait()
+                            if queued_message.type is not OrderBookMessageType.DIFF:
+                                # Keep the stream order, the snapshot is handled after the diffs received before it.
+                                pending_message = queued_message
+                                break
+                            diffs.append(queued_message)
+                        self._apply_coalesced_diffs(order_book, diffs)
+                        past_diffs_window.extend(diffs)
+                        diff_messages_accepted += len(diffs)
+                        if len(diffs) > 1:
+                            pair_metrics.diffs_coalesced += len(diffs)
+                            pair_metrics.coalesced_batches += 1
+                            self._metrics.total_diffs_coalesced += len(diffs)
+                            self._metrics.total_coalesced_batches += 1
+                        pair_metrics.queue_depth = message_queue.qsize()
+                    else:
+                        order_book.apply_diff_message(message)
+                        past_diffs_window.append(message)
+                        diff_messages_accepted += 1
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -673,6 +740,31 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    @staticmethod
+    def _apply_coalesced_diffs(order_book: OrderBook, diffs: List[OrderBookMessage]):
+        """
+        Merges consecutive diff messages into one net diff of (price, amount) levels, where the last update for each
+        price level wins, and applies it to the order book in a single call through the raw levels path. The merged
+        levels take the update id of the last message.
+        """
+        if len(diffs) == 1:
+            order_book.apply_diff_message(diffs[0])
+            return
+        bids: Dict[float, float] = {}
+        asks: Dict[float, float] = {}
+        for diff in diffs:
+            if diff.has_raw_levels:
+                for price, amount, *trash in diff.content["bids"]:
+                    bids[float(price)] = float(amount)
+                for price, amount, *trash in diff.content["asks"]:
+                    asks[float(price)] = float(amount)
+            else:
+                for row in diff.bids:
+                    bids[row.price] = row.amount
+                for row in diff.asks:
+                    asks[row.price] = row.amount
+        order_book.apply_raw_diffs(list(bids.items()), list(asks.items()), diffs[-1].update_id)
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -694,15 +786,7 @@ class OrderBookTracker:
                     continue
 
                 order_book: OrderBook = self._order_books[trading_pair]
-                order_book.apply_trade(OrderBookTradeEvent(
-                    trading_pair=trade_message.trading_pair,
-                    timestamp=trade_message.timestamp,
-                    price=float(trade_message.content["price"]),
-                    amount=float(trade_message.content["amount"]),
-                    trade_id=trade_message.trade_id,
-                    type=TradeType.SELL if
-                    trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
-                ))
+                order_book.apply_trade(self._trade_event(trade_message))
 
                 messages_accepted += 1
 
@@ -737,6 +821,18 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    @staticmethod
+    def _trade_event(trade_message: OrderBookMessage) -> OrderBookTradeEvent:
+        return OrderBookTradeEvent(
+            trading_pair=trade_message.trading_pair,
+            timestamp=trade_message.timestamp,
+            price=float(trade_message.content["price"]),
+            amount=float(trade_message.content["amount"]),
+            trade_id=trade_message.trade_id,
+            type=TradeType.SELL if
+            trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+        )
+
     @staticmethod
     async def _sleep(delay: float):
         await asyncio.sleep(delay=delay)
@@ -0,0 +1,175 @@
+import asyncio
+import gzip
+import json
+import math
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+def _open_recording(path: str, mode: str) -> IO:
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def save_order_book_messages(path: str, messages: Iterable[OrderBookMessage]):
+    """
+    Writes order book messages to a recording file, one JSON object per line. Paths ending with .gz are compressed.
+    """
+    with _open_recording(path, "w") as recording:
+        for message in messages:
+            recording.write(json.dumps({"type": message.type.name,
+                                        "timestamp": message.timestamp,
+                                        "content": message.content}))
+            recording.write("\n")
+
+
+def load_order_book_messages(path: str) -> Iterator[OrderBookMessage]:
+    """
+    Reads the order book messages of a recording file written by save_order_book_messages.
+    """
+    with _open_recording(path, "r") as recording:
+        for line in recording:
+            if line.strip() == "":
+                continue
+            message: Dict[str, Any] = json.loads(line)
+            yield OrderBookMessage(OrderBookMessageType[message["type"]], message["content"], message["timestamp"])
+
+
+def order_book_messages_from_chunks(directory: str,
+                                    exchange: str,
+                                    trading_pair: str,
+                                    start: Optional[float] = None,
+                                    end: Optional[float] = None) -> Iterator[OrderBookMessage]:
+    """
+    Builds snapshot messages from the market data chunks recorded by MarketsRecorder.
+    """
+    from hummingbot.model.market_data_chunk_store import MarketDataChunkReader
+
+    data = MarketDataChunkReader(directory).read(exchange, trading_pair, start, end)
+    for row, timestamp in enumerate(data["timestamp"]):
+        bids = [[price, amount] for price, amount in zip(data["bid_price"][row], data["bid_amount"][row])
+                if not math.isnan(price)]
+        asks = [[price, amount] for price, amount in zip(data["ask_price"][row], data["ask_amount"][row])
+                if not math.isnan(price)]
+        yield OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": int(timestamp * 1e3),
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=float(timestamp))
+
+
+class ReplayOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    """
+    Order book data source replaying recorded snapshot, diff and trade messages instead of connecting to an exchange.
+
+    With an OrderBookTracker, listen_for_subscriptions streams the messages in time order, waiting between them so
+    the recording plays at replay_speed times the recorded pace. Backtests use ReplayOrderBookTracker instead, which
+    takes the messages with pop_messages as the clock goes, without any waiting.
+    """
+
+    def __init__(self,
+                 trading_pairs: List[str],
+                 messages: Iterable[OrderBookMessage],
+                 replay_speed: float = 1.0):
+        """
+        :param trading_pairs: Trading pairs to replay, the messages of any other pair are skipped
+        :param messages: Recorded messages. Messages with the same timestamp keep their recorded order.
+        :param replay_speed: Pace of the streamed replay, relative to the recorded pace
+        """
+        super().__init__(trading_pairs)
+        self._messages: List[OrderBookMessage] = sorted(
+            (message for message in messages if message.trading_pair in trading_pairs),
+            key=lambda message: message.timestamp)
+        self._replay_speed: float = replay_speed
+        self._next_message_index: int = 0
+        self._snapshots: Dict[str, OrderBookMessage] = {}
+        self._last_traded_prices: Dict[str, float] = {}
+
+    @property
+    def start_timestamp(self) -> float:
+        return self._messages[0].timestamp if len(self._messages) > 0 else math.nan
+
+    @property
+    def end_timestamp(self) -> float:
+        return self._messages[-1].timestamp if len(self._messages) > 0 else math.nan
+
+    @property
+    def is_exhausted(self) -> bool:
+        return self._next_message_index >= len(self._messages)
+
+    def pop_messages(self, timestamp: float) -> List[OrderBookMessage]:
+        """
+        Replays the messages recorded up to the timestamp, included.
+        :return: The messages in time order
+        """
+        first_index = self._next_message_index
+        while self._next_message_index < len(self._messages) \
+                and self._messages[self._next_message_index].timestamp <= timestamp:
+            self._replayed(self._messages[self._next_message_index])
+            self._next_message_index += 1
+        return self._messages[first_index:self._next_message_index]
+
+    def snapshot_message(self, trading_pair: str) -> OrderBookMessage:
+        """
+        :return: The last replayed snapshot of the trading pair, or its first recorded snapshot if none was replayed
+        """
+        snapshot = self._snapshots.get(trading_pair)
+        if snapshot is None:
+            snapshot = next((message for message in self._messages
+                             if message.type is OrderBookMessageType.SNAPSHOT and message.trading_pair == trading_pair),
+                            None)
+        if snapshot is None:
+            raise ValueError(f"The recording has no order book snapshot for {trading_pair}.")
+        return snapshot
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {trading_pair: self._last_traded_prices[trading_pair]
+                for trading_pair in trading_pairs
+                if trading_pair in self._last_traded_prices}
+
+    async def listen_for_subscriptions(self):
+        previous_timestamp: Optional[float] = None
+        while not self.is_exhausted:
+            message = self._messages[self._next_message_index]
+            if previous_timestamp is not None:
+                await self._sleep((message.timestamp - previous_timestamp) / self._replay_speed)
+            previous_timestamp = message.timestamp
+            self._replayed(message)
+            self._next_message_index += 1
+            self._message_queue[self._queue_key(message)].put_nowait(message)
+        self.logger().info("Order book replay finished.")
+
+    async def subscribe_to_trading_pair(self, trading_pair: str) -> bool:
+        return trading_pair in self._trading_pairs
+
+    async def unsubscribe_from_trading_pair(self, trading_pair: str) -> bool:
+        return trading_pair in self._trading_pairs
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        return self.snapshot_message(trading_pair)
+
+    async def _parse_trade_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_diff_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_snapshot_message(self, raw_message: OrderBookMessage, message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    def _queue_key(self, message: OrderBookMessage) -> str:
+        if message.type is OrderBookMessageType.SNAPSHOT:
+            return self._snapshot_messages_queue_key
+        if message.type is OrderBookMessageType.DIFF:
+            return self._diff_messages_queue_key
+        return self._trade_messages_queue_key
+
+    def _replayed(self, message: OrderBookMessage):
+        if message.type is OrderBookMessageType.SNAPSHOT:
+            self._snapshots[message.trading_pair] = message
+        elif message.type is OrderBookMessageType.TRADE:
+            self._last_traded_prices[message.trading_pair] = float(message.content["price"])
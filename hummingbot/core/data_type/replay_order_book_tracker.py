@@ -0,0 +1,85 @@
+from typing import List
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.replay_order_book_data_source import ReplayOrderBookTrackerDataSource
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+
+class ReplayOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker replaying a recording in a backtest clock, as fast as the clock ticks.
+
+    No tracking task is started. The order books are created from the recorded snapshots on start, and advance_to
+    applies the recorded messages up to a timestamp in their recorded order, so a replay is deterministic. Trade
+    messages are applied to the books as trade events, which fill the PaperTradeExchange limit orders they cross.
+
+    (i.e)
+        data_source = ReplayOrderBookTrackerDataSource(["BTC-USDT"], load_order_book_messages("btc_usdt.jsonl.gz"))
+        tracker = ReplayOrderBookTracker(data_source, ["BTC-USDT"])
+        exchange = PaperTradeExchange(tracker, BinanceExchange, exchange_name="binance")
+        clock = Clock(ClockMode.BACKTEST, 1.0, data_source.start_timestamp, data_source.end_timestamp)
+        clock.add_iterator(OrderBookReplayIterator(tracker))  # Ahead of the exchange and the strategy
+        clock.add_iterator(exchange)
+        clock.add_iterator(strategy)
+        clock.backtest()
+    """
+
+    def __init__(self, data_source: ReplayOrderBookTrackerDataSource, trading_pairs: List[str]):
+        super().__init__(data_source=data_source, trading_pairs=trading_pairs)
+
+    @property
+    def data_source(self) -> ReplayOrderBookTrackerDataSource:
+        return self._data_source
+
+    def start(self):
+        if self.ready:
+            return
+        for trading_pair in self._trading_pairs:
+            order_book = self._data_source.order_book_create_function()
+            order_book.apply_snapshot_message(self._data_source.snapshot_message(trading_pair))
+            self._order_books[trading_pair] = order_book
+        self._order_books_initialized.set()
+
+    def stop(self):
+        # The books are kept for the strategy reports once the backtest is over
+        pass
+
+    def advance_to(self, timestamp: float) -> int:
+        """
+        Applies the recorded messages up to the timestamp, included.
+        :return: The number of messages applied
+        """
+        messages = self._data_source.pop_messages(timestamp)
+        for message in messages:
+            order_book = self._order_books[message.trading_pair]
+            if message.type is OrderBookMessageType.DIFF:
+                order_book.apply_diff_message(message)
+            elif message.type is OrderBookMessageType.SNAPSHOT:
+                order_book.apply_snapshot_message(message)
+            else:
+                order_book.apply_trade(self._trade_event(message))
+        return len(messages)
+
+
+class OrderBookReplayIterator(PyTimeIterator):
+    """
+    Clock iterator advancing a ReplayOrderBookTracker on each tick. It has to be added to the clock ahead of the
+    iterators reading the order books. Once the recording is over, the next tick ends the backtest.
+    """
+
+    def __init__(self, tracker: ReplayOrderBookTracker, stop_at_end: bool = True):
+        super().__init__()
+        self._tracker: ReplayOrderBookTracker = tracker
+        self._stop_at_end: bool = stop_at_end
+        self._messages_replayed: int = 0
+
+    @property
+    def messages_replayed(self) -> int:
+        return self._messages_replayed
+
+    def tick(self, timestamp: float):
+        if self._stop_at_end and self._tracker.ready and self._tracker.data_source.is_exhausted:
+            raise StopIteration
+        self._tracker.start()
+        self._messages_replayed += self._tracker.advance_to(timestamp)
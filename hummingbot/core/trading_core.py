@@ -29,6 +29,7 @@ from hummingbot.exceptions import InvalidScriptModule
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_performance import TradePerformance
 from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.strategy_base import StrategyBase
@@ -353,7 +354,8 @@ class TradingCore:
             list(self.connector_manager.connectors.values()),
             self._strategy_file_name or db_name,
             self.strategy_name or db_name,
-            self.client_config_map.market_data_collection
+            self.client_config_map.market_data_collection,
+            write_behind=True,
         )
 
         self.markets_recorder.start()
@@ -721,35 +723,76 @@ class TradingCore:
         if any(not market.ready for market in self.connector_manager.connectors.values()):
             return s_decimal_0
 
-        start_time = self.init_time
+        perf_metrics = await self.performance_metrics_since(self.init_time, self.strategy_file_name)
+        returns_pct = [perf.return_pct for perf in perf_metrics.values()]
+        return sum(returns_pct) / len(returns_pct) if len(returns_pct) > 0 else s_decimal_0
 
+    async def performance_metrics_since(self,
+                                        start_time: float,
+                                        config_file_path: Optional[str] = None
+                                        ) -> Dict[Tuple[str, str], PerformanceMetrics]:
+        """
+        Calculates performance metrics by connector and trading pair for the trades recorded since start_time, from the
+        hourly trade totals kept by the markets recorder. Only the trades of derivative markets are loaded, since their
+        PnL pairs the open and close position orders.
+        """
+        if self.markets_recorder is not None:
+            # The trade totals of the fills still queued by the recorder are not committed yet.
+            await asyncio.get_running_loop().run_in_executor(None, self.markets_recorder.flush_writes)
+        start_timestamp = int(start_time * 1e3)
+        derivative_trades: Dict[Tuple[str, str], List[TradeFill]] = {}
         with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            perf_metrics = await self.calculate_performance_metrics_by_connector_pair(trades)
-            returns_pct = [perf.return_pct for perf in perf_metrics]
-            return sum(returns_pct) / len(returns_pct) if len(returns_pct) > 0 else s_decimal_0
+            aggregates = TradePerformance.get_aggregates(session, start_timestamp, config_file_path)
+            for market, symbol in (market_info for market_info, aggregate in aggregates.items()
+                                   if aggregate.is_derivative):
+                derivative_trades[(market, symbol)] = self._get_market_trades_from_session(
+                    start_timestamp, session, market, symbol, config_file_path
+                )
+        balances = await self._get_current_balances_by_market(set(market for market, _ in aggregates))
+        performance_metrics: Dict[Tuple[str, str], PerformanceMetrics] = {}
+        for (market, symbol), aggregate in aggregates.items():
+            if (market, symbol) in derivative_trades:
+                perf = await PerformanceMetrics.create(symbol, derivative_trades[(market, symbol)], balances[market])
+            else:
+                perf = await PerformanceMetrics.create_from_aggregate(symbol, aggregate, balances[market])
+            performance_metrics[(market, symbol)] = perf
+        return performance_metrics
 
     async def calculate_performance_metrics_by_connector_pair(self, trades: List[TradeFill]) -> List[PerformanceMetrics]:
         """
         Calculates performance metrics by connector and trading pair using the provided trades and the PerformanceMetrics class.
         """
         market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        balances = await self._get_current_balances_by_market(set(market for market, _ in market_info))
         performance_metrics: List[PerformanceMetrics] = []
         for market, symbol in market_info:
             cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
-            network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
-            try:
-                cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
-            except asyncio.TimeoutError:
-                self.logger().warning("\nA network error prevented the balances retrieval to complete. See logs for more details.")
-                raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            perf = await PerformanceMetrics.create(symbol, cur_trades, balances[market])
             performance_metrics.append(perf)
         return performance_metrics
 
+    async def _get_current_balances_by_market(self, markets: Set[str]) -> Dict[str, Dict[str, Decimal]]:
+        markets = list(markets)
+        network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
+        try:
+            balances = await asyncio.gather(*[asyncio.wait_for(self.get_current_balances(market), network_timeout)
+                                              for market in markets])
+        except asyncio.TimeoutError:
+            self.logger().warning("\nA network error prevented the balances retrieval to complete. See logs for more details.")
+            raise
+        return dict(zip(markets, balances))
+
+    @staticmethod
+    def _get_market_trades_from_session(start_timestamp: int,
+                                        session: Session,
+                                        market: str,
+                                        symbol: str,
+                                        config_file_path: Optional[str] = None) -> List[TradeFill]:
+        filters = [TradeFill.timestamp >= start_timestamp, TradeFill.market == market, TradeFill.symbol == symbol]
+        if config_file_path is not None:
+            filters.append(TradeFill.config_file_path.like(f"%{config_file_path}%"))
+        return session.query(TradeFill).filter(*filters).order_by(TradeFill.timestamp).all()
+
     @staticmethod
     def _get_trades_from_session(start_timestamp: int,
                                  session: Session,
@@ -0,0 +1,73 @@
+"""
+Import time profiling of a Hummingbot run, based on the report of the interpreter -X importtime option
+"""
+import signal
+import subprocess
+import sys
+from typing import Iterable, List, NamedTuple, TextIO
+
+PROFILE_IMPORTS_ARG = "--profile-imports"
+IMPORT_TIME_PREFIX = "import time:"
+
+
+class ImportTime(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_import_times(lines: Iterable[str]) -> List[ImportTime]:
+    """
+    Parses the lines written to stderr by -X importtime, skipping any other line.
+    """
+    import_times = []
+    for line in lines:
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        self_us, cumulative_us, module = line[len(IMPORT_TIME_PREFIX):].split("|", 2)
+        if not self_us.strip().isdigit():
+            # Header line
+            continue
+        module = module.rstrip()
+        name = module.lstrip()
+        # Nested imports are indented by two spaces per level
+        depth = (len(module) - len(name) - 1) // 2
+        import_times.append(ImportTime(name, int(self_us), int(cumulative_us), depth))
+    return import_times
+
+
+def format_import_report(import_times: List[ImportTime], top: int = 30) -> str:
+    total_us = sum(import_time.self_us for import_time in import_times)
+    lines = [f"Imported {len(import_times)} modules in {total_us / 1e6:.3f} s. Slowest by cumulative time:",
+             f"{'cumulative (ms)':>16}  {'self (ms)':>10}  module"]
+    for import_time in sorted(import_times, key=lambda i: i.cumulative_us, reverse=True)[:top]:
+        lines.append(f"{import_time.cumulative_us / 1e3:16.1f}  {import_time.self_us / 1e3:10.1f}  "
+                     f"{'  ' * import_time.depth}{import_time.module}")
+    return "\n".join(lines)
+
+
+def run_with_import_profile(argv: List[str], top: int = 30, output: TextIO = sys.stdout) -> int:
+    """
+    Runs the interpreter arguments in argv in a child interpreter with -X importtime, and prints the import report
+    once it exits. The other lines the child writes to stderr are passed through.
+    Interrupting the profiled run stops the child, which still gets its report.
+    :return: The exit code of the child
+    """
+    process = subprocess.Popen([sys.executable, "-X", "importtime", *argv], stderr=subprocess.PIPE, text=True)
+    # The child gets the terminal interrupts by itself, and a termination request is forwarded to it
+    previous_sigint = signal.signal(signal.SIGINT, signal.SIG_IGN)
+    previous_sigterm = signal.signal(signal.SIGTERM, lambda *_: process.terminate())
+    import_lines = []
+    try:
+        for line in process.stderr:
+            if line.startswith(IMPORT_TIME_PREFIX):
+                import_lines.append(line)
+            else:
+                sys.stderr.write(line)
+        returncode = process.wait()
+    finally:
+        signal.signal(signal.SIGINT, previous_sigint)
+        signal.signal(signal.SIGTERM, previous_sigterm)
+    print(format_import_report(parse_import_times(import_lines), top), file=output)
+    return returncode
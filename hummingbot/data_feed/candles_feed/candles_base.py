@@ -1,8 +1,7 @@
 import asyncio
 import os
 import time
-from collections import deque
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -15,13 +14,15 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_indicators import CandlesIndicator
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
 from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
+    The class uses the Rest and WS Assistants for all the IO operations, and a CandlesRingBuffer to store candles.
     Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
     be updated via websockets mainly.
     """
@@ -51,7 +52,10 @@ class CandlesBase(NetworkBase):
         async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self.max_records = max_records
-        self._candles = deque(maxlen=max_records)
+        self._candles = CandlesRingBuffer(maxlen=max_records, n_columns=len(self.columns))
+        self._candles_df_cache: Optional[pd.DataFrame] = None
+        self._candles_df_version: Optional[int] = None
+        self._indicators: Dict[str, CandlesIndicator] = {}
         self._listen_candles_task: Optional[asyncio.Task] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
@@ -91,7 +95,7 @@ class CandlesBase(NetworkBase):
     @property
     def ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -141,9 +145,36 @@ class CandlesBase(NetworkBase):
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles buffer as a Pandas DataFrame. The DataFrame is built
+        once per update of the candles, and every call returns a copy of it that the caller is free to modify.
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        if self._candles_df_version != self._candles.version or self._candles_df_cache is None:
+            self._candles_df_cache = pd.DataFrame(self._candles.values, columns=self.columns, dtype=float, copy=True)
+            self._candles_df_version = self._candles.version
+        return self._candles_df_cache.copy()
+
+    def add_indicator(self, indicator: CandlesIndicator) -> CandlesIndicator:
+        """
+        Registers an indicator kept up to date with the candles. If an indicator with the same name is already
+        registered, that one is returned instead, so the method can be called on every controller update.
+        :param indicator: the indicator to register
+        :return: the registered indicator, synced with the candles
+        """
+        indicator = self._indicators.setdefault(indicator.name, indicator)
+        indicator.sync(self._candles)
+        return indicator
+
+    def get_indicator(self, name: str) -> CandlesIndicator:
+        """
+        This method returns a registered indicator, synced with the candles.
+        :param name: the name of the indicator, which is the name of its first column
+        """
+        indicator = self._indicators[name]
+        indicator.sync(self._candles)
+        return indicator
+
+    def remove_indicator(self, name: str):
+        self._indicators.pop(name, None)
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -162,7 +193,12 @@ class CandlesBase(NetworkBase):
         self._candles.extendleft(df.values.tolist())
 
     async def get_historical_candles(self, config: HistoricalCandlesConfig):
-        candles_df = pd.DataFrame()
+        """
+        Fetches the candles of the time range in the config, paging backwards from the end time through the REST API.
+        The pages are kept as arrays and concatenated once at the end.
+        :return: The candles DataFrame, in time order
+        """
+        pages: List[np.ndarray] = []
         try:
             await self.initialize_exchange_data()
             current_end_time = self._round_timestamp_to_interval_multiple(config.end_time)
@@ -173,16 +209,17 @@ class CandlesBase(NetworkBase):
                                                    end_time=current_end_time,
                                                    limit=missing_records)
                 if len(candles) <= 1 or missing_records == 0:
-                    fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
-                    candles_df = pd.concat([fetched_candles_df, candles_df])
+                    pages.append(np.asarray(candles, dtype=float).reshape(-1, len(self.columns)))
                     break
                 candles = candles[candles[:, 0] <= current_end_time]
                 current_end_time = self.ensure_timestamp_in_seconds(candles[0][0])
-                fetched_candles_df = pd.DataFrame(candles, columns=self.columns)
-                candles_df = pd.concat([fetched_candles_df, candles_df])
-                candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
-                candles_df.reset_index(drop=True, inplace=True)
-                self.check_candles_sorted_and_equidistant(candles_df.values)
+                pages.append(candles)
+            # The pages overlap on their boundary candles, and were fetched from the most recent one
+            candles = np.concatenate(pages[::-1]) if len(pages) > 0 else np.empty((0, len(self.columns)))
+            _, unique_rows = np.unique(candles[:, 0], return_index=True)
+            candles = candles[unique_rows]
+            self.check_candles_sorted_and_equidistant(candles)
+            candles_df = pd.DataFrame(candles, columns=self.columns)
             candles_df = candles_df[(candles_df["timestamp"] <= config.end_time) & (candles_df["timestamp"] >= config.start_time)]
             return candles_df
         except ValueError as e:
@@ -214,6 +251,11 @@ class CandlesBase(NetworkBase):
     def _reset_candles(self):
         self._ws_candle_available.clear()
         self._candles.clear()
+        self._reset_indicators()
+
+    def _reset_indicators(self):
+        for indicator in self._indicators.values():
+            indicator.reset()
 
     def _rest_payload(self, **kwargs) -> Optional[dict]:
         return None
@@ -321,7 +363,7 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This method fills the historical candles in the _candles deque until it reaches the maximum length.
+        This method fills the historical candles in the _candles buffer until it reaches the maximum length.
         """
         while not self.ready:
             await self._ws_candle_available.wait()
@@ -341,7 +383,7 @@ class CandlesBase(NetworkBase):
                     "Unexpected error occurred when getting historical klines. Retrying in 1 seconds...",
                 )
                 await self._sleep(1.0)
-        self.check_candles_sorted_and_equidistant(np.array(self._candles))
+        self.check_candles_sorted_and_equidistant(self._candles.values)
 
     async def listen_for_subscriptions(self):
         """
@@ -472,6 +514,7 @@ class CandlesBase(NetworkBase):
     async def _on_order_stream_interruption(self, websocket_assistant: Optional[WSAssistant] = None):
         websocket_assistant and await websocket_assistant.disconnect()
         self._candles.clear()
+        self._reset_indicators()
 
     def get_seconds_from_interval(self, interval: str) -> int:
         """
@@ -0,0 +1,428 @@
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
+
+# Positions of the candle fields in CandlesBase.columns
+TIMESTAMP, OPEN, HIGH, LOW, CLOSE, VOLUME = range(6)
+EPSILON = np.finfo(float).eps
+
+
+class _AdjustedEWM:
+    """
+    Exponentially weighted mean of `Series.ewm(alpha=alpha, min_periods=min_periods).mean()`, the moving average
+    pandas-ta uses for RMA. Leading NaNs are skipped like pandas does.
+    """
+
+    def __init__(self, alpha: float, min_periods: int):
+        self._decay = 1 - alpha
+        self._min_periods = min_periods
+        self._weighted_sum = 0.0
+        self._weights = 0.0
+        self._count = 0
+
+    def peek(self, value: float) -> float:
+        if math.isnan(value):
+            return self._weighted_sum / self._weights if self._count >= self._min_periods else math.nan
+        weighted_sum = value + self._decay * self._weighted_sum
+        weights = 1 + self._decay * self._weights
+        return weighted_sum / weights if self._count + 1 >= self._min_periods else math.nan
+
+    def commit(self, value: float):
+        if math.isnan(value):
+            if self._count > 0:
+                self._weighted_sum *= self._decay
+                self._weights *= self._decay
+            return
+        self._weighted_sum = value + self._decay * self._weighted_sum
+        self._weights = 1 + self._decay * self._weights
+        self._count += 1
+
+
+class _EMA:
+    """
+    Exponential moving average of pandas-ta `ema`: seeded with the mean of the first `length` values, ignoring NaNs,
+    then `Series.ewm(span=length, adjust=False)`.
+    """
+
+    def __init__(self, length: int):
+        self._length = length
+        self._alpha = 2 / (length + 1)
+        self._count = 0
+        self._seed_sum = 0.0
+        self._seed_count = 0
+        self._ema = math.nan
+
+    def peek(self, value: float) -> float:
+        if self._count < self._length - 1:
+            return math.nan
+        if self._count == self._length - 1:
+            seed_sum = self._seed_sum + (0.0 if math.isnan(value) else value)
+            seed_count = self._seed_count + (not math.isnan(value))
+            return seed_sum / seed_count if seed_count > 0 else math.nan
+        if math.isnan(value):
+            return self._ema
+        return self._alpha * value + (1 - self._alpha) * self._ema
+
+    def commit(self, value: float):
+        ema = self.peek(value)
+        if self._count < self._length and not math.isnan(value):
+            self._seed_sum += value
+            self._seed_count += 1
+        self._count += 1
+        self._ema = ema
+
+
+class _RollingWindow:
+    """
+    Mean and variance of the last `length` values, like `Series.rolling(length).mean()` and `.var(ddof)`, kept with
+    Welford's updates and recomputed from the window every `length` values to bound the rounding errors.
+    """
+
+    def __init__(self, length: int, ddof: int):
+        self._length = length
+        self._ddof = ddof
+        self._window: Deque[float] = deque()
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._removed = 0
+
+    def peek(self, value: float) -> Tuple[float, float]:
+        """
+        :return: the mean and the variance of the window ending with value
+        """
+        if len(self._window) + 1 < self._length:
+            return math.nan, math.nan
+        count = len(self._window) + 1
+        delta = value - self._mean
+        mean = self._mean + delta / count
+        m2 = self._m2 + delta * (value - mean)
+        return mean, max(m2, 0.0) / (count - self._ddof)
+
+    def commit(self, value: float):
+        self._window.append(value)
+        count = len(self._window)
+        delta = value - self._mean
+        self._mean += delta / count
+        self._m2 += delta * (value - self._mean)
+        if count >= self._length:
+            removed = self._window.popleft()
+            count -= 1
+            delta = removed - self._mean
+            self._mean -= delta / count
+            self._m2 -= delta * (removed - self._mean)
+            self._removed += 1
+            if self._removed >= self._length:
+                window = np.fromiter(self._window, dtype=float, count=count)
+                self._mean = float(window.mean())
+                self._m2 = float(((window - self._mean) ** 2).sum())
+                self._removed = 0
+
+
+class CandlesIndicator(ABC):
+    """
+    Technical indicator updated candle by candle. The values of the closed candles are computed once and kept, and only
+    the value of the last candle, which is still updated by the feed, is recomputed, so keeping an indicator up to date
+    costs O(1) per candle instead of a recomputation over the whole candles window.
+
+    The values are aligned with the candles of the feed the indicator is synced with, and are NaN until enough candles
+    are available, with the column names and the formulas of the pandas-ta indicator of the same name (without TA-Lib).
+    When older candles are prepended or the candles are replaced, the values are recomputed from all the candles. When
+    the candles window slides, the moving averages keep the history of the candles dropped from the window, so they
+    differ from a recomputation over the window by a factor decaying exponentially with the window length.
+    """
+
+    def __init__(self):
+        self._values: Optional[CandlesRingBuffer] = None
+        self._first_timestamp: Optional[float] = None
+        self._last_timestamp: Optional[float] = None
+        self._candles_version: Optional[int] = None
+
+    @property
+    @abstractmethod
+    def columns(self) -> List[str]:
+        ...
+
+    @property
+    def name(self) -> str:
+        return self.columns[0]
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Read-only view of the values, one row per candle and one column per entry of `columns`.
+        """
+        if self._values is None:
+            return np.empty((0, len(self.columns)))
+        return self._values.values
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.values[:, self.columns.index(column)]
+
+    def latest(self) -> Dict[str, float]:
+        """
+        :return: the values of the last candle by column, NaN if there is no candle
+        """
+        values = self.values
+        if len(values) == 0:
+            return {column: math.nan for column in self.columns}
+        return dict(zip(self.columns, values[-1].tolist()))
+
+    def reset(self):
+        self._reset_state()
+        if self._values is not None:
+            self._values.clear()
+        self._first_timestamp = None
+        self._last_timestamp = None
+        self._candles_version = None
+
+    def sync(self, candles: CandlesRingBuffer):
+        """
+        Brings the values up to date with the candles, computing only the candles added or updated since the last sync.
+        """
+        if candles.version == self._candles_version:
+            return
+        self._candles_version = candles.version
+        rows = candles.values
+        if len(rows) == 0:
+            self.reset()
+            return
+        if self._values is None or self._values.maxlen != candles.maxlen:
+            self._values = CandlesRingBuffer(maxlen=candles.maxlen, n_columns=len(self.columns))
+            self._last_timestamp = None
+
+        last_index = self._index_of_last_timestamp(rows)
+        if last_index is None:
+            self._recompute(rows)
+            return
+        new_rows = rows[last_index + 1:]
+        self._values[-1] = self._peek(rows[last_index])
+        if len(new_rows) > 0:
+            self._commit(rows[last_index])
+            for row in new_rows[:-1]:
+                self._values.append(self._peek(row))
+                self._commit(row)
+            self._values.append(self._peek(new_rows[-1]))
+        self._first_timestamp = rows[0][TIMESTAMP]
+        self._last_timestamp = rows[-1][TIMESTAMP]
+
+    def _index_of_last_timestamp(self, rows: np.ndarray) -> Optional[int]:
+        """
+        :return: the index of the last synced candle if the values can be updated incrementally
+        """
+        if self._last_timestamp is None or rows[0][TIMESTAMP] < self._first_timestamp:
+            return None
+        timestamps = rows[:, TIMESTAMP]
+        index = int(np.searchsorted(timestamps, self._last_timestamp))
+        if index >= len(rows) or timestamps[index] != self._last_timestamp:
+            return None
+        new_candles = len(rows) - 1 - index
+        if min(self._values.maxlen, len(self._values) + new_candles) != len(rows):
+            return None
+        return index
+
+    def _recompute(self, rows: np.ndarray):
+        self._reset_state()
+        self._values.clear()
+        for row in rows[:-1]:
+            self._values.append(self._peek(row))
+            self._commit(row)
+        self._values.append(self._peek(rows[-1]))
+        self._first_timestamp = rows[0][TIMESTAMP]
+        self._last_timestamp = rows[-1][TIMESTAMP]
+
+    @abstractmethod
+    def _reset_state(self):
+        ...
+
+    @abstractmethod
+    def _peek(self, candle: np.ndarray) -> Sequence[float]:
+        """
+        :return: the values for the candle following the committed ones, without changing the state
+        """
+        ...
+
+    @abstractmethod
+    def _commit(self, candle: np.ndarray):
+        """
+        Adds a closed candle to the state.
+        """
+        ...
+
+
+class EMA(CandlesIndicator):
+    """
+    Exponential moving average of the close, like `ta.ema(close, length)`.
+    """
+
+    def __init__(self, length: int = 10):
+        self.length = length
+        super().__init__()
+        self._reset_state()
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"EMA_{self.length}"]
+
+    def _reset_state(self):
+        self._ema = _EMA(self.length)
+
+    def _peek(self, candle: np.ndarray) -> Sequence[float]:
+        return (self._ema.peek(candle[CLOSE]),)
+
+    def _commit(self, candle: np.ndarray):
+        self._ema.commit(candle[CLOSE])
+
+
+class RSI(CandlesIndicator):
+    """
+    Relative strength index of the close, like `ta.rsi(close, length)`, from the RMA of the gains and the losses.
+    """
+
+    def __init__(self, length: int = 14, scalar: float = 100):
+        self.length = length
+        self.scalar = scalar
+        super().__init__()
+        self._reset_state()
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"RSI_{self.length}"]
+
+    def _reset_state(self):
+        self._previous_close = math.nan
+        self._gains = _AdjustedEWM(alpha=1 / self.length, min_periods=self.length)
+        self._losses = _AdjustedEWM(alpha=1 / self.length, min_periods=self.length)
+
+    def _peek(self, candle: np.ndarray) -> Sequence[float]:
+        change = candle[CLOSE] - self._previous_close
+        gain = self._gains.peek(max(change, 0.0) if not math.isnan(change) else change)
+        loss = self._losses.peek(max(-change, 0.0) if not math.isnan(change) else change)
+        total = gain + loss
+        return (self.scalar * gain / total if total != 0 else math.nan,)
+
+    def _commit(self, candle: np.ndarray):
+        change = candle[CLOSE] - self._previous_close
+        self._gains.commit(max(change, 0.0) if not math.isnan(change) else change)
+        self._losses.commit(max(-change, 0.0) if not math.isnan(change) else change)
+        self._previous_close = candle[CLOSE]
+
+
+class MACD(CandlesIndicator):
+    """
+    Moving average convergence divergence of the close, like `ta.macd(close, fast, slow, signal)`. The signal line is
+    the EMA of the MACD from its first value.
+    """
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        if slow < fast:
+            fast, slow = slow, fast
+        self.fast = fast
+        self.slow = slow
+        self.signal = signal
+        super().__init__()
+        self._reset_state()
+
+    @property
+    def columns(self) -> List[str]:
+        suffix = f"{self.fast}_{self.slow}_{self.signal}"
+        return [f"MACD_{suffix}", f"MACDh_{suffix}", f"MACDs_{suffix}"]
+
+    def _reset_state(self):
+        self._fast_ema = _EMA(self.fast)
+        self._slow_ema = _EMA(self.slow)
+        self._signal_ema = _EMA(self.signal)
+
+    def _peek(self, candle: np.ndarray) -> Sequence[float]:
+        macd = self._fast_ema.peek(candle[CLOSE]) - self._slow_ema.peek(candle[CLOSE])
+        signal = self._signal_ema.peek(macd) if not math.isnan(macd) else math.nan
+        return macd, macd - signal, signal
+
+    def _commit(self, candle: np.ndarray):
+        macd = self._fast_ema.peek(candle[CLOSE]) - self._slow_ema.peek(candle[CLOSE])
+        self._fast_ema.commit(candle[CLOSE])
+        self._slow_ema.commit(candle[CLOSE])
+        if not math.isnan(macd):
+            self._signal_ema.commit(macd)
+
+
+class BBands(CandlesIndicator):
+    """
+    Bollinger bands of the close, like `ta.bbands(close, length, lower_std, upper_std, ddof)`: the lower, middle and
+    upper bands, the bandwidth and the percent of the close within the bands.
+    """
+
+    def __init__(self, length: int = 5, lower_std: float = 2.0, upper_std: float = 2.0, ddof: int = 0):
+        self.length = length
+        self.lower_std = float(lower_std)
+        self.upper_std = float(upper_std)
+        self.ddof = ddof if 0 <= ddof < length else 1
+        super().__init__()
+        self._reset_state()
+
+    @property
+    def columns(self) -> List[str]:
+        suffix = f"{self.length}_{self.lower_std}_{self.upper_std}"
+        return [f"BBL_{suffix}", f"BBM_{suffix}", f"BBU_{suffix}", f"BBB_{suffix}", f"BBP_{suffix}"]
+
+    def _reset_state(self):
+        self._window = _RollingWindow(self.length, self.ddof)
+
+    def _peek(self, candle: np.ndarray) -> Sequence[float]:
+        close = candle[CLOSE]
+        mid, variance = self._window.peek(close)
+        if math.isnan(mid):
+            return (math.nan,) * 5
+        deviation = math.sqrt(variance)
+        lower = mid - self.lower_std * deviation
+        upper = mid + self.upper_std * deviation
+        width = _non_zero_range(upper, lower)
+        return lower, mid, upper, 100 * width / mid, _non_zero_range(close, lower) / width
+
+    def _commit(self, candle: np.ndarray):
+        self._window.commit(candle[CLOSE])
+
+
+class NATR(CandlesIndicator):
+    """
+    Normalized average true range, like `ta.natr(high, low, close, length)`: the EMA of the true range relative to the
+    close.
+    """
+
+    def __init__(self, length: int = 14, scalar: float = 100):
+        self.length = length
+        self.scalar = scalar
+        super().__init__()
+        self._reset_state()
+
+    @property
+    def columns(self) -> List[str]:
+        return [f"NATR_{self.length}"]
+
+    def _reset_state(self):
+        self._previous_close = math.nan
+        self._atr = _EMA(self.length)
+
+    def _true_range(self, candle: np.ndarray) -> float:
+        if math.isnan(self._previous_close):
+            return math.nan
+        return max(abs(_non_zero_range(candle[HIGH], candle[LOW])),
+                   abs(candle[HIGH] - self._previous_close),
+                   abs(self._previous_close - candle[LOW]))
+
+    def _peek(self, candle: np.ndarray) -> Sequence[float]:
+        return (self.scalar / candle[CLOSE] * self._atr.peek(self._true_range(candle)),)
+
+    def _commit(self, candle: np.ndarray):
+        self._atr.commit(self._true_range(candle))
+        self._previous_close = candle[CLOSE]
+
+
+def _non_zero_range(high: float, low: float) -> float:
+    # pandas-ta's non_zero_range, avoiding divisions by zero on flat candles
+    difference = high - low
+    return difference + EPSILON if difference == 0 else difference
@@ -0,0 +1,118 @@
+from typing import Iterable, Iterator, Union
+
+import numpy as np
+
+
+class CandlesRingBuffer:
+    """
+    Fixed size buffer of candles stored in a preallocated 2-D NumPy array, with the interface of the deque the candles
+    feeds used to keep them in: rows are appended and prepended like in a deque with `maxlen`, dropping the candles at
+    the other end once full, and updated in place by index.
+
+    Every row is written twice, at its position in the ring and `maxlen` rows after it, so the candles are always
+    contiguous in the array and `values` is an ordered view of them, oldest first, without copying.
+    `version` changes with every update, so the views derived from the candles can be cached.
+    """
+
+    def __init__(self, maxlen: int, n_columns: int):
+        self._maxlen = maxlen
+        self._data = np.zeros((2 * maxlen, n_columns), dtype=float)
+        self._head = 0
+        self._size = 0
+        self.version = 0
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Read-only view of the candles, oldest first. It is only valid until the next update.
+        """
+        view = self._data[self._head:self._head + self._size]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return iter(self.values.copy())
+
+    def __reversed__(self) -> Iterator[np.ndarray]:
+        return iter(self.values[::-1].copy())
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return np.array(self.values, dtype=dtype)
+
+    def __getitem__(self, index: Union[int, slice]) -> np.ndarray:
+        if isinstance(index, slice):
+            return self.values[index].copy()
+        return self._data[self._head + self._position(index)].copy()
+
+    def __setitem__(self, index: int, row: Iterable[float]):
+        self._write(self._head + self._position(index), row)
+
+    def append(self, row: Iterable[float]):
+        if self._size == self._maxlen:
+            self._head = (self._head + 1) % self._maxlen
+            self._size -= 1
+        self._write(self._head + self._size, row)
+        self._size += 1
+
+    def appendleft(self, row: Iterable[float]):
+        if self._size == self._maxlen:
+            self._size -= 1
+        self._head = (self._head - 1) % self._maxlen
+        self._write(self._head, row)
+        self._size += 1
+
+    def extend(self, rows: Iterable[Iterable[float]]):
+        rows = self._as_rows(rows)
+        if len(rows) >= self._maxlen:
+            self._reset(rows[-self._maxlen:])
+        elif len(rows) > 0:
+            self._write(self._head + self._size + np.arange(len(rows)), rows)
+            size = min(self._maxlen, self._size + len(rows))
+            self._head = (self._head + self._size + len(rows) - size) % self._maxlen
+            self._size = size
+
+    def extendleft(self, rows: Iterable[Iterable[float]]):
+        """
+        Prepends the rows one by one like deque.extendleft, so they end up in reverse order.
+        """
+        rows = self._as_rows(rows)[::-1]
+        if len(rows) >= self._maxlen:
+            self._reset(rows[:self._maxlen])
+        elif len(rows) > 0:
+            self._write(self._head - len(rows) + np.arange(len(rows)), rows)
+            self._head = (self._head - len(rows)) % self._maxlen
+            self._size = min(self._maxlen, self._size + len(rows))
+
+    def clear(self):
+        self._head = 0
+        self._size = 0
+        self.version += 1
+
+    def _position(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("candles index out of range")
+        return index
+
+    def _as_rows(self, rows) -> np.ndarray:
+        rows = np.asarray(rows if isinstance(rows, np.ndarray) else list(rows), dtype=float)
+        return rows[:, None] if rows.ndim == 1 else rows
+
+    def _reset(self, rows: np.ndarray):
+        self._head = 0
+        self._size = len(rows)
+        self._write(np.arange(len(rows)), rows)
+
+    def _write(self, positions: Union[int, np.ndarray], rows):
+        positions = np.mod(positions, self._maxlen)
+        self._data[positions] = rows
+        self._data[positions + self._maxlen] = rows
+        self.version += 1
@@ -0,0 +1,217 @@
+import logging
+import os
+import tempfile
+import time
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot import data_path
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+from hummingbot.logger import HummingbotLogger
+
+SEGMENT_SUFFIX = ".npy"
+
+
+def _segment_name(first_timestamp: int, last_timestamp: int) -> str:
+    # Zero padded seconds, so the names sort in time order
+    return f"{first_timestamp:012d}-{last_timestamp:012d}{SEGMENT_SUFFIX}"
+
+
+def _segment_range(file_name: str) -> Tuple[int, int]:
+    first, last = file_name[:-len(SEGMENT_SUFFIX)].split("-")
+    return int(first), int(last)
+
+
+class CandlesStore:
+    """
+    Keeps the historical candles fetched from the exchanges on disk, one directory per candles feed:
+
+        <directory>/<connector>/<trading_pair>/<interval>/<first timestamp>-<last timestamp>.npy
+
+    Each segment file holds the candles of a contiguous time range, as a (n, 10) float array with the CandlesBase
+    columns. The range in the file name is the range that was fetched, so the candles the exchange doesn't have, for
+    example before the listing of the pair, are not requested again. Segments that overlap or follow each other are
+    merged on write, and only closed candles are stored.
+
+    (i.e)
+        store = CandlesStore()
+        candles_df = await store.get_candles(config, fetch=candles_feed.get_historical_candles)
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        :param directory: Root directory of the segment files, data/candles by default
+        """
+        self._directory: str = directory or os.path.join(data_path(), "candles")
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @staticmethod
+    def interval_in_seconds(interval: str) -> int:
+        return CandlesBase.interval_to_seconds[interval]
+
+    def covered_ranges(self, connector_name: str, trading_pair: str, interval: str) -> List[Tuple[int, int]]:
+        """
+        :return: The (first, last) candle timestamps of the stored segments, in time order. Only the file names are
+            read.
+        """
+        feed_directory = self._feed_directory(connector_name, trading_pair, interval)
+        if not os.path.isdir(feed_directory):
+            return []
+        return sorted(_segment_range(file_name) for file_name in os.listdir(feed_directory)
+                      if file_name.endswith(SEGMENT_SUFFIX))
+
+    def missing_ranges(self, connector_name: str, trading_pair: str, interval: str, start_time: float,
+                       end_time: float) -> List[Tuple[int, int]]:
+        """
+        :return: The (first, last) candle timestamps of the parts of the time range that are not stored, in time order
+        """
+        step = self.interval_in_seconds(interval)
+        first, last = self._first_and_last_candles(step, start_time, end_time)
+        missing = []
+        for segment_first, segment_last in self.covered_ranges(connector_name, trading_pair, interval):
+            if first > last:
+                break
+            if segment_last < first or segment_first > last:
+                continue
+            if segment_first > first:
+                missing.append((first, segment_first - step))
+            first = max(first, segment_last + step)
+        if first <= last:
+            missing.append((first, last))
+        return missing
+
+    def read(self, connector_name: str, trading_pair: str, interval: str, start_time: float,
+             end_time: float) -> np.ndarray:
+        """
+        Reads the stored candles between start_time and end_time, both included. The segments are memory-mapped, and
+        only the rows in the time range are copied, once, into the result.
+        :return: The candles in time order, as a (n, 10) float array
+        """
+        parts = []
+        previous_timestamp = None
+        for segment_first, segment_last in self.covered_ranges(connector_name, trading_pair, interval):
+            if segment_last < start_time or segment_first > end_time:
+                continue
+            path = os.path.join(self._feed_directory(connector_name, trading_pair, interval),
+                                _segment_name(segment_first, segment_last))
+            try:
+                candles = np.load(path, mmap_mode="r")
+            except FileNotFoundError:
+                # Merged by another process since the directory was listed
+                continue
+            timestamps = candles[:, 0]
+            first_row = np.searchsorted(timestamps, start_time, side="left")
+            if previous_timestamp is not None:
+                # Segments written concurrently by several processes may overlap
+                first_row = max(first_row, np.searchsorted(timestamps, previous_timestamp, side="right"))
+            last_row = np.searchsorted(timestamps, end_time, side="right")
+            if first_row < last_row:
+                parts.append(candles[first_row:last_row])
+                previous_timestamp = timestamps[last_row - 1]
+        result = np.empty((sum(len(part) for part in parts), len(CandlesBase.columns)))
+        row = 0
+        for part in parts:
+            result[row:row + len(part)] = part
+            row += len(part)
+        return result
+
+    def read_df(self, connector_name: str, trading_pair: str, interval: str, start_time: float,
+                end_time: float) -> pd.DataFrame:
+        return pd.DataFrame(self.read(connector_name, trading_pair, interval, start_time, end_time),
+                            columns=CandlesBase.columns)
+
+    def write(self, connector_name: str, trading_pair: str, interval: str, candles: np.ndarray, start_time: float,
+              end_time: float):
+        """
+        Stores the candles fetched for a time range, and records the range as covered. The candles outside the range,
+        and the ones that are not closed yet, are not stored.
+        :param candles: The fetched candles, with the CandlesBase columns
+        """
+        step = self.interval_in_seconds(interval)
+        first, last = self._first_and_last_candles(step, start_time, end_time)
+        if first > last:
+            return
+        candles = np.asarray(candles, dtype=float).reshape(-1, len(CandlesBase.columns))
+        candles = candles[(candles[:, 0] >= first) & (candles[:, 0] <= last)]
+
+        feed_directory = self._feed_directory(connector_name, trading_pair, interval)
+        merged_paths = []
+        parts = [candles]
+        for segment_first, segment_last in self.covered_ranges(connector_name, trading_pair, interval):
+            if segment_last + step < first or segment_first - step > last:
+                continue
+            path = os.path.join(feed_directory, _segment_name(segment_first, segment_last))
+            try:
+                parts.append(np.load(path))
+            except FileNotFoundError:
+                continue
+            merged_paths.append(path)
+            first, last = min(first, segment_first), max(last, segment_last)
+
+        # The fetched candles come first, so they replace the stored ones with the same timestamp
+        candles = np.concatenate(parts)
+        _, unique_rows = np.unique(candles[:, 0], return_index=True)
+        candles = candles[unique_rows]
+
+        os.makedirs(feed_directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=feed_directory, suffix=".tmp", delete=False) as segment_file:
+            np.save(segment_file, candles)
+        segment_path = os.path.join(feed_directory, _segment_name(first, last))
+        os.replace(segment_file.name, segment_path)
+        for path in merged_paths:
+            if path != segment_path:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    async def get_candles(self, config: HistoricalCandlesConfig,
+                          fetch: Callable[[HistoricalCandlesConfig], Awaitable[pd.DataFrame]]) -> pd.DataFrame:
+        """
+        Returns the closed candles of the time range in the config, fetching and storing only the ranges that are not
+        stored yet. No request is made when the whole range is stored.
+        :param config: The candles feed and time range
+        :param fetch: Coroutine function returning the candles of a time range, like CandlesBase.get_historical_candles
+        :return: The candles DataFrame
+        """
+        for first, last in self.missing_ranges(config.connector_name, config.trading_pair, config.interval,
+                                               config.start_time, config.end_time):
+            self.logger().info(f"Fetching {config.interval} candles of {config.connector_name} {config.trading_pair} "
+                               f"from {first} to {last}.")
+            candles_df = await fetch(HistoricalCandlesConfig(connector_name=config.connector_name,
+                                                             trading_pair=config.trading_pair,
+                                                             interval=config.interval,
+                                                             start_time=first,
+                                                             end_time=last))
+            self.write(config.connector_name, config.trading_pair, config.interval,
+                       candles_df[CandlesBase.columns].to_numpy(dtype=float), first, last)
+        return self.read_df(config.connector_name, config.trading_pair, config.interval, config.start_time,
+                            config.end_time)
+
+    def _feed_directory(self, connector_name: str, trading_pair: str, interval: str) -> str:
+        return os.path.join(self._directory, connector_name, trading_pair, interval)
+
+    @staticmethod
+    def _first_and_last_candles(step: int, start_time: float, end_time: float) -> Tuple[int, int]:
+        """
+        :return: The timestamps of the first and last candles opening in the time range, the last one being at most
+            the last closed candle
+        """
+        first = int(-(-start_time // step) * step)
+        last_closed = int(time.time() // step * step) - step
+        last = min(int(end_time // step * step), last_closed)
+        return first, last
@@ -4,6 +4,7 @@ import time
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.client.config.config_helpers import (
@@ -19,6 +20,7 @@ from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.candles_indicators import CandlesIndicator
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.executors.data_types import ConnectorPair
@@ -436,7 +438,7 @@ class MarketDataProvider:
         while waited < timeout:
             if trading_pair in tracker.order_books:
                 ob = tracker.order_books[trading_pair]
-                bids, asks = ob.snapshot
+                bids, asks = ob.top_levels(1)
                 if len(bids) > 0 and len(asks) > 0:
                     self.logger().info(f"Order book for {trading_pair} initialized successfully")
                     return True
@@ -532,6 +534,26 @@ class MarketDataProvider:
         ))
         return candles.candles_df.iloc[-max_records:]
 
+    def get_candles_indicator(self, connector_name: str, trading_pair: str, interval: str,
+                              indicator: CandlesIndicator, max_records: int = 500) -> CandlesIndicator:
+        """
+        Retrieves an indicator updated incrementally with the candles of a trading pair, registering it on the candles
+        feed on the first call. Its values are aligned with the candles of the feed.
+        :param connector_name: str
+        :param trading_pair: str
+        :param interval: str
+        :param indicator: CandlesIndicator, e.g. RSI(length=14)
+        :param max_records: int
+        :return: The indicator registered on the candles feed.
+        """
+        candles = self.get_candles_feed(CandlesConfig(
+            connector=connector_name,
+            trading_pair=trading_pair,
+            interval=interval,
+            max_records=max_records,
+        ))
+        return candles.add_indicator(indicator)
+
     async def get_historical_candles_df(self, connector_name: str, trading_pair: str, interval: str,
                                         start_time: Optional[int] = None, end_time: Optional[int] = None,
                                         max_records: Optional[int] = None, max_cache_records: int = 10000):
@@ -718,6 +740,20 @@ class MarketDataProvider:
         order_book = connector.get_order_book(trading_pair)
         return order_book.snapshot
 
+    def get_order_book_arrays(self, connector_name: str, trading_pair: str,
+                              depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retrieves the order book for a trading pair from the specified connector as a tuple of bid and ask NumPy arrays
+        of (price, amount, update_id) rows, best level first. Cheaper than get_order_book_snapshot.
+        :param connector_name: str
+        :param trading_pair: str
+        :param depth: Maximum number of levels per side, or None for the whole book.
+        :return: Tuple of bid and ask arrays.
+        """
+        connector = self.get_connector_with_fallback(connector_name)
+        order_book = connector.get_order_book(trading_pair)
+        return order_book.to_numpy(depth)
+
     def get_price_for_quote_volume(self, connector_name: str, trading_pair: str, quote_volume: float,
                                    is_buy: bool) -> OrderBookQueryResult:
         """
@@ -3,6 +3,7 @@ from sqlalchemy import Column, Integer, Text
 from hummingbot.model.db_migration.base_transformation import DatabaseTransformation
 from hummingbot.model.decimal_type_decorator import SqliteDecimal
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_performance import TradePerformance
 
 
 class AddExchangeOrderIdColumnToOrders(DatabaseTransformation):
@@ -149,3 +150,23 @@ class AddTradeFeeInQuote(DatabaseTransformation):
     @property
     def to_version(self):
         return 20230516
+
+
+class BuildTradePerformanceTotals(DatabaseTransformation):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def apply(self, db_handle: SQLConnectionManager) -> SQLConnectionManager:
+        # The TradePerformance table is created with the other tables when the DB handle is opened
+        with db_handle.get_new_session() as session:
+            with session.begin():
+                TradePerformance.rebuild(session)
+        return db_handle
+
+    @property
+    def name(self):
+        return "BuildTradePerformanceTotals"
+
+    @property
+    def to_version(self):
+        return 20261018
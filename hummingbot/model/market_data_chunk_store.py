@@ -0,0 +1,340 @@
+import atexit
+import logging
+import os
+import queue
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.logger import HummingbotLogger
+
+CHUNK_SUFFIX = ".npz"
+SEGMENT_SUFFIX = ".part.npz"
+SCALAR_COLUMNS = ("timestamp", "mid_price", "best_bid", "best_ask")
+LEVEL_COLUMNS = ("bid_price", "bid_amount", "ask_price", "ask_amount")
+
+_STOP = object()
+
+
+class MarketDataSnapshot(NamedTuple):
+    """
+    Top of book and book levels of a market at a point in time. The bids and asks are (price, amount, ...) rows, best
+    level first, like the arrays returned by OrderBook.to_numpy.
+    """
+    timestamp: float
+    exchange: str
+    trading_pair: str
+    mid_price: float
+    best_bid: float
+    best_ask: float
+    bids: np.ndarray
+    asks: np.ndarray
+
+
+class _FlushRequest:
+    def __init__(self):
+        self.done: threading.Event = threading.Event()
+
+
+def _chunk_name(first_timestamp: float, last_timestamp: float, suffix: str = CHUNK_SUFFIX) -> str:
+    # Zero padded milliseconds, so the names sort in time order
+    return f"{int(first_timestamp * 1e3):015d}-{int(last_timestamp * 1e3):015d}{suffix}"
+
+
+def _chunk_range(file_name: str) -> Tuple[float, float]:
+    suffix = SEGMENT_SUFFIX if file_name.endswith(SEGMENT_SUFFIX) else CHUNK_SUFFIX
+    first, last = file_name[:-len(suffix)].split("-")
+    return int(first) / 1e3, int(last) / 1e3
+
+
+class MarketDataChunkWriter:
+    """
+    Records order book snapshots into compressed columnar chunk files, one directory per market:
+
+        <directory>/<exchange>/<trading_pair>/<first timestamp ms>-<last timestamp ms>.npz
+
+    A chunk holds the timestamp, mid_price, best_bid and best_ask columns, and the bid_price, bid_amount, ask_price
+    and ask_amount matrices with one column per book level. Books with less levels than the depth are padded with
+    NaN.
+
+    The snapshots are buffered by a background thread. Every `max_flush_interval` seconds, the snapshots buffered
+    since the last flush are appended to the open chunk of their market as a segment file,
+    <first timestamp ms>-<last timestamp ms>.part.npz, so a crash loses at most that interval. The segments of a chunk
+    are merged into the chunk file once it holds `max_chunk_rows` snapshots, or once a new snapshot is
+    `max_chunk_duration` seconds newer than its first one, and when the writer stops. `flush()` writes the buffered
+    snapshots to segments right away. Files are written to a temporary file first, so readers never see a partial
+    chunk or segment.
+    """
+
+    MAX_CHUNK_ROWS: int = 10_000
+    MAX_CHUNK_DURATION: float = 24 * 60 * 60
+    MAX_FLUSH_INTERVAL: float = 5 * 60
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 directory: str,
+                 depth: int,
+                 max_chunk_rows: Optional[int] = None,
+                 max_chunk_duration: Optional[float] = None,
+                 max_flush_interval: Optional[float] = None):
+        """
+        :param directory: Root directory of the chunk files
+        :param depth: Number of book levels recorded per side
+        :param max_chunk_rows: Maximum number of snapshots in a chunk
+        :param max_chunk_duration: Maximum time in seconds covered by a chunk
+        :param max_flush_interval: Maximum time in seconds a snapshot stays buffered in memory
+        """
+        self._directory: str = directory
+        self._depth: int = depth
+        self._max_chunk_rows: int = max_chunk_rows or self.MAX_CHUNK_ROWS
+        self._max_chunk_duration: float = max_chunk_duration or self.MAX_CHUNK_DURATION
+        self._max_flush_interval: float = max_flush_interval or self.MAX_FLUSH_INTERVAL
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        # Snapshots not written yet, and the segments, first timestamp and rows of the open chunk of each market
+        self._buffers: Dict[Tuple[str, str], List[MarketDataSnapshot]] = defaultdict(list)
+        self._segments: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        self._open_chunks: Dict[Tuple[str, str], Tuple[float, int]] = {}
+        self._last_flush: float = 0
+        self._chunks_written: int = 0
+        self._segments_written: int = 0
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def chunks_written(self) -> int:
+        return self._chunks_written
+
+    @property
+    def segments_written(self) -> int:
+        return self._segments_written
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.is_running:
+            return
+        self._thread = threading.Thread(target=self._run, name="MarketDataChunkWriter", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Writes the buffered snapshots, merges the open chunks and stops the writer thread.
+        """
+        if self._thread is None:
+            return
+        atexit.unregister(self.stop)
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def put(self, snapshot: MarketDataSnapshot):
+        self._queue.put(snapshot)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until the snapshots queued so far are written to segment files.
+        :return: False if the timeout expired first
+        """
+        if not self.is_running:
+            return False
+        request = _FlushRequest()
+        self._queue.put(request)
+        return request.done.wait(timeout)
+
+    def _run(self):
+        self._last_flush = time.monotonic()
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, self._last_flush + self._max_flush_interval - time.monotonic()))
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                break
+            if isinstance(item, _FlushRequest):
+                self._flush_all()
+                item.done.set()
+            elif item is not None:
+                self._add(item)
+            if time.monotonic() - self._last_flush >= self._max_flush_interval:
+                self._flush_all()
+        # Snapshots queued after the stop request, from other threads, are still written.
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, MarketDataSnapshot):
+                self._add(item)
+            elif isinstance(item, _FlushRequest):
+                item.done.set()
+        for key in list(self._open_chunks):
+            self._close_chunk(key)
+
+    def _add(self, snapshot: MarketDataSnapshot):
+        key = (snapshot.exchange, snapshot.trading_pair)
+        first_timestamp, rows = self._open_chunks.get(key, (snapshot.timestamp, 0))
+        if rows > 0 and snapshot.timestamp - first_timestamp >= self._max_chunk_duration:
+            self._close_chunk(key)
+            first_timestamp, rows = snapshot.timestamp, 0
+        self._buffers[key].append(snapshot)
+        self._open_chunks[key] = (first_timestamp, rows + 1)
+        if rows + 1 >= self._max_chunk_rows:
+            self._close_chunk(key)
+
+    def _flush_all(self):
+        for key in list(self._buffers):
+            self._write_segment(key)
+        self._last_flush = time.monotonic()
+
+    def _write_segment(self, key: Tuple[str, str]):
+        snapshots = self._buffers.pop(key, [])
+        if len(snapshots) == 0:
+            return
+        try:
+            path = self._write_file(key, self._to_columns(snapshots), _chunk_name(
+                snapshots[0].timestamp, snapshots[-1].timestamp, SEGMENT_SUFFIX))
+            self._segments[key].append(path)
+            self._segments_written += 1
+        except Exception:
+            self.logger().error(f"Unexpected error while writing the market data of {key[0]} {key[1]}.",
+                                exc_info=True)
+
+    def _close_chunk(self, key: Tuple[str, str]):
+        """
+        Merges the segments and the buffered snapshots of the open chunk of a market into a chunk file, then removes
+        the segments. Readers skip the segments covered by a chunk, in case the removal is interrupted.
+        """
+        snapshots = self._buffers.pop(key, [])
+        segments = self._segments.pop(key, [])
+        self._open_chunks.pop(key, None)
+        try:
+            parts = []
+            for path in segments:
+                with np.load(path) as segment:
+                    parts.append({name: segment[name] for name in SCALAR_COLUMNS + LEVEL_COLUMNS})
+            if len(snapshots) > 0:
+                parts.append(self._to_columns(snapshots))
+            if len(parts) == 0:
+                return
+            columns = {name: np.concatenate([part[name] for part in parts]) for name in SCALAR_COLUMNS + LEVEL_COLUMNS}
+            self._write_file(key, columns, _chunk_name(columns["timestamp"][0], columns["timestamp"][-1]))
+            self._chunks_written += 1
+            for path in segments:
+                os.remove(path)
+        except Exception:
+            self.logger().error(f"Unexpected error while writing the market data of {key[0]} {key[1]}.",
+                                exc_info=True)
+
+    def _write_file(self, key: Tuple[str, str], columns: Dict[str, np.ndarray], file_name: str) -> str:
+        market_directory = os.path.join(self._directory, *key)
+        os.makedirs(market_directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=market_directory, suffix=".tmp", delete=False) as chunk_file:
+            np.savez_compressed(chunk_file, **columns)
+        path = os.path.join(market_directory, file_name)
+        os.replace(chunk_file.name, path)
+        return path
+
+    def _to_columns(self, snapshots: List[MarketDataSnapshot]) -> Dict[str, np.ndarray]:
+        columns = {name: np.array([getattr(snapshot, name) for snapshot in snapshots], dtype=np.float64)
+                   for name in SCALAR_COLUMNS}
+        for side in ("bid", "ask"):
+            prices = np.full((len(snapshots), self._depth), np.nan)
+            amounts = np.full((len(snapshots), self._depth), np.nan)
+            for row, snapshot in enumerate(snapshots):
+                levels = snapshot.bids if side == "bid" else snapshot.asks
+                levels = levels[:self._depth]
+                prices[row, :len(levels)] = levels[:, 0]
+                amounts[row, :len(levels)] = levels[:, 1]
+            columns[f"{side}_price"] = prices
+            columns[f"{side}_amount"] = amounts
+        return columns
+
+
+class MarketDataChunkReader:
+    """
+    Reads the chunk files recorded by MarketDataChunkWriter.
+
+    (i.e)
+        reader = MarketDataChunkReader(directory)
+        data = reader.read("binance", "BTC-USDT", start=1_700_000_000, end=1_700_086_400)
+        spreads = data["ask_price"][:, 0] - data["bid_price"][:, 0]
+    """
+
+    def __init__(self, directory: str):
+        self._directory: str = directory
+
+    def markets(self) -> List[Tuple[str, str]]:
+        """
+        :return: The (exchange, trading pair) of every recorded market
+        """
+        if not os.path.isdir(self._directory):
+            return []
+        return sorted((exchange, trading_pair)
+                      for exchange in os.listdir(self._directory)
+                      if os.path.isdir(os.path.join(self._directory, exchange))
+                      for trading_pair in os.listdir(os.path.join(self._directory, exchange)))
+
+    def chunk_paths(self, exchange: str, trading_pair: str, start: Optional[float] = None,
+                    end: Optional[float] = None) -> List[str]:
+        """
+        :return: The paths of the chunks and segments overlapping the time range, in time order. Segments already
+            merged into a chunk are skipped. Only the file names are read.
+        """
+        market_directory = os.path.join(self._directory, exchange, trading_pair)
+        if not os.path.isdir(market_directory):
+            return []
+        files = sorted((_chunk_range(file_name), file_name)
+                       for file_name in os.listdir(market_directory) if file_name.endswith(CHUNK_SUFFIX))
+        chunk_ranges = [file_range for file_range, file_name in files if not file_name.endswith(SEGMENT_SUFFIX)]
+        paths = []
+        for (first, last), file_name in files:
+            if file_name.endswith(SEGMENT_SUFFIX) and any(chunk_first <= first and last <= chunk_last
+                                                          for chunk_first, chunk_last in chunk_ranges):
+                continue
+            if (start is None or last >= start) and (end is None or first <= end):
+                paths.append(os.path.join(market_directory, file_name))
+        return paths
+
+    def read(self, exchange: str, trading_pair: str, start: Optional[float] = None,
+             end: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Reads the snapshots of a market recorded between start and end, both included.
+        :param start: Start timestamp in seconds, from the first snapshot if None
+        :param end: End timestamp in seconds, up to the last snapshot if None
+        :return: The columns of the snapshots in time order. The level matrices have one column per book level, and
+            are padded with NaN to the largest depth when the chunks were recorded with different depths.
+        """
+        chunks = []
+        for path in self.chunk_paths(exchange, trading_pair, start, end):
+            with np.load(path) as chunk:
+                timestamps = chunk["timestamp"]
+                mask = np.ones(len(timestamps), dtype=bool)
+                if start is not None:
+                    mask &= timestamps >= start
+                if end is not None:
+                    mask &= timestamps <= end
+                chunks.append({name: chunk[name][mask] for name in SCALAR_COLUMNS + LEVEL_COLUMNS})
+        depth = max((chunk["bid_price"].shape[1] for chunk in chunks), default=0)
+        columns = {name: np.concatenate([chunk[name] for chunk in chunks]) if len(chunks) > 0 else np.empty(0)
+                   for name in SCALAR_COLUMNS}
+        for name in LEVEL_COLUMNS:
+            matrices = [np.pad(chunk[name], ((0, 0), (0, depth - chunk[name].shape[1])), constant_values=np.nan)
+                        for chunk in chunks]
+            columns[name] = np.concatenate(matrices) if len(matrices) > 0 else np.empty((0, 0))
+        return columns
@@ -0,0 +1,204 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.transaction_base import TransactionBase
+
+SQLWrite = Callable[[Session], None]
+
+_STOP = object()
+_FLUSH = object()
+
+
+@dataclass
+class SQLWriteQueueMetrics:
+    """Counters of a SQLWriteQueue. Latencies are in milliseconds."""
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    writes_flushed: int = 0
+    batches_flushed: int = 0
+    write_errors: int = 0
+    last_flush_ms: float = 0.0
+    max_flush_ms: float = 0.0
+    total_flush_ms: float = 0.0
+    last_write_latency_ms: float = 0.0
+    max_write_latency_ms: float = 0.0
+
+    @property
+    def avg_flush_ms(self) -> float:
+        return self.total_flush_ms / self.batches_flushed if self.batches_flushed > 0 else 0.0
+
+    @property
+    def avg_batch_size(self) -> float:
+        return self.writes_flushed / self.batches_flushed if self.batches_flushed > 0 else 0.0
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "writes_flushed": self.writes_flushed,
+            "batches_flushed": self.batches_flushed,
+            "write_errors": self.write_errors,
+            "avg_batch_size": self.avg_batch_size,
+            "last_flush_ms": self.last_flush_ms,
+            "max_flush_ms": self.max_flush_ms,
+            "avg_flush_ms": self.avg_flush_ms,
+            "last_write_latency_ms": self.last_write_latency_ms,
+            "max_write_latency_ms": self.max_write_latency_ms,
+        }
+
+
+class SQLWriteQueue:
+    """
+    Write-behind queue for a SQL database. Callers enqueue write functions, which receive a session, and a dedicated
+    writer thread runs them in batched transactions, so the event loop never waits on the database.
+
+    A batch is committed once it holds `max_batch_size` writes, or once its oldest write has waited
+    `max_batch_latency` seconds. If a batch fails, its writes are retried one transaction each, so a single bad write
+    is logged and dropped without losing the others. `stop()` commits everything queued before returning, and is
+    also called at interpreter exit.
+    """
+
+    MAX_BATCH_SIZE: int = 100
+    MAX_BATCH_LATENCY: float = 0.2
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 sql: TransactionBase,
+                 max_batch_size: Optional[int] = None,
+                 max_batch_latency: Optional[float] = None):
+        """
+        :param sql: The connection manager providing the sessions
+        :param max_batch_size: Maximum number of writes committed in one transaction
+        :param max_batch_latency: Maximum time in seconds a write waits in the queue before its batch is committed
+        """
+        self._sql: TransactionBase = sql
+        self._max_batch_size: int = max_batch_size or self.MAX_BATCH_SIZE
+        self._max_batch_latency: float = self.MAX_BATCH_LATENCY if max_batch_latency is None else max_batch_latency
+        self._queue: queue.Queue = queue.Queue()
+        self._pending: int = 0
+        self._pending_condition: threading.Condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._metrics: SQLWriteQueueMetrics = SQLWriteQueueMetrics()
+
+    @property
+    def metrics(self) -> SQLWriteQueueMetrics:
+        self._metrics.queue_depth = self._pending
+        return self._metrics
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.is_running:
+            return
+        self._thread = threading.Thread(target=self._run, name="SQLWriteQueue", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Commits all the queued writes and stops the writer thread.
+        """
+        if self._thread is None:
+            return
+        atexit.unregister(self.stop)
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def put(self, write: SQLWrite):
+        with self._pending_condition:
+            self._pending += 1
+            if self._pending > self._metrics.max_queue_depth:
+                self._metrics.max_queue_depth = self._pending
+        self._queue.put((time.perf_counter(), write))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Commits the batch being collected without waiting for its latency deadline, and blocks until every write
+        queued so far is committed.
+        :return: False if the timeout expired first
+        """
+        with self._pending_condition:
+            if self._pending == 0:
+                return True
+        self._queue.put(_FLUSH)
+        with self._pending_condition:
+            return self._pending_condition.wait_for(lambda: self._pending == 0, timeout)
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            if item is _FLUSH:
+                continue
+            batch: List[Tuple[float, SQLWrite]] = [item]
+            deadline = item[0] + self._max_batch_latency
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                if item is _FLUSH:
+                    break
+                batch.append(item)
+            self._commit(batch)
+        # Writes queued after the stop request, from other threads, are still committed.
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP and item is not _FLUSH:
+                self._commit([item])
+
+    def _commit(self, batch: List[Tuple[float, SQLWrite]]):
+        start = time.perf_counter()
+        try:
+            with self._sql.begin() as session:
+                for _, write in batch:
+                    write(session)
+        except Exception:
+            if len(batch) > 1:
+                for item in batch:
+                    self._commit([item])
+                return
+            self._metrics.write_errors += 1
+            self.logger().error("Unexpected error while writing to the database.", exc_info=True)
+        else:
+            end = time.perf_counter()
+            flush_ms = (end - start) * 1000
+            write_latency_ms = (end - batch[0][0]) * 1000
+            metrics = self._metrics
+            metrics.writes_flushed += len(batch)
+            metrics.batches_flushed += 1
+            metrics.last_flush_ms = flush_ms
+            metrics.max_flush_ms = max(metrics.max_flush_ms, flush_ms)
+            metrics.total_flush_ms += flush_ms
+            metrics.last_write_latency_ms = write_latency_ms
+            metrics.max_write_latency_ms = max(metrics.max_write_latency_ms, write_latency_ms)
+        with self._pending_condition:
+            self._pending -= len(batch)
+            self._pending_condition.notify_all()
@@ -1,14 +1,20 @@
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 import numpy
 import pandas as pd
-from sqlalchemy import JSON, BigInteger, Column, ForeignKey, Index, Integer, Text
+from sqlalchemy import JSON, BigInteger, Column, ForeignKey, Index, Integer, Text, select
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session, relationship
 
 from hummingbot.core.event.events import PositionAction
 from hummingbot.model import HummingbotBase
 from hummingbot.model.decimal_type_decorator import SqliteDecimal
+from hummingbot.model.order import Order
+
+DEFAULT_CHUNK_SIZE = 10_000
+# Largest number of order ids looked up in one query, below the SQLite bound parameters limit of older versions
+ORDER_LOOKUP_SIZE = 500
 
 
 class TradeFill(HummingbotBase):
@@ -51,17 +57,17 @@ class TradeFill(HummingbotBase):
                f"exchange_trade_id={self.exchange_trade_id}, position={self.position})"
 
     @staticmethod
-    def get_trades(sql_session: Session,
-                   strategy: str = None,
-                   market: str = None,
-                   trading_pair: str = None,
-                   base_asset: str = None,
-                   quote_asset: str = None,
-                   trade_type: str = None,
-                   order_type: str = None,
-                   start_time: int = None,
-                   end_time: int = None,
-                   ) -> Optional[List["TradeFill"]]:
+    def filters(strategy: str = None,
+                market: str = None,
+                trading_pair: str = None,
+                base_asset: str = None,
+                quote_asset: str = None,
+                trade_type: str = None,
+                order_type: str = None,
+                start_time: int = None,
+                end_time: int = None,
+                config_file_path: str = None,
+                ) -> List[Any]:
         filters = []
         if strategy is not None:
             filters.append(TradeFill.strategy == strategy)
@@ -81,6 +87,31 @@ class TradeFill(HummingbotBase):
             filters.append(TradeFill.timestamp >= start_time)
         if end_time is not None:
             filters.append(TradeFill.timestamp <= end_time)
+        if config_file_path is not None:
+            filters.append(TradeFill.config_file_path == config_file_path)
+        return filters
+
+    @staticmethod
+    def get_trades(sql_session: Session,
+                   strategy: str = None,
+                   market: str = None,
+                   trading_pair: str = None,
+                   base_asset: str = None,
+                   quote_asset: str = None,
+                   trade_type: str = None,
+                   order_type: str = None,
+                   start_time: int = None,
+                   end_time: int = None,
+                   ) -> Optional[List["TradeFill"]]:
+        filters = TradeFill.filters(strategy=strategy,
+                                    market=market,
+                                    trading_pair=trading_pair,
+                                    base_asset=base_asset,
+                                    quote_asset=quote_asset,
+                                    trade_type=trade_type,
+                                    order_type=order_type,
+                                    start_time=start_time,
+                                    end_time=end_time)
 
         trades: Optional[List[TradeFill]] = (sql_session
                                              .query(TradeFill)
@@ -89,8 +120,89 @@ class TradeFill(HummingbotBase):
                                              .all())
         return trades
 
+    @staticmethod
+    def iter_trade_chunks(sql_session: Session,
+                          filters: Sequence[Any] = (),
+                          columns: Optional[Sequence[str]] = None,
+                          chunk_size: int = DEFAULT_CHUNK_SIZE,
+                          descending: bool = False) -> Iterator[List[Row]]:
+        """
+        Yields the trades matching the filters in timestamp order, in chunks of named tuples holding only the
+        requested columns. No ORM object is created, and the rows are read through a server-side cursor where the
+        database supports it, so the memory used is bounded by the chunk size.
+        :param filters: SQL conditions on the TradeFill columns, see TradeFill.filters
+        :param columns: Names of the TradeFill columns to read, all of them if None
+        :param descending: Yields the newest trades first
+        """
+        table_columns = TradeFill.__table__.c
+        selected = [table_columns[name] for name in columns] if columns is not None else list(table_columns)
+        statement = (select(*selected)
+                     .where(*filters)
+                     .order_by(TradeFill.timestamp.desc() if descending else TradeFill.timestamp.asc())
+                     .execution_options(stream_results=True))
+        for chunk in sql_session.execute(statement).partitions(chunk_size):
+            yield chunk
+
+    @staticmethod
+    def iter_trade_arrays(sql_session: Session,
+                          filters: Sequence[Any] = (),
+                          columns: Optional[Sequence[str]] = None,
+                          chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[numpy.ndarray]:
+        """
+        Same as iter_trade_chunks, with each chunk as a NumPy structured array. Integer columns are int64, price and
+        amount columns are float64 (NaN for missing values) and the others are Python objects.
+        """
+        table_columns = TradeFill.__table__.c
+        names = list(columns) if columns is not None else [column.name for column in table_columns]
+        dtype = numpy.dtype([(name, TradeFill._numpy_type(table_columns[name])) for name in names])
+        for chunk in TradeFill.iter_trade_chunks(sql_session, filters, names, chunk_size):
+            array = numpy.empty(len(chunk), dtype=dtype)
+            for i, name in enumerate(names):
+                values = [row[i] for row in chunk]
+                if dtype[name] == numpy.float64:
+                    values = [numpy.nan if value is None else float(value) for value in values]
+                array[name] = values
+            yield array
+
+    @staticmethod
+    def _numpy_type(column: Column) -> Any:
+        if isinstance(column.type, SqliteDecimal):
+            return numpy.float64
+        if isinstance(column.type, (BigInteger, Integer)):
+            return numpy.int64
+        return object
+
+    @classmethod
+    def iter_pandas_chunks(cls,
+                           sql_session: Session,
+                           filters: Sequence[Any] = (),
+                           chunk_size: int = DEFAULT_CHUNK_SIZE,
+                           descending: bool = False) -> Iterator[pd.DataFrame]:
+        """
+        Yields the trades matching the filters in timestamp order, as chunks of the to_pandas data frame.
+        :param descending: Yields the newest trades first
+        """
+        columns = ["exchange_trade_id", "timestamp", "market", "symbol", "order_type", "trade_type", "price",
+                   "amount", "leverage", "position", "order_id"]
+        for chunk in cls.iter_trade_chunks(sql_session, filters, columns, chunk_size, descending):
+            order_ids = list(set(row.order_id for row in chunk))
+            creation_timestamps: Dict[str, int] = {}
+            for start in range(0, len(order_ids), ORDER_LOOKUP_SIZE):
+                creation_timestamps.update(sql_session
+                                           .query(Order.id, Order.creation_timestamp)
+                                           .filter(Order.id.in_(order_ids[start:start + ORDER_LOOKUP_SIZE]))
+                                           .all())
+            yield cls._to_pandas(chunk, creation_timestamps)
+
     @classmethod
     def to_pandas(cls, trades: List):
+        # The order creation update may not have arrived yet
+        creation_timestamps = {trade.order_id: trade.order.creation_timestamp for trade in trades
+                               if trade.order is not None}
+        return cls._to_pandas(trades, creation_timestamps)
+
+    @classmethod
+    def _to_pandas(cls, trades: Sequence[Any], order_creation_timestamps: Dict[str, int]) -> pd.DataFrame:
         columns: List[str] = ["Id",
                               "Timestamp",
                               "Exchange",
@@ -104,11 +216,11 @@ class TradeFill(HummingbotBase):
                               "Age"]
         data = []
         for trade in trades:
-
-            if trade.order is None:  # order creation update has not arrived yet
+            creation_timestamp = order_creation_timestamps.get(trade.order_id)
+            if creation_timestamp is None:
                 age = pd.Timestamp(0, unit='s').strftime('%H:%M:%S')
             else:
-                age = pd.Timestamp(int(trade.timestamp / 1e3 - trade.order.creation_timestamp / 1e3),
+                age = pd.Timestamp(int(trade.timestamp / 1e3 - creation_timestamp / 1e3),
                                    unit='s').strftime('%H:%M:%S')
             data.append([
                 trade.exchange_trade_id,
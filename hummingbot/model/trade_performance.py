@@ -0,0 +1,259 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, Optional, Tuple, Union
+
+from sqlalchemy import JSON, BigInteger, Column, Index, Integer, Text
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from hummingbot.core.data_type.common import PositionAction, TradeType
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee
+from hummingbot.model import HummingbotBase
+from hummingbot.model.decimal_type_decorator import SqliteDecimal
+from hummingbot.model.trade_fill import TradeFill
+
+s_decimal_0 = Decimal("0")
+s_decimal_nan = Decimal("NaN")
+
+DECIMAL_FIELDS = ("b_vol_base", "b_vol_quote", "s_vol_base", "s_vol_quote")
+# The TradeFill columns read to total the fills
+TRADE_FILL_COLUMNS = ("config_file_path", "market", "symbol", "timestamp", "trade_type", "price", "amount",
+                      "trade_fee", "position")
+
+
+def _stored_decimal(column, value) -> Decimal:
+    # The price and amount of a fill as read back from the TradeFill table
+    return column.type.process_result_value(column.type.process_bind_param(value, None), None)
+
+
+@dataclass
+class PerformanceAggregate:
+    """
+    Running totals of the trade fills of a market, from which PerformanceMetrics are built without going through the
+    fills again. The totals of consecutive periods are combined with merge.
+
+    position_buys and position_sells count the fills opening or closing a derivative position. The trade P&L of
+    derivative positions pairs the open and close orders, which can't be done from totals.
+    """
+    num_buys: int = 0
+    num_sells: int = 0
+    position_buys: int = 0
+    position_sells: int = 0
+    b_vol_base: Decimal = s_decimal_0
+    b_vol_quote: Decimal = s_decimal_0
+    s_vol_base: Decimal = s_decimal_0
+    s_vol_quote: Decimal = s_decimal_0
+    fees: Dict[str, Decimal] = field(default_factory=dict)
+    start_timestamp: Optional[int] = None
+    start_price: Decimal = s_decimal_nan
+    end_timestamp: Optional[int] = None
+    end_price: Decimal = s_decimal_nan
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def is_derivative(self) -> bool:
+        return ((self.num_buys > 0 and self.position_buys == self.num_buys)
+                or (self.num_sells > 0 and self.position_sells == self.num_sells))
+
+    def add_trade_fill(self, trade_fill: Union[TradeFill, Row]):
+        """
+        :param trade_fill: A TradeFill, or a row of its TRADE_FILL_COLUMNS as yielded by TradeFill.iter_trade_chunks
+        """
+        price = _stored_decimal(TradeFill.__table__.c.price, trade_fill.price)
+        amount = _stored_decimal(TradeFill.__table__.c.amount, trade_fill.amount)
+        is_position = trade_fill.position is not None and trade_fill.position != PositionAction.NIL.value
+        if trade_fill.trade_type.upper() == TradeType.BUY.name:
+            self.num_buys += 1
+            self.position_buys += is_position
+            self.b_vol_base += amount
+            self.b_vol_quote -= amount * price
+        elif trade_fill.trade_type.upper() == TradeType.SELL.name:
+            self.num_sells += 1
+            self.position_sells += is_position
+            self.s_vol_base -= amount
+            self.s_vol_quote += amount * price
+
+        quote = trade_fill.symbol.split("-")[1]
+        trade_fee: Dict[str, Any] = trade_fill.trade_fee
+        if trade_fee.get("percent") is not None:
+            fee_percent = Decimal(str(trade_fee["percent"]))
+            self._add_fee(quote, price * amount * fee_percent)
+            if trade_fee.get("fee_type") == DeductedFromReturnsTradeFee.type_descriptor_for_json():
+                self.s_vol_quote -= amount * price * fee_percent
+        for flat_fee in trade_fee.get("flat_fees", []):
+            self._add_fee(flat_fee["token"], Decimal(flat_fee["amount"]))
+
+        if self.start_timestamp is None or trade_fill.timestamp < self.start_timestamp:
+            self.start_timestamp = trade_fill.timestamp
+            self.start_price = price
+        if self.end_timestamp is None or trade_fill.timestamp >= self.end_timestamp:
+            self.end_timestamp = trade_fill.timestamp
+            self.end_price = price
+
+    def merge(self, other: "PerformanceAggregate"):
+        self.num_buys += other.num_buys
+        self.num_sells += other.num_sells
+        self.position_buys += other.position_buys
+        self.position_sells += other.position_sells
+        for name in DECIMAL_FIELDS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for token, amount in other.fees.items():
+            self._add_fee(token, amount)
+        if other.start_timestamp is not None and (self.start_timestamp is None
+                                                  or other.start_timestamp < self.start_timestamp):
+            self.start_timestamp = other.start_timestamp
+            self.start_price = other.start_price
+        if other.end_timestamp is not None and (self.end_timestamp is None
+                                                or other.end_timestamp >= self.end_timestamp):
+            self.end_timestamp = other.end_timestamp
+            self.end_price = other.end_price
+
+    def _add_fee(self, token: str, amount: Decimal):
+        self.fees[token] = self.fees.get(token, s_decimal_0) + amount
+
+
+class TradePerformance(HummingbotBase):
+    """
+    Hourly totals of the trade fills of a strategy config on a market. MarketsRecorder updates them in the transaction
+    recording each fill, so performance reports read one row per market and hour instead of every fill.
+    """
+    __tablename__ = "TradePerformance"
+    __table_args__ = (Index("tp_config_market_symbol_period_index",
+                            "config_file_path", "market", "symbol", "period_timestamp", unique=True),
+                      Index("tp_config_period_index",
+                            "config_file_path", "period_timestamp"))
+
+    PERIOD_MS = 60 * 60 * 1000
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    market = Column(Text, nullable=False)
+    symbol = Column(Text, nullable=False)
+    period_timestamp = Column(BigInteger, nullable=False)
+    num_buys = Column(Integer, nullable=False, default=0)
+    num_sells = Column(Integer, nullable=False, default=0)
+    position_buys = Column(Integer, nullable=False, default=0)
+    position_sells = Column(Integer, nullable=False, default=0)
+    # Decimal totals are stored as text, since their precision is not bounded like the fills price and amount
+    b_vol_base = Column(Text, nullable=False, default="0")
+    b_vol_quote = Column(Text, nullable=False, default="0")
+    s_vol_base = Column(Text, nullable=False, default="0")
+    s_vol_quote = Column(Text, nullable=False, default="0")
+    fees = Column(JSON, nullable=False, default=dict)
+    start_timestamp = Column(BigInteger, nullable=False)
+    start_price = Column(SqliteDecimal(6), nullable=False)
+    end_timestamp = Column(BigInteger, nullable=False)
+    end_price = Column(SqliteDecimal(6), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"TradePerformance(config_file_path='{self.config_file_path}', market='{self.market}', " \
+               f"symbol='{self.symbol}', period_timestamp={self.period_timestamp}, num_buys={self.num_buys}, " \
+               f"num_sells={self.num_sells})"
+
+    def to_aggregate(self) -> PerformanceAggregate:
+        return PerformanceAggregate(
+            num_buys=self.num_buys,
+            num_sells=self.num_sells,
+            position_buys=self.position_buys,
+            position_sells=self.position_sells,
+            b_vol_base=Decimal(self.b_vol_base),
+            b_vol_quote=Decimal(self.b_vol_quote),
+            s_vol_base=Decimal(self.s_vol_base),
+            s_vol_quote=Decimal(self.s_vol_quote),
+            fees={token: Decimal(amount) for token, amount in self.fees.items()},
+            start_timestamp=self.start_timestamp,
+            start_price=Decimal(self.start_price),
+            end_timestamp=self.end_timestamp,
+            end_price=Decimal(self.end_price),
+        )
+
+    def update_from_aggregate(self, aggregate: PerformanceAggregate):
+        self.num_buys = aggregate.num_buys
+        self.num_sells = aggregate.num_sells
+        self.position_buys = aggregate.position_buys
+        self.position_sells = aggregate.position_sells
+        for name in DECIMAL_FIELDS:
+            setattr(self, name, str(getattr(aggregate, name)))
+        self.fees = {token: str(amount) for token, amount in aggregate.fees.items()}
+        self.start_timestamp = aggregate.start_timestamp
+        self.start_price = aggregate.start_price
+        self.end_timestamp = aggregate.end_timestamp
+        self.end_price = aggregate.end_price
+
+    @classmethod
+    def period_of(cls, timestamp: int) -> int:
+        return timestamp - timestamp % cls.PERIOD_MS
+
+    @classmethod
+    def add_trade_fill(cls, sql_session: Session, trade_fill: TradeFill):
+        """
+        Adds a fill to the totals of its market and hour.
+        """
+        period_timestamp = cls.period_of(trade_fill.timestamp)
+        record: Optional[TradePerformance] = (sql_session.query(cls)
+                                              .filter(cls.config_file_path == trade_fill.config_file_path,
+                                                      cls.market == trade_fill.market,
+                                                      cls.symbol == trade_fill.symbol,
+                                                      cls.period_timestamp == period_timestamp)
+                                              .one_or_none())
+        aggregate = record.to_aggregate() if record is not None else PerformanceAggregate()
+        aggregate.add_trade_fill(trade_fill)
+        if record is None:
+            record = TradePerformance(config_file_path=trade_fill.config_file_path,
+                                      market=trade_fill.market,
+                                      symbol=trade_fill.symbol,
+                                      period_timestamp=period_timestamp)
+            sql_session.add(record)
+        record.update_from_aggregate(aggregate)
+
+    @classmethod
+    def get_aggregates(cls,
+                       sql_session: Session,
+                       start_timestamp: int,
+                       config_file_path: Optional[str] = None) -> Dict[Tuple[str, str], PerformanceAggregate]:
+        """
+        Totals the fills recorded since start_timestamp, by market and trading pair. The hourly totals cover the whole
+        hours, and only the fills of the first, partial hour are read.
+        :param start_timestamp: Start of the report, in milliseconds
+        :param config_file_path: Matched like TradeFill queries do, as a substring of the recorded config file path
+        """
+        first_period_timestamp = cls.period_of(start_timestamp)
+        if first_period_timestamp < start_timestamp:
+            first_period_timestamp += cls.PERIOD_MS
+        filters = [cls.period_timestamp >= first_period_timestamp]
+        fill_filters = [TradeFill.timestamp >= start_timestamp, TradeFill.timestamp < first_period_timestamp]
+        if config_file_path is not None:
+            filters.append(cls.config_file_path.like(f"%{config_file_path}%"))
+            fill_filters.append(TradeFill.config_file_path.like(f"%{config_file_path}%"))
+
+        aggregates: Dict[Tuple[str, str], PerformanceAggregate] = {}
+        for record in sql_session.query(cls).filter(*filters).order_by(cls.period_timestamp):
+            aggregates.setdefault((record.market, record.symbol), PerformanceAggregate()).merge(record.to_aggregate())
+        for chunk in TradeFill.iter_trade_chunks(sql_session, fill_filters, TRADE_FILL_COLUMNS):
+            for trade_fill in chunk:
+                aggregates.setdefault((trade_fill.market, trade_fill.symbol),
+                                      PerformanceAggregate()).add_trade_fill(trade_fill)
+        return aggregates
+
+    @classmethod
+    def rebuild(cls, sql_session: Session):
+        """
+        Recomputes the hourly totals from all the recorded fills, for databases recorded before the totals existed.
+        """
+        sql_session.query(cls).delete()
+        aggregates: Dict[Tuple[str, str, str, int], PerformanceAggregate] = {}
+        for chunk in TradeFill.iter_trade_chunks(sql_session, columns=TRADE_FILL_COLUMNS):
+            for trade_fill in chunk:
+                key = (trade_fill.config_file_path, trade_fill.market, trade_fill.symbol,
+                       cls.period_of(trade_fill.timestamp))
+                aggregates.setdefault(key, PerformanceAggregate()).add_trade_fill(trade_fill)
+        for (config_file_path, market, symbol, period_timestamp), aggregate in aggregates.items():
+            record = TradePerformance(config_file_path=config_file_path,
+                                      market=market,
+                                      symbol=symbol,
+                                      period_timestamp=period_timestamp)
+            record.update_from_aggregate(aggregate)
+            sql_session.add(record)
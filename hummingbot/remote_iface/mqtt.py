@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import asyncio
+import copy
 import functools
 import logging
 import threading
@@ -46,9 +47,32 @@ from hummingbot.remote_iface.messages import (
     StatusUpdateMessage,
     StopCommandMessage,
 )
+from hummingbot.remote_iface.mqtt_event_queue import MQTTEventQueue, MQTTEventQueueMetrics
 
 mqtts_logger: HummingbotLogger = None
 
+MARKET_EVENT_TYPES: Dict[int, str] = {
+    events.MarketEvent.BuyOrderCreated.value: "BuyOrderCreated",
+    events.MarketEvent.BuyOrderCompleted.value: "BuyOrderCompleted",
+    events.MarketEvent.SellOrderCreated.value: "SellOrderCreated",
+    events.MarketEvent.SellOrderCompleted.value: "SellOrderCompleted",
+    events.MarketEvent.OrderFilled.value: "OrderFilled",
+    events.MarketEvent.OrderCancelled.value: "OrderCancelled",
+    events.MarketEvent.OrderExpired.value: "OrderExpired",
+    events.MarketEvent.OrderFailure.value: "OrderFailure",
+    events.MarketEvent.FundingPaymentCompleted.value: "FundingPaymentCompleted",
+    events.MarketEvent.RangePositionLiquidityAdded.value: "RangePositionLiquidityAdded",
+    events.MarketEvent.RangePositionLiquidityRemoved.value: "RangePositionLiquidityRemoved",
+    events.MarketEvent.RangePositionUpdateFailure.value: "RangePositionUpdateFailure",
+}
+# Events of the order book activity, dropped first when the publisher falls behind. Fills, completions and failures
+# are kept as long as other events can be dropped.
+DROPPABLE_MARKET_EVENT_TYPES = frozenset({"BuyOrderCreated", "SellOrderCreated", "OrderCancelled", "OrderExpired"})
+COALESCING_MARKET_EVENT_TYPES = {
+    "OrderCancelled": frozenset({"BuyOrderCreated", "SellOrderCreated"}),
+    "OrderExpired": frozenset({"BuyOrderCreated", "SellOrderCreated"}),
+}
+
 
 class CommandTopicSpecs:
     START: str = '/start'
@@ -343,6 +367,8 @@ class MQTTCommands:
 
 
 class MQTTMarketEventForwarder:
+    EVENT_QUEUE_STOP_TIMEOUT: float = 5.0
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global mqtts_logger
@@ -388,51 +414,45 @@ class MQTTMarketEventForwarder:
         self.event_fw_pub = self._node.create_publisher(
             topic=self._topic, msg_type=InternalEventMessage
         )
+        self._event_queue: MQTTEventQueue = MQTTEventQueue(
+            self._publish_mqtt_event,
+            droppable_event_types=DROPPABLE_MARKET_EVENT_TYPES,
+            coalescing_event_types=COALESCING_MARKET_EVENT_TYPES,
+        )
+        self._event_queue.start()
         self._start_event_listeners()
 
-    def _send_mqtt_event(self, event_tag: int, pubsub: PubSub, event):
-        if threading.current_thread() != threading.main_thread():  # pragma: no cover
-            self._ev_loop.call_soon_threadsafe(
-                self._send_mqtt_event,
-                event_tag,
-                pubsub,
-                event
-            )
-            return
-        try:
-            event_types = {
-                events.MarketEvent.BuyOrderCreated.value: "BuyOrderCreated",
-                events.MarketEvent.BuyOrderCompleted.value: "BuyOrderCompleted",
-                events.MarketEvent.SellOrderCreated.value: "SellOrderCreated",
-                events.MarketEvent.SellOrderCompleted.value: "SellOrderCompleted",
-                events.MarketEvent.OrderFilled.value: "OrderFilled",
-                events.MarketEvent.OrderCancelled.value: "OrderCancelled",
-                events.MarketEvent.OrderExpired.value: "OrderExpired",
-                events.MarketEvent.OrderFailure.value: "OrderFailure",
-                events.MarketEvent.FundingPaymentCompleted.value: "FundingPaymentCompleted",
-                events.MarketEvent.RangePositionLiquidityAdded.value: "RangePositionLiquidityAdded",
-                events.MarketEvent.RangePositionLiquidityRemoved.value: "RangePositionLiquidityRemoved",
-                events.MarketEvent.RangePositionUpdateFailure.value: "RangePositionUpdateFailure",
-            }
-            event_type = event_types[event_tag]
-        except KeyError:
-            event_type = "Unknown"
+    @property
+    def event_queue_metrics(self) -> MQTTEventQueueMetrics:
+        return self._event_queue.metrics
 
+    def _send_mqtt_event(self, event_tag: int, pubsub: PubSub, event):
+        # Only a shallow copy of the event is taken here, the conversion and the publishing are left to the event
+        # queue thread
+        event_type = MARKET_EVENT_TYPES.get(event_tag, "Unknown")
         if is_dataclass(event):
-            event_data = asdict(event)
+            snapshot = copy.copy(event)
         elif isinstance(event, tuple) and hasattr(event, '_fields'):
-            event_data = event._asdict()
+            snapshot = event
         else:
             try:
-                event_data = dict(event)
+                snapshot = dict(event)
             except (TypeError, ValueError):
-                event_data = {}
+                snapshot = {}
+        self._event_queue.put(event_type,
+                              (snapshot, datetime.now().timestamp()),
+                              order_id=getattr(event, "order_id", None))
 
-        try:
-            timestamp = event_data.pop('timestamp')
-        except KeyError:
-            timestamp = datetime.now().timestamp()
+    def _publish_mqtt_event(self, event_type: str, queued_event: Tuple[Any, float]):
+        event, queued_timestamp = queued_event
+        if is_dataclass(event):
+            event_data = asdict(event)
+        elif isinstance(event, tuple) and hasattr(event, '_fields'):
+            event_data = event._asdict()
+        else:
+            event_data = event
 
+        timestamp = event_data.pop('timestamp', queued_timestamp)
         event_data = self._make_event_payload(event_data)
 
         self.event_fw_pub.publish(
@@ -476,6 +496,8 @@ class MQTTMarketEventForwarder:
         for market in self._markets:
             for event_pair in self._market_event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+        # Bounded, so a broker that stopped responding does not hold up the shutdown
+        self._event_queue.stop(timeout=self.EVENT_QUEUE_STOP_TIMEOUT)
 
 
 class MQTTNotifier(NotifierBase):
@@ -698,6 +720,7 @@ class MQTTGateway(Node):
         # Must be called after loading the strategy.
         # Markets must be initialized via TradingCore before calling this method
         if self._hb_app.client_config_map.mqtt_bridge.mqtt_events:
+            self._remove_market_event_listeners()
             self._market_events = MQTTMarketEventForwarder(self._hb_app, self)
             if self.state == NodeState.RUNNING:
                 self._market_events.event_fw_pub.run()
@@ -0,0 +1,290 @@
+import atexit
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, FrozenSet, List, Optional
+
+from hummingbot.logger import HummingbotLogger
+
+
+@dataclass
+class MQTTEventQueueMetrics:
+    """Counters of a MQTTEventQueue. Latencies are in milliseconds."""
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    events_published: int = 0
+    batches_published: int = 0
+    events_dropped: int = 0
+    events_coalesced: int = 0
+    publish_errors: int = 0
+    last_publish_ms: float = 0.0
+    max_publish_ms: float = 0.0
+    total_publish_ms: float = 0.0
+    last_event_latency_ms: float = 0.0
+    max_event_latency_ms: float = 0.0
+
+    @property
+    def avg_publish_ms(self) -> float:
+        return self.total_publish_ms / self.batches_published if self.batches_published > 0 else 0.0
+
+    @property
+    def avg_batch_size(self) -> float:
+        return self.events_published / self.batches_published if self.batches_published > 0 else 0.0
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "events_published": self.events_published,
+            "batches_published": self.batches_published,
+            "events_dropped": self.events_dropped,
+            "events_coalesced": self.events_coalesced,
+            "publish_errors": self.publish_errors,
+            "avg_batch_size": self.avg_batch_size,
+            "last_publish_ms": self.last_publish_ms,
+            "max_publish_ms": self.max_publish_ms,
+            "avg_publish_ms": self.avg_publish_ms,
+            "last_event_latency_ms": self.last_event_latency_ms,
+            "max_event_latency_ms": self.max_event_latency_ms,
+        }
+
+
+class _QueuedEvent:
+    __slots__ = ("queued_at", "event_type", "event", "order_id", "alive")
+
+    def __init__(self, queued_at: float, event_type: str, event: Any, order_id: Optional[str]):
+        self.queued_at: float = queued_at
+        self.event_type: str = event_type
+        self.event: Any = event
+        self.order_id: Optional[str] = order_id
+        self.alive: bool = True
+
+
+class MQTTEventQueue:
+    """
+    Bounded queue of market events published to MQTT by a dedicated thread. Callers only enqueue the events, and the
+    publisher thread serializes and publishes everything queued in batches of up to `max_batch_size` events, so the
+    event loop never waits on the conversion of the events or on the broker.
+
+    When the queue holds `max_queue_size` events, the oldest queued event of a `droppable_event_types` type is dropped
+    to make room for a new one, or the oldest event if none is queued. Once the queue holds `coalesce_threshold`
+    events, an event of a `coalescing_event_types` type cancels out the queued events of the types it maps to for the
+    same order, and neither is published: an order created and cancelled while the publisher is behind is skipped
+    altogether. `stop()` publishes everything queued within its timeout and drops the rest, and is also called at
+    interpreter exit.
+    """
+
+    MAX_QUEUE_SIZE: int = 10_000
+    MAX_BATCH_SIZE: int = 500
+    STOP_TIMEOUT: float = 5.0
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 publish: Callable[[str, Any], None],
+                 max_queue_size: Optional[int] = None,
+                 max_batch_size: Optional[int] = None,
+                 droppable_event_types: FrozenSet[str] = frozenset(),
+                 coalescing_event_types: Optional[Dict[str, FrozenSet[str]]] = None,
+                 coalesce_threshold: Optional[int] = None):
+        """
+        :param publish: Called from the publisher thread with the type and the data of each event
+        :param max_queue_size: Maximum number of events waiting to be published
+        :param max_batch_size: Maximum number of events taken from the queue at once
+        :param droppable_event_types: The high rate event types dropped first when the queue is full
+        :param coalescing_event_types: Event types mapped to the queued event types of the same order they cancel out
+        :param coalesce_threshold: Queue depth from which events are coalesced, half the queue size by default
+        """
+        self._publish: Callable[[str, Any], None] = publish
+        self._max_queue_size: int = max_queue_size or self.MAX_QUEUE_SIZE
+        self._max_batch_size: int = max_batch_size or self.MAX_BATCH_SIZE
+        self._droppable_event_types: FrozenSet[str] = droppable_event_types
+        self._coalescing_event_types: Dict[str, FrozenSet[str]] = coalescing_event_types or {}
+        self._coalesced_event_types: FrozenSet[str] = frozenset().union(*self._coalescing_event_types.values())
+        self._coalesce_threshold: int = (self._max_queue_size // 2 if coalesce_threshold is None
+                                         else coalesce_threshold)
+        # Dropped events are only flagged, and skipped when they reach the front of the deques
+        self._events: Deque[_QueuedEvent] = deque()
+        self._droppable_events: Deque[_QueuedEvent] = deque()
+        self._coalescible_events: Dict[Any, _QueuedEvent] = {}
+        self._size: int = 0
+        self._publishing: int = 0
+        self._stopping: bool = False
+        self._condition: threading.Condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._metrics: MQTTEventQueueMetrics = MQTTEventQueueMetrics()
+
+    @property
+    def metrics(self) -> MQTTEventQueueMetrics:
+        self._metrics.queue_depth = self._size
+        return self._metrics
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.is_running:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="MQTTEventQueue", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Publishes the queued events and stops the publisher thread. The events still queued once the timeout expires,
+        with a slow or unreachable broker, are dropped, and the thread exits after the batch it is publishing.
+        :param timeout: Maximum time in seconds to wait for the publisher thread, STOP_TIMEOUT if None
+        """
+        if self._thread is None:
+            return
+        atexit.unregister(self.stop)
+        timeout = self.STOP_TIMEOUT if timeout is None else timeout
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            with self._condition:
+                dropped = self._drop_all()
+            self.logger().warning(f"The MQTT event publisher did not finish within {timeout} seconds, {dropped} "
+                                  f"queued market events were dropped.")
+        self._thread = None
+
+    def put(self, event_type: str, event: Any, order_id: Optional[str] = None):
+        """
+        Queues an event. Safe to call from any thread.
+        :param order_id: The order of the event, used to coalesce the events of an order
+        """
+        queued_event = _QueuedEvent(time.perf_counter(), event_type, event, order_id)
+        with self._condition:
+            if self._coalesce(queued_event):
+                return
+            if self._size >= self._max_queue_size:
+                self._drop_one()
+            self._events.append(queued_event)
+            if event_type in self._droppable_event_types:
+                self._droppable_events.append(queued_event)
+            if order_id is not None and event_type in self._coalesced_event_types:
+                self._coalescible_events[(event_type, order_id)] = queued_event
+            self._size += 1
+            if self._size > self._metrics.max_queue_depth:
+                self._metrics.max_queue_depth = self._size
+            self._compact()
+            self._condition.notify()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until every event queued so far is published.
+        :return: False if the timeout expired first
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._size == 0 and self._publishing == 0, timeout)
+
+    def _coalesce(self, queued_event: _QueuedEvent) -> bool:
+        cancelled_types = self._coalescing_event_types.get(queued_event.event_type)
+        if cancelled_types is None or queued_event.order_id is None or self._size < self._coalesce_threshold:
+            return False
+        for event_type in cancelled_types:
+            cancelled_event = self._coalescible_events.pop((event_type, queued_event.order_id), None)
+            if cancelled_event is not None and cancelled_event.alive:
+                cancelled_event.alive = False
+                self._size -= 1
+                self._metrics.events_coalesced += 2
+                return True
+        return False
+
+    def _drop_one(self):
+        while self._droppable_events:
+            queued_event = self._droppable_events.popleft()
+            if queued_event.alive:
+                queued_event.alive = False
+                self._size -= 1
+                self._metrics.events_dropped += 1
+                return
+        while self._events:
+            queued_event = self._events.popleft()
+            if queued_event.alive:
+                queued_event.alive = False
+                self._size -= 1
+                self._metrics.events_dropped += 1
+                return
+
+    def _drop_all(self) -> int:
+        dropped = self._size
+        for queued_event in self._events:
+            queued_event.alive = False
+        self._events.clear()
+        self._droppable_events.clear()
+        self._coalescible_events.clear()
+        self._size = 0
+        self._metrics.events_dropped += dropped
+        return dropped
+
+    def _compact(self):
+        # Keeps the memory held by the dropped events bounded while the publisher is behind
+        if len(self._events) > 2 * self._max_queue_size:
+            self._events = deque(e for e in self._events if e.alive)
+        if len(self._droppable_events) > 2 * self._max_queue_size:
+            self._droppable_events = deque(e for e in self._droppable_events if e.alive)
+        if len(self._coalescible_events) > 2 * self._max_queue_size:
+            self._coalescible_events = {key: e for key, e in self._coalescible_events.items() if e.alive}
+
+    def _take_batch(self) -> List[_QueuedEvent]:
+        batch: List[_QueuedEvent] = []
+        while self._events and len(batch) < self._max_batch_size:
+            queued_event = self._events.popleft()
+            if not queued_event.alive:
+                continue
+            queued_event.alive = False
+            if queued_event.order_id is not None:
+                key = (queued_event.event_type, queued_event.order_id)
+                if self._coalescible_events.get(key) is queued_event:
+                    del self._coalescible_events[key]
+            batch.append(queued_event)
+        self._size -= len(batch)
+        self._publishing = len(batch)
+        return batch
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._size > 0 or self._stopping)
+                if self._size == 0:
+                    break
+                batch = self._take_batch()
+            self._publish_batch(batch)
+            with self._condition:
+                self._publishing = 0
+                self._condition.notify_all()
+
+    def _publish_batch(self, batch: List[_QueuedEvent]):
+        start = time.perf_counter()
+        published = 0
+        for queued_event in batch:
+            try:
+                self._publish(queued_event.event_type, queued_event.event)
+                published += 1
+            except Exception:
+                self._metrics.publish_errors += 1
+                self.logger().error("Unexpected error while publishing a market event to MQTT.", exc_info=True)
+        end = time.perf_counter()
+        publish_ms = (end - start) * 1000
+        event_latency_ms = (end - batch[0].queued_at) * 1000
+        metrics = self._metrics
+        metrics.events_published += published
+        metrics.batches_published += 1
+        metrics.last_publish_ms = publish_ms
+        metrics.max_publish_ms = max(metrics.max_publish_ms, publish_ms)
+        metrics.total_publish_ms += publish_ms
+        metrics.last_event_latency_ms = event_latency_ms
+        metrics.max_event_latency_ms = max(metrics.max_event_latency_ms, event_latency_ms)
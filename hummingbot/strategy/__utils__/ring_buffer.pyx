@@ -1,11 +1,22 @@
 import numpy as np
 import logging
+from libc.math cimport isfinite, sqrt
 cimport numpy as np
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length buffer of the last values added.
+
+    Each value is written twice, at its position and at its position plus the length, so the values from the oldest
+    to the last one are always contiguous and get_as_numpy_view() returns them without copying.
+
+    The mean and the variance of the values are updated on each value added, with Welford's algorithm over the sliding
+    window, so they are O(1). They are computed again from the values once per rotation of the buffer, to keep the
+    rounding errors from adding up, and on the next read while a value that isn't finite is in the buffer.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -13,18 +24,62 @@ cdef class RingBuffer:
             pmm_logger = logging.getLogger(__name__)
         return pmm_logger
 
-    def __cinit__(self, int length):
-        self._length = length
-        self._buffer = np.zeros(length, dtype=np.float64)
-        self._delimiter = 0
-        self._is_full = False
+    def __cinit__(self, int64_t length):
+        self.c_reset(length)
 
     def __dealloc__(self):
         self._buffer = None
+        self._array = None
+
+    cdef void c_reset(self, int64_t length):
+        self._length = length
+        self._array = np.zeros(2 * length, dtype=np.float64)
+        self._buffer = self._array
+        self._delimiter = 0
+        self._is_full = False
+        self._mean = 0
+        self._m2 = 0
+        self._stats_stale = False
 
     cdef void c_add_value(self, float val):
-        self._buffer[self._delimiter] = val
+        cdef:
+            double value = val
+            double removed
+            double previous_mean
+            double delta
+
+        if self._is_full:
+            removed = self._buffer[self._delimiter]
+            if isfinite(value) and isfinite(removed) and not self._stats_stale:
+                previous_mean = self._mean
+                self._mean += (value - removed) / self._length
+                self._m2 += (value - removed) * (value - self._mean + removed - previous_mean)
+            else:
+                self._stats_stale = True
+        elif isfinite(value) and not self._stats_stale:
+            delta = value - self._mean
+            self._mean += delta / (self._delimiter + 1)
+            self._m2 += delta * (value - self._mean)
+        else:
+            self._stats_stale = True
+        self._buffer[self._delimiter] = value
+        self._buffer[self._delimiter + self._length] = value
         self.c_increment_delimiter()
+        if self._delimiter == 0:
+            self.c_update_stats()
+
+    cdef void c_update_stats(self):
+        cdef np.ndarray[np.double_t, ndim=1] values = self.c_get_as_numpy_view()
+
+        if values.size == 0:
+            self._mean = 0
+            self._m2 = 0
+            self._stats_stale = False
+            return
+        self._mean = np.mean(values)
+        self._m2 = np.var(values) * values.size
+        # While a value that isn't finite is in the buffer, the stats are computed again on each read
+        self._stats_stale = not isfinite(self._m2)
 
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
@@ -34,47 +89,54 @@ cdef class RingBuffer:
     cdef bint c_is_empty(self):
         return (not self._is_full) and (0==self._delimiter)
 
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
     cdef double c_get_last_value(self):
         if self.c_is_empty():
             return np.nan
-        return self._buffer[self._delimiter-1]
+        return self._buffer[self._delimiter + self._length - 1]
 
     cdef bint c_is_full(self):
         return self._is_full
 
     cdef double c_mean_value(self):
-        result = np.nan
-        if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
-        return result
+        if not self._is_full:
+            return np.nan
+        if self._stats_stale:
+            self.c_update_stats()
+        return self._mean
 
     cdef double c_variance(self):
-        result = np.nan
-        if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
-        return result
+        if not self._is_full:
+            return np.nan
+        if self._stats_stale:
+            self.c_update_stats()
+        return max(self._m2, 0) / self._length
 
     cdef double c_std_dev(self):
-        result = np.nan
-        if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
-        return result
+        if not self._is_full:
+            return np.nan
+        return sqrt(self.c_variance())
 
-    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_view(self):
+        cdef np.ndarray[np.double_t, ndim=1] view
 
-        if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
+        if self._is_full:
+            view = self._array[self._delimiter:self._delimiter + self._length]
         else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            view = self._array[:self._delimiter]
+        view.flags.writeable = False
+        return view
+
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
+        return self.c_get_as_numpy_view().copy()
 
     def __init__(self, length):
-        self._length = length
-        self._buffer = np.zeros(length, dtype=np.double)
-        self._delimiter = 0
-        self._is_full = False
+        self.c_reset(length)
+
+    def __len__(self):
+        return self.c_size()
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -82,6 +144,13 @@ cdef class RingBuffer:
     def get_as_numpy_array(self):
         return self.c_get_as_numpy_array()
 
+    def get_as_numpy_view(self):
+        """
+        :return: A read-only view of the values from the oldest to the last one, only valid until the next value is
+        added. get_as_numpy_array() returns a copy to keep.
+        """
+        return self.c_get_as_numpy_view()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -109,10 +178,7 @@ cdef class RingBuffer:
     def length(self, value):
         data = self.get_as_numpy_array()
 
-        self._length = value
-        self._buffer = np.zeros(value, dtype=np.float64)
-        self._delimiter = 0
-        self._is_full = False
+        self.c_reset(value)
 
         for val in data[-value:]:
             self.add_value(val)
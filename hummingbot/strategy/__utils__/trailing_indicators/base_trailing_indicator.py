@@ -35,7 +35,7 @@ class BaseTrailingIndicator(ABC):
         Processing of the processing buffer to return final value.
         Default behavior is buffer average
         """
-        return np.mean(self._processing_buffer.get_as_numpy_array())
+        return np.mean(self._processing_buffer.get_as_numpy_view())
 
     @property
     def current_value(self) -> float:
@@ -51,7 +51,7 @@ class BaseTrailingIndicator(ABC):
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        buffer_len = len(self._sampling_buffer.get_as_numpy_array())
+        buffer_len = len(self._sampling_buffer)
         is_changed = self._samples_length != buffer_len
         self._samples_length = buffer_len
         return is_changed
@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 
 from .base_trailing_indicator import BaseTrailingIndicator
@@ -6,15 +8,44 @@ from .base_trailing_indicator import BaseTrailingIndicator
 class InstantVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # Sum of the squared differences between consecutive samples of the sampling buffer
+        self._squared_diffs_sum = 0.0
+        self._samples_since_sum_update = 0
+
+    def add_sample(self, value: float):
+        samples = self._sampling_buffer.get_as_numpy_view()
+        if self._sampling_buffer.is_full and samples.size > 1:
+            # The oldest sample leaves the buffer with the sample added
+            self._squared_diffs_sum -= float(samples[1] - samples[0]) ** 2
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
         # The standard deviation should be calculated between ticks and not with a mean of the whole buffer
         # Otherwise if the asset is trending, changing the length of the buffer would result in a greater volatility as more ticks would be further away from the mean
         # which is a nonsense result. If volatility of the underlying doesn't change in fact, changing the length of the buffer shouldn't change the result.
-        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
-        vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
+        np_sampling_buffer = self._sampling_buffer.get_as_numpy_view()
+        self._samples_since_sum_update += 1
+        if self._samples_since_sum_update >= np_sampling_buffer.size or not math.isfinite(self._squared_diffs_sum):
+            # Summed again once per rotation of the buffer, so the rounding errors don't add up
+            self._update_squared_diffs_sum()
+        elif np_sampling_buffer.size > 1:
+            self._squared_diffs_sum += float(np_sampling_buffer[-1] - np_sampling_buffer[-2]) ** 2
+        vol = math.sqrt(max(self._squared_diffs_sum, 0.0) / np_sampling_buffer.size)
         return vol
 
     def _processing_calculation(self) -> float:
         # Only the last calculated volatlity, not an average of multiple past volatilities
         return self._processing_buffer.get_last_value()
+
+    def _update_squared_diffs_sum(self):
+        self._squared_diffs_sum = float(np.sum(np.square(np.diff(self._sampling_buffer.get_as_numpy_view()))))
+        self._samples_since_sum_update = 0
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_buffer.length
+
+    @sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        self._update_squared_diffs_sum()
@@ -13,16 +13,24 @@ cdef class TradingIntensityIndicator:
         double _alpha
         double _kappa
         dict _trade_samples
+        list _sample_timestamps
+        dict _price_levels_amount
+        dict _price_levels_trades
+        bint _price_levels_changed
         list _current_trade_sample
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
+        list _quote_timestamps
+        list _quote_prices
         int _sampling_length
         int _samples_length
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_quote(self, double timestamp, double price)
+    cdef c_add_trade(self, double sample_timestamp, double price_level, double amount)
+    cdef c_remove_trade_sample(self, double sample_timestamp)
     cdef c_estimate_intensity(self)
 
 cdef class TradesForwarder(EventListener):
@@ -2,6 +2,7 @@
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
 import warnings
+from bisect import bisect_left, insort
 from decimal import Decimal
 from typing import Tuple
 
@@ -26,11 +27,26 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
+    """
+    Estimates the order book intensity factor alpha and depth factor kappa of the Avellaneda model, fitting
+    alpha * exp(-kappa * price level) to the amount traded at each price level away from the mid price of the last quote
+    before the trade.
+
+    The quotes are kept in ascending timestamp order, so each trade finds its quote with a binary search. The amount
+    traded by price level is kept up to date as the trades are sampled and the oldest samples leave the buffer, and the
+    fit only runs again when it changed.
+    """
 
     def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
         self._alpha = 0
         self._kappa = 0
+        # Trades by sample timestamp, as (price level, amount)
         self._trade_samples = {}
+        self._sample_timestamps = []
+        # Amount and number of trades by price level, over the trade samples
+        self._price_levels_amount = {}
+        self._price_levels_trades = {}
+        self._price_levels_changed = False
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -38,7 +54,9 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
+        # Mid price quotes, in ascending timestamp order
+        self._quote_timestamps = []
+        self._quote_prices = []
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -67,53 +85,49 @@ cdef class TradingIntensityIndicator:
     @property
     def last_quotes(self) -> list:
         """A helper method to be used in unit tests"""
-        return self._last_quotes
+        return [{"timestamp": timestamp, "price": price}
+                for timestamp, price in zip(reversed(self._quote_timestamps), reversed(self._quote_prices))]
 
     @last_quotes.setter
     def last_quotes(self, value):
-        """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        """A helper method to be used in unit tests. The quotes are in descending timestamp order."""
+        self._quote_timestamps = []
+        self._quote_prices = []
+        for quote in reversed(value):
+            self.c_add_quote(quote["timestamp"], float(quote["price"]))
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
         self.c_calculate(timestamp)
 
     cdef c_calculate(self, timestamp):
+        cdef:
+            int quote_index
+            int latest_processed_quote_index = -1
+
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+        self.c_add_quote(timestamp, float(price))
 
-        latest_processed_quote_idx = None
         for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
+            # Last quote before the trade
+            quote_index = bisect_left(self._quote_timestamps, trade.timestamp) - 1
+            if quote_index >= 0:
+                latest_processed_quote_index = max(latest_processed_quote_index, quote_index)
+                self.c_add_trade(self._quote_timestamps[quote_index] + 1,
+                                 abs(trade.price - self._quote_prices[quote_index]),
+                                 trade.amount)
 
         # THere are no trades left to process
         self._current_trade_sample = []
         # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
-
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+        if latest_processed_quote_index > 0:
+            del self._quote_timestamps[:latest_processed_quote_index]
+            del self._quote_prices[:latest_processed_quote_index]
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+        while len(self._sample_timestamps) > self._sampling_length:
+            self.c_remove_trade_sample(self._sample_timestamps[0])
 
-        if self.is_sampling_buffer_full:
+        if self.is_sampling_buffer_full and self._price_levels_changed:
             self.c_estimate_intensity()
 
     def register_trade(self, trade):
@@ -123,40 +137,70 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
+    cdef c_add_quote(self, double timestamp, double price):
+        # A trade is matched to the last quote added before it, so the quotes after a quote added back in time are
+        # left out, and the quotes stay in ascending timestamp order
+        while len(self._quote_timestamps) > 0 and self._quote_timestamps[-1] > timestamp:
+            self._quote_timestamps.pop()
+            self._quote_prices.pop()
+        self._quote_timestamps.append(timestamp)
+        self._quote_prices.append(price)
+
+    cdef c_add_trade(self, double sample_timestamp, double price_level, double amount):
+        if sample_timestamp not in self._trade_samples:
+            self._trade_samples[sample_timestamp] = []
+            insort(self._sample_timestamps, sample_timestamp)
+        self._trade_samples[sample_timestamp].append((price_level, amount))
+        self._price_levels_amount[price_level] = self._price_levels_amount.get(price_level, 0) + amount
+        self._price_levels_trades[price_level] = self._price_levels_trades.get(price_level, 0) + 1
+        self._price_levels_changed = True
+
+    cdef c_remove_trade_sample(self, double sample_timestamp):
+        self._sample_timestamps.remove(sample_timestamp)
+        for price_level, amount in self._trade_samples.pop(sample_timestamp):
+            trades = self._price_levels_trades[price_level] - 1
+            if trades == 0:
+                del self._price_levels_trades[price_level]
+                del self._price_levels_amount[price_level]
+            else:
+                self._price_levels_trades[price_level] = trades
+                self._price_levels_amount[price_level] -= amount
+        self._price_levels_changed = True
+
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
-            list lambdas
-            list price_levels
-
-        # Calculate lambdas / trading intensities
-        lambdas = []
-
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
+            int price_levels_count = len(self._price_levels_amount)
+            tuple initial_params = (self._alpha, self._kappa)
 
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+        self._price_levels_changed = False
+        price_levels = np.fromiter(self._price_levels_amount.keys(), dtype=np.float64, count=price_levels_count)
+        lambdas = np.fromiter(self._price_levels_amount.values(), dtype=np.float64, count=price_levels_count)
+        # Descending price levels
+        order = np.argsort(price_levels)[::-1]
+        price_levels = price_levels[order]
+        lambdas = lambdas[order]
 
         # Adjust to be able to calculate log
-        lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
-
-        # Fit the probability density function; reuse previously calculated parameters as initial values
+        lambdas[lambdas == 0] = 10**-10
+
+        # Reuse previously calculated parameters as initial values, so the estimate doesn't jump to another local
+        # minimum. The first fit starts from the closed-form least squares fit of log(lambda) = log(alpha) - kappa * t
+        if self._alpha == 0 and price_levels_count > 1 and np.all(lambdas > 0):
+            log_lambdas = np.log(lambdas)
+            price_levels_deviation = price_levels - price_levels.mean()
+            price_levels_variance = price_levels_deviation @ price_levels_deviation
+            if price_levels_variance > 0:
+                kappa = max(-(price_levels_deviation @ (log_lambdas - log_lambdas.mean())) / price_levels_variance, 0)
+                alpha = np.exp(log_lambdas.mean() + kappa * price_levels.mean())
+                if np.isfinite(alpha):
+                    initial_params = (alpha, kappa)
+
+        # Fit the probability density function
         try:
             params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
                                price_levels,
-                               lambdas_adj,
-                               p0=(self._alpha, self._kappa),
+                               lambdas,
+                               p0=initial_params,
                                method='dogbox',
                                bounds=([0, 0], [np.inf, np.inf]))
 
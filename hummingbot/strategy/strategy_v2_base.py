@@ -4,7 +4,7 @@ import inspect
 import logging
 import os
 from decimal import Decimal
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
 
 import numpy as np
 import pandas as pd
@@ -13,7 +13,6 @@ from pydantic import BaseModel, Field, field_validator
 
 from hummingbot.client import settings
 from hummingbot.client.config.config_data_types import BaseClientModel
-from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.connector.utils import split_hb_trading_pair
@@ -25,7 +24,6 @@ from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 from hummingbot.exceptions import InvalidController
 from hummingbot.logger import HummingbotLogger
-from hummingbot.remote_iface.mqtt import ETopicPublisher
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.strategy_py_base import StrategyPyBase
 from hummingbot.strategy_v2.controllers.controller_base import ControllerBase, ControllerConfigBase
@@ -43,6 +41,9 @@ from hummingbot.strategy_v2.models.executor_actions import (
 )
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
+if TYPE_CHECKING:
+    from hummingbot.remote_iface.mqtt import ETopicPublisher
+
 lsb_logger = None
 s_decimal_nan = Decimal("NaN")
 
@@ -275,7 +276,7 @@ class StrategyV2Base(StrategyPyBase):
         self.market_data_provider = MarketDataProvider(connectors)
         self._is_stop_triggered = False
         self.mqtt_enabled = False
-        self._pub: Optional[ETopicPublisher] = None
+        self._pub: Optional["ETopicPublisher"] = None
 
         self.actions_queue = asyncio.Queue()
         self.listen_to_executor_actions_task: asyncio.Task = asyncio.create_task(self.listen_to_executor_actions())
@@ -498,6 +499,8 @@ class StrategyV2Base(StrategyPyBase):
         Returns status of the current strategy on user balances and current active orders.
         In V2 mode, also shows controller reports and performance summary.
         """
+        from hummingbot.client.ui.interface_utils import format_df_for_printout
+
         if not self.ready_to_trade:
             return "Market connectors are not ready."
         lines = []
@@ -641,6 +644,7 @@ class StrategyV2Base(StrategyPyBase):
         # Check if MQTT is enabled at runtime
         from hummingbot.client.hummingbot_application import HummingbotApplication
         if HummingbotApplication.main_application()._mqtt is not None:
+            from hummingbot.remote_iface.mqtt import ETopicPublisher
             self.mqtt_enabled = True
             self._pub = ETopicPublisher("performance", use_bot_prefix=True)
 
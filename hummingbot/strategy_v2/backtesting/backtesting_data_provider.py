@@ -10,6 +10,7 @@ from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import LazyDict, PriceType
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig, HistoricalCandlesConfig
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 
@@ -25,8 +26,13 @@ class BacktestingDataProvider(MarketDataProvider):
                            "coinbase_advanced_trade", "kraken", "dydx_v4_perpetual", "hitbtc",
                            "hyperliquid", "injective_v2_perpetual", "injective_v2"]
 
-    def __init__(self, connectors: Dict[str, ConnectorBase]):
+    def __init__(self, connectors: Dict[str, ConnectorBase], candles_store: Optional[CandlesStore] = None):
+        """
+        :param connectors: The connectors of the market data provider
+        :param candles_store: The on-disk store of the historical candles, data/candles by default
+        """
         super().__init__(connectors)
+        self.candles_store = candles_store or CandlesStore()
         self.start_time = None
         self.end_time = None
         self.prices = {}
@@ -83,8 +89,9 @@ class BacktestingDataProvider(MarketDataProvider):
 
     async def get_candles_feed(self, config: CandlesConfig):
         """
-        Retrieves or creates and starts a candle feed based on the given configuration.
-        If an existing feed has a higher or equal max_records, it is reused.
+        Retrieves the historical candles of the backtesting time range, plus max_records candles before it.
+        If the candles already loaded cover the time range, they are reused. Otherwise they are read from the candles
+        store, and only the ranges missing from the store are fetched from the exchange.
         :param config: CandlesConfig
         :return: Candle feed instance.
         """
@@ -97,16 +104,22 @@ class BacktestingDataProvider(MarketDataProvider):
             existing_feed_end_time = existing_feed["timestamp"].max()
             if existing_feed_start_time <= self.start_time and existing_feed_end_time >= self.end_time:
                 return existing_feed
-        # Create a new feed or restart the existing one with updated max_records
-        candle_feed = CandlesFactory.get_candle(config)
+        candles_feeds = []
+
+        async def fetch(historical_config: HistoricalCandlesConfig) -> pd.DataFrame:
+            # The feed is only created when candles are missing from the store
+            if len(candles_feeds) == 0:
+                candles_feeds.append(CandlesFactory.get_candle(config))
+            return await candles_feeds[0].get_historical_candles(config=historical_config)
+
         candles_buffer = config.max_records * CandlesBase.interval_to_seconds[config.interval]
-        candles_df = await candle_feed.get_historical_candles(config=HistoricalCandlesConfig(
+        candles_df = await self.candles_store.get_candles(HistoricalCandlesConfig(
             connector_name=config.connector,
             trading_pair=config.trading_pair,
             interval=config.interval,
             start_time=self.start_time - candles_buffer,
             end_time=self.end_time,
-        ))
+        ), fetch=fetch)
         # TODO: fix pandas-ta improper float index slicing to allow us to use float indexes
         # candles_df = self.ensure_epoch_index(candles_df)
         self.candles_feeds[key] = candles_df
@@ -32,7 +32,11 @@ from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 class BacktestingEngineBase:
     __controller_class_cache = LazyDict[str, Type[ControllerBase]]()
 
-    def __init__(self):
+    def __init__(self, vectorized: bool = False):
+        """
+        :param vectorized: Advance the simulation over NumPy arrays instead of pandas rows, with the same results
+        """
+        self.vectorized = vectorized
         self.controller = None
         self.backtesting_resolution = None
         self.backtesting_data_provider = BacktestingDataProvider(connectors={})
@@ -89,13 +93,10 @@ class BacktestingEngineBase:
             from hummingbot.strategy_v2.utils.common import generate_unique_id
             controller_config.id = generate_unique_id()
 
-        controller_class = self.__controller_class_cache.get_or_add(controller_config.controller_name, controller_config.get_controller_class)
-        # controller_class = controller_config.get_controller_class()
         # Load historical candles
         self.backtesting_data_provider.update_backtesting_time(start, end)
         await self.backtesting_data_provider.initialize_trading_rules(controller_config.connector_name)
-        self.controller = controller_class(config=controller_config, market_data_provider=self.backtesting_data_provider,
-                                           actions_queue=None)
+        self.controller = self.create_controller(controller_config)
         self.backtesting_resolution = backtesting_resolution
         await self.initialize_backtesting_data_provider()
         await self.controller.update_processed_data()
@@ -107,14 +108,26 @@ class BacktestingEngineBase:
             "processed_data": self.controller.processed_data,
         }
 
-    async def initialize_backtesting_data_provider(self):
+    def create_controller(self, controller_config: ControllerConfigBase) -> ControllerBase:
+        controller_class = self.__controller_class_cache.get_or_add(controller_config.controller_name,
+                                                                    controller_config.get_controller_class)
+        return controller_class(config=controller_config, market_data_provider=self.backtesting_data_provider,
+                                actions_queue=None)
+
+    def get_backtesting_candles_configs(self) -> List[CandlesConfig]:
+        """
+        Returns the candles feeds the controller needs: the backtesting resolution feed of its trading pair, followed by
+        the feeds requested by the controller.
+        """
         backtesting_config = CandlesConfig(
             connector=self.controller.config.connector_name,
             trading_pair=self.controller.config.trading_pair,
             interval=self.backtesting_resolution
         )
-        await self.controller.market_data_provider.initialize_candles_feed(backtesting_config)
-        for config in self.controller.config.candles_config:
+        return [backtesting_config] + self.controller.get_candles_config()
+
+    async def initialize_backtesting_data_provider(self):
+        for config in self.get_backtesting_candles_configs():
             await self.controller.market_data_provider.initialize_candles_feed(config)
 
     async def simulate_execution(self, trade_cost: float) -> list:
@@ -127,6 +140,8 @@ class BacktestingEngineBase:
         Returns:
             List[ExecutorInfo]: List of executor information objects detailing the simulation results.
         """
+        if self.vectorized:
+            return await self.simulate_execution_vectorized(trade_cost)
         processed_features = self.prepare_market_data()
         self.active_executor_simulations: List[ExecutorSimulation] = []
         self.stopped_executors_info: List[ExecutorInfo] = []
@@ -142,6 +157,45 @@ class BacktestingEngineBase:
 
         return self.controller.executors_info
 
+    async def simulate_execution_vectorized(self, trade_cost: float) -> list:
+        """
+        Same simulation as simulate_execution, without building a pandas row per timestamp. The features are read once
+        into a NumPy array and each step updates the controller from a plain dict of the row, while the executor info
+        of the active simulations is only rebuilt when they reach a new row of their own simulation.
+
+        Args:
+            trade_cost (float): The cost per trade.
+
+        Returns:
+            List[ExecutorInfo]: List of executor information objects detailing the simulation results.
+        """
+        processed_features = self.prepare_market_data()
+        self.active_executor_simulations: List[ExecutorSimulation] = []
+        self.stopped_executors_info: List[ExecutorInfo] = []
+        columns = processed_features.columns.tolist()
+        # DataFrame.to_numpy() upcasts the columns like iterrows() does, so the rows hold the same values.
+        rows = processed_features.to_numpy()
+        for position in range(len(rows)):
+            row = dict(zip(columns, rows[position].tolist()))
+            await self.update_state_from_dict(row)
+            for action in self.controller.determine_executor_actions():
+                if isinstance(action, CreateExecutorAction):
+                    executor_simulation = self.simulate_executor(action.executor_config,
+                                                                 processed_features.iloc[position:], trade_cost)
+                    if executor_simulation is not None and executor_simulation.close_type != CloseType.FAILED:
+                        self.manage_active_executors(executor_simulation)
+                elif isinstance(action, StopExecutorAction):
+                    self.handle_stop_action(action, row["timestamp"])
+
+        return self.controller.executors_info
+
+    async def update_state_from_dict(self, row: Dict):
+        key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
+        self.controller.market_data_provider.prices = {key: Decimal(row["close_bt"])}
+        self.controller.market_data_provider._time = row["timestamp"]
+        self.controller.processed_data.update(row)
+        self.update_executors_info(row["timestamp"])
+
     async def update_state(self, row):
         key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
         self.controller.market_data_provider.prices = {key: Decimal(row["close_bt"])}
@@ -153,7 +207,10 @@ class BacktestingEngineBase:
         active_executors_info = []
         simulations_to_remove = []
         for executor in self.active_executor_simulations:
-            executor_info = executor.get_executor_info_at_timestamp(timestamp)
+            if self.vectorized:
+                executor_info = executor.get_latest_executor_info(timestamp)
+            else:
+                executor_info = executor.get_executor_info_at_timestamp(timestamp)
             if executor_info.status == RunnableStatus.TERMINATED:
                 self.stopped_executors_info.append(executor_info)
                 simulations_to_remove.append(executor.config.id)
@@ -0,0 +1,242 @@
+import asyncio
+import itertools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
+
+
+@dataclass
+class SharedColumn:
+    name: Any
+    dtype: str
+    offset: int
+
+
+@dataclass
+class SharedFrame:
+    """
+    Location of a DataFrame whose numeric columns were copied into a shared memory block. The columns that can not
+    be shared, like object ones, travel with the descriptor.
+    """
+    shm_name: str
+    rows: int
+    columns: List[SharedColumn]
+    column_order: List[Any]
+    index: Any
+    other_columns: Dict[Any, np.ndarray]
+
+
+def share_frame(df: pd.DataFrame) -> Tuple[SharedMemory, SharedFrame]:
+    """
+    Copies the numeric columns of the DataFrame into a new shared memory block. The caller owns the block and must
+    close and unlink it once the readers are done.
+    """
+    numeric_columns = [column for column in df.columns if df[column].dtype.kind in "biuf"]
+    shared_columns = []
+    size = 0
+    for column in numeric_columns:
+        dtype = df[column].dtype
+        shared_columns.append(SharedColumn(name=column, dtype=dtype.str, offset=size))
+        # Keeps every column 8 bytes aligned
+        size += -(-len(df) * dtype.itemsize // 8) * 8
+    shm = SharedMemory(create=True, size=max(size, 1))
+    for shared_column in shared_columns:
+        values = df[shared_column.name].to_numpy()
+        np.ndarray(len(df), dtype=values.dtype, buffer=shm.buf, offset=shared_column.offset)[:] = values
+    return shm, SharedFrame(
+        shm_name=shm.name,
+        rows=len(df),
+        columns=shared_columns,
+        column_order=list(df.columns),
+        index=df.index,
+        other_columns={column: df[column].to_numpy() for column in df.columns if column not in numeric_columns},
+    )
+
+
+def attach_frame(shared_frame: SharedFrame) -> Tuple[SharedMemory, pd.DataFrame]:
+    """
+    Rebuilds the DataFrame on top of the shared memory block, without copying it. The columns are read only, and the
+    returned block must stay open while the DataFrame is in use.
+    """
+    shm = SharedMemory(name=shared_frame.shm_name)
+    columns = dict(shared_frame.other_columns)
+    for shared_column in shared_frame.columns:
+        values = np.ndarray(shared_frame.rows, dtype=np.dtype(shared_column.dtype), buffer=shm.buf,
+                            offset=shared_column.offset)
+        values.flags.writeable = False
+        columns[shared_column.name] = values
+    df = pd.DataFrame({column: columns[column] for column in shared_frame.column_order},
+                      index=shared_frame.index, copy=False)
+    return shm, df
+
+
+class SharedCandlesDataProvider(BacktestingDataProvider):
+    """
+    BacktestingDataProvider serving the candles loaded by the sweep process instead of fetching them again.
+    """
+
+    def __init__(self, shared_feeds: Dict[str, pd.DataFrame]):
+        super().__init__(connectors={})
+        self._shared_feeds = shared_feeds
+        self.candles_feeds.update(shared_feeds)
+
+    async def get_candles_feed(self, config: CandlesConfig):
+        candles_df = self._shared_feeds.get(self._generate_candle_feed_key(config))
+        if candles_df is not None:
+            return candles_df
+        return await super().get_candles_feed(config)
+
+
+# State of a sweep worker process, set once by _initialize_worker and reused by all the backtests it runs.
+_worker_state: Dict[str, Any] = {}
+
+
+def _initialize_worker(shared_feeds: Dict[str, SharedFrame], trading_rules: Dict, vectorized: bool):
+    segments = []
+    feeds = {}
+    for key, shared_frame in shared_feeds.items():
+        shm, feeds[key] = attach_frame(shared_frame)
+        segments.append(shm)
+    data_provider = SharedCandlesDataProvider(feeds)
+    data_provider.trading_rules = trading_rules
+    engine = BacktestingEngineBase(vectorized=vectorized)
+    engine.backtesting_data_provider = data_provider
+    _worker_state.update(segments=segments, engine=engine)
+
+
+def _run_backtest(controller_config: ControllerConfigBase, start: int, end: int, backtesting_resolution: str,
+                  trade_cost: float) -> Dict:
+    engine: BacktestingEngineBase = _worker_state["engine"]
+    backtesting_result = asyncio.run(engine.run_backtesting(controller_config, start, end, backtesting_resolution,
+                                                            trade_cost))
+    return backtesting_result["results"]
+
+
+class BacktestingSweep:
+    """
+    Runs the backtest of a controller config for every combination of a parameter grid, spread across a pool of
+    processes.
+
+    The trading rules and the candles of all the runs are loaded once, in the calling process, and the candles are
+    copied into shared memory blocks that each worker maps without copying. Each worker then reuses one engine for
+    all its runs, so a run only pays for its own simulation.
+
+    (i.e)
+        sweep = BacktestingSweep(max_workers=8)
+        results_df = await sweep.run(config, {"stop_loss": [0.01, 0.02], "take_profit": [0.01, 0.02]}, start, end)
+    """
+
+    MP_START_METHOD = "spawn"
+
+    def __init__(self,
+                 max_workers: Optional[int] = None,
+                 vectorized: bool = True,
+                 backtesting_data_provider: Optional[BacktestingDataProvider] = None):
+        """
+        :param max_workers: Number of worker processes, defaults to the number of CPUs
+        :param vectorized: Run the backtests with the vectorized engine mode
+        :param backtesting_data_provider: Provider used to load the candles and trading rules, a new one by default
+        """
+        self._max_workers: int = max_workers or os.cpu_count() or 1
+        self._vectorized: bool = vectorized
+        self._engine: BacktestingEngineBase = BacktestingEngineBase()
+        if backtesting_data_provider is not None:
+            self._engine.backtesting_data_provider = backtesting_data_provider
+
+    @staticmethod
+    def expand_grid(base_config: ControllerConfigBase,
+                    param_grid: Dict[str, List[Any]]) -> List[Tuple[Dict[str, Any], ControllerConfigBase]]:
+        """
+        Builds a validated copy of the base config for every combination of the parameter values.
+        :return: List of (parameters, config) tuples
+        """
+        unknown_params = [param for param in param_grid if param not in type(base_config).model_fields]
+        if len(unknown_params) > 0:
+            raise ValueError(f"Unknown {type(base_config).__name__} fields in the parameter grid: {unknown_params}")
+        base_values = base_config.model_dump()
+        param_names = list(param_grid)
+        runs = []
+        for i, values in enumerate(itertools.product(*(param_grid[name] for name in param_names))):
+            params = dict(zip(param_names, values))
+            config_values = {**base_values, **params}
+            if base_config.id:
+                config_values["id"] = f"{base_config.id}_{i}"
+            runs.append((params, type(base_config).model_validate(config_values)))
+        return runs
+
+    async def run(self,
+                  base_config: ControllerConfigBase,
+                  param_grid: Dict[str, List[Any]],
+                  start: int,
+                  end: int,
+                  backtesting_resolution: str = "1m",
+                  trade_cost: float = 0.0006) -> pd.DataFrame:
+        """
+        Backtests every combination of the parameter grid.
+        :return: One row per run, with the parameters, the config id and the summarize_results metrics. A run that
+            failed keeps its parameters and config id, and has the exception in its error column.
+        """
+        runs = self.expand_grid(base_config, param_grid)
+        if len(runs) == 0:
+            return pd.DataFrame(columns=[*param_grid, "config_id"])
+        await self._load_backtesting_data([config for _, config in runs], start, end, backtesting_resolution)
+
+        data_provider = self._engine.backtesting_data_provider
+        segments: List[SharedMemory] = []
+        try:
+            shared_feeds = {}
+            for key, candles_df in data_provider.candles_feeds.items():
+                shm, shared_feeds[key] = share_frame(candles_df)
+                segments.append(shm)
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(max_workers=min(self._max_workers, len(runs)),
+                                     mp_context=multiprocessing.get_context(self.MP_START_METHOD),
+                                     initializer=_initialize_worker,
+                                     initargs=(shared_feeds, data_provider.trading_rules, self._vectorized)) as pool:
+                results = await asyncio.gather(*[
+                    loop.run_in_executor(pool, _run_backtest, config, start, end, backtesting_resolution, trade_cost)
+                    for _, config in runs
+                ], return_exceptions=True)
+        finally:
+            for shm in segments:
+                shm.close()
+                shm.unlink()
+
+        rows = []
+        for (params, config), result in zip(runs, results):
+            if isinstance(result, BaseException):
+                rows.append({**params, "config_id": config.id, "error": repr(result)})
+            else:
+                rows.append({**params, "config_id": config.id, **result})
+        return pd.DataFrame(rows)
+
+    async def _load_backtesting_data(self, configs: List[ControllerConfigBase], start: int, end: int,
+                                     backtesting_resolution: str):
+        """
+        Loads the trading rules and, once per feed, the candles every run needs.
+        """
+        engine = self._engine
+        data_provider = engine.backtesting_data_provider
+        data_provider.update_backtesting_time(start, end)
+        engine.backtesting_resolution = backtesting_resolution
+        candles_configs: Dict[str, CandlesConfig] = {}
+        for config in configs:
+            await data_provider.initialize_trading_rules(config.connector_name)
+            engine.controller = engine.create_controller(config)
+            for candles_config in engine.get_backtesting_candles_configs():
+                key = data_provider._generate_candle_feed_key(candles_config)
+                if key not in candles_configs or candles_configs[key].max_records < candles_config.max_records:
+                    candles_configs[key] = candles_config
+        for candles_config in candles_configs.values():
+            await data_provider.initialize_candles_feed(candles_config)
@@ -1,8 +1,9 @@
 from decimal import Decimal
-from typing import Union
+from typing import Dict, Optional, Union
 
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, PrivateAttr, field_validator
 
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
@@ -16,6 +17,9 @@ class ExecutorSimulation(BaseModel):
     executor_simulation: pd.DataFrame
     close_type: CloseType
     model_config = ConfigDict(arbitrary_types_allowed=True)
+    _columns: Optional[Dict[str, np.ndarray]] = PrivateAttr(default=None)
+    _info_position: Optional[int] = PrivateAttr(default=None)
+    _info: Optional[ExecutorInfo] = PrivateAttr(default=None)
 
     @field_validator('executor_simulation', mode="before")
     @classmethod
@@ -53,6 +57,60 @@ class ExecutorSimulation(BaseModel):
             custom_info=self.get_custom_info(last_entry)
         )
 
+    def get_latest_executor_info(self, timestamp: float) -> ExecutorInfo:
+        """
+        Same result as get_executor_info_at_timestamp, built from the simulation columns read once as NumPy arrays
+        instead of a pandas row. The ExecutorInfo is only rebuilt when the timestamp reaches another simulation row,
+        so it must not be mutated by the caller.
+        """
+        if self._columns is None:
+            df = self.executor_simulation
+            self._columns = {
+                "timestamp": df.index.to_numpy(dtype=float),
+                "net_pnl_pct": df["net_pnl_pct"].to_numpy(),
+                "net_pnl_quote": df["net_pnl_quote"].to_numpy(),
+                "cum_fees_quote": df["cum_fees_quote"].to_numpy(),
+                "filled_amount_quote": df["filled_amount_quote"].to_numpy(),
+                "close": df["close"].to_numpy(),
+                "current_position_average_price": (df["current_position_average_price"].to_numpy()
+                                                   if "current_position_average_price" in df else None),
+            }
+        columns = self._columns
+        timestamps = columns["timestamp"]
+        pos = int(np.searchsorted(timestamps, timestamp, side="right")) - 1
+        if pos == self._info_position:
+            return self._info
+        if pos < 0:
+            info = self._empty_executor_info()
+        else:
+            is_active = bool(timestamps[pos] < timestamps[-1])
+            filled_amount_quote = columns["filled_amount_quote"][pos]
+            average_prices = columns["current_position_average_price"]
+            info = ExecutorInfo.model_construct(
+                id=self.config.id,
+                timestamp=self.config.timestamp,
+                type=self.config.type,
+                close_timestamp=None if is_active else float(timestamps[pos]),
+                close_type=None if is_active else self.close_type,
+                status=RunnableStatus.RUNNING if is_active else RunnableStatus.TERMINATED,
+                config=self.config,
+                net_pnl_pct=Decimal(columns["net_pnl_pct"][pos]),
+                net_pnl_quote=Decimal(columns["net_pnl_quote"][pos]),
+                cum_fees_quote=Decimal(columns["cum_fees_quote"][pos]),
+                filled_amount_quote=Decimal(filled_amount_quote),
+                is_active=is_active,
+                is_trading=bool(filled_amount_quote > 0 and is_active),
+                custom_info={
+                    "close_price": columns["close"][pos],
+                    "level_id": self.config.level_id,
+                    "side": self.config.side,
+                    "current_position_average_price": average_prices[pos] if average_prices is not None else None,
+                },
+            )
+        self._info_position = pos
+        self._info = info
+        return info
+
     def _empty_executor_info(self):
         # Helper method to create an empty ExecutorInfo
         return ExecutorInfo(
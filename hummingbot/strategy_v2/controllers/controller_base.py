@@ -1,9 +1,9 @@
 import asyncio
 import importlib
 import inspect
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from decimal import Decimal
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from pydantic import ConfigDict, Field, field_validator
 
@@ -54,6 +54,123 @@ class ExecutorFilter:
     min_close_timestamp: Optional[float] = None
     max_close_timestamp: Optional[float] = None
 
+    def key(self) -> Tuple:
+        """Hashable key of the criteria, to cache the result of the filter."""
+        values = (getattr(self, field.name) for field in fields(self))
+        return tuple(tuple(value) if isinstance(value, list) else value for value in values)
+
+    def indexed_values(self) -> Dict[str, List]:
+        """
+        :return: The values of the criteria an ExecutorIndex looks up, by executor attribute
+        """
+        indexed_values = {}
+        for criteria, attribute in ExecutorIndex.INDEXED_CRITERIA:
+            values = getattr(self, criteria)
+            if values:
+                indexed_values[attribute] = values
+        if self.is_active is not None:
+            indexed_values["is_active"] = [self.is_active]
+        return indexed_values
+
+    def apply(self, executors: List[ExecutorInfo], skip: Optional[str] = None) -> List[ExecutorInfo]:
+        """
+        Keeps the executors matching the criteria, each criteria narrowing down the executors left by the previous one.
+
+        :param skip: Executor attribute of an indexed criteria already checked
+        :return: A new list of the executors matching the criteria
+        """
+        filtered = list(executors)
+        for attribute, values in self.indexed_values().items():
+            if attribute != skip:
+                filtered = [e for e in filtered if getattr(e, attribute) in values]
+        if self.is_trading is not None:
+            filtered = [e for e in filtered if e.is_trading == self.is_trading]
+        if self.close_types:
+            filtered = [e for e in filtered if e.close_type in self.close_types]
+        if self.min_pnl_pct is not None:
+            filtered = [e for e in filtered if e.net_pnl_pct >= self.min_pnl_pct]
+        if self.max_pnl_pct is not None:
+            filtered = [e for e in filtered if e.net_pnl_pct <= self.max_pnl_pct]
+        if self.min_pnl_quote is not None:
+            filtered = [e for e in filtered if e.net_pnl_quote >= self.min_pnl_quote]
+        if self.max_pnl_quote is not None:
+            filtered = [e for e in filtered if e.net_pnl_quote <= self.max_pnl_quote]
+        if self.min_timestamp is not None:
+            filtered = [e for e in filtered if e.timestamp >= self.min_timestamp]
+        if self.max_timestamp is not None:
+            filtered = [e for e in filtered if e.timestamp <= self.max_timestamp]
+        if self.min_close_timestamp is not None:
+            filtered = [e for e in filtered if e.close_timestamp and e.close_timestamp >= self.min_close_timestamp]
+        if self.max_close_timestamp is not None:
+            filtered = [e for e in filtered if e.close_timestamp and e.close_timestamp <= self.max_close_timestamp]
+        return filtered
+
+
+class ExecutorIndex:
+    """
+    Positions of the executors of a controller by id, controller, connector, trading pair, side, type, status and
+    active flag, built from one snapshot of executors_info.
+
+    The positions by an attribute are only built the first time a filter uses it. A filter looks up the executors
+    matching the indexed criteria that matches the fewest of them, and checks its other criteria on these executors
+    only. Since the snapshot doesn't change, the result of each filter is cached until the controller gets a new
+    executors_info.
+    """
+    INDEXED_CRITERIA: Tuple[Tuple[str, str], ...] = (
+        ("executor_ids", "id"),
+        ("controller_ids", "controller_id"),
+        ("connector_names", "connector_name"),
+        ("trading_pairs", "trading_pair"),
+        ("sides", "side"),
+        ("executor_types", "type"),
+        ("statuses", "status"),
+    )
+
+    def __init__(self, executors: List[ExecutorInfo]):
+        self.executors = executors
+        self.size = len(executors)
+        self._positions_by_attribute: Dict[str, Dict[Any, List[int]]] = {}
+        self._results: Dict[Tuple, List[ExecutorInfo]] = {}
+
+    def is_index_of(self, executors: List[ExecutorInfo]) -> bool:
+        return self.executors is executors and self.size == len(executors)
+
+    def get_by_id(self, executor_id: str) -> Optional[ExecutorInfo]:
+        positions = self._positions("id").get(executor_id)
+        return self.executors[positions[0]] if positions else None
+
+    def filter(self, executor_filter: ExecutorFilter) -> List[ExecutorInfo]:
+        """
+        :return: A new list of the executors matching the filter, in the order of executors_info
+        """
+        key = executor_filter.key()
+        result = self._results.get(key)
+        if result is None:
+            result = self._results[key] = self._filter(executor_filter)
+        return list(result)
+
+    def _positions(self, attribute: str) -> Dict[Any, List[int]]:
+        positions = self._positions_by_attribute.get(attribute)
+        if positions is None:
+            positions = self._positions_by_attribute[attribute] = {}
+            for position, executor in enumerate(self.executors):
+                positions.setdefault(getattr(executor, attribute), []).append(position)
+        return positions
+
+    def _filter(self, executor_filter: ExecutorFilter) -> List[ExecutorInfo]:
+        looked_up_attribute: Optional[str] = None
+        looked_up_positions: Optional[List[int]] = None
+        for attribute, values in executor_filter.indexed_values().items():
+            positions_by_value = self._positions(attribute)
+            positions = [position for value in dict.fromkeys(values) for position in positions_by_value.get(value, ())]
+            if looked_up_positions is None or len(positions) < len(looked_up_positions):
+                looked_up_attribute, looked_up_positions = attribute, positions
+        if looked_up_positions is None:
+            return executor_filter.apply(self.executors)
+        looked_up_positions.sort()
+        return executor_filter.apply([self.executors[position] for position in looked_up_positions],
+                                     skip=looked_up_attribute)
+
 
 class ControllerConfigBase(BaseClientModel):
     """
@@ -196,7 +313,8 @@ class ControllerBase(RunnableBase):
                  actions_queue: asyncio.Queue, update_interval: float = 1.0):
         super().__init__(update_interval=update_interval)
         self.config = config
-        self.executors_info: List[ExecutorInfo] = []
+        self._executors_info: List[ExecutorInfo] = []
+        self._executor_index: Optional[ExecutorIndex] = None
         self.positions_held: List[PositionSummary] = []
         self.performance_report: Optional[PerformanceReport] = None
         self.market_data_provider: MarketDataProvider = market_data_provider
@@ -205,6 +323,24 @@ class ControllerBase(RunnableBase):
         self.executors_update_event = asyncio.Event()
         self.executors_info_queue = asyncio.Queue()
 
+    @property
+    def executors_info(self) -> List[ExecutorInfo]:
+        return self._executors_info
+
+    @executors_info.setter
+    def executors_info(self, executors_info: List[ExecutorInfo]):
+        self._executors_info = executors_info
+        self._executor_index = None
+
+    @property
+    def executor_index(self) -> ExecutorIndex:
+        """
+        Index of executors_info, built on the first query after executors_info is updated.
+        """
+        if self._executor_index is None or not self._executor_index.is_index_of(self._executors_info):
+            self._executor_index = ExecutorIndex(self._executors_info)
+        return self._executor_index
+
     def start(self):
         """
         Allow controllers to be restarted after being stopped.
@@ -278,87 +414,22 @@ class ControllerBase(RunnableBase):
         :param filter_func: Optional custom filter function for backward compatibility
         :return: List of filtered ExecutorInfo objects
         """
-        filtered_executors = (executors or self.executors_info).copy()
+        if executors:
+            filtered_executors = executor_filter.apply(executors) if executor_filter else executors.copy()
+        elif executor_filter:
+            filtered_executors = self.executor_index.filter(executor_filter)
+        else:
+            filtered_executors = self.executors_info.copy()
 
         # Apply custom filter function if provided (backward compatibility)
         if filter_func:
             filtered_executors = [executor for executor in filtered_executors if filter_func(executor)]
 
-        # Apply ExecutorFilter criteria if provided
-        if executor_filter:
-            filtered_executors = self._apply_executor_filter(filtered_executors, executor_filter)
-
         return filtered_executors
 
     def _apply_executor_filter(self, executors: List[ExecutorInfo], executor_filter: ExecutorFilter) -> List[ExecutorInfo]:
         """Apply ExecutorFilter criteria to a list of executors."""
-        filtered = executors
-
-        # Filter by executor IDs
-        if executor_filter.executor_ids:
-            filtered = [e for e in filtered if e.id in executor_filter.executor_ids]
-
-        # Filter by connector names
-        if executor_filter.connector_names:
-            filtered = [e for e in filtered if e.connector_name in executor_filter.connector_names]
-
-        # Filter by trading pairs
-        if executor_filter.trading_pairs:
-            filtered = [e for e in filtered if e.trading_pair in executor_filter.trading_pairs]
-
-        # Filter by executor types
-        if executor_filter.executor_types:
-            filtered = [e for e in filtered if e.type in executor_filter.executor_types]
-
-        # Filter by statuses
-        if executor_filter.statuses:
-            filtered = [e for e in filtered if e.status in executor_filter.statuses]
-
-        # Filter by sides
-        if executor_filter.sides:
-            filtered = [e for e in filtered if e.side in executor_filter.sides]
-
-        # Filter by active state
-        if executor_filter.is_active is not None:
-            filtered = [e for e in filtered if e.is_active == executor_filter.is_active]
-
-        # Filter by trading state
-        if executor_filter.is_trading is not None:
-            filtered = [e for e in filtered if e.is_trading == executor_filter.is_trading]
-
-        # Filter by close types
-        if executor_filter.close_types:
-            filtered = [e for e in filtered if e.close_type in executor_filter.close_types]
-
-        # Filter by controller IDs
-        if executor_filter.controller_ids:
-            filtered = [e for e in filtered if e.controller_id in executor_filter.controller_ids]
-
-        # Filter by PnL percentage range
-        if executor_filter.min_pnl_pct is not None:
-            filtered = [e for e in filtered if e.net_pnl_pct >= executor_filter.min_pnl_pct]
-        if executor_filter.max_pnl_pct is not None:
-            filtered = [e for e in filtered if e.net_pnl_pct <= executor_filter.max_pnl_pct]
-
-        # Filter by PnL quote range
-        if executor_filter.min_pnl_quote is not None:
-            filtered = [e for e in filtered if e.net_pnl_quote >= executor_filter.min_pnl_quote]
-        if executor_filter.max_pnl_quote is not None:
-            filtered = [e for e in filtered if e.net_pnl_quote <= executor_filter.max_pnl_quote]
-
-        # Filter by timestamp range
-        if executor_filter.min_timestamp is not None:
-            filtered = [e for e in filtered if e.timestamp >= executor_filter.min_timestamp]
-        if executor_filter.max_timestamp is not None:
-            filtered = [e for e in filtered if e.timestamp <= executor_filter.max_timestamp]
-
-        # Filter by close timestamp range
-        if executor_filter.min_close_timestamp is not None:
-            filtered = [e for e in filtered if e.close_timestamp and e.close_timestamp >= executor_filter.min_close_timestamp]
-        if executor_filter.max_close_timestamp is not None:
-            filtered = [e for e in filtered if e.close_timestamp and e.close_timestamp <= executor_filter.max_close_timestamp]
-
-        return filtered
+        return executor_filter.apply(executors)
 
     def get_executors(self, executor_filter: ExecutorFilter = None) -> List[ExecutorInfo]:
         """
@@ -854,7 +925,4 @@ class ControllerBase(RunnableBase):
         :param executor_id: The executor ID to find
         :return: ExecutorInfo if found, None otherwise
         """
-        for executor in self.executors_info:
-            if executor.id == executor_id:
-                return executor
-        return None
+        return self.executor_index.get_by_id(executor_id)
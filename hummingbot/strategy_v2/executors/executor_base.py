@@ -1,7 +1,7 @@
 import time
 from decimal import Decimal
 from functools import lru_cache
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
@@ -46,17 +46,24 @@ class ExecutorBase(RunnableBase):
         self.close_timestamp: Optional[float] = None
         self._strategy: StrategyV2Base = strategy
         self._held_position_orders = []  # Keep track of orders that become held positions
+        self._executor_info: Optional[ExecutorInfo] = None
+        self._executor_info_key: Optional[Tuple] = None
         self.connectors = {connector_name: connector for connector_name, connector in strategy.connectors.items() if
                            connector_name in connectors}
 
-        # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
+        # Event forwarders for different order events, marking the executor dirty before processing the event, and
+        # waking it up after
+        self._create_buy_order_forwarder = SourceInfoEventForwarder(
+            self._dirty_on_event(self.process_order_created_event))
+        self._create_sell_order_forwarder = SourceInfoEventForwarder(
+            self._dirty_on_event(self.process_order_created_event))
+        self._fill_order_forwarder = SourceInfoEventForwarder(self._dirty_on_event(self.process_order_filled_event))
+        self._complete_buy_order_forwarder = SourceInfoEventForwarder(
+            self._dirty_on_event(self.process_order_completed_event))
+        self._complete_sell_order_forwarder = SourceInfoEventForwarder(
+            self._dirty_on_event(self.process_order_completed_event))
+        self._cancel_order_forwarder = SourceInfoEventForwarder(self._dirty_on_event(self.process_order_canceled_event))
+        self._failed_order_forwarder = SourceInfoEventForwarder(self._dirty_on_event(self.process_order_failed_event))
 
         # Pairs of market events and their corresponding event forwarders
         self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
@@ -107,8 +114,17 @@ class ExecutorBase(RunnableBase):
     @property
     def executor_info(self) -> ExecutorInfo:
         """
-        Returns the executor info.
+        Returns the executor info. It is built again only when the executor changed since the last call: after an
+        order event, a run of the control task, a call to mark_dirty, or a change of status or close type. In between,
+        the same ExecutorInfo is returned.
         """
+        key = (self.version, self._status, self.close_type, self.close_timestamp)
+        if self._executor_info is None or self._executor_info_key != key:
+            self._executor_info = self._build_executor_info()
+            self._executor_info_key = key
+        return self._executor_info
+
+    def _build_executor_info(self) -> ExecutorInfo:
         def _safe_decimal(value) -> Decimal:
             d = Decimal(str(value))
             return d if d.is_finite() else Decimal("0")
@@ -138,6 +154,13 @@ class ExecutorBase(RunnableBase):
         )
         return ei
 
+    def _dirty_on_event(self, process_event: Callable[[int, ConnectorBase, Any], None]):
+        def process_event_and_mark_dirty(event_tag: int, market: ConnectorBase, event: Any):
+            self.mark_dirty()
+            process_event(event_tag, market, event)
+            self.wake()
+        return process_event_and_mark_dirty
+
     def get_custom_info(self) -> Dict:
         """
         Returns the custom info of the executor. Returns an empty dictionary by default, and can be reimplemented
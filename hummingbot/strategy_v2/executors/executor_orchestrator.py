@@ -16,6 +16,7 @@ if TYPE_CHECKING:
 from hummingbot.strategy_v2.executors.arbitrage_executor.arbitrage_executor import ArbitrageExecutor
 from hummingbot.strategy_v2.executors.data_types import PositionSummary
 from hummingbot.strategy_v2.executors.dca_executor.dca_executor import DCAExecutor
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
 from hummingbot.strategy_v2.executors.grid_executor.grid_executor import GridExecutor
 from hummingbot.strategy_v2.executors.lp_executor.lp_executor import LPExecutor
 from hummingbot.strategy_v2.executors.order_executor.order_executor import OrderExecutor
@@ -30,6 +31,7 @@ from hummingbot.strategy_v2.models.executor_actions import (
 )
 from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, PerformanceReport
+from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler
 
 
 class PositionHold:
@@ -167,7 +169,12 @@ class ExecutorOrchestrator:
         self.positions_held = {}
         self.executors_ids_position_held = deque(maxlen=50)
         self.cached_performance = {}
+        # Performance of the done executors that are not stored yet, kept up to date as they finish
+        self._done_executors_performance: Dict[str, PerformanceReport] = {}
+        self._done_executors_info: Dict[str, Dict[ExecutorBase, ExecutorInfo]] = {}
         self.initial_positions_by_controller = initial_positions_by_controller or {}
+        # Runs the control tasks of all the executors, instead of one control loop per executor
+        self.scheduler = RunnableScheduler()
         self._initialize_cached_performance()
 
     def _initialize_cached_performance(self):
@@ -211,14 +218,31 @@ class ExecutorOrchestrator:
         """
         if controller_id not in self.cached_performance:
             self.cached_performance[controller_id] = PerformanceReport()
-        report = self.cached_performance[controller_id]
-        # Only add to realized PnL if not a position hold (consistent with generate_performance_report)
+        self._add_done_executor_performance(self.cached_performance[controller_id], executor_info)
+
+    @staticmethod
+    def _add_done_executor_performance(report: PerformanceReport, executor_info: ExecutorInfo, sign: int = 1):
+        """
+        Add the performance of a done executor to a report, or remove it with sign=-1.
+        """
+        # Only add to realized PnL if not a position hold, position holds are counted separately
         if executor_info.close_type != CloseType.POSITION_HOLD:
-            report.realized_pnl_quote += executor_info.net_pnl_quote
-            report.volume_traded += executor_info.filled_amount_quote
+            report.realized_pnl_quote += sign * executor_info.net_pnl_quote
+            report.volume_traded += sign * executor_info.filled_amount_quote
         if executor_info.close_type:
-            report.close_type_counts[executor_info.close_type] = report.close_type_counts.get(executor_info.close_type,
-                                                                                              0) + 1
+            count = report.close_type_counts.get(executor_info.close_type, 0) + sign
+            if count != 0:
+                report.close_type_counts[executor_info.close_type] = count
+            else:
+                report.close_type_counts.pop(executor_info.close_type, None)
+
+    def _forget_done_executor(self, controller_id: str, executor: ExecutorBase):
+        """
+        Remove a done executor from the performance of the done executors, once it's stored.
+        """
+        executor_info = self._done_executors_info.get(controller_id, {}).pop(executor, None)
+        if executor_info is not None:
+            self._add_done_executor_performance(self._done_executors_performance[controller_id], executor_info, -1)
 
     def _load_position_from_db(self, controller_id: str, db_position: Position):
         """
@@ -312,6 +336,7 @@ class ExecutorOrchestrator:
         self.store_all_executors()
         # Clear executors and trigger garbage collection
         self.active_executors.clear()
+        self.scheduler.stop()
 
     def store_all_positions(self):
         """
@@ -362,6 +387,8 @@ class ExecutorOrchestrator:
                 self._update_cached_performance(controller_id, executor.executor_info)
         # Remove the executors from the list
         self.active_executors = {}
+        self._done_executors_performance.clear()
+        self._done_executors_info.clear()
 
     def execute_action(self, action: ExecutorAction):
         """
@@ -413,6 +440,7 @@ class ExecutorOrchestrator:
         else:
             raise ValueError("Unsupported executor config type")
 
+        executor.scheduler = self.scheduler
         executor.start()
         self.active_executors[controller_id].append(executor)
         # MarketsRecorder.get_instance().store_or_update_executor(executor)
@@ -440,12 +468,13 @@ class ExecutorOrchestrator:
         """
         for controller_id, executors_list in self.active_executors.items():
             # Filter executors that need position updates
-            executors_to_process = [
-                executor for executor in executors_list
-                if (executor.executor_info.is_done and
-                    executor.executor_info.close_type == CloseType.POSITION_HOLD and
-                    executor.executor_info.config.id not in self.executors_ids_position_held)
-            ]
+            executors_to_process = []
+            for executor in executors_list:
+                executor_info = executor.executor_info
+                if (executor_info.is_done and
+                        executor_info.close_type == CloseType.POSITION_HOLD and
+                        executor_info.config.id not in self.executors_ids_position_held):
+                    executors_to_process.append(executor_info)
 
             # Skip if no executors to process
             if not executors_to_process:
@@ -453,8 +482,7 @@ class ExecutorOrchestrator:
 
             positions = self.positions_held.get(controller_id, [])
 
-            for executor in executors_to_process:
-                executor_info = executor.executor_info
+            for executor_info in executors_to_process:
                 self.executors_ids_position_held.append(executor_info.config.id)
 
                 # Determine position side (handling perpetual markets)
@@ -538,6 +566,7 @@ class ExecutorOrchestrator:
             self.logger().error(f"Executor info: {executor.executor_info} | Config: {executor.config}")
 
         self.active_executors[controller_id].remove(executor)
+        self._forget_done_executor(controller_id, executor)
         del executor
         # Trigger garbage collection after executor cleanup
 
@@ -601,23 +630,37 @@ class ExecutorOrchestrator:
         report.volume_traded = cached_report.volume_traded
         report.close_type_counts = cached_report.close_type_counts.copy() if cached_report.close_type_counts else {}
 
-        # Add data from active executors
+        # Add data from active executors. The done executors are added to the performance of the done executors once,
+        # or again if their info changed since.
         active_executors = self.active_executors.get(controller_id, [])
         positions = self.positions_held.get(controller_id, [])
+        done_report = self._done_executors_performance.setdefault(controller_id, PerformanceReport())
+        done_executors_info = self._done_executors_info.setdefault(controller_id, {})
 
+        done_executors_count = 0
         for executor in active_executors:
             executor_info = executor.executor_info
             if not executor_info.is_done:
                 report.unrealized_pnl_quote += executor_info.net_pnl_quote
                 report.volume_traded += executor_info.filled_amount_quote
-            else:
-                # For done executors, only add to realized PnL if they're not already in position holds
-                # Position holds will be counted separately to avoid double counting
-                if executor_info.close_type != CloseType.POSITION_HOLD:
-                    report.realized_pnl_quote += executor_info.net_pnl_quote
-                    report.volume_traded += executor_info.filled_amount_quote
-                if executor_info.close_type:
-                    report.close_type_counts[executor_info.close_type] = report.close_type_counts.get(executor_info.close_type, 0) + 1
+                continue
+            done_executors_count += 1
+            counted_executor_info = done_executors_info.get(executor)
+            if counted_executor_info is executor_info:
+                continue
+            if counted_executor_info is not None:
+                self._add_done_executor_performance(done_report, counted_executor_info, -1)
+            self._add_done_executor_performance(done_report, executor_info)
+            done_executors_info[executor] = executor_info
+        if len(done_executors_info) != done_executors_count:
+            # Some done executors were removed from the active executors without being stored
+            for executor in set(done_executors_info) - set(active_executors):
+                self._forget_done_executor(controller_id, executor)
+
+        report.realized_pnl_quote += done_report.realized_pnl_quote
+        report.volume_traded += done_report.volume_traded
+        for close_type, count in done_report.close_type_counts.items():
+            report.close_type_counts[close_type] = report.close_type_counts.get(close_type, 0) + count
 
         # Add data from positions held and collect position summaries
         positions_summary = []
@@ -1,11 +1,15 @@
 import asyncio
 import logging
 from abc import ABC
+from typing import TYPE_CHECKING, Optional
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.models.base import RunnableStatus
 
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler
+
 
 class RunnableBase(ABC):
     """
@@ -28,7 +32,10 @@ class RunnableBase(ABC):
         """
         self.update_interval = update_interval
         self._status: RunnableStatus = RunnableStatus.NOT_STARTED
+        self._version: int = 0
         self.terminated = asyncio.Event()
+        # When set before start, the control task is run by the scheduler instead of the control loop
+        self.scheduler: Optional["RunnableScheduler"] = None
 
     @property
     def status(self):
@@ -39,6 +46,22 @@ class RunnableBase(ABC):
         """
         return self._status
 
+    @property
+    def version(self) -> int:
+        """
+        Get the version of the state of the smart component. It is incremented by mark_dirty, and after every run of
+        the control task, so the readers can cache what they derive from the state until it changes.
+
+        :return: The version of the state of the smart component.
+        """
+        return self._version
+
+    def mark_dirty(self):
+        """
+        Increment the version of the state of the smart component, to signal that it changed.
+        """
+        self._version += 1
+
     def start(self):
         """
         Start the control loop of the smart component.
@@ -47,7 +70,10 @@ class RunnableBase(ABC):
         if self._status == RunnableStatus.NOT_STARTED:
             self.terminated.clear()
             self._status = RunnableStatus.RUNNING
-            safe_ensure_future(self.control_loop())
+            if self.scheduler is not None:
+                self.scheduler.add(self)
+            else:
+                safe_ensure_future(self.control_loop())
 
     def stop(self):
         """
@@ -57,6 +83,15 @@ class RunnableBase(ABC):
         if self._status != RunnableStatus.TERMINATED:
             self._status = RunnableStatus.TERMINATED
             self.terminated.set()
+            self.wake()
+
+    def wake(self):
+        """
+        Run the control task as soon as possible, instead of waiting for the update interval. Only the smart
+        components run by a scheduler are woken, the control loop always waits for the update interval.
+        """
+        if self.scheduler is not None:
+            self.scheduler.wake(self)
 
     async def control_loop(self):
         """
@@ -65,14 +100,21 @@ class RunnableBase(ABC):
         """
         await self.on_start()
         while not self.terminated.is_set():
-            try:
-                await self.control_task()
-            except Exception as e:
-                self.logger().error(e, exc_info=True)
-            finally:
-                await asyncio.sleep(self.update_interval)
+            await self.run_control_task()
+            await asyncio.sleep(self.update_interval)
         self.on_stop()
 
+    async def run_control_task(self):
+        """
+        Run the control task once, logging its errors, and mark the smart component dirty.
+        """
+        try:
+            await self.control_task()
+        except Exception as e:
+            self.logger().error(e, exc_info=True)
+        finally:
+            self.mark_dirty()
+
     def on_stop(self):
         """
         Method to be executed when the control loop is stopped.
@@ -0,0 +1,296 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import types
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Coroutine, Dict, List, Optional, Tuple
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.runnable_base import RunnableBase
+
+
+@dataclass
+class RunnableSchedulerMetrics:
+    """Counters of a RunnableScheduler. Durations are in milliseconds."""
+    scheduled: int = 0
+    passes: int = 0
+    steps: int = 0
+    inline_steps: int = 0
+    wakeups: int = 0
+    overruns: int = 0
+    last_step_ms: float = 0.0
+    max_step_ms: float = 0.0
+    total_step_ms: float = 0.0
+    max_lateness_ms: float = 0.0
+
+    @property
+    def avg_step_ms(self) -> float:
+        return self.total_step_ms / self.steps if self.steps > 0 else 0.0
+
+    @property
+    def avg_steps_per_pass(self) -> float:
+        return self.steps / self.passes if self.passes > 0 else 0.0
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "scheduled": self.scheduled,
+            "passes": self.passes,
+            "steps": self.steps,
+            "inline_steps": self.inline_steps,
+            "wakeups": self.wakeups,
+            "overruns": self.overruns,
+            "avg_steps_per_pass": self.avg_steps_per_pass,
+            "last_step_ms": self.last_step_ms,
+            "max_step_ms": self.max_step_ms,
+            "avg_step_ms": self.avg_step_ms,
+            "max_lateness_ms": self.max_lateness_ms,
+        }
+
+
+class _ScheduledRunnable:
+    __slots__ = ("runnable", "interval", "deadline", "generation", "task", "started", "running", "inline",
+                 "suspended", "suspensions", "wake_requested")
+
+    def __init__(self, runnable: "RunnableBase", interval: float):
+        self.runnable: "RunnableBase" = runnable
+        self.interval: float = interval
+        self.deadline: float = 0.0
+        # Incremented on every reschedule, so the older heap entries of the runnable are skipped
+        self.generation: int = 0
+        self.task: Optional[asyncio.Task] = None
+        self.started: bool = False
+        self.running: bool = False
+        # Whether the control task is run inline, as long as it never awaited anything on the event loop
+        self.inline: bool = False
+        self.suspended: bool = False
+        self.suspensions: int = 0
+        self.wake_requested: bool = False
+
+
+def _resolve(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+@types.coroutine
+def _count_suspensions(coroutine: Coroutine, entry: _ScheduledRunnable):
+    """
+    Awaits the coroutine, counting the times it is suspended on the event loop.
+    """
+    value: Any = None
+    error: Optional[BaseException] = None
+    while True:
+        try:
+            yielded = coroutine.send(value) if error is None else coroutine.throw(error)
+        except StopIteration as stop:
+            return stop.value
+        entry.suspensions += 1
+        try:
+            value, error = (yield yielded), None
+        except BaseException as e:
+            value, error = None, e
+
+
+class RunnableScheduler:
+    """
+    Runs the control tasks of many runnables from a single timer, instead of one control loop sleeping per runnable.
+
+    The runnables are kept in a heap ordered by their next deadline. The scheduler sleeps until the earliest deadline,
+    and then runs the control task of every runnable due, in deadline order, in one pass. Each runnable is rescheduled
+    at its previous deadline plus its own update interval once its control task is done, or right away when the
+    control task took longer than that, which is counted as an overrun. A control task still running is never started
+    twice.
+
+    Most control tasks never wait on the event loop, so creating a task for each of them would cost as much as the
+    control loops. A control task that completed without being suspended the last time it ran is run inline in the
+    pass. The others, and the first run with on_start, get their own asyncio task, so a control task waiting on the
+    network doesn't hold back the others. A control task run inline that waits anyway holds the pass back once, and
+    gets its own task from then on.
+
+    A runnable whose on_start or control task raises is removed and stopped, with on_stop.
+
+    `wake()` brings the deadline of a runnable forward to now, for example when one of its orders got filled. The
+    runnables are started and stopped like with their own control loop: on_start runs before the first control task,
+    and on_stop once the runnable is terminated.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self):
+        self._entries: Dict["RunnableBase", _ScheduledRunnable] = {}
+        self._heap: List[Tuple[float, int, int, _ScheduledRunnable]] = []
+        self._sequence = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Future] = None
+        self._sleep_until: float = math.inf
+        self._metrics: RunnableSchedulerMetrics = RunnableSchedulerMetrics()
+
+    @property
+    def metrics(self) -> RunnableSchedulerMetrics:
+        self._metrics.scheduled = len(self._entries)
+        return self._metrics
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def __contains__(self, runnable: "RunnableBase") -> bool:
+        return runnable in self._entries
+
+    def add(self, runnable: "RunnableBase", interval: Optional[float] = None):
+        """
+        Schedules the control task of a runnable, starting with on_start in the next pass.
+        :param interval: Seconds between two runs of the control task, the update interval of the runnable by default
+        """
+        if runnable in self._entries:
+            return
+        entry = _ScheduledRunnable(runnable, interval if interval is not None else runnable.update_interval)
+        self._entries[runnable] = entry
+        self._push(entry, self._now())
+        if not self.is_running:
+            self._task = safe_ensure_future(self._run())
+
+    def remove(self, runnable: "RunnableBase"):
+        """
+        Stops scheduling a runnable. A control task already running is not cancelled.
+        """
+        entry = self._entries.pop(runnable, None)
+        if entry is not None:
+            entry.generation += 1
+
+    def wake(self, runnable: "RunnableBase"):
+        """
+        Runs the control task of a runnable in the next pass, or right after the control task already running.
+        """
+        entry = self._entries.get(runnable)
+        if entry is None:
+            return
+        if entry.running:
+            entry.wake_requested = True
+            return
+        now = self._now()
+        if entry.deadline > now:
+            self._metrics.wakeups += 1
+            self._push(entry, now)
+
+    def stop(self):
+        """
+        Stops the scheduler, and cancels the control tasks still running. on_stop is not called on the runnables that
+        are not terminated.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for entry in self._entries.values():
+            if entry.task is not None:
+                entry.task.cancel()
+        self._entries.clear()
+        self._heap.clear()
+
+    @staticmethod
+    def _now() -> float:
+        return asyncio.get_event_loop().time()
+
+    def _push(self, entry: _ScheduledRunnable, deadline: float):
+        entry.deadline = deadline
+        entry.generation += 1
+        heapq.heappush(self._heap, (deadline, next(self._sequence), entry.generation, entry))
+        if self._wakeup is not None and deadline < self._sleep_until:
+            _resolve(self._wakeup)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            due = []
+            while len(self._heap) > 0 and self._heap[0][0] <= now:
+                _, _, generation, entry = heapq.heappop(self._heap)
+                if generation == entry.generation and self._entries.get(entry.runnable) is entry:
+                    due.append(entry)
+            if len(due) > 0:
+                self._metrics.passes += 1
+                for entry in due:
+                    if self._entries.get(entry.runnable) is not entry:
+                        # Removed by a control task run earlier in the pass
+                        continue
+                    self._metrics.max_lateness_ms = max(self._metrics.max_lateness_ms,
+                                                        (loop.time() - entry.deadline) * 1e3)
+                    entry.running = True
+                    if entry.inline:
+                        self._metrics.inline_steps += 1
+                        await self._step(entry)
+                    else:
+                        entry.task = safe_ensure_future(self._step(entry))
+            await self._sleep(loop, self._heap[0][0] if len(self._heap) > 0 else None)
+
+    async def _sleep(self, loop: asyncio.AbstractEventLoop, deadline: Optional[float]):
+        self._wakeup = loop.create_future()
+        self._sleep_until = deadline if deadline is not None else math.inf
+        handle = loop.call_at(deadline, _resolve, self._wakeup) if deadline is not None else None
+        try:
+            await self._wakeup
+        finally:
+            if handle is not None:
+                handle.cancel()
+            self._wakeup = None
+
+    async def _step(self, entry: _ScheduledRunnable):
+        runnable = entry.runnable
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        entry.suspensions = 0
+        phase = "starting"
+        failed = False
+        try:
+            if not entry.started:
+                entry.started = True
+                await runnable.on_start()
+            if not runnable.terminated.is_set():
+                phase = "running the control task of"
+                await _count_suspensions(runnable.run_control_task(), entry)
+                entry.suspended = entry.suspended or entry.suspensions > 0
+                entry.inline = not entry.suspended
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error(f"Unexpected error {phase} {type(runnable).__name__}.", exc_info=True)
+            failed = True
+        finally:
+            entry.task = None
+            entry.running = False
+        finished = loop.time()
+        step_ms = (finished - started) * 1e3
+        self._metrics.steps += 1
+        self._metrics.last_step_ms = step_ms
+        self._metrics.max_step_ms = max(self._metrics.max_step_ms, step_ms)
+        self._metrics.total_step_ms += step_ms
+
+        if self._entries.get(runnable) is not entry:
+            return
+        if failed:
+            runnable.stop()
+        if runnable.terminated.is_set():
+            self.remove(runnable)
+            runnable.on_stop()
+            return
+        next_deadline = entry.deadline + entry.interval
+        if finished > next_deadline:
+            self._metrics.overruns += 1
+            next_deadline = finished
+        if entry.wake_requested:
+            entry.wake_requested = False
+            self._metrics.wakeups += 1
+            next_deadline = finished
+        self._push(entry, next_deadline)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""
+Compares the cost of a controller tick reading the candles DataFrame of a feed, when the candles are kept in a deque
+of row arrays and the DataFrame is rebuilt on every read, as CandlesBase used to, with the CandlesRingBuffer and the
+cached DataFrame. Each tick updates the last candle like a websocket message, closes a candle every
+`--updates-per-candle` ticks, and reads the DataFrame once per controller.
+
+Run with `python -m test.benchmark.candles_df_benchmark`.
+"""
+import argparse
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
+
+
+def run_deque(candles: np.ndarray, ticks: int, updates_per_candle: int, readers: int) -> float:
+    buffer = deque(candles, maxlen=len(candles))
+    row = candles[-1].copy()
+    start = time.perf_counter()
+    for tick in range(ticks):
+        row = row.copy()
+        row[4] += 0.01
+        if tick % updates_per_candle == 0:
+            row[0] += 60
+            buffer.append(row)
+        else:
+            buffer[-1] = row
+        for _ in range(readers):
+            pd.DataFrame(buffer, columns=CandlesBase.columns, dtype=float)
+    return time.perf_counter() - start
+
+
+def run_ring_buffer(candles: np.ndarray, ticks: int, updates_per_candle: int, readers: int) -> float:
+    buffer = CandlesRingBuffer(maxlen=len(candles), n_columns=candles.shape[1])
+    buffer.extend(candles)
+    row = candles[-1].copy()
+    cache, cache_version = None, None
+    start = time.perf_counter()
+    for tick in range(ticks):
+        row[4] += 0.01
+        if tick % updates_per_candle == 0:
+            row[0] += 60
+            buffer.append(row)
+        else:
+            buffer[-1] = row
+        for _ in range(readers):
+            # The same steps as CandlesBase.candles_df
+            if cache_version != buffer.version:
+                cache = pd.DataFrame(buffer.values, columns=CandlesBase.columns, dtype=float, copy=True)
+                cache_version = buffer.version
+            cache.copy()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-records", type=int, default=1000, help="Candles kept by the feed")
+    parser.add_argument("--ticks", type=int, default=2000, help="Websocket updates")
+    parser.add_argument("--updates-per-candle", type=int, default=20, help="Updates before a candle closes")
+    parser.add_argument("--readers", type=int, default=4, help="Controllers reading the feed on each tick")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    candles = np.column_stack([1_700_000_000 + 60 * np.arange(args.max_records)]
+                              + [100 + rng.random(args.max_records) for _ in range(len(CandlesBase.columns) - 1)])
+    for name, run in (("deque", run_deque), ("ring buffer", run_ring_buffer)):
+        elapsed = run(candles, args.ticks, args.updates_per_candle, args.readers)
+        print(f"{name:>11}: {elapsed / args.ticks * 1e6:9.1f} us per tick")
+
+
+if __name__ == "__main__":
+    main()
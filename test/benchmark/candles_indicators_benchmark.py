@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""
+Compares keeping RSI, MACD, Bollinger bands and NATR up to date on a candles feed by recomputing them over the whole
+candles window on every update, the way the controllers use pandas-ta, with the incremental indicators registered on
+the feed. Each tick updates the last candle like a websocket message and closes a candle every `--updates-per-candle`
+ticks. The recomputation uses pandas-ta when it is installed, and the same pandas steps otherwise.
+
+Run with `python -m test.benchmark.candles_indicators_benchmark`.
+"""
+import argparse
+import importlib.util
+import time
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_indicators import MACD, NATR, RSI, BBands
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
+
+
+def pandas_ema(close: pd.Series, length: int) -> pd.Series:
+    close = close.copy()
+    seed = close.iloc[0:length].mean()
+    close.iloc[:length - 1] = np.nan
+    close.iloc[length - 1] = seed
+    return close.ewm(span=length, adjust=False).mean()
+
+
+def recompute_with_pandas(df: pd.DataFrame) -> pd.DataFrame:
+    change = df["close"].diff(1)
+    gains = change.clip(lower=0).ewm(alpha=1 / 14, min_periods=14).mean()
+    losses = (-change).clip(lower=0).ewm(alpha=1 / 14, min_periods=14).mean()
+    df["RSI_14"] = 100 * gains / (gains + losses)
+    macd = pandas_ema(df["close"], 12) - pandas_ema(df["close"], 26)
+    signal = pandas_ema(macd.loc[macd.first_valid_index():], 9)
+    df["MACD_12_26_9"], df["MACDh_12_26_9"], df["MACDs_12_26_9"] = macd, macd - signal, signal
+    mid = df["close"].rolling(20).mean()
+    deviation = df["close"].rolling(20).var(ddof=0).apply(np.sqrt)
+    df["BBL_20_2.0_2.0"], df["BBM_20_2.0_2.0"], df["BBU_20_2.0_2.0"] = mid - 2 * deviation, mid, mid + 2 * deviation
+    df["BBP_20_2.0_2.0"] = (df["close"] - df["BBL_20_2.0_2.0"]) / (4 * deviation)
+    previous_close = df["close"].shift(1)
+    true_range = pd.concat([df["high"] - df["low"], df["high"] - previous_close, previous_close - df["low"]],
+                           axis=1).abs().max(axis=1)
+    true_range.iloc[0] = np.nan
+    df["NATR_14"] = 100 / df["close"] * pandas_ema(true_range, 14)
+    return df
+
+
+def recompute_with_pandas_ta(df: pd.DataFrame) -> pd.DataFrame:
+    import pandas_ta  # noqa: F401
+
+    df.ta.rsi(length=14, append=True)
+    df.ta.macd(fast=12, slow=26, signal=9, append=True)
+    df.ta.bbands(length=20, lower_std=2.0, upper_std=2.0, append=True)
+    df.ta.natr(length=14, append=True)
+    return df
+
+
+def make_candles(count: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, count))
+    candles = np.zeros((count, len(CandlesBase.columns)))
+    candles[:, 0] = 1_700_000_000 + 60 * np.arange(count)
+    candles[:, 1] = close
+    candles[:, 2] = close + rng.random(count)
+    candles[:, 3] = close - rng.random(count)
+    candles[:, 4] = close
+    return candles
+
+
+def run(candles: np.ndarray, ticks: int, updates_per_candle: int, update) -> float:
+    buffer = CandlesRingBuffer(maxlen=len(candles), n_columns=candles.shape[1])
+    buffer.extend(candles)
+    row = candles[-1].copy()
+    update(buffer)
+    start = time.perf_counter()
+    for tick in range(ticks):
+        row[4] += 0.01
+        if tick % updates_per_candle == 0:
+            row[0] += 60
+            buffer.append(row)
+        else:
+            buffer[-1] = row
+        update(buffer)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-records", type=int, default=500, help="Candles kept by the feed")
+    parser.add_argument("--ticks", type=int, default=500, help="Websocket updates")
+    parser.add_argument("--updates-per-candle", type=int, default=20, help="Updates before a candle closes")
+    args = parser.parse_args()
+
+    candles = make_candles(args.max_records)
+    recompute = recompute_with_pandas_ta if importlib.util.find_spec("pandas_ta") else recompute_with_pandas
+    indicators = [RSI(14), MACD(12, 26, 9), BBands(20, 2.0, 2.0), NATR(14)]
+
+    def full(buffer: CandlesRingBuffer):
+        recompute(pd.DataFrame(buffer.values, columns=CandlesBase.columns, copy=True))
+
+    def incremental(buffer: CandlesRingBuffer):
+        for indicator in indicators:
+            indicator.sync(buffer)
+            indicator.latest()
+
+    for name, update in ((f"full recomputation ({recompute.__name__})", full), ("incremental", incremental)):
+        elapsed = run(candles, args.ticks, args.updates_per_candle, update)
+        print(f"{name:>45}: {elapsed / args.ticks * 1e6:9.1f} us per tick")
+
+
+if __name__ == "__main__":
+    main()
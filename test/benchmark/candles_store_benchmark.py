@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""
+Compares building the historical candles DataFrame from the REST pages by concatenating DataFrames in the paging loop,
+as CandlesBase.get_historical_candles used to, with keeping the pages as arrays and concatenating them once, and with
+reading the same candles back from the CandlesStore once they are stored on disk.
+
+Run with `python -m test.benchmark.candles_store_benchmark`.
+"""
+import argparse
+import tempfile
+import time
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+
+START = 1_600_000_020
+
+
+def make_pages(pages: int, page_size: int) -> List[np.ndarray]:
+    """
+    :return: The pages in the order they are fetched, from the most recent one, overlapping on one candle
+    """
+    rng = np.random.default_rng(0)
+    result = []
+    for page in range(pages - 1, -1, -1):
+        first = START + 60 * page * (page_size - 1)
+        candles = rng.random((page_size, len(CandlesBase.columns)))
+        candles[:, 0] = first + 60 * np.arange(page_size)
+        result.append(candles)
+    return result
+
+
+def concat_in_loop(pages: List[np.ndarray]) -> pd.DataFrame:
+    candles_df = pd.DataFrame()
+    for candles in pages:
+        candles_df = pd.concat([pd.DataFrame(candles, columns=CandlesBase.columns), candles_df])
+        candles_df.drop_duplicates(subset=["timestamp"], inplace=True)
+        candles_df.reset_index(drop=True, inplace=True)
+    return candles_df
+
+
+def concat_once(pages: List[np.ndarray]) -> pd.DataFrame:
+    candles = np.concatenate(pages[::-1])
+    _, unique_rows = np.unique(candles[:, 0], return_index=True)
+    return pd.DataFrame(candles[unique_rows], columns=CandlesBase.columns)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=200, help="REST pages of the time range")
+    parser.add_argument("--page-size", type=int, default=1000, help="Candles per REST page")
+    args = parser.parse_args()
+
+    pages = make_pages(args.pages, args.page_size)
+    for name, build in (("pd.concat in the paging loop", concat_in_loop), ("single concatenation", concat_once)):
+        start = time.perf_counter()
+        candles_df = build(pages)
+        print(f"{name:>30}: {(time.perf_counter() - start) * 1e3:9.1f} ms for {len(candles_df)} candles")
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = CandlesStore(directory)
+        first, last = candles_df["timestamp"].iloc[0], candles_df["timestamp"].iloc[-1]
+        store.write("binance", "BTC-USDT", "1m", candles_df.to_numpy(), first, last)
+        start = time.perf_counter()
+        candles_df = store.read_df("binance", "BTC-USDT", "1m", first, last)
+        print(f"{'read from the candles store':>30}: {(time.perf_counter() - start) * 1e3:9.1f} ms for "
+              f"{len(candles_df)} candles")
+
+
+if __name__ == "__main__":
+    main()
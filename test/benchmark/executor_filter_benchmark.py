@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""
+Compares the executor queries of a controller tick when every query copies executors_info and filters it with one list
+comprehension per criteria, as ControllerBase.filter_executors used to, with the ExecutorIndex built once per
+executors_info update. The controller gets new executors_info, then runs the queries of a typical
+determine_executor_actions: its active executors, and its active executors by trading pair and side.
+
+Run with `python -m test.benchmark.executor_filter_benchmark`.
+"""
+import argparse
+import asyncio
+import time
+from decimal import Decimal
+from typing import List
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.data_feed.market_data_provider import MarketDataProvider
+from hummingbot.strategy_v2.controllers.controller_base import ControllerBase, ControllerConfigBase, ExecutorFilter
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+
+def list_filter(executors: List[ExecutorInfo], executor_filter: ExecutorFilter) -> List[ExecutorInfo]:
+    filtered = executors.copy()
+    if executor_filter.connector_names:
+        filtered = [e for e in filtered if e.connector_name in executor_filter.connector_names]
+    if executor_filter.trading_pairs:
+        filtered = [e for e in filtered if e.trading_pair in executor_filter.trading_pairs]
+    if executor_filter.executor_types:
+        filtered = [e for e in filtered if e.type in executor_filter.executor_types]
+    if executor_filter.statuses:
+        filtered = [e for e in filtered if e.status in executor_filter.statuses]
+    if executor_filter.sides:
+        filtered = [e for e in filtered if e.side in executor_filter.sides]
+    if executor_filter.is_active is not None:
+        filtered = [e for e in filtered if e.is_active == executor_filter.is_active]
+    if executor_filter.is_trading is not None:
+        filtered = [e for e in filtered if e.is_trading == executor_filter.is_trading]
+    return filtered
+
+
+def make_executors(executors: int, trading_pairs: int) -> List[ExecutorInfo]:
+    result = []
+    for i in range(executors):
+        side = TradeType.BUY if i % 2 == 0 else TradeType.SELL
+        config = PositionExecutorConfig(id=str(i), timestamp=1_700_000_000, trading_pair=f"TOKEN{i % trading_pairs}-USDT",
+                                        connector_name="binance", side=side, amount=Decimal(1),
+                                        entry_price=Decimal(100), controller_id="benchmark")
+        is_active = i % 4 != 0
+        result.append(ExecutorInfo(id=str(i), timestamp=1_700_000_000, type="position_executor",
+                                   status=RunnableStatus.RUNNING if is_active else RunnableStatus.TERMINATED,
+                                   config=config, net_pnl_pct=Decimal(0), net_pnl_quote=Decimal(0),
+                                   cum_fees_quote=Decimal(0), filled_amount_quote=Decimal(0), is_active=is_active,
+                                   is_trading=i % 3 == 0, custom_info={"side": side}, controller_id="benchmark"))
+    return result
+
+
+def make_queries(trading_pairs: int) -> List[ExecutorFilter]:
+    queries = [ExecutorFilter(is_active=True), ExecutorFilter(is_active=True, is_trading=True)]
+    for i in range(trading_pairs):
+        for side in (TradeType.BUY, TradeType.SELL):
+            queries.append(ExecutorFilter(is_active=True, sides=[side], trading_pairs=[f"TOKEN{i}-USDT"]))
+    # Queries repeated within the tick
+    queries.extend([ExecutorFilter(is_active=True)] * 3)
+    return queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--executors", type=int, default=1000, help="Executors of the controller")
+    parser.add_argument("--trading-pairs", type=int, default=10, help="Trading pairs of the executors")
+    parser.add_argument("--ticks", type=int, default=200, help="Controller ticks")
+    args = parser.parse_args()
+
+    controller = ControllerBase(config=ControllerConfigBase(id="benchmark", controller_name="benchmark"),
+                                market_data_provider=MagicMock(spec=MarketDataProvider),
+                                actions_queue=asyncio.Queue())
+    executors = make_executors(args.executors, args.trading_pairs)
+    queries = make_queries(args.trading_pairs)
+
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        executors_info = list(executors)
+        for executor_filter in queries:
+            list_filter(executors_info, executor_filter)
+    list_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        controller.executors_info = list(executors)
+        for executor_filter in queries:
+            controller.filter_executors(executor_filter=executor_filter)
+    index_elapsed = time.perf_counter() - start
+
+    for name, elapsed in (("list comprehensions", list_elapsed), ("executor index", index_elapsed)):
+        print(f"{name:>20}: {elapsed / args.ticks * 1e3:8.3f} ms per tick for {len(queries)} queries")
+
+
+if __name__ == "__main__":
+    main()
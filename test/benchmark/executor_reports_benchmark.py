@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""
+Compares the cost of the ExecutorOrchestrator reports built on every strategy tick, when the ExecutorInfo of every
+executor is built again on each access, as ExecutorBase.executor_info used to, with the versioned executors that only
+build it again once they changed. Every running executor runs its control task, and is marked dirty, once per tick,
+while the done executors wait to be stored.
+
+Run with `python -m test.benchmark.executor_reports_benchmark`.
+"""
+import argparse
+import time
+from decimal import Decimal
+from typing import Dict
+from unittest.mock import MagicMock, patch
+
+from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.strategy.strategy_v2_base import StrategyV2Base
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
+from hummingbot.strategy_v2.executors.executor_orchestrator import ExecutorOrchestrator
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+
+class BenchmarkExecutor(ExecutorBase):
+    def get_net_pnl_quote(self) -> Decimal:
+        return Decimal("1.5")
+
+    def get_net_pnl_pct(self) -> Decimal:
+        return Decimal("0.015")
+
+    def get_cum_fees_quote(self) -> Decimal:
+        return Decimal("0.1")
+
+    def get_custom_info(self) -> Dict:
+        return {"side": self.config.side, "current_position_average_price": Decimal("100"),
+                "held_position_orders": []}
+
+
+class UncachedBenchmarkExecutor(BenchmarkExecutor):
+    @property
+    def executor_info(self) -> ExecutorInfo:
+        return self._build_executor_info()
+
+
+def make_orchestrator(executor_class, executors: int, done_ratio: float) -> ExecutorOrchestrator:
+    strategy = MagicMock(spec=StrategyV2Base)
+    strategy.controllers = {"benchmark": MagicMock()}
+    strategy.connectors = {}
+    strategy.markets = {}
+    strategy.current_timestamp = 1_700_000_000
+    with patch.object(MarketsRecorder, "get_instance") as markets_recorder:
+        markets_recorder.return_value.get_all_executors.return_value = []
+        markets_recorder.return_value.get_all_positions.return_value = []
+        orchestrator = ExecutorOrchestrator(strategy=strategy)
+    for i in range(executors):
+        config = PositionExecutorConfig(id=str(i), timestamp=1_700_000_000, trading_pair="ETH-USDT",
+                                        connector_name="binance", side=TradeType.BUY, amount=Decimal(1),
+                                        entry_price=Decimal(100), controller_id="benchmark")
+        executor = executor_class(strategy=strategy, connectors=[], config=config)
+        if i < executors * done_ratio:
+            executor.close_type = CloseType.TAKE_PROFIT
+            executor._status = RunnableStatus.TERMINATED
+        else:
+            executor._status = RunnableStatus.RUNNING
+        orchestrator.active_executors["benchmark"].append(executor)
+    return orchestrator
+
+
+def run(orchestrator: ExecutorOrchestrator, ticks: int) -> float:
+    running = [executor for executor in orchestrator.active_executors["benchmark"] if executor.is_active]
+    start = time.perf_counter()
+    for _ in range(ticks):
+        for executor in running:
+            # The control task of the running executors
+            executor.mark_dirty()
+        orchestrator.get_all_reports()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--executors", type=int, default=300, help="Executors of the controller")
+    parser.add_argument("--done-ratio", type=float, default=0.5, help="Share of done executors not stored yet")
+    parser.add_argument("--ticks", type=int, default=50, help="Strategy ticks")
+    args = parser.parse_args()
+
+    for name, executor_class in (("built on each access", UncachedBenchmarkExecutor),
+                                 ("versioned", BenchmarkExecutor)):
+        orchestrator = make_orchestrator(executor_class, args.executors, args.done_ratio)
+        elapsed = run(orchestrator, args.ticks)
+        print(f"{name:>20}: {elapsed / args.ticks * 1e3:9.2f} ms per tick")
+
+
+if __name__ == "__main__":
+    main()
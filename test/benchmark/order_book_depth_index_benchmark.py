@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Compares OrderBook volume queries with and without the cumulative depth index on a synthetic but realistic diff stream:
+a deep book around a random-walk mid price, where most diffs touch levels close to the top of the book. Apply and
+query costs are reported separately, along with an apply-only run, since the index moves work from the queries to the
+first query after each batch of diffs.
+
+Run with `python -m test.benchmark.order_book_depth_index_benchmark`.
+"""
+import argparse
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+def generate_diff_stream(levels: int,
+                         diffs: int,
+                         levels_per_diff: int,
+                         tick_size: float = 0.01,
+                         seed: int = 0) -> Tuple[np.ndarray, np.ndarray, List[Tuple[np.ndarray, np.ndarray]]]:
+    rng = np.random.default_rng(seed)
+    mid_ticks = 100_000
+    bids = np.column_stack([(mid_ticks - 1 - np.arange(levels)) * tick_size,
+                            rng.exponential(2.0, levels),
+                            np.ones(levels)])
+    asks = np.column_stack([(mid_ticks + 1 + np.arange(levels)) * tick_size,
+                            rng.exponential(2.0, levels),
+                            np.ones(levels)])
+    stream = []
+    for update_id in range(2, diffs + 2):
+        mid_ticks += int(rng.integers(-1, 2))
+        distances = np.minimum(rng.geometric(0.05, (2, levels_per_diff)), levels)
+        amounts = np.where(rng.random((2, levels_per_diff)) < 0.2, 0, rng.exponential(2.0, (2, levels_per_diff)))
+        update_ids = np.full(levels_per_diff, update_id)
+        bids_diff = np.column_stack([(mid_ticks - distances[0]) * tick_size, amounts[0], update_ids])
+        asks_diff = np.column_stack([(mid_ticks + distances[1]) * tick_size, amounts[1], update_ids])
+        stream.append((bids_diff, asks_diff))
+    return bids, asks, stream
+
+
+def run(order_book: OrderBook,
+        bids: np.ndarray,
+        asks: np.ndarray,
+        stream: List[Tuple[np.ndarray, np.ndarray]],
+        volumes: np.ndarray) -> Tuple[float, float]:
+    order_book.apply_numpy_snapshot(bids, asks)
+    apply_time = query_time = 0.0
+    for bids_diff, asks_diff in stream:
+        start = time.perf_counter()
+        order_book.apply_numpy_diffs(bids_diff, asks_diff)
+        applied = time.perf_counter()
+        for volume in volumes:
+            order_book.get_price_for_volume(True, volume)
+            order_book.get_vwap_for_volume(False, volume)
+            order_book.get_volume_for_price(True, order_book.get_price(True) * 1.01)
+        query_time += time.perf_counter() - applied
+        apply_time += applied - start
+    return apply_time, query_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--levels", type=int, default=5000, help="Price levels per side")
+    parser.add_argument("--diffs", type=int, default=2000, help="Number of diff messages")
+    parser.add_argument("--levels-per-diff", type=int, default=10, help="Levels per side in each diff")
+    parser.add_argument("--queries", type=int, default=10, help="Volumes queried after each diff")
+    args = parser.parse_args()
+
+    bids, asks, stream = generate_diff_stream(args.levels, args.diffs, args.levels_per_diff)
+    total_depth = min(bids[:, 1].sum(), asks[:, 1].sum())
+    volumes = np.geomspace(1, total_depth * 0.9, args.queries)
+
+    print(f"{args.levels} levels per side, {args.diffs} diffs, {args.queries * 3} queries per diff")
+    for label, depth_index in (("linear scan", False), ("depth index", True)):
+        apply_time, query_time = run(OrderBook(depth_index=depth_index), bids, asks, stream, volumes)
+        print(f"{label:>12}: apply {apply_time * 1e3:9.2f} ms  query {query_time * 1e3:9.2f} ms  "
+              f"total {(apply_time + query_time) * 1e3:9.2f} ms")
+
+    # The index is refreshed by the first query after a change, so a book that is never queried should pay nothing.
+    print("apply only, no queries")
+    for label, depth_index in (("linear scan", False), ("depth index", True)):
+        apply_time, _ = run(OrderBook(depth_index=depth_index), bids, asks, stream, np.empty(0))
+        print(f"{label:>12}: apply {apply_time * 1e3:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""
+Compares the OrderBookRow-based diff ingestion path, `apply_diffs(message.bids, message.asks, message.update_id)`,
+with the raw levels fast path `apply_diff_message(message)` on diff messages carrying string price/amount pairs, as
+delivered by exchange websockets.
+
+Run with `python -m test.benchmark.order_book_message_ingestion_benchmark`.
+"""
+import argparse
+import time
+from typing import List
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+
+def generate_messages(count: int, levels_per_side: int, seed: int = 0) -> List[OrderBookMessage]:
+    rng = np.random.default_rng(seed)
+    messages = []
+    for update_id in range(1, count + 1):
+        bid_prices = 100 - rng.integers(1, 500, levels_per_side) * 0.01
+        ask_prices = 100 + rng.integers(1, 500, levels_per_side) * 0.01
+        amounts = np.where(rng.random((2, levels_per_side)) < 0.2, 0, rng.exponential(2.0, (2, levels_per_side)))
+        messages.append(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "BTC-USDT",
+            "update_id": update_id,
+            "bids": [[f"{price:.2f}", f"{amount:.6f}"] for price, amount in zip(bid_prices, amounts[0])],
+            "asks": [[f"{price:.2f}", f"{amount:.6f}"] for price, amount in zip(ask_prices, amounts[1])],
+        }, timestamp=float(update_id)))
+    return messages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=20000, help="Number of diff messages")
+    parser.add_argument("--levels", type=int, default=20, help="Levels per side in each diff")
+    args = parser.parse_args()
+
+    print(f"{args.messages} diff messages with {args.levels} levels per side")
+
+    order_book = OrderBook()
+    messages = generate_messages(args.messages, args.levels)
+    start = time.perf_counter()
+    for message in messages:
+        order_book.apply_diffs(message.bids, message.asks, message.update_id)
+    rows_time = time.perf_counter() - start
+
+    order_book = OrderBook()
+    messages = generate_messages(args.messages, args.levels)
+    start = time.perf_counter()
+    for message in messages:
+        order_book.apply_diff_message(message)
+    raw_time = time.perf_counter() - start
+
+    print(f"OrderBookRow path: {rows_time * 1e3:9.2f} ms ({rows_time / args.messages * 1e6:7.2f} us/message)")
+    print(f" raw levels path: {raw_time * 1e3:9.2f} ms ({raw_time / args.messages * 1e6:7.2f} us/message)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+"""
+Replays a synthetic recording through ReplayOrderBookTracker and a PaperTradeExchange in a backtest clock, and reports
+how much faster than real time the recording plays. The recording has one diff every 100 ms around a random-walk mid
+price, a trade every second and a snapshot every minute. A limit order is kept one tick below the best bid, so the
+replayed trades keep filling paper trade orders.
+
+Run with `python -m test.benchmark.order_book_replay_benchmark`.
+"""
+import argparse
+import time
+from decimal import Decimal
+from typing import List
+
+import numpy as np
+
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.replay_order_book_data_source import ReplayOrderBookTrackerDataSource
+from hummingbot.core.data_type.replay_order_book_tracker import OrderBookReplayIterator, ReplayOrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+TRADING_PAIR = "COINALPHA-HBOT"
+TICK_SIZE = 0.01
+
+
+def generate_recording(hours: float, levels: int, seed: int = 0) -> List[OrderBookMessage]:
+    rng = np.random.default_rng(seed)
+    start = 1_700_000_000.0
+    mid_ticks = 10_000
+    messages = []
+    for step in range(int(hours * 36_000)):
+        timestamp = start + step * 0.1
+        mid_ticks += int(rng.integers(-1, 2))
+        if step % 600 == 0:
+            messages.append(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": TRADING_PAIR,
+                "update_id": step,
+                "bids": [[(mid_ticks - 1 - i) * TICK_SIZE, 1.0] for i in range(levels)],
+                "asks": [[(mid_ticks + 1 + i) * TICK_SIZE, 1.0] for i in range(levels)],
+            }, timestamp))
+            continue
+        distances = rng.integers(1, 10, 2)
+        amounts = np.where(rng.random(2) < 0.2, 0, rng.exponential(1.0, 2))
+        messages.append(OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": TRADING_PAIR,
+            "update_id": step,
+            "bids": [[(mid_ticks - distances[0]) * TICK_SIZE, amounts[0]]],
+            "asks": [[(mid_ticks + distances[1]) * TICK_SIZE, amounts[1]]],
+        }, timestamp))
+        if step % 10 == 5:
+            is_sell = rng.random() < 0.5
+            messages.append(OrderBookMessage(OrderBookMessageType.TRADE, {
+                "trading_pair": TRADING_PAIR,
+                "trade_type": float(TradeType.SELL.value if is_sell else TradeType.BUY.value),
+                "trade_id": step,
+                "update_id": step,
+                "price": (mid_ticks + (-1 if is_sell else 1) * int(rng.integers(1, 4))) * TICK_SIZE,
+                "amount": 0.1,
+            }, timestamp))
+    return messages
+
+
+class BidRefresher(PyTimeIterator):
+    def __init__(self, exchange: PaperTradeExchange):
+        super().__init__()
+        self._exchange = exchange
+
+    def tick(self, timestamp: float):
+        if not self._exchange.ready:
+            return
+        if len(self._exchange.limit_orders) == 0:
+            best_bid = Decimal(str(self._exchange.get_price(TRADING_PAIR, False)))
+            self._exchange.buy(TRADING_PAIR, Decimal("0.01"), OrderType.LIMIT, best_bid - Decimal(str(TICK_SIZE)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--hours", type=float, default=1.0, help="Hours of recorded market data")
+    parser.add_argument("--levels", type=int, default=100, help="Price levels per side in the snapshots")
+    parser.add_argument("--tick-size", type=float, default=1.0, help="Backtest clock tick size in seconds")
+    args = parser.parse_args()
+
+    messages = generate_recording(args.hours, args.levels)
+    data_source = ReplayOrderBookTrackerDataSource([TRADING_PAIR], messages)
+    tracker = ReplayOrderBookTracker(data_source, [TRADING_PAIR])
+    exchange = PaperTradeExchange(tracker, BinanceExchange, exchange_name="binance")
+    exchange.set_balance("HBOT", Decimal("1e9"))
+    exchange.set_balance("COINALPHA", Decimal("1e9"))
+    fill_logger = EventLogger()
+    exchange.add_listener(MarketEvent.OrderFilled, fill_logger)
+    replay_iterator = OrderBookReplayIterator(tracker)
+
+    clock = Clock(ClockMode.BACKTEST, args.tick_size, data_source.start_timestamp, float("nan"))
+    clock.add_iterator(replay_iterator)
+    clock.add_iterator(exchange)
+    clock.add_iterator(BidRefresher(exchange))
+    start = time.perf_counter()
+    clock.backtest()
+    elapsed = time.perf_counter() - start
+
+    recorded = data_source.end_timestamp - data_source.start_timestamp
+    print(f"{len(messages)} messages over {recorded / 3600:.2f} h, {args.levels} levels per side")
+    print(f"replayed {replay_iterator.messages_replayed} messages in {elapsed:.2f} s "
+          f"({replay_iterator.messages_replayed / elapsed:,.0f} messages/s, {recorded / elapsed:,.0f}x real time), "
+          f"{len(fill_logger.event_log)} paper trade fills")
+
+
+if __name__ == "__main__":
+    main()
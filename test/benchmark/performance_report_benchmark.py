@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Compares the performance report of a long session built from every recorded fill, as the history command and the
+trade monitor used to, with the report built from the hourly trade totals kept by TradePerformance. The fills are
+recorded in a temporary SQLite database, a few per minute on a handful of markets, and the reports start in the
+middle of an hour so the fills of the first, partial hour are read too.
+
+Run with `python -m test.benchmark.performance_report_benchmark`.
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_performance import TradePerformance
+
+CONFIG_FILE_PATH = "benchmark.yml"
+START_TIMESTAMP = 1_700_000_000_000
+
+
+def record_fills(manager: SQLConnectionManager, days: float, fills_per_minute: int, markets: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    trade_fee = AddedToCostTradeFee(percent=Decimal("0.001")).to_json()
+    count = int(days * 24 * 60 * fills_per_minute)
+    timestamps = START_TIMESTAMP + np.sort(rng.integers(0, int(days * 24 * 3600 * 1000), count))
+    prices = 100 + np.cumsum(rng.normal(0, 0.05, count))
+    with manager.get_new_session() as session:
+        with session.begin():
+            for i, timestamp in enumerate(timestamps):
+                symbol = f"TOKEN{i % markets}-USDT"
+                trade_fill = TradeFill(
+                    config_file_path=CONFIG_FILE_PATH, strategy="benchmark", market="binance", symbol=symbol,
+                    base_asset=symbol.split("-")[0], quote_asset="USDT", timestamp=int(timestamp),
+                    order_id=f"OID{i}", trade_type="BUY" if rng.random() < 0.5 else "SELL", order_type="LIMIT",
+                    price=Decimal(f"{prices[i]:.4f}"), amount=Decimal(f"{rng.exponential(1.0):.4f}"), leverage=1,
+                    trade_fee=trade_fee, exchange_trade_id=f"EID{i}", position="NIL")
+                session.add(trade_fill)
+                TradePerformance.add_trade_fill(session, trade_fill)
+    return count
+
+
+async def report_from_fills(manager: SQLConnectionManager, start_timestamp: int):
+    with manager.get_new_session() as session:
+        trades = (session.query(TradeFill)
+                  .filter(TradeFill.timestamp >= start_timestamp,
+                          TradeFill.config_file_path.like(f"%{CONFIG_FILE_PATH}%"))
+                  .order_by(TradeFill.timestamp)
+                  .all())
+    metrics = {}
+    for market, symbol in set((t.market, t.symbol) for t in trades):
+        cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+        metrics[(market, symbol)] = await PerformanceMetrics.create(symbol, cur_trades, {})
+    return metrics
+
+
+async def report_from_totals(manager: SQLConnectionManager, start_timestamp: int):
+    with manager.get_new_session() as session:
+        aggregates = TradePerformance.get_aggregates(session, start_timestamp, CONFIG_FILE_PATH)
+    return {(market, symbol): await PerformanceMetrics.create_from_aggregate(symbol, aggregate, {})
+            for (market, symbol), aggregate in aggregates.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=float, default=7.0, help="Days of recorded fills")
+    parser.add_argument("--fills-per-minute", type=int, default=5, help="Recorded fills per minute")
+    parser.add_argument("--markets", type=int, default=4, help="Trading pairs the fills are spread over")
+    parser.add_argument("--runs", type=int, default=3, help="Reports built with each method")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as db_dir:
+        manager = SQLConnectionManager(ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS,
+                                       db_path=os.path.join(db_dir, "benchmark.sqlite"))
+        start = time.perf_counter()
+        count = record_fills(manager, args.days, args.fills_per_minute, args.markets)
+        print(f"recorded {count} fills with their hourly totals in {time.perf_counter() - start:.2f} s")
+
+        report_start = START_TIMESTAMP + TradePerformance.PERIOD_MS // 2
+        loop = asyncio.new_event_loop()
+        with patch("hummingbot.client.performance.RateOracle.get_instance") as rate_oracle_mock:
+            rate_oracle_mock.return_value.stored_or_live_rate = AsyncMock(return_value=None)
+            for name, report in (("every fill", report_from_fills), ("hourly totals", report_from_totals)):
+                start = time.perf_counter()
+                for _ in range(args.runs):
+                    metrics = loop.run_until_complete(report(manager, report_start))
+                elapsed = (time.perf_counter() - start) / args.runs
+                total_pnl = sum(perf.total_pnl for perf in metrics.values())
+                print(f"{name:>13}: {elapsed * 1000:9.1f} ms per report, total P&L {total_pnl:.6f}")
+        manager.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""
+Compares reading the standard deviation of a RingBuffer after each value added, when it is computed again from the
+values gathered in order with an index array, as RingBuffer.std_dev used to, with the rolling stats of the RingBuffer.
+Also times the InstantVolatilityIndicator, computed again over the whole sampling buffer on each sample as it used to
+be, and with its running sum.
+
+Run with `python -m test.benchmark.ring_buffer_benchmark`.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from hummingbot.strategy.__utils__.ring_buffer import RingBuffer
+from hummingbot.strategy.__utils__.trailing_indicators.instant_volatility import InstantVolatilityIndicator
+
+
+def std_dev_from_values(buffer: RingBuffer, values: np.ndarray, delimiter: int) -> float:
+    indexes = np.arange(delimiter, stop=delimiter + buffer.length) % buffer.length
+    return np.std(values[indexes])
+
+
+class RecomputedInstantVolatilityIndicator(InstantVolatilityIndicator):
+    def add_sample(self, value: float):
+        self._sampling_buffer.add_value(value)
+        self._processing_buffer.add_value(self._indicator_calculation())
+
+    def _indicator_calculation(self) -> float:
+        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
+        return np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--length", type=int, default=3000, help="Length of the buffer")
+    parser.add_argument("--samples", type=int, default=20000, help="Values added")
+    args = parser.parse_args()
+
+    samples = np.random.default_rng(0).normal(100, 1, args.samples)
+
+    buffer = RingBuffer(args.length)
+    values = np.zeros(args.length)
+    start = time.perf_counter()
+    for i, sample in enumerate(samples):
+        buffer.add_value(sample)
+        values[i % args.length] = sample
+        if buffer.is_full:
+            std_dev_from_values(buffer, values, (i + 1) % args.length)
+    print(f"{'std dev from the values':>28}: {(time.perf_counter() - start) / args.samples * 1e6:8.2f} us per value")
+
+    buffer = RingBuffer(args.length)
+    start = time.perf_counter()
+    for sample in samples:
+        buffer.add_value(sample)
+        buffer.std_dev
+    print(f"{'rolling std dev':>28}: {(time.perf_counter() - start) / args.samples * 1e6:8.2f} us per value")
+
+    for name, indicator_class in (("volatility over the buffer", RecomputedInstantVolatilityIndicator),
+                                  ("volatility with running sum", InstantVolatilityIndicator)):
+        indicator = indicator_class(sampling_length=args.length, processing_length=15)
+        start = time.perf_counter()
+        for sample in samples:
+            indicator.add_sample(sample)
+            indicator.current_value
+        print(f"{name:>28}: {(time.perf_counter() - start) / args.samples * 1e6:8.2f} us per sample")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""
+Compares the event loop overhead of running the control tasks of many executors from their own control loop, one
+task sleeping per executor as RunnableBase does by default, with the RunnableScheduler used by the
+ExecutorOrchestrator. The control tasks do nothing, so the CPU time measured is the scheduling overhead.
+
+Run with `python -m test.benchmark.runnable_scheduler_benchmark`.
+"""
+import argparse
+import asyncio
+import time
+from typing import Optional
+
+from hummingbot.strategy_v2.runnable_base import RunnableBase
+from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler
+
+
+class BenchmarkRunnable(RunnableBase):
+    control_tasks = 0
+
+    async def control_task(self):
+        BenchmarkRunnable.control_tasks += 1
+
+
+async def run(runnables: int, interval: float, duration: float, scheduler: Optional[RunnableScheduler]):
+    BenchmarkRunnable.control_tasks = 0
+    components = []
+    for _ in range(runnables):
+        component = BenchmarkRunnable(update_interval=interval)
+        component.scheduler = scheduler
+        component.start()
+        components.append(component)
+    start_cpu = time.process_time()
+    await asyncio.sleep(duration)
+    cpu = time.process_time() - start_cpu
+    for component in components:
+        component.stop()
+    if scheduler is not None:
+        scheduler.stop()
+    await asyncio.sleep(interval * 2)
+    return cpu, BenchmarkRunnable.control_tasks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runnables", type=int, default=500, help="Executors running")
+    parser.add_argument("--interval", type=float, default=0.1, help="Update interval of the executors, in seconds")
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds measured")
+    args = parser.parse_args()
+
+    for name, scheduler in (("control loops", None), ("scheduler", RunnableScheduler())):
+        cpu, control_tasks = asyncio.run(run(args.runnables, args.interval, args.duration, scheduler))
+        print(f"{name:>13}: {cpu * 1e3:8.1f} ms CPU for {control_tasks} control tasks, "
+              f"{cpu / max(control_tasks, 1) * 1e6:6.1f} us per control task")
+        if scheduler is not None:
+            print(f"{'':>13}  {scheduler.metrics.to_dict()}")
+
+
+if __name__ == "__main__":
+    main()
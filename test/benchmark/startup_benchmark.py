@@ -0,0 +1,81 @@
+"""
+Measures the import and connector discovery time paid by a headless start of bin/hummingbot_quickstart.py, each
+sample in a fresh interpreter.
+
+The connector discovery runs against a temporary manifest, first without it (a cold start, which scans and imports
+every connector utils module) and then with the manifest written by the cold run.
+
+Run with `python -m test.benchmark.startup_benchmark`
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from os.path import join, realpath
+
+ROOT = realpath(join(__file__, "../../../"))
+
+IMPORT_QUICKSTART = """
+import json, sys, time
+sys.path.insert(0, {bin_path!r})
+start = time.perf_counter()
+import hummingbot_quickstart
+print(json.dumps({{"seconds": time.perf_counter() - start, "modules": len(sys.modules)}}))
+"""
+
+CONNECTOR_DISCOVERY = """
+import json, sys, time
+from pathlib import Path
+import hummingbot.client.settings as settings
+settings.CONNECTOR_MANIFEST_PATH = Path({manifest_path!r})
+modules = len(sys.modules)
+start = time.perf_counter()
+connector_settings = settings.AllConnectorSettings.create_connector_settings()
+print(json.dumps({{"seconds": time.perf_counter() - start, "modules": len(sys.modules) - modules}}))
+"""
+
+
+def sample(code: str) -> dict:
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True,
+                            env={**os.environ, "PYTHONPATH": ROOT})
+    if output.returncode != 0:
+        return {"error": output.stderr.strip().splitlines()[-1]}
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def report(label: str, samples: list):
+    errors = [s["error"] for s in samples if "error" in s]
+    if len(errors) > 0:
+        print(f"{label:>28}: failed, {errors[0]}")
+        return
+    seconds = statistics.median(s["seconds"] for s in samples)
+    modules = statistics.median(s["modules"] for s in samples)
+    print(f"{label:>28}: {seconds * 1e3:9.2f} ms  ({modules:.0f} modules imported)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per measurement")
+    args = parser.parse_args()
+
+    print(f"median of {args.runs} runs")
+    report("import hummingbot_quickstart",
+           [sample(IMPORT_QUICKSTART.format(bin_path=join(ROOT, "bin"))) for _ in range(args.runs)])
+
+    with tempfile.TemporaryDirectory() as manifest_dir:
+        manifest_path = join(manifest_dir, "connector_manifest.json")
+        discovery = CONNECTOR_DISCOVERY.format(manifest_path=manifest_path)
+        cold_samples = []
+        for _ in range(args.runs):
+            if os.path.exists(manifest_path):
+                os.remove(manifest_path)
+            cold_samples.append(sample(discovery))
+        report("connector discovery, cold", cold_samples)
+        report("connector discovery, warm", [sample(discovery) for _ in range(args.runs)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""
+Compares the TradingIntensityIndicator with a copy of the algorithm it used to run: prepending each quote to a list,
+matching each trade to its quote with a linear scan, and consolidating the trades by price level and fitting them on
+every tick once the sampling buffer is full. The ticks are shorter than a second, so most of them have no trade.
+
+Run with `python -m test.benchmark.trading_intensity_benchmark`.
+"""
+import argparse
+import time
+import warnings
+from decimal import Decimal
+from typing import List
+from unittest.mock import MagicMock
+
+import numpy as np
+from scipy.optimize import OptimizeWarning, curve_fit
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
+
+
+class ListTradingIntensityIndicator:
+    def __init__(self, sampling_length: int):
+        self.alpha, self.kappa = 0, 0
+        self.trade_samples = {}
+        self.current_trade_sample = []
+        self.last_quotes = []
+        self.sampling_length = sampling_length
+
+    def register_trade(self, trade: OrderBookTradeEvent):
+        self.current_trade_sample.append(trade)
+
+    def calculate(self, timestamp: float, price: float):
+        self.last_quotes = [{"timestamp": timestamp, "price": price}] + self.last_quotes
+        latest_processed_quote_idx = None
+        for trade in self.current_trade_sample:
+            for i, quote in enumerate(self.last_quotes):
+                if quote["timestamp"] < trade.timestamp:
+                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
+                        latest_processed_quote_idx = i
+                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
+                    self.trade_samples.setdefault(quote["timestamp"] + 1, []).append(trade)
+                    break
+        self.current_trade_sample = []
+        if latest_processed_quote_idx is not None:
+            self.last_quotes = self.last_quotes[0:latest_processed_quote_idx + 1]
+        if len(self.trade_samples) > self.sampling_length:
+            timestamps = sorted(self.trade_samples.keys())[-self.sampling_length:]
+            self.trade_samples = {timestamp: self.trade_samples[timestamp] for timestamp in timestamps}
+        if len(self.trade_samples) == self.sampling_length:
+            self.estimate_intensity()
+
+    def estimate_intensity(self):
+        trades_consolidated = {}
+        for tick in self.trade_samples.values():
+            for trade in tick:
+                trades_consolidated[trade["price_level"]] = trades_consolidated.get(trade["price_level"], 0) + trade["amount"]
+        price_levels = sorted(trades_consolidated.keys(), reverse=True)
+        lambdas = [trades_consolidated[price_level] or 10**-10 for price_level in price_levels]
+        try:
+            params = curve_fit(lambda t, a, b: a * np.exp(-b * t), price_levels, lambdas, p0=(self.alpha, self.kappa),
+                               method="dogbox", bounds=([0, 0], [np.inf, np.inf]))
+            self.alpha, self.kappa = float(params[0][0]), float(params[0][1])
+        except (RuntimeError, ValueError):
+            pass
+
+
+def make_ticks(ticks: int, tick_size: float, trade_probability: float):
+    rng = np.random.default_rng(0)
+    mid_prices = 100 + np.cumsum(rng.normal(0, 0.01, ticks))
+    trades: List[List[OrderBookTradeEvent]] = []
+    for i in range(ticks):
+        tick_trades = []
+        if i > 0 and rng.random() < trade_probability:
+            for _ in range(rng.integers(1, 6)):
+                side = 1 if rng.random() < 0.5 else -1
+                price = round(mid_prices[i - 1] + side * rng.exponential(0.05), 2)
+                tick_trades.append(OrderBookTradeEvent(trading_pair="COINALPHA-HBOT", timestamp=1_700_000_000 + i * tick_size,
+                                                       price=price, amount=float(rng.exponential(1)),
+                                                       type=TradeType.BUY if side > 0 else TradeType.SELL))
+        trades.append(tick_trades)
+    return mid_prices, trades
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ticks", type=int, default=5000, help="Strategy ticks")
+    parser.add_argument("--tick-size", type=float, default=0.2, help="Seconds between ticks")
+    parser.add_argument("--trade-probability", type=float, default=0.1, help="Share of the ticks with trades")
+    parser.add_argument("--sampling-length", type=int, default=30, help="Trade samples of the indicator")
+    args = parser.parse_args()
+    warnings.simplefilter("ignore", OptimizeWarning)
+
+    mid_prices, trades = make_ticks(args.ticks, args.tick_size, args.trade_probability)
+    list_indicator = ListTradingIntensityIndicator(args.sampling_length)
+    price_delegate = MagicMock()
+    indicator = TradingIntensityIndicator(OrderBook(), price_delegate, args.sampling_length)
+
+    start = time.perf_counter()
+    for i, (mid_price, tick_trades) in enumerate(zip(mid_prices, trades)):
+        for trade in tick_trades:
+            list_indicator.register_trade(trade)
+        list_indicator.calculate(1_700_000_000 + i * args.tick_size, mid_price)
+    list_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i, (mid_price, tick_trades) in enumerate(zip(mid_prices, trades)):
+        price_delegate.get_price_by_type.return_value = Decimal(str(mid_price))
+        for trade in tick_trades:
+            indicator.register_trade(trade)
+        indicator.calculate(1_700_000_000 + i * args.tick_size)
+    elapsed = time.perf_counter() - start
+
+    for name, tick_elapsed, (alpha, kappa) in (
+            ("fit on every tick", list_elapsed, (list_indicator.alpha, list_indicator.kappa)),
+            ("incremental", elapsed, indicator.current_value)):
+        print(f"{name:>17}: {tick_elapsed / args.ticks * 1e6:9.1f} us per tick, alpha={float(alpha):.6f} "
+              f"kappa={float(kappa):.6f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,7 @@ from hummingbot.client.hummingbot_application import HummingbotApplication
 from hummingbot.connector.exchange.paper_trade import PaperTradeExchange
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.model.order import Order
-from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
 
 
@@ -138,3 +138,39 @@ class HistoryCommandTest(IsolatedAsyncioWrapperTestCase):
         )
 
         self.assertEqual(df_str_expected, captures[0])
+
+    def test_get_history_trades_json_lists_newest_trades_first(self):
+        self.app.strategy_file_name = f"{self.mock_strategy_name}.yml"
+        db_name = f"{self.mock_strategy_name}-json"
+        self.addCleanup(Path(SQLConnectionManager.create_db_path(db_name=db_name)).unlink, missing_ok=True)
+        self.app.trading_core.trade_fill_db = SQLConnectionManager(
+            self.client_config_map, SQLConnectionType.TRADE_FILLS, db_name=db_name
+        )
+        self.addCleanup(self.app.trading_core.trade_fill_db.engine.dispose)
+        now = int(time.time() * 1e3)
+        trade_fee = AddedToCostTradeFee(percent=Decimal("5"))
+        with self.app.trading_core.trade_fill_db.get_new_session() as session:
+            for i in [3, 1, 2]:
+                session.add(TradeFill(
+                    config_file_path=f"{self.mock_strategy_name}.yml",
+                    strategy=self.mock_strategy_name,
+                    market="binance",
+                    symbol="BTC-USDT",
+                    base_asset="BTC",
+                    quote_asset="USDT",
+                    timestamp=now - i * 1000,
+                    order_id=f"someId{i}",
+                    trade_type="BUY",
+                    order_type="LIMIT",
+                    price=i,
+                    amount=2,
+                    leverage=1,
+                    trade_fee=trade_fee.to_json(),
+                    exchange_trade_id=f"someExchangeId{i}",
+                ))
+            session.commit()
+
+        trades = self.app.get_history_trades_json(days=1)
+
+        self.assertEqual(["someExchangeId1", "someExchangeId2", "someExchangeId3"],
+                         [trade["trade_id"] for trade in trades])
@@ -1,8 +1,13 @@
+import json
+import tempfile
 import unittest
+from pathlib import Path
+from unittest.mock import patch
 
 from pydantic import SecretStr
 
-from hummingbot.client.settings import ConnectorSetting, ConnectorType
+from hummingbot.client import settings
+from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting, ConnectorType
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
@@ -61,3 +66,65 @@ class SettingsTest(unittest.TestCase):
         }
 
         self.assertEqual(expected_params, params)
+
+
+class ConnectorManifestTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.manifest_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = Path(self.manifest_dir.name) / "connector_manifest.json"
+        manifest_path_patch = patch.object(settings, "CONNECTOR_MANIFEST_PATH", self.manifest_path)
+        manifest_path_patch.start()
+        self.addCleanup(manifest_path_patch.stop)
+        self.addCleanup(self.manifest_dir.cleanup)
+        self.addCleanup(AllConnectorSettings.create_connector_settings)
+
+    def test_settings_loaded_from_manifest_match_the_built_ones(self):
+        built_settings = dict(AllConnectorSettings.create_connector_settings())
+        self.assertTrue(self.manifest_path.exists())
+
+        with patch.object(AllConnectorSettings, "_build_connector_manifest") as build_mock:
+            loaded_settings = AllConnectorSettings.create_connector_settings()
+        build_mock.assert_not_called()
+
+        self.assertIn("binance", loaded_settings)
+        self.assertEqual(built_settings.keys(), loaded_settings.keys())
+        for name, connector_setting in loaded_settings.items():
+            built_setting = built_settings[name]
+            for field in ConnectorSetting._fields:
+                self.assertEqual(getattr(built_setting, field), getattr(connector_setting, field), f"{name}.{field}")
+
+    def test_config_keys_are_imported_when_read(self):
+        AllConnectorSettings.create_connector_settings()
+
+        with patch.object(settings.importlib, "import_module", wraps=settings.importlib.import_module) as import_mock:
+            connector_settings = AllConnectorSettings.create_connector_settings()
+            import_mock.assert_not_called()
+            AllConnectorSettings.initialize_paper_trade_settings(["binance"])
+            import_mock.assert_not_called()
+
+            config_keys = connector_settings["binance_paper_trade"].config_keys
+
+        import_mock.assert_called_once_with("hummingbot.connector.exchange.binance.binance_utils")
+        self.assertIsInstance(config_keys, BinanceConfigMap)
+        self.assertEqual("binance", connector_settings["binance_paper_trade"].parent_name)
+
+    def test_manifest_is_rebuilt_when_connector_sources_change(self):
+        AllConnectorSettings.create_connector_settings()
+
+        with patch.object(AllConnectorSettings, "_connector_sources_fingerprint", return_value="changed"):
+            AllConnectorSettings.create_connector_settings()
+
+        with open(self.manifest_path) as manifest_file:
+            self.assertEqual("changed", json.load(manifest_file)["fingerprint"])
+
+    def test_manifest_is_rebuilt_when_a_missing_dependency_is_installed(self):
+        fingerprint = AllConnectorSettings._connector_sources_fingerprint()
+        manifest = {"version": settings.CONNECTOR_MANIFEST_VERSION, "fingerprint": fingerprint,
+                    "connectors": [], "missing_dependencies": ["not_installed_dependency"]}
+        AllConnectorSettings._write_connector_manifest(manifest)
+        self.assertEqual(manifest, AllConnectorSettings._read_connector_manifest(fingerprint))
+
+        manifest["missing_dependencies"].append("json")
+        AllConnectorSettings._write_connector_manifest(manifest)
+        self.assertIsNone(AllConnectorSettings._read_connector_manifest(fingerprint))
@@ -68,19 +68,17 @@ class InterfaceUtilsTest(unittest.TestCase):
             mock_monitor.log.call_args_list[0].args[0])
 
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
-    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create", new_callable=AsyncMock)
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
-    def test_start_trade_monitor_multi_loops(self, mock_hb_app, mock_perf, mock_sleep):
+    def test_start_trade_monitor_multi_loops(self, mock_hb_app, mock_sleep):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.trading_core._strategy_running = True
         mock_app.trading_core.strategy = MagicMock()
         mock_app.trading_core.markets = {"a": MagicMock(ready=True)}
-        mock_app.trading_core.trade_fill_db = MagicMock()
-        mock_app._get_trades_from_session.return_value = [MagicMock(market="ExchangeA", symbol="HBOT-USDT")]
-        mock_app.trading_core.get_current_balances = AsyncMock()
-        mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
-                                 MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("2"))]
+        mock_app.trading_core.performance_metrics_since = AsyncMock(side_effect=[
+            {("ExchangeA", "HBOT-USDT"): MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2"), num_trades=1)},
+            {("ExchangeA", "HBOT-USDT"): MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("2"), num_trades=1)},
+        ])
         mock_sleep.side_effect = [None, asyncio.CancelledError()]
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(start_trade_monitor(mock_result))
@@ -90,22 +88,17 @@ class InterfaceUtilsTest(unittest.TestCase):
         self.assertEqual('Trades: 1, Total P&L: 2.00 USDT, Return %: 2.00%', mock_result.log.call_args_list[2].args[0])
 
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
-    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create", new_callable=AsyncMock)
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
-    def test_start_trade_monitor_multi_pairs_diff_quotes(self, mock_hb_app, mock_perf, mock_sleep):
+    def test_start_trade_monitor_multi_pairs_diff_quotes(self, mock_hb_app, mock_sleep):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.trading_core._strategy_running = True
         mock_app.trading_core.strategy = MagicMock()
         mock_app.trading_core.markets = {"a": MagicMock(ready=True)}
-        mock_app.trading_core.trade_fill_db = MagicMock()
-        mock_app._get_trades_from_session.return_value = [
-            MagicMock(market="ExchangeA", symbol="HBOT-USDT"),
-            MagicMock(market="ExchangeA", symbol="HBOT-BTC")
-        ]
-        mock_app.trading_core.get_current_balances = AsyncMock()
-        mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
-                                 MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("3"))]
+        mock_app.trading_core.performance_metrics_since = AsyncMock(return_value={
+            ("ExchangeA", "HBOT-USDT"): MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2"), num_trades=1),
+            ("ExchangeA", "HBOT-BTC"): MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("3"), num_trades=1),
+        })
         mock_sleep.side_effect = asyncio.CancelledError()
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(start_trade_monitor(mock_result))
@@ -114,22 +107,17 @@ class InterfaceUtilsTest(unittest.TestCase):
         self.assertEqual('Trades: 2, Total P&L: N/A, Return %: 1.50%', mock_result.log.call_args_list[1].args[0])
 
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
-    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create", new_callable=AsyncMock)
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
-    def test_start_trade_monitor_multi_pairs_same_quote(self, mock_hb_app, mock_perf, mock_sleep):
+    def test_start_trade_monitor_multi_pairs_same_quote(self, mock_hb_app, mock_sleep):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.trading_core._strategy_running = True
         mock_app.trading_core.strategy = MagicMock()
         mock_app.trading_core.markets = {"a": MagicMock(ready=True)}
-        mock_app.trading_core.trade_fill_db = MagicMock()
-        mock_app._get_trades_from_session.return_value = [
-            MagicMock(market="ExchangeA", symbol="HBOT-USDT"),
-            MagicMock(market="ExchangeA", symbol="BTC-USDT")
-        ]
-        mock_app.trading_core.get_current_balances = AsyncMock()
-        mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
-                                 MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("3"))]
+        mock_app.trading_core.performance_metrics_since = AsyncMock(return_value={
+            ("ExchangeA", "HBOT-USDT"): MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2"), num_trades=1),
+            ("ExchangeA", "BTC-USDT"): MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("3"), num_trades=1),
+        })
         mock_sleep.side_effect = asyncio.CancelledError()
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(start_trade_monitor(mock_result))
@@ -160,8 +148,7 @@ class InterfaceUtilsTest(unittest.TestCase):
         mock_app.trading_core._strategy_running = True
         mock_app.trading_core.strategy = MagicMock()
         mock_app.trading_core.markets = {"a": MagicMock(ready=True)}
-        mock_app.trading_core.trade_fill_db = MagicMock()
-        mock_app._get_trades_from_session.return_value = []
+        mock_app.trading_core.performance_metrics_since = AsyncMock(return_value={})
         mock_sleep.side_effect = asyncio.CancelledError()
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(start_trade_monitor(mock_result))
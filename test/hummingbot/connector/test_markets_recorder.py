@@ -1,4 +1,6 @@
 import asyncio
+import os
+import tempfile
 import time
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
@@ -26,10 +28,13 @@ from hummingbot.core.event.events import (
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.executors import Executors
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_data_chunk_store import MarketDataChunkReader
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.position import Position
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_performance import TradePerformance
 from hummingbot.strategy.strategy_v2_base import StrategyV2Base
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
@@ -94,6 +99,12 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -152,6 +163,11 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(1, len(trades))
         self.assertEqual(fill_id, trades[0].exchange_trade_id)
 
+        chunks = list(recorder.iter_trades_for_config("test_config", columns=["exchange_trade_id", "price"]))
+        self.assertEqual(1, len(chunks))
+        self.assertEqual([(fill_id, Decimal(1000))], [tuple(row) for row in chunks[0]])
+        self.assertEqual([], list(recorder.iter_trades_for_config("other_config")))
+
     def test_buy_order_created_event_creates_order_record(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -280,6 +296,7 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
             order = orders[0]
             order_status = order.status
             trade_fills = order.trade_fills
+            trade_performance = session.query(TradePerformance).all()
 
         self.assertEqual(1, len(orders))
         self.assertEqual(self.config_file_path, orders[0].config_file_path)
@@ -290,6 +307,155 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(1, len(trade_fills))
         self.assertEqual(self.config_file_path, trade_fills[0].config_file_path)
         self.assertEqual(fill_event.order_id, trade_fills[0].order_id)
+        self.assertEqual(1, len(trade_performance))
+        self.assertEqual(1, trade_performance[0].num_buys)
+        self.assertEqual(Decimal("-1010"), Decimal(trade_performance[0].b_vol_quote))
+
+    def test_write_behind_records_events_from_writer_thread(self):
+        db_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(db_dir.cleanup)
+        # The writer thread needs a file database, every thread gets its own in-memory SQLite database.
+        manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()),
+            SQLConnectionType.TRADE_FILLS,
+            db_path=os.path.join(db_dir.name, "test_DB.sqlite"),
+        )
+        self.addCleanup(manager.engine.dispose)
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            write_behind=True,
+            write_batch_latency=60,
+        )
+        recorder.start()
+        self.addCleanup(recorder.stop)
+
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1-1642010000000000",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=Decimal(1010),
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+        # Both writes wait in the same batch until a read flushes them.
+        self.assertEqual(2, recorder.write_queue_metrics.queue_depth)
+        trade_fills = recorder.get_trades_for_config(self.config_file_path)
+
+        self.assertEqual(1, len(trade_fills))
+        self.assertEqual(fill_event.exchange_trade_id, trade_fills[0].exchange_trade_id)
+        with manager.get_new_session() as session:
+            order = session.query(Order).one()
+            statuses = [order_status.status for order_status in order.status]
+        self.assertEqual([MarketEvent.BuyOrderCreated.name, MarketEvent.OrderFilled.name], statuses)
+        metrics = recorder.write_queue_metrics
+        self.assertEqual(0, metrics.queue_depth)
+        self.assertEqual(2, metrics.writes_flushed)
+        self.assertEqual(0, metrics.write_errors)
+
+    def write_behind_recorder(self, **kwargs) -> MarketsRecorder:
+        db_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(db_dir.cleanup)
+        manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()),
+            SQLConnectionType.TRADE_FILLS,
+            db_path=os.path.join(db_dir.name, "test_DB.sqlite"),
+        )
+        self.addCleanup(manager.engine.dispose)
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            write_behind=True,
+            **kwargs,
+        )
+        recorder.start()
+        self.addCleanup(recorder.stop)
+        return recorder
+
+    def test_write_behind_queues_positions_and_executors(self):
+        recorder = self.write_behind_recorder(write_batch_latency=60)
+        position = Position(id="123", timestamp=123, controller_id="test_controller", connector_name="binance",
+                            trading_pair="ETH-USDT", side=TradeType.BUY.name, amount=Decimal("1"),
+                            breakeven_price=Decimal("1000"), unrealized_pnl_quote=Decimal("0"),
+                            realized_pnl_quote=Decimal("0"), cum_fees_quote=Decimal("0"),
+                            volume_traded_quote=Decimal("10"))
+        executor_config = PositionExecutorConfig(
+            id="456", timestamp=1234, trading_pair="ETH-USDT", connector_name="binance", side=TradeType.BUY,
+            entry_price=Decimal("1000"), amount=Decimal("1"), controller_id="test_controller")
+        executor = MagicMock(spec=PositionExecutor)
+        executor.config = executor_config
+        executor.executor_info = ExecutorInfo(
+            id="456", timestamp=1234, type="position_executor", status=RunnableStatus.RUNNING,
+            controller_id="test_controller", custom_info={}, config=executor_config, net_pnl_pct=Decimal("0"),
+            net_pnl_quote=Decimal("0"), cum_fees_quote=Decimal("0"), filled_amount_quote=Decimal("0"),
+            is_active=True, is_trading=False)
+
+        recorder.update_or_store_position(position)
+        recorder.store_or_update_executor(executor)
+
+        self.assertEqual(2, recorder.write_queue_metrics.queue_depth)
+        self.assertEqual(["123"], [position.id for position in recorder.get_positions_by_controller("test_controller")])
+        self.assertEqual(["456"], [executor.id for executor in recorder.get_executors_by_controller("test_controller")])
+        self.assertEqual(0, recorder.write_queue_metrics.queue_depth)
+
+    def test_write_behind_saves_market_states_once_per_batch(self):
+        recorder = self.write_behind_recorder(write_batch_latency=60)
+        events = [BuyOrderCreatedEvent(timestamp=1642010000, type=OrderType.LIMIT, trading_pair=self.trading_pair,
+                                       amount=Decimal(1), price=Decimal(1000), order_id=f"OID{i}",
+                                       creation_timestamp=1640001112.223 + i)
+                  for i in range(3)]
+
+        with patch.object(recorder, "_save_market_states", wraps=recorder._save_market_states) as save_mock:
+            for i, event in enumerate(events):
+                self.tracking_states = {"orders": i}
+                recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, event)
+            self.assertTrue(recorder.flush_writes())
+
+        save_mock.assert_called_once()
+        with recorder.sql_manager.get_new_session() as session:
+            self.assertEqual(3, session.query(Order).count())
+            self.assertEqual({"orders": 2}, session.query(MarketState).one().saved_state)
+
+    def test_flush_writes_timeout_is_logged(self):
+        recorder = self.write_behind_recorder()
+
+        with patch.object(recorder._write_queue, "flush", return_value=False) as flush_mock, \
+                self.assertLogs(recorder.logger(), level="WARNING") as logs:
+            self.assertFalse(recorder.flush_writes())
+
+        flush_mock.assert_called_once_with(MarketsRecorder.FLUSH_WRITES_TIMEOUT)
+        self.assertIn("were not committed within", logs.output[0])
 
     def test_duplicate_create_order_event_is_idempotent(self):
         recorder = MarketsRecorder(
@@ -722,6 +888,7 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
                 market_data_collection_enabled=True,
                 market_data_collection_interval=1,
                 market_data_collection_depth=20,
+                market_data_collection_storage="sql",
             ),
         )
         with patch.object(self, "get_price_by_type") as get_price_by_type:
@@ -751,6 +918,44 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
 
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder._sleep")
+    async def test_market_data_collection_writes_chunks(self, sleep_mock):
+        sleep_mock.side_effect = [None, asyncio.CancelledError]
+        market_data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(market_data_dir.cleanup)
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=True,
+                market_data_collection_interval=1,
+                market_data_collection_depth=2,
+                market_data_collection_storage="chunks",
+            ),
+            market_data_directory=market_data_dir.name,
+        )
+        prices = {PriceType.MidPrice: Decimal("100"), PriceType.BestBid: Decimal("99"), PriceType.BestAsk: Decimal("101")}
+        order_book = OrderBook(dex=False)
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64),
+                                        np.array([[4, 1, 1], [5, 2, 2]], dtype=np.float64))
+
+        with patch.object(self, "get_price_by_type", side_effect=lambda pair, price_type: prices[price_type]), \
+                patch.object(self, "get_order_book", return_value=order_book):
+            recorder._start_market_data_recording()
+            with self.assertRaises(asyncio.CancelledError):
+                await recorder._market_data_collection_task
+        recorder.stop()
+
+        data = MarketDataChunkReader(market_data_dir.name).read(self.display_name, self.trading_pair)
+        self.assertEqual(2, len(data["timestamp"]))
+        self.assertEqual([100, 100], data["mid_price"].tolist())
+        self.assertEqual([[3, 2], [3, 2]], data["bid_price"].tolist())
+        self.assertEqual([[1, 2], [1, 2]], data["ask_amount"].tolist())
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, session.query(MarketData).count())
+
     def test_store_position(self):
         recorder = MarketsRecorder(
             sql=self.manager,
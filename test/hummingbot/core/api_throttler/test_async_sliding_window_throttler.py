@@ -0,0 +1,177 @@
+import asyncio
+import time
+import unittest
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import List
+
+from hummingbot.core.api_throttler.async_sliding_window_throttler import AsyncSlidingWindowThrottler, LimitWindow
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.request_priority import RequestPriority, request_priority
+
+TEST_PATH_URL = "/hummingbot"
+TEST_POOL_ID = "TEST"
+TEST_OTHER_ID = "/other"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+
+
+class LimitWindowTests(unittest.TestCase):
+
+    def test_evict_keeps_running_sum(self):
+        window = LimitWindow()
+        window.append(1.0, 1)
+        window.append(2.0, 5)
+        window.append(3.0, 2)
+
+        window.evict(2.0)
+
+        self.assertEqual(1, len(window.entries))
+        self.assertEqual(2, window.used)
+
+    def test_time_freeing(self):
+        window = LimitWindow()
+        window.append(1.0, 1)
+        window.append(2.0, 5)
+
+        self.assertEqual(1.0, window.time_freeing(1))
+        self.assertEqual(2.0, window.time_freeing(3))
+        self.assertEqual(float("inf"), window.time_freeing(7))
+
+
+class AsyncSlidingWindowThrottlerTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.2),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=0.2,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_OTHER_ID, limit=1, time_interval=0.2),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+        ]
+        self.throttler = AsyncSlidingWindowThrottler(rate_limits=self.rate_limits, safety_margin_pct=0)
+
+    async def test_within_capacity_pool_weighted_tasks(self):
+        async with self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID):
+            pass
+        async with self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID):
+            pass
+
+        # Another Task 1 (weight=5) would exceed the pool capacity (11/10), but Task 2 (weight=1) fits (7/10)
+        self.assertFalse(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        self.assertTrue(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).within_capacity())
+        self.assertEqual(6, self.throttler._windows[TEST_WEIGHTED_POOL_ID].used)
+
+    async def test_linked_limit_consumes_pool_capacity(self):
+        async with self.throttler.execute_task(TEST_PATH_URL):
+            pass
+
+        self.assertFalse(self.throttler.execute_task(TEST_POOL_ID).within_capacity())
+        self.assertTrue(self.throttler.execute_task(TEST_OTHER_ID).within_capacity())
+
+    async def test_within_capacity_for_unknown_limit_id(self):
+        throttler = AsyncSlidingWindowThrottler(rate_limits=[])
+
+        context = throttler.execute_task(limit_id="test_limit_id")
+        self.assertTrue(context.within_capacity())
+        async with context:
+            pass
+
+    async def test_waiter_is_woken_when_capacity_frees_up(self):
+        async with self.throttler.execute_task(TEST_POOL_ID):
+            pass
+        first_request_time = self.throttler._windows[TEST_POOL_ID].entries[0][0]
+
+        async with self.throttler.execute_task(TEST_POOL_ID):
+            acquired_time = time.time()
+
+        self.assertGreaterEqual(acquired_time, first_request_time + 0.2)
+        # Woken by a timer, not a polling loop, so the request does not sleep much past the window.
+        self.assertLess(acquired_time, first_request_time + 0.2 + 0.05)
+
+    async def test_waiters_are_granted_in_order(self):
+        order = []
+
+        async def request(name: str, limit_id: str):
+            async with self.throttler.execute_task(limit_id):
+                order.append(name)
+
+        await asyncio.gather(request("first", TEST_PATH_URL), request("second", TEST_POOL_ID),
+                             request("third", TEST_POOL_ID))
+
+        self.assertEqual(["first", "second", "third"], order)
+
+    async def test_waiter_does_not_block_unrelated_limits(self):
+        async with self.throttler.execute_task(TEST_POOL_ID):
+            pass
+        blocked = asyncio.ensure_future(self.throttler.execute_task(TEST_POOL_ID).acquire())
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(self.throttler.execute_task(TEST_OTHER_ID).acquire(), 0.05)
+        self.assertFalse(blocked.done())
+        self.assertEqual(1, self.throttler.waiting_requests)
+        await blocked
+
+    async def test_cancelled_waiter_leaves_the_queue(self):
+        async with self.throttler.execute_task(TEST_POOL_ID):
+            pass
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(self.throttler.execute_task(TEST_POOL_ID).acquire(), 0.05)
+
+        self.assertEqual(0, self.throttler.waiting_requests)
+        self.assertEqual(1, len(self.throttler._windows[TEST_POOL_ID].entries))
+
+    async def test_share_percentage_applies_to_limits(self):
+        throttler = AsyncSlidingWindowThrottler(
+            rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=5.0)],
+            limits_share_percentage=Decimal("20"))
+
+        for _ in range(2):
+            async with throttler.execute_task(TEST_POOL_ID):
+                pass
+
+        self.assertFalse(throttler.execute_task(TEST_POOL_ID).within_capacity())
+
+    async def test_waiters_are_granted_by_priority(self):
+        order = []
+
+        async def request(name: str, priority: RequestPriority):
+            with request_priority(priority):
+                context = self.throttler.execute_task(TEST_POOL_ID)
+            async with context:
+                order.append(name)
+
+        async with self.throttler.execute_task(TEST_POOL_ID):
+            pass
+        await asyncio.gather(request("background", RequestPriority.BACKGROUND),
+                             request("polling", RequestPriority.POLLING),
+                             request("cancel", RequestPriority.CANCEL))
+
+        self.assertEqual(["cancel", "polling", "background"], order)
+
+    async def test_weight_above_the_limit_is_capped(self):
+        throttler = AsyncSlidingWindowThrottler(rate_limits=[
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID, limit=100, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 20)]),
+        ])
+
+        with self.assertLogs(throttler.logger().name, level="WARNING") as logs:
+            context = throttler.execute_task(TEST_WEIGHTED_TASK_1_ID)
+        await asyncio.wait_for(context.acquire(), 1)
+
+        self.assertEqual(1, len(logs.records))
+        self.assertIn(TEST_WEIGHTED_POOL_ID, logs.output[0])
+        self.assertEqual(10, throttler._windows[TEST_WEIGHTED_POOL_ID].used)
+        self.assertEqual(0, throttler.waiting_requests)
@@ -12,6 +12,7 @@ from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
 from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.request_priority import RequestPriority, request_priority
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
 TEST_PATH_URL = "/hummingbot"
@@ -275,3 +276,52 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         time_mock.return_value = 1640000000.2100
         result = context.within_capacity()
         self.assertTrue(result)
+
+    def test_within_capacity_defers_to_higher_priority_waiter(self):
+        rate_limit, related_limits = self.throttler.get_related_limits(limit_id=TEST_POOL_ID)
+        self.throttler._priority_lanes.add_waiter([TEST_POOL_ID], RequestPriority.CANCEL)
+
+        context = AsyncRequestContext(task_logs=self.throttler._task_logs,
+                                      rate_limit=rate_limit,
+                                      related_limits=related_limits,
+                                      lock=asyncio.Lock(),
+                                      safety_margin_pct=self.throttler._safety_margin_pct,
+                                      priority=RequestPriority.POLLING,
+                                      priority_lanes=self.throttler._priority_lanes)
+        self.assertFalse(context.within_capacity())
+
+        self.throttler._priority_lanes.remove_waiter([TEST_POOL_ID], RequestPriority.CANCEL)
+        self.assertTrue(context.within_capacity())
+
+    def test_within_capacity_keeps_headroom_from_low_priority_tasks(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=5.0)])
+        rate_limit, related_limits = throttler.get_related_limits(limit_id=TEST_POOL_ID)
+        for _ in range(8):
+            throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=1))
+
+        with request_priority(RequestPriority.BACKGROUND):
+            background_context = throttler.execute_task(TEST_POOL_ID)
+        with request_priority(RequestPriority.POLLING):
+            polling_context = throttler.execute_task(TEST_POOL_ID)
+        create_context = throttler.execute_task(TEST_POOL_ID)
+
+        # 25% of the limit is kept for higher priorities than background work, 10% for higher than polling
+        self.assertFalse(background_context.within_capacity())
+        self.assertTrue(polling_context.within_capacity())
+        self.assertTrue(create_context.within_capacity())
+
+        throttler._task_logs.append(TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=1))
+        self.assertFalse(polling_context.within_capacity())
+        self.assertTrue(create_context.within_capacity())
+
+    def test_acquire_removes_priority_waiter_when_done(self):
+        rate_limit = self.rate_limits[0]
+        self.throttler._task_logs.append(
+            TaskLog(timestamp=time.time(), rate_limit=rate_limit, weight=rate_limit.weight))
+        with request_priority(RequestPriority.CANCEL):
+            context = self.throttler.execute_task(TEST_POOL_ID)
+
+        with self.assertRaises(asyncio.exceptions.TimeoutError):
+            self.ev_loop.run_until_complete(asyncio.wait_for(context.acquire(), 0.3))
+
+        self.assertFalse(self.throttler._priority_lanes.has_waiter_ahead([TEST_POOL_ID], RequestPriority.BACKGROUND))
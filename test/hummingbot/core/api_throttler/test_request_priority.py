@@ -0,0 +1,57 @@
+import asyncio
+import unittest
+
+from hummingbot.core.api_throttler.request_priority import (
+    PriorityLanes,
+    RequestPriority,
+    current_request_priority,
+    request_priority,
+)
+
+
+class RequestPriorityTests(unittest.TestCase):
+
+    def test_request_priority_is_scoped_to_the_block(self):
+        self.assertEqual(RequestPriority.DEFAULT, current_request_priority())
+        with request_priority(RequestPriority.CANCEL):
+            self.assertEqual(RequestPriority.CANCEL, current_request_priority())
+            with request_priority(RequestPriority.POLLING):
+                self.assertEqual(RequestPriority.POLLING, current_request_priority())
+            self.assertEqual(RequestPriority.CANCEL, current_request_priority())
+        self.assertEqual(RequestPriority.DEFAULT, current_request_priority())
+
+    def test_request_priority_is_inherited_by_created_tasks(self):
+        async def priority_in_task():
+            return await asyncio.ensure_future(asyncio.sleep(0, result=current_request_priority()))
+
+        async def run():
+            with request_priority(RequestPriority.BACKGROUND):
+                return await asyncio.ensure_future(priority_in_task())
+
+        self.assertEqual(RequestPriority.BACKGROUND, asyncio.run(run()))
+
+
+class PriorityLanesTests(unittest.TestCase):
+
+    def test_has_waiter_ahead(self):
+        lanes = PriorityLanes()
+        lanes.add_waiter(["A", "B"], RequestPriority.CREATE)
+
+        self.assertTrue(lanes.has_waiter_ahead(["B", "C"], RequestPriority.POLLING))
+        self.assertFalse(lanes.has_waiter_ahead(["C"], RequestPriority.POLLING))
+        self.assertFalse(lanes.has_waiter_ahead(["A"], RequestPriority.CREATE))
+        self.assertFalse(lanes.has_waiter_ahead(["A"], RequestPriority.CANCEL))
+
+        lanes.remove_waiter(["A", "B"], RequestPriority.CREATE)
+        self.assertFalse(lanes.has_waiter_ahead(["A", "B"], RequestPriority.BACKGROUND))
+        self.assertEqual({}, lanes._waiting)
+
+    def test_usable_capacity(self):
+        lanes = PriorityLanes()
+
+        self.assertEqual(10, lanes.usable_capacity(10, 1, RequestPriority.CANCEL))
+        self.assertEqual(10, lanes.usable_capacity(10, 1, RequestPriority.DEFAULT))
+        self.assertEqual(9, lanes.usable_capacity(10, 1, RequestPriority.POLLING))
+        self.assertEqual(8, lanes.usable_capacity(10, 1, RequestPriority.BACKGROUND))
+        # A low priority request can always use an idle limit
+        self.assertEqual(1, lanes.usable_capacity(1, 1, RequestPriority.BACKGROUND))
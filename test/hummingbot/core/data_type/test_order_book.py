@@ -2,10 +2,14 @@
 
 import logging
 import unittest
+from types import SimpleNamespace
 
 import numpy as np
 
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 
 
 class OrderBookUnitTest(unittest.TestCase):
@@ -52,6 +56,193 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_depth_queries_walk_book(self):
+        order_book = OrderBook()
+        bids_array = np.array([[97, 3, 1], [98, 2, 1], [99, 1, 1]], dtype=np.float64)
+        asks_array = np.array([[101, 1, 1], [102, 2, 1], [103, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        result = order_book.get_price_for_volume(True, 2)
+        self.assertEqual(102, result.result_price)
+        self.assertEqual(2, result.result_volume)
+        result = order_book.get_price_for_volume(False, 10)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(6, result.result_volume)
+
+        result = order_book.get_vwap_for_volume(True, 2)
+        self.assertAlmostEqual((101 + 102) / 2, result.result_price)
+        result = order_book.get_vwap_for_volume(False, 4)
+        self.assertAlmostEqual((99 + 98 * 2 + 97) / 4, result.result_price)
+
+        result = order_book.get_price_for_quote_volume(True, 200)
+        self.assertEqual(102, result.result_price)
+        result = order_book.get_quote_volume_for_base_amount(False, 2)
+        self.assertEqual(99 + 98, result.result_volume)
+        result = order_book.get_volume_for_price(True, 102)
+        self.assertEqual(3, result.result_volume)
+        self.assertEqual(102, result.result_price)
+        result = order_book.get_quote_volume_for_price(False, 98)
+        self.assertEqual(99 + 98 * 2, result.result_volume)
+
+    def test_batched_depth_queries_match_scalar_queries(self):
+        order_book = OrderBook()
+        bids_array = np.array([[97, 3, 1], [98, 2, 1], [99, 1, 1]], dtype=np.float64)
+        asks_array = np.array([[101, 1, 1], [102, 2, 1], [103, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        volumes = np.array([4, 0.5, 10, 1, 2.5])
+        prices = np.array([102.5, 96, 101, 99, 104])
+
+        for is_buy in (True, False):
+            np.testing.assert_array_equal(
+                [order_book.get_price_for_volume(is_buy, v).result_price for v in volumes],
+                order_book.get_prices_for_volumes(is_buy, volumes))
+            np.testing.assert_allclose(
+                [order_book.get_vwap_for_volume(is_buy, v).result_price for v in volumes],
+                order_book.get_vwaps_for_volumes(is_buy, volumes))
+            np.testing.assert_array_equal(
+                [order_book.get_volume_for_price(is_buy, p).result_volume for p in prices],
+                order_book.get_volumes_for_prices(is_buy, prices))
+
+        volumes = np.array([np.nan, 1, -1])
+        prices = np.array([np.nan, 102])
+        for is_buy in (True, False):
+            np.testing.assert_array_equal(
+                [order_book.get_price_for_volume(is_buy, v).result_price for v in volumes],
+                order_book.get_prices_for_volumes(is_buy, volumes))
+            np.testing.assert_allclose(
+                [order_book.get_vwap_for_volume(is_buy, v).result_price for v in volumes],
+                order_book.get_vwaps_for_volumes(is_buy, volumes))
+            np.testing.assert_array_equal(
+                [order_book.get_volume_for_price(is_buy, p).result_volume for p in prices],
+                order_book.get_volumes_for_prices(is_buy, prices))
+            with self.assertRaises(ZeroDivisionError):
+                order_book.get_vwap_for_volume(is_buy, 0)
+            with self.assertRaises(ZeroDivisionError):
+                order_book.get_vwaps_for_volumes(is_buy, np.array([1, 0]))
+
+    def test_depth_index_matches_linear_scan(self):
+        rng = np.random.default_rng(42)
+        indexed_book = OrderBook(depth_index=True)
+        linear_book = OrderBook()
+        bids_array = np.array([[100 - i * 0.5, 1 + i % 3, 1] for i in range(50)], dtype=np.float64)
+        asks_array = np.array([[101 + i * 0.5, 1 + i % 4, 1] for i in range(50)], dtype=np.float64)
+        for order_book in (indexed_book, linear_book):
+            order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        for update_id in range(2, 200):
+            bids_diff = np.array([[100 - rng.integers(0, 60) * 0.5, rng.integers(0, 3), update_id]], dtype=np.float64)
+            asks_diff = np.array([[101 + rng.integers(-2, 60) * 0.5, rng.integers(0, 3), update_id]], dtype=np.float64)
+            for order_book in (indexed_book, linear_book):
+                order_book.apply_numpy_diffs(bids_diff, asks_diff)
+
+            for is_buy in (True, False):
+                volume = rng.uniform(0, 120)
+                price = rng.uniform(70, 130)
+                for query, argument in ((OrderBook.get_price_for_volume, volume),
+                                        (OrderBook.get_vwap_for_volume, volume),
+                                        (OrderBook.get_price_for_quote_volume, volume * 100),
+                                        (OrderBook.get_quote_volume_for_base_amount, volume),
+                                        (OrderBook.get_volume_for_price, price),
+                                        (OrderBook.get_quote_volume_for_price, price)):
+                    expected = query(linear_book, is_buy, argument)
+                    result = query(indexed_book, is_buy, argument)
+                    np.testing.assert_allclose(
+                        [expected.result_price, expected.result_volume],
+                        [result.result_price, result.result_volume])
+
+    def test_depth_index_can_be_toggled(self):
+        order_book = OrderBook()
+        bids_array = np.array([[97, 3, 1], [98, 2, 1], [99, 1, 1]], dtype=np.float64)
+        asks_array = np.array([[101, 1, 1], [102, 2, 1], [103, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        self.assertFalse(order_book.depth_index_enabled)
+
+        order_book.depth_index_enabled = True
+        self.assertTrue(order_book.depth_index_enabled)
+        self.assertEqual(98, order_book.get_price_for_volume(False, 3).result_price)
+        order_book.apply_numpy_diffs(np.array([[99, 0, 2]], dtype=np.float64), np.empty((0, 3)))
+        self.assertEqual(97, order_book.get_price_for_volume(False, 3).result_price)
+        self.assertTrue(np.isnan(order_book.get_price_for_volume(False, np.nan).result_price))
+        self.assertEqual(5, order_book.get_volume_for_price(False, np.nan).result_volume)
+
+    def test_to_numpy(self):
+        order_book = OrderBook()
+        bids_array = np.array([[97, 3, 1], [98, 2, 2], [99, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[101, 1, 1], [102, 2, 2]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids, asks = order_book.to_numpy()
+        np.testing.assert_array_equal(bids_array[::-1], bids)
+        np.testing.assert_array_equal(asks_array, asks)
+        self.assertTrue(bids.flags.c_contiguous)
+
+        bids, asks = order_book.to_numpy(depth=2)
+        np.testing.assert_array_equal(bids_array[:0:-1], bids)
+        np.testing.assert_array_equal(asks_array, asks)
+
+        bids_df, asks_df = order_book.snapshot
+        np.testing.assert_array_equal(bids_array[::-1], bids_df.values)
+
+        bids, asks = order_book.to_numpy(depth=0)
+        self.assertEqual((0, 3), bids.shape)
+        with self.assertRaises(ValueError):
+            order_book.to_numpy(depth=-1)
+        with self.assertRaises(ValueError):
+            order_book.top_levels(-1)
+
+    def test_top_levels_reuses_buffers(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[98, 2, 1], [99, 1, 1]], dtype=np.float64),
+                                        np.array([[101, 1, 1]], dtype=np.float64))
+
+        bids, asks = order_book.top_levels(2)
+        np.testing.assert_array_equal([[99, 1, 1], [98, 2, 1]], bids)
+        np.testing.assert_array_equal([[101, 1, 1]], asks)
+
+        order_book.apply_numpy_diffs(np.array([[99, 0, 2]], dtype=np.float64), np.empty((0, 3)))
+        new_bids, _ = order_book.top_levels(2)
+        np.testing.assert_array_equal([[98, 2, 1]], new_bids)
+        self.assertTrue(np.shares_memory(bids, new_bids))
+
+    def test_apply_raw_levels_matches_order_book_rows(self):
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 1,
+            "bids": [["99.5", "1.5"], ["99", "2"]],
+            "asks": [["100.5", "1"], ["101", "3", "extra"]],
+        }, timestamp=1)
+        diff = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 2,
+            "bids": [["99.5", "0"], ["98", "4"]],
+            "asks": [[100.75, 2.5]],
+        }, timestamp=2)
+
+        rows_book = OrderBook()
+        rows_book.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        rows_book.apply_diffs(diff.bids, diff.asks, diff.update_id)
+        raw_book = OrderBook()
+        raw_book.apply_snapshot_message(snapshot)
+        raw_book.apply_diff_message(diff)
+
+        for expected, result in zip(rows_book.to_numpy(), raw_book.to_numpy()):
+            np.testing.assert_array_equal(expected, result)
+        self.assertEqual(2, raw_book.last_diff_uid)
+        self.assertEqual(1, raw_book.snapshot_uid)
+
+    def test_composite_depth_queries_account_for_recorded_fills(self):
+        order_book = CompositeOrderBook()
+        bids_array = np.array([[97, 3, 1], [98, 2, 1], [99, 1, 1]], dtype=np.float64)
+        asks_array = np.array([[101, 1, 1], [102, 2, 1], [103, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        order_book.record_filled_order(SimpleNamespace(trade_type=TradeType.BUY, price=101.0, amount=1, timestamp=2))
+
+        self.assertEqual(103, order_book.get_price_for_volume(True, 3).result_price)
+        self.assertEqual(2, order_book.get_volume_for_price(True, 102).result_volume)
+        np.testing.assert_array_equal([102, 103], order_book.get_prices_for_volumes(True, np.array([1, 3])))
+        _, asks = order_book.to_numpy()
+        np.testing.assert_array_equal([[102, 2, 1], [103, 3, 1]], asks)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -118,6 +118,30 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertEqual(6, bids[0].amount)
         self.assertEqual(update_id, bids[0].update_id)
 
+    def test_bids_and_asks_are_parsed_once(self):
+        msg = OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "update_id": 1,
+                "asks": [("1", "2")],
+                "bids": [("5", "6")],
+            },
+            timestamp=time.time(),
+        )
+
+        self.assertIs(msg.asks, msg.asks)
+        self.assertIs(msg.bids, msg.bids)
+
+    def test_has_raw_levels(self):
+        class CustomLevelsMessage(OrderBookMessage):
+            @property
+            def bids(self):
+                return []
+
+        content = {"update_id": 1, "asks": [], "bids": []}
+        self.assertTrue(OrderBookMessage(OrderBookMessageType.DIFF, content, time.time()).has_raw_levels)
+        self.assertFalse(CustomLevelsMessage(OrderBookMessageType.DIFF, content, time.time()).has_raw_levels)
+
     def test_has_update_id(self):
         update_id = "someId"
 
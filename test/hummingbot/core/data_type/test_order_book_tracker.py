@@ -19,6 +19,7 @@ import numpy as np
 
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker import (
     LatencyStats,
     OrderBookPairMetrics,
@@ -581,6 +582,112 @@ class OrderBookTrackerMetricsIntegrationTests(IsolatedAsyncioWrapperTestCase):
         self.assertNotIn("SOL-USDT", tracker.metrics.per_pair_metrics)
 
 
+class OrderBookTrackerDiffCoalescingTests(IsolatedAsyncioWrapperTestCase):
+    """Tests for merging queued diffs in _track_single_book."""
+
+    def setUp(self):
+        super().setUp()
+        self.data_source = MagicMock(spec=OrderBookTrackerDataSource)
+        self.trading_pair = "BTC-USDT"
+
+    def _create_tracker(self) -> OrderBookTracker:
+        tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=[self.trading_pair])
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(99.0, 1.0, 1), OrderBookRow(98.0, 2.0, 1)],
+                                  [OrderBookRow(101.0, 1.0, 1), OrderBookRow(102.0, 2.0, 1)], 1)
+        tracker._order_books[self.trading_pair] = order_book
+        tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        return tracker
+
+    def _diff(self, update_id: int, bids, asks) -> OrderBookMessage:
+        return OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=float(update_id),
+        )
+
+    def _diffs(self):
+        return [
+            self._diff(2, [["99.5", "1.0"], ["98", "0"]], [["101", "3.0"]]),
+            self._diff(3, [["99.5", "4.0"]], [["100.5", "1.0"], ["102", "0"]]),
+            self._diff(4, [["99.5", "0"], ["97", "5.0"]], [["100.5", "2.0"]]),
+        ]
+
+    async def _run_tracking(self, tracker: OrderBookTracker, messages):
+        for message in messages:
+            tracker._tracking_message_queues[self.trading_pair].put_nowait(message)
+        task = asyncio.create_task(tracker._track_single_book(self.trading_pair))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def test_queued_diffs_are_merged_and_applied_once(self):
+        tracker = self._create_tracker()
+        expected = self._create_tracker().order_books[self.trading_pair]
+        diffs = self._diffs()
+        for diff in diffs:
+            expected.apply_diff_message(diff)
+
+        await self._run_tracking(tracker, diffs)
+
+        order_book = tracker.order_books[self.trading_pair]
+        expected_bids, expected_asks = expected.to_numpy()
+        bids, asks = order_book.to_numpy()
+        # Same prices and amounts, the merged levels take the update id of the last diff
+        np.testing.assert_array_equal(expected_bids[:, :2], bids[:, :2])
+        np.testing.assert_array_equal(expected_asks[:, :2], asks[:, :2])
+        self.assertEqual([1, 4], bids[:, 2].tolist())
+        self.assertEqual([4, 4], asks[:, 2].tolist())
+        self.assertEqual(4, order_book.last_diff_uid)
+        self.assertEqual(diffs, list(tracker._past_diffs_windows[self.trading_pair]))
+
+        pair_metrics = tracker.metrics.per_pair_metrics[self.trading_pair]
+        self.assertEqual(3, pair_metrics.diffs_coalesced)
+        self.assertEqual(1, pair_metrics.coalesced_batches)
+        self.assertEqual(3.0, pair_metrics.coalescing_ratio)
+        self.assertEqual(2, pair_metrics.max_queue_depth)
+        self.assertEqual(0, pair_metrics.queue_depth)
+        self.assertEqual(3, tracker.metrics.total_diffs_coalesced)
+        self.assertEqual(3.0, tracker.metrics.to_dict()["coalescing_ratio"])
+
+    async def test_snapshot_in_backlog_is_applied_after_preceding_diffs(self):
+        tracker = self._create_tracker()
+        diffs = self._diffs()
+        snapshot = OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={"trading_pair": self.trading_pair, "update_id": 3, "bids": [["90", "1"]], "asks": [["110", "1"]]},
+            timestamp=3.0,
+        )
+
+        await self._run_tracking(tracker, diffs[:2] + [snapshot, diffs[2]])
+
+        order_book = tracker.order_books[self.trading_pair]
+        bids, asks = order_book.to_numpy()
+        # The snapshot replaces the levels of the initial book, and the diff queued after it is applied on top.
+        self.assertIn(90.0, bids[:, 0])
+        self.assertIn(97.0, bids[:, 0])
+        self.assertNotIn(99.0, bids[:, 0])
+        self.assertEqual(3, order_book.snapshot_uid)
+        self.assertEqual(4, order_book.last_diff_uid)
+        self.assertEqual(1, tracker.metrics.per_pair_metrics[self.trading_pair].coalesced_batches)
+        self.assertEqual(2, tracker.metrics.per_pair_metrics[self.trading_pair].diffs_coalesced)
+
+    async def test_coalescing_disabled(self):
+        tracker = self._create_tracker()
+        tracker.DIFF_COALESCING_MIN_BACKLOG = None
+        diffs = self._diffs()
+
+        await self._run_tracking(tracker, diffs)
+
+        self.assertEqual(4, tracker.order_books[self.trading_pair].last_diff_uid)
+        self.assertEqual(diffs, list(tracker._past_diffs_windows[self.trading_pair]))
+        self.assertEqual(0, tracker.metrics.per_pair_metrics[self.trading_pair].coalesced_batches)
+        self.assertEqual(0.0, tracker.metrics.coalescing_ratio)
+
+
 class OrderBookTrackerDynamicPairTests(IsolatedAsyncioWrapperTestCase):
     """Tests for dynamically adding/removing trading pairs from OrderBookTracker."""
 
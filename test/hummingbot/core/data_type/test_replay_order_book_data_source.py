@@ -0,0 +1,147 @@
+import asyncio
+import os
+import tempfile
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest import TestCase
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.replay_order_book_data_source import (
+    ReplayOrderBookTrackerDataSource,
+    load_order_book_messages,
+    order_book_messages_from_chunks,
+    save_order_book_messages,
+)
+from hummingbot.model.market_data_chunk_store import MarketDataChunkWriter, MarketDataSnapshot
+
+
+def snapshot(timestamp: float, update_id: int, trading_pair: str = "COINALPHA-HBOT") -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+        "trading_pair": trading_pair, "update_id": update_id, "bids": [["99", "1"]], "asks": [["101", "2"]],
+    }, timestamp)
+
+
+def diff(timestamp: float, update_id: int, trading_pair: str = "COINALPHA-HBOT") -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.DIFF, {
+        "trading_pair": trading_pair, "update_id": update_id, "bids": [["99.5", "3"]], "asks": [],
+    }, timestamp)
+
+
+def trade(timestamp: float, trade_id: int, price: str, trading_pair: str = "COINALPHA-HBOT") -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.TRADE, {
+        "trading_pair": trading_pair, "trade_type": float(TradeType.SELL.value), "trade_id": trade_id,
+        "update_id": trade_id, "price": price, "amount": "0.5",
+    }, timestamp)
+
+
+class ReplayOrderBookTrackerDataSourceTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.messages = [diff(3, 3), trade(2, 1, "100.5"), snapshot(1, 1), snapshot(1, 1, trading_pair="OTHER-HBOT"),
+                         diff(3, 4), snapshot(5, 5)]
+        self.data_source = ReplayOrderBookTrackerDataSource(["COINALPHA-HBOT"], self.messages, replay_speed=10)
+
+    def test_messages_are_sorted_by_timestamp_keeping_the_recorded_order(self):
+        self.assertEqual(1, self.data_source.start_timestamp)
+        self.assertEqual(5, self.data_source.end_timestamp)
+
+        messages = self.data_source.pop_messages(3)
+
+        self.assertEqual([OrderBookMessageType.SNAPSHOT, OrderBookMessageType.TRADE, OrderBookMessageType.DIFF,
+                          OrderBookMessageType.DIFF], [message.type for message in messages])
+        self.assertEqual([3, 4], [message.update_id for message in messages[2:]])
+        self.assertFalse(self.data_source.is_exhausted)
+        self.assertEqual([], self.data_source.pop_messages(4.5))
+        self.assertEqual(5, self.data_source.pop_messages(10)[0].update_id)
+        self.assertTrue(self.data_source.is_exhausted)
+
+    async def test_initial_order_book_from_the_first_snapshot(self):
+        order_book = await self.data_source.get_new_order_book("COINALPHA-HBOT")
+
+        self.assertEqual(1, order_book.snapshot_uid)
+        self.assertEqual(99, order_book.get_price(False))
+        self.assertEqual(101, order_book.get_price(True))
+
+        self.data_source.pop_messages(5)
+        order_book = await self.data_source.get_new_order_book("COINALPHA-HBOT")
+        self.assertEqual(5, order_book.snapshot_uid)
+
+    def test_snapshot_message_of_a_pair_without_snapshot(self):
+        data_source = ReplayOrderBookTrackerDataSource(["COINALPHA-HBOT"], [diff(1, 1)])
+
+        with self.assertRaises(ValueError):
+            data_source.snapshot_message("COINALPHA-HBOT")
+
+    async def test_last_traded_prices(self):
+        self.assertEqual({}, await self.data_source.get_last_traded_prices(["COINALPHA-HBOT"]))
+
+        self.data_source.pop_messages(2)
+
+        self.assertEqual({"COINALPHA-HBOT": 100.5}, await self.data_source.get_last_traded_prices(["COINALPHA-HBOT"]))
+
+    @patch("hummingbot.core.data_type.replay_order_book_data_source.ReplayOrderBookTrackerDataSource._sleep",
+           new_callable=AsyncMock)
+    async def test_listen_for_subscriptions_streams_messages_at_replay_speed(self, sleep_mock: AsyncMock):
+        await self.data_source.listen_for_subscriptions()
+
+        self.assertEqual([0.1, 0.1, 0, 0.2], [call.args[0] for call in sleep_mock.call_args_list])
+        self.assertTrue(self.data_source.is_exhausted)
+
+        diffs, snapshots, trades = asyncio.Queue(), asyncio.Queue(), asyncio.Queue()
+        tasks = [asyncio.create_task(self.data_source.listen_for_order_book_diffs(None, diffs)),
+                 asyncio.create_task(self.data_source.listen_for_order_book_snapshots(None, snapshots)),
+                 asyncio.create_task(self.data_source.listen_for_trades(None, trades))]
+        self.addCleanup(lambda: [task.cancel() for task in tasks])
+        self.assertEqual(3, (await diffs.get()).update_id)
+        self.assertEqual(4, (await diffs.get()).update_id)
+        self.assertEqual(1, (await snapshots.get()).update_id)
+        self.assertEqual(5, (await snapshots.get()).update_id)
+        self.assertEqual(1, (await trades.get()).trade_id)
+
+    async def test_subscriptions(self):
+        self.assertTrue(await self.data_source.subscribe_to_trading_pair("COINALPHA-HBOT"))
+        self.assertFalse(await self.data_source.subscribe_to_trading_pair("OTHER-HBOT"))
+        self.assertTrue(await self.data_source.unsubscribe_from_trading_pair("COINALPHA-HBOT"))
+
+
+class OrderBookRecordingTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_save_and_load_messages(self):
+        messages = [snapshot(1, 1), diff(2, 2), trade(3, 1, "100")]
+        for file_name in ("recording.jsonl", "recording.jsonl.gz"):
+            path = os.path.join(self.directory.name, file_name)
+
+            save_order_book_messages(path, messages)
+            loaded = list(load_order_book_messages(path))
+
+            self.assertEqual([message.type for message in messages], [message.type for message in loaded])
+            self.assertEqual([message.timestamp for message in messages], [message.timestamp for message in loaded])
+            self.assertEqual([message.content for message in messages], [message.content for message in loaded])
+
+    def test_snapshot_messages_from_market_data_chunks(self):
+        writer = MarketDataChunkWriter(self.directory.name, depth=2)
+        writer.start()
+        for timestamp, levels in ((1, 2), (2, 1)):
+            writer.put(MarketDataSnapshot(
+                timestamp=timestamp, exchange="binance", trading_pair="COINALPHA-HBOT", mid_price=100, best_bid=99,
+                best_ask=101, bids=np.array([[99 - i, 1, 0] for i in range(levels)], dtype=np.float64),
+                asks=np.array([[101 + i, 2, 0] for i in range(levels)], dtype=np.float64)))
+        writer.stop()
+
+        messages = list(order_book_messages_from_chunks(self.directory.name, "binance", "COINALPHA-HBOT", start=2))
+
+        self.assertEqual(1, len(messages))
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, messages[0].type)
+        self.assertEqual(2, messages[0].timestamp)
+        self.assertEqual(2000, messages[0].update_id)
+        self.assertEqual([[99, 1]], messages[0].content["bids"])
+        self.assertEqual([[101, 2]], messages[0].content["asks"])
@@ -0,0 +1,110 @@
+from decimal import Decimal
+from unittest import TestCase
+
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.replay_order_book_data_source import ReplayOrderBookTrackerDataSource
+from hummingbot.core.data_type.replay_order_book_tracker import OrderBookReplayIterator, ReplayOrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent
+from hummingbot.core.py_time_iterator import PyTimeIterator
+
+
+class BookObserver(PyTimeIterator):
+    def __init__(self, tracker: ReplayOrderBookTracker, trading_pair: str):
+        super().__init__()
+        self.tracker = tracker
+        self.trading_pair = trading_pair
+        self.best_bids = []
+
+    def tick(self, timestamp: float):
+        self.best_bids.append((timestamp, self.tracker.order_books[self.trading_pair].get_price(False)))
+
+
+class ReplayOrderBookTrackerTests(TestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        messages = [
+            self.book_message(OrderBookMessageType.SNAPSHOT, 100, 1, bids=[["99", "10"]], asks=[["101", "10"]]),
+            self.book_message(OrderBookMessageType.DIFF, 102, 2, bids=[["99.5", "5"]], asks=[]),
+            self.trade_message(103.5, 1, price="99.2", amount="2"),
+            self.book_message(OrderBookMessageType.DIFF, 105, 3, bids=[["99.5", "0"]], asks=[]),
+        ]
+        self.data_source = ReplayOrderBookTrackerDataSource([self.trading_pair], messages)
+        self.tracker = ReplayOrderBookTracker(self.data_source, [self.trading_pair])
+        self.clock = Clock(ClockMode.BACKTEST, 1.0, 100, 1000)
+
+    def book_message(self, message_type: OrderBookMessageType, timestamp: float, update_id: int, bids, asks):
+        return OrderBookMessage(message_type, {
+            "trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks,
+        }, timestamp)
+
+    def trade_message(self, timestamp: float, trade_id: int, price: str, amount: str):
+        return OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": self.trading_pair, "trade_type": float(TradeType.SELL.value), "trade_id": trade_id,
+            "update_id": trade_id, "price": price, "amount": amount,
+        }, timestamp)
+
+    def test_start_creates_the_books_from_the_first_snapshots(self):
+        self.assertFalse(self.tracker.ready)
+
+        self.tracker.start()
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(99, self.tracker.order_books[self.trading_pair].get_price(False))
+        self.tracker.stop()
+        self.assertTrue(self.tracker.ready)
+
+    def test_advance_to_applies_the_recorded_messages(self):
+        self.tracker.start()
+        trade_logger = EventLogger()
+        self.tracker.order_books[self.trading_pair].add_listener(OrderBookEvent.TradeEvent, trade_logger)
+
+        self.assertEqual(2, self.tracker.advance_to(102))
+        self.assertEqual(99.5, self.tracker.order_books[self.trading_pair].get_price(False))
+        self.assertEqual(1, self.tracker.advance_to(104))
+        self.assertEqual(1, len(trade_logger.event_log))
+        self.assertEqual(TradeType.SELL, trade_logger.event_log[0].type)
+        self.assertEqual(99.2, trade_logger.event_log[0].price)
+        self.assertEqual(1, self.tracker.advance_to(105))
+        self.assertEqual(99, self.tracker.order_books[self.trading_pair].get_price(False))
+        self.assertEqual(0, self.tracker.advance_to(200))
+
+    def test_backtest_stops_after_the_recording(self):
+        replay_iterator = OrderBookReplayIterator(self.tracker)
+        observer = BookObserver(self.tracker, self.trading_pair)
+        self.clock.add_iterator(replay_iterator)
+        self.clock.add_iterator(observer)
+
+        self.clock.backtest()
+
+        self.assertEqual(4, replay_iterator.messages_replayed)
+        self.assertEqual([(101, 99), (102, 99.5), (103, 99.5), (104, 99.5), (105, 99)], observer.best_bids)
+        self.assertEqual(106, self.clock.current_timestamp)
+
+    def test_paper_trade_limit_order_filled_by_replayed_trade(self):
+        exchange = PaperTradeExchange(self.tracker, BinanceExchange, exchange_name="binance")
+        exchange.set_balance("HBOT", Decimal("1000"))
+        exchange.set_balance("COINALPHA", Decimal("0"))
+        fill_logger = EventLogger()
+        exchange.add_listener(MarketEvent.OrderFilled, fill_logger)
+        self.assertIsInstance(self.data_source.order_book_create_function(), CompositeOrderBook)
+        self.clock.add_iterator(OrderBookReplayIterator(self.tracker))
+        self.clock.add_iterator(exchange)
+
+        self.clock.backtest_til(101)
+        self.assertTrue(exchange.ready)
+        order_id = exchange.buy(self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("99.3"))
+        self.clock.backtest()
+
+        self.assertEqual(1, len(fill_logger.event_log))
+        self.assertEqual(order_id, fill_logger.event_log[0].order_id)
+        self.assertEqual(Decimal("99.3"), fill_logger.event_log[0].price)
+        self.assertLess(exchange.get_balance("HBOT"), Decimal("1000"))
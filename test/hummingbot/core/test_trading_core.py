@@ -611,30 +611,51 @@ class TradingCoreTest(IsolatedAsyncioWrapperTestCase):
         self.mock_connector.ready = True
         self.trading_core.connector_manager.connectors["binance"] = self.mock_connector
 
-        # Set up mock trades
-        mock_trade1 = Mock(spec=TradeFill)
-        mock_trade1.market = "binance"
-        mock_trade1.symbol = "BTC-USDT"
-        mock_trades = [mock_trade1]
-
-        # Mock session and trades retrieval
-        mock_session = Mock(spec=Session)
-        self.trading_core.trade_fill_db.get_new_session.return_value.__enter__ = Mock(return_value=mock_session)
-        self.trading_core.trade_fill_db.get_new_session.return_value.__exit__ = Mock(return_value=None)
-
-        # Mock calculate_performance_metrics_by_connector_pair
         mock_perf = Mock()
         mock_perf.return_pct = Decimal("5.0")
 
-        with patch.object(self.trading_core, "_get_trades_from_session", return_value=mock_trades):
-            with patch.object(self.trading_core, "calculate_performance_metrics_by_connector_pair",
-                              return_value=[mock_perf]) as mock_calc_perf:
+        with patch.object(self.trading_core, "performance_metrics_since",
+                          return_value={("binance", "BTC-USDT"): mock_perf}) as mock_perf_since:
 
-                result = await self.trading_core.calculate_profitability()
+            result = await self.trading_core.calculate_profitability()
 
-                # Verify
-                self.assertEqual(result, Decimal("5.0"))
-                mock_calc_perf.assert_called_once_with(mock_trades)
+            # Verify
+            self.assertEqual(result, Decimal("5.0"))
+            mock_perf_since.assert_called_once_with(self.trading_core.init_time, "test_strategy.yml")
+
+    @patch("hummingbot.core.trading_core.TradePerformance.get_aggregates")
+    @patch("hummingbot.core.trading_core.PerformanceMetrics")
+    async def test_performance_metrics_since(self, mock_perf_metrics_class, mock_get_aggregates):
+        """Test performance_metrics_since builds spot metrics from the trade totals and loads derivative trades"""
+        self.trading_core.trade_fill_db = Mock()
+        self.trading_core.markets_recorder = Mock()
+        mock_session = Mock(spec=Session)
+        self.trading_core.trade_fill_db.get_new_session.return_value.__enter__ = Mock(return_value=mock_session)
+        self.trading_core.trade_fill_db.get_new_session.return_value.__exit__ = Mock(return_value=None)
+        spot_aggregate = Mock(is_derivative=False)
+        perp_aggregate = Mock(is_derivative=True)
+        mock_get_aggregates.return_value = {("binance", "BTC-USDT"): spot_aggregate,
+                                            ("binance_perpetual", "BTC-USDT"): perp_aggregate}
+        perp_trades = [Mock(spec=TradeFill)]
+        mock_spot_perf = Mock()
+        mock_perp_perf = Mock()
+        mock_perf_metrics_class.create_from_aggregate = AsyncMock(return_value=mock_spot_perf)
+        mock_perf_metrics_class.create = AsyncMock(return_value=mock_perp_perf)
+        balances = {"binance": {"BTC": Decimal("1")}, "binance_perpetual": {"USDT": Decimal("100")}}
+
+        with patch.object(self.trading_core, "_get_market_trades_from_session", return_value=perp_trades):
+            with patch.object(self.trading_core, "get_current_balances",
+                              side_effect=lambda market: balances[market]) as mock_balances:
+                result = await self.trading_core.performance_metrics_since(1000, "test_strategy.yml")
+
+        self.assertEqual({("binance", "BTC-USDT"): mock_spot_perf,
+                          ("binance_perpetual", "BTC-USDT"): mock_perp_perf}, result)
+        self.trading_core.markets_recorder.flush_writes.assert_called_once()
+        mock_get_aggregates.assert_called_once_with(mock_session, 1000000, "test_strategy.yml")
+        mock_perf_metrics_class.create_from_aggregate.assert_called_once_with(
+            "BTC-USDT", spot_aggregate, balances["binance"])
+        mock_perf_metrics_class.create.assert_called_once_with("BTC-USDT", perp_trades, balances["binance_perpetual"])
+        self.assertEqual(2, mock_balances.call_count)
 
     @patch("hummingbot.core.trading_core.PerformanceMetrics")
     async def test_calculate_performance_metrics_by_connector_pair(self, mock_perf_metrics_class):
@@ -0,0 +1,47 @@
+import io
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.utils.import_profiler import (
+    ImportTime,
+    format_import_report,
+    parse_import_times,
+    run_with_import_profile,
+)
+
+IMPORT_TIME_LINES = [
+    "import time: self [us] | cumulative | imported package\n",
+    "import time:       120 |        120 |     _json\n",
+    "import time:       700 |        820 |   json.decoder\n",
+    "import time:       300 |       1120 | json\n",
+    "Some other warning\n",
+]
+
+
+class ImportProfilerTest(unittest.TestCase):
+
+    def test_parse_import_times(self):
+        self.assertEqual(
+            [ImportTime("_json", 120, 120, 2), ImportTime("json.decoder", 700, 820, 1), ImportTime("json", 300, 1120, 0)],
+            parse_import_times(IMPORT_TIME_LINES))
+
+    def test_format_import_report_sorts_by_cumulative_time(self):
+        report = format_import_report(parse_import_times(IMPORT_TIME_LINES), top=2).split("\n")
+
+        self.assertEqual("Imported 3 modules in 0.001 s. Slowest by cumulative time:", report[0])
+        self.assertEqual(4, len(report))
+        self.assertTrue(report[2].endswith("  json"))
+        self.assertIn("1.1", report[2])
+        self.assertTrue(report[3].endswith("    json.decoder"))
+
+    def test_run_with_import_profile(self):
+        output = io.StringIO()
+
+        with patch("sys.stderr", new_callable=io.StringIO) as stderr:
+            returncode = run_with_import_profile(
+                ["-c", "import sys, decimal; sys.stderr.write('child error\\n'); sys.exit(3)"], output=output)
+
+        self.assertEqual(3, returncode)
+        self.assertEqual("child error\n", stderr.getvalue())
+        self.assertIn("decimal", output.getvalue())
+        self.assertTrue(output.getvalue().startswith("Imported "))
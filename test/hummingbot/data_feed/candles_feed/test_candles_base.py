@@ -14,6 +14,7 @@ from aioresponses import aioresponses
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_indicators import EMA
 
 
 class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
@@ -90,6 +91,32 @@ class TestCandlesBase(IsolatedAsyncioWrapperTestCase, ABC):
 
         pd.testing.assert_frame_equal(self.data_feed.candles_df, expected_df)
 
+    def test_candles_df_is_rebuilt_when_candles_change(self):
+        self.data_feed._candles.extend(self._candles_data_mock())
+        candles_df = self.data_feed.candles_df
+        candles_df["close"] = 0.0
+
+        self.assertEqual(float(self._candles_data_mock()[-1][4]), self.data_feed.candles_df["close"].iloc[-1])
+
+        last_candle = self.data_feed._candles[-1]
+        last_candle[4] += 1
+        self.data_feed._candles[-1] = last_candle
+        self.assertEqual(last_candle[4], self.data_feed.candles_df["close"].iloc[-1])
+
+    def test_indicators_are_synced_with_the_candles(self):
+        self.data_feed._candles.extend(self._candles_data_mock())
+        ema = self.data_feed.add_indicator(EMA(length=2))
+
+        self.assertIs(ema, self.data_feed.add_indicator(EMA(length=2)))
+        self.assertEqual(4, len(self.data_feed.get_indicator("EMA_2").values))
+        self.assertFalse(np.isnan(ema.latest()["EMA_2"]))
+
+        self.data_feed._reset_candles()
+        self.assertEqual(0, len(ema.values))
+        self.data_feed.remove_indicator("EMA_2")
+        with self.assertRaises(KeyError):
+            self.data_feed.get_indicator("EMA_2")
+
     def test_get_exchange_trading_pair(self):
         result = self.data_feed.get_exchange_trading_pair(self.trading_pair)
         self.assertEqual(result, self.ex_trading_pair)
@@ -0,0 +1,164 @@
+import importlib.util
+from unittest import TestCase, skipUnless
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_indicators import EMA, MACD, NATR, RSI, BBands
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
+
+
+def reference_ema(close: pd.Series, length: int) -> pd.Series:
+    # pandas-ta ema, seeded with the mean of the first values
+    close = close.copy()
+    seed = close.iloc[0:length].mean()
+    close.iloc[:length - 1] = np.nan
+    close.iloc[length - 1] = seed
+    return close.ewm(span=length, adjust=False).mean()
+
+
+def reference_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    The indicators computed over the whole frame with the steps of pandas-ta, without TA-Lib.
+    """
+    result = pd.DataFrame(index=df.index)
+    result["EMA_10"] = reference_ema(df["close"], 10)
+
+    change = df["close"].diff(1)
+    gains = change.clip(lower=0).ewm(alpha=1 / 14, min_periods=14).mean()
+    losses = (-change).clip(lower=0).ewm(alpha=1 / 14, min_periods=14).mean()
+    result["RSI_14"] = 100 * gains / (gains + losses)
+
+    macd = reference_ema(df["close"], 12) - reference_ema(df["close"], 26)
+    signal = reference_ema(macd.loc[macd.first_valid_index():], 9)
+    result["MACD_12_26_9"] = macd
+    result["MACDh_12_26_9"] = macd - signal
+    result["MACDs_12_26_9"] = signal
+
+    mid = df["close"].rolling(20).mean()
+    deviation = df["close"].rolling(20).var(ddof=0).apply(np.sqrt)
+    result["BBL_20_2.0_2.0"] = mid - 2 * deviation
+    result["BBM_20_2.0_2.0"] = mid
+    result["BBU_20_2.0_2.0"] = mid + 2 * deviation
+    result["BBB_20_2.0_2.0"] = 100 * (4 * deviation) / mid
+    result["BBP_20_2.0_2.0"] = (df["close"] - result["BBL_20_2.0_2.0"]) / (4 * deviation)
+
+    previous_close = df["close"].shift(1)
+    true_range = pd.concat([df["high"] - df["low"], df["high"] - previous_close, previous_close - df["low"]],
+                           axis=1).abs().max(axis=1)
+    true_range.iloc[0] = np.nan
+    result["NATR_14"] = 100 / df["close"] * reference_ema(true_range, 14)
+    return result
+
+
+def indicators():
+    return [EMA(10), RSI(14), MACD(12, 26, 9), BBands(20, 2, 2), NATR(14)]
+
+
+class CandlesIndicatorsTests(TestCase):
+
+    @staticmethod
+    def candles(count: int, seed: int = 0) -> np.ndarray:
+        rng = np.random.default_rng(seed)
+        close = 100 + np.cumsum(rng.normal(0, 0.5, count))
+        open_ = np.concatenate([[100], close[:-1]])
+        high = np.maximum(open_, close) + rng.random(count)
+        low = np.minimum(open_, close) - rng.random(count)
+        candles = np.zeros((count, len(CandlesBase.columns)))
+        candles[:, 0] = 1_700_000_000 + 60 * np.arange(count)
+        candles[:, 1:5] = np.column_stack([open_, high, low, close])
+        candles[:, 5] = rng.random(count) * 10
+        return candles
+
+    def assert_matches(self, expected: pd.DataFrame, indicator, rtol=1e-9, start: int = 0):
+        for column in indicator.columns:
+            np.testing.assert_allclose(indicator[column][start:], expected[column].to_numpy()[start:],
+                                       rtol=rtol, atol=1e-9, err_msg=column)
+
+    def test_streamed_candles_match_the_full_recomputation(self):
+        candles = self.candles(300)
+        buffer = CandlesRingBuffer(maxlen=500, n_columns=candles.shape[1])
+        streamed = indicators()
+        for candle in candles:
+            # Each candle is updated a few times before it closes, like websocket messages do
+            in_progress = candle.copy()
+            in_progress[4] = candle[1]
+            buffer.append(in_progress)
+            for close in (candle[2], candle[3], candle[4]):
+                in_progress[4] = close
+                buffer[-1] = in_progress
+                for indicator in streamed:
+                    indicator.sync(buffer)
+            buffer[-1] = candle
+            for indicator in streamed:
+                indicator.sync(buffer)
+
+        expected = reference_indicators(pd.DataFrame(candles, columns=CandlesBase.columns))
+        for indicator in streamed:
+            self.assertEqual(len(candles), len(indicator.values))
+            self.assert_matches(expected, indicator)
+        self.assertTrue(np.isnan(streamed[1]["RSI_14"][13]))
+        self.assertFalse(np.isnan(streamed[1]["RSI_14"][14]))
+        self.assertAlmostEqual(expected["MACDh_12_26_9"].iloc[-1], streamed[2].latest()["MACDh_12_26_9"])
+
+    def test_sliding_window(self):
+        candles = self.candles(400, seed=1)
+        buffer = CandlesRingBuffer(maxlen=150, n_columns=candles.shape[1])
+        streamed = indicators()
+        for candle in candles:
+            buffer.append(candle)
+            for indicator in streamed:
+                indicator.sync(buffer)
+
+        window = pd.DataFrame(candles[-150:], columns=CandlesBase.columns)
+        windowed = reference_indicators(window)
+        continuous = reference_indicators(pd.DataFrame(candles, columns=CandlesBase.columns)).iloc[-150:]
+        for indicator in streamed:
+            self.assertEqual(150, len(indicator.values))
+            self.assert_matches(continuous.reset_index(drop=True), indicator, rtol=1e-8)
+        # Once the window recomputation is warmed up, the rolling indicators only depend on the window, and the moving
+        # averages converge to the window recomputation
+        self.assert_matches(windowed, streamed[3], rtol=1e-8, start=19)
+        np.testing.assert_allclose(streamed[1]["RSI_14"][-1], windowed["RSI_14"].iloc[-1], rtol=1e-4)
+
+    def test_prepended_history_is_recomputed(self):
+        candles = self.candles(100, seed=2)
+        buffer = CandlesRingBuffer(maxlen=100, n_columns=candles.shape[1])
+        rsi = RSI(14)
+        buffer.append(candles[-1])
+        rsi.sync(buffer)
+        self.assertTrue(np.isnan(rsi.latest()["RSI_14"]))
+
+        buffer.extendleft(candles[:-1][::-1])
+        rsi.sync(buffer)
+
+        expected = reference_indicators(pd.DataFrame(candles, columns=CandlesBase.columns))
+        self.assert_matches(expected, rsi)
+
+        buffer.clear()
+        rsi.sync(buffer)
+        self.assertEqual(0, len(rsi.values))
+
+    @skipUnless(importlib.util.find_spec("pandas_ta") is not None, "pandas-ta is not installed")
+    def test_match_pandas_ta(self):
+        import pandas_ta as ta
+
+        candles = self.candles(300, seed=4)
+        buffer = CandlesRingBuffer(maxlen=300, n_columns=candles.shape[1])
+        streamed = indicators()
+        for candle in candles:
+            buffer.append(candle)
+            for indicator in streamed:
+                indicator.sync(buffer)
+
+        df = pd.DataFrame(candles, columns=CandlesBase.columns)
+        expected = pd.concat([
+            ta.ema(df["close"], length=10, talib=False),
+            ta.rsi(df["close"], length=14, talib=False),
+            ta.macd(df["close"], fast=12, slow=26, signal=9, talib=False),
+            ta.bbands(df["close"], length=20, lower_std=2.0, upper_std=2.0, talib=False),
+            ta.natr(df["high"], df["low"], df["close"], length=14, talib=False),
+        ], axis=1)
+        for indicator in streamed:
+            self.assert_matches(expected, indicator, rtol=1e-7)
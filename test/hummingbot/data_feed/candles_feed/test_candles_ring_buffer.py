@@ -0,0 +1,62 @@
+from collections import deque
+from unittest import TestCase
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_ring_buffer import CandlesRingBuffer
+
+
+class CandlesRingBufferTests(TestCase):
+
+    @staticmethod
+    def row(timestamp: float):
+        return [timestamp, timestamp + 0.1, timestamp + 0.2]
+
+    def assert_same_rows(self, expected: deque, buffer: CandlesRingBuffer):
+        self.assertEqual(len(expected), len(buffer))
+        np.testing.assert_array_equal(np.array(list(expected)).reshape(-1, 3), buffer.values)
+
+    def test_behaves_like_a_bounded_deque(self):
+        buffer = CandlesRingBuffer(maxlen=4, n_columns=3)
+        expected = deque(maxlen=4)
+        operations = [
+            ("append", self.row(1)), ("append", self.row(2)), ("appendleft", self.row(0)),
+            ("extend", [self.row(3), self.row(4), self.row(5)]), ("appendleft", self.row(-1)),
+            ("extendleft", [self.row(-2), self.row(-3)]), ("append", self.row(6)),
+            ("extend", [self.row(i) for i in range(10, 16)]), ("extendleft", [self.row(i) for i in range(20, 26)]),
+        ]
+        for name, argument in operations:
+            getattr(buffer, name)(argument)
+            getattr(expected, name)(argument)
+            self.assert_same_rows(expected, buffer)
+
+    def test_rows_are_updated_in_place(self):
+        buffer = CandlesRingBuffer(maxlen=3, n_columns=3)
+        buffer.extend([self.row(1), self.row(2), self.row(3), self.row(4)])
+        version = buffer.version
+
+        buffer[-1] = self.row(5)
+        old_first = buffer[0]
+        buffer[0] = self.row(0)
+
+        self.assertGreater(buffer.version, version)
+        self.assertEqual(self.row(2), old_first.tolist())
+        self.assertEqual([0, 3, 5], buffer.values[:, 0].tolist())
+        self.assertEqual([5, 3, 0], [row[0] for row in reversed(buffer)])
+        with self.assertRaises(IndexError):
+            buffer[3]
+
+    def test_values_is_a_read_only_view(self):
+        buffer = CandlesRingBuffer(maxlen=3, n_columns=3)
+        for i in range(5):
+            buffer.append(self.row(i))
+
+        values = buffer.values
+        self.assertFalse(values.flags.writeable)
+        self.assertFalse(values.flags.owndata)
+        self.assertEqual([2, 3, 4], values[:, 0].tolist())
+        np.testing.assert_array_equal(values, np.array(buffer))
+
+        buffer.clear()
+        self.assertEqual(0, len(buffer))
+        self.assertEqual((0, 3), buffer.values.shape)
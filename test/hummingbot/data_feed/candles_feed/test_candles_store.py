@@ -0,0 +1,124 @@
+import os
+import tempfile
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.data_feed.candles_feed.data_types import HistoricalCandlesConfig
+
+START = 1_700_000_040
+
+
+def make_candles(first: int, last: int, step: int = 60) -> np.ndarray:
+    timestamps = np.arange(first, last + step, step, dtype=float)
+    candles = np.zeros((len(timestamps), len(CandlesBase.columns)))
+    candles[:, 0] = timestamps
+    candles[:, 1:5] = (timestamps / 1e6)[:, None]
+    return candles
+
+
+class CandlesStoreTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = CandlesStore(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+        super().tearDown()
+
+    def config(self, start_time: float, end_time: float) -> HistoricalCandlesConfig:
+        return HistoricalCandlesConfig(connector_name="binance", trading_pair="BTC-USDT", interval="1m",
+                                       start_time=start_time, end_time=end_time)
+
+    @staticmethod
+    def fetch_mock() -> AsyncMock:
+        async def fetch(config: HistoricalCandlesConfig) -> pd.DataFrame:
+            return pd.DataFrame(make_candles(config.start_time, config.end_time), columns=CandlesBase.columns)
+        return AsyncMock(side_effect=fetch)
+
+    def test_missing_ranges(self):
+        self.assertEqual([(START, START + 3000)],
+                         self.store.missing_ranges("binance", "BTC-USDT", "1m", START - 30, START + 3030))
+
+        self.store.write("binance", "BTC-USDT", "1m", make_candles(START + 600, START + 1200), START + 600,
+                         START + 1200)
+        self.store.write("binance", "BTC-USDT", "1m", make_candles(START + 2400, START + 2700), START + 2400,
+                         START + 2700)
+
+        self.assertEqual([(START + 600, START + 1200), (START + 2400, START + 2700)],
+                         self.store.covered_ranges("binance", "BTC-USDT", "1m"))
+        self.assertEqual([(START, START + 540), (START + 1260, START + 2340), (START + 2760, START + 3000)],
+                         self.store.missing_ranges("binance", "BTC-USDT", "1m", START, START + 3000))
+        self.assertEqual([], self.store.missing_ranges("binance", "BTC-USDT", "1m", START + 700, START + 1100))
+        self.assertEqual([(START, START + 3000)], self.store.missing_ranges("binance", "ETH-USDT", "1m", START,
+                                                                            START + 3000))
+
+    def test_adjacent_and_overlapping_segments_are_merged(self):
+        self.store.write("binance", "BTC-USDT", "1m", make_candles(START, START + 600), START, START + 600)
+        self.store.write("binance", "BTC-USDT", "1m", make_candles(START + 660, START + 1200), START + 660,
+                         START + 1200)
+        updated = make_candles(START + 1200, START + 1800)
+        updated[0, 4] = 42
+        self.store.write("binance", "BTC-USDT", "1m", updated, START + 1200, START + 1800)
+
+        self.assertEqual([(START, START + 1800)], self.store.covered_ranges("binance", "BTC-USDT", "1m"))
+        self.assertEqual(1, len(os.listdir(os.path.join(self.directory.name, "binance", "BTC-USDT", "1m"))))
+        candles = self.store.read("binance", "BTC-USDT", "1m", START, START + 1800)
+        np.testing.assert_array_equal(make_candles(START, START + 1800)[:, 0], candles[:, 0])
+        self.assertEqual(42, candles[20, 4])
+
+    def test_read_slices_the_time_range(self):
+        self.store.write("binance", "BTC-USDT", "1m", make_candles(START, START + 600), START, START + 600)
+        self.store.write("binance", "BTC-USDT", "1m", make_candles(START + 1200, START + 1800), START + 1200,
+                         START + 1800)
+
+        candles_df = self.store.read_df("binance", "BTC-USDT", "1m", START + 300, START + 1500)
+
+        self.assertEqual(CandlesBase.columns, list(candles_df.columns))
+        expected = np.concatenate([make_candles(START + 300, START + 600), make_candles(START + 1200, START + 1500)])
+        np.testing.assert_array_equal(expected, candles_df.to_numpy())
+        self.assertEqual(0, len(self.store.read("binance", "BTC-USDT", "1m", START + 700, START + 1100)))
+
+    def test_candles_missing_from_the_exchange_are_not_fetched_again(self):
+        # The exchange has no candles before START + 600, for example before the listing of the pair
+        self.store.write("binance", "BTC-USDT", "1m", make_candles(START + 600, START + 1200), START, START + 1200)
+
+        self.assertEqual([], self.store.missing_ranges("binance", "BTC-USDT", "1m", START, START + 1200))
+        self.assertEqual(11, len(self.store.read("binance", "BTC-USDT", "1m", START, START + 1200)))
+
+    def test_candles_not_closed_are_not_stored(self):
+        now = 1_800_000_000
+        with patch("hummingbot.data_feed.candles_feed.candles_store.time.time", return_value=now):
+            self.store.write("binance", "BTC-USDT", "1m", make_candles(now - 600, now), now - 600, now + 600)
+
+            self.assertEqual([(now - 600, now - 60)], self.store.covered_ranges("binance", "BTC-USDT", "1m"))
+            self.assertEqual([], self.store.missing_ranges("binance", "BTC-USDT", "1m", now - 600, now))
+
+    async def test_get_candles_only_fetches_the_missing_ranges(self):
+        fetch = self.fetch_mock()
+        candles_df = await self.store.get_candles(self.config(START + 600, START + 1200), fetch=fetch)
+        self.assertEqual(11, len(candles_df))
+        fetch.assert_awaited_once()
+
+        candles_df = await self.store.get_candles(self.config(START, START + 1800), fetch=fetch)
+
+        np.testing.assert_array_equal(make_candles(START, START + 1800), candles_df.to_numpy())
+        fetched_ranges = [(call.args[0].start_time, call.args[0].end_time) for call in fetch.await_args_list[1:]]
+        self.assertEqual([(START, START + 540), (START + 1260, START + 1800)], fetched_ranges)
+
+    async def test_get_candles_from_the_store_does_not_fetch(self):
+        fetch = self.fetch_mock()
+        await self.store.get_candles(self.config(START, START + 1800), fetch=fetch)
+        fetch.reset_mock()
+
+        candles_df = await CandlesStore(self.directory.name).get_candles(self.config(START + 60, START + 1200),
+                                                                         fetch=fetch)
+
+        fetch.assert_not_awaited()
+        np.testing.assert_array_equal(make_candles(START + 60, START + 1200), candles_df.to_numpy())
@@ -3,13 +3,16 @@ from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.data_type.funding_info import FundingInfo
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_indicators import RSI
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
 from hummingbot.strategy.strategy_v2_base import MarketDataProvider
 from hummingbot.strategy_v2.executors.data_types import ConnectorPair
@@ -71,6 +74,15 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         result = self.provider.get_candles_df("binance", "BTC-USDT", "1m", 100)
         self.assertIsInstance(result, pd.DataFrame)
 
+    @patch.object(CandlesBase, "start", MagicMock())
+    def test_get_candles_indicator(self):
+        self.provider.initialize_candles_feed(
+            CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m", max_records=100))
+        rsi = self.provider.get_candles_indicator("binance", "BTC-USDT", "1m", RSI(length=14), 100)
+        self.assertIsInstance(rsi, RSI)
+        self.assertIs(rsi, self.provider.get_candles_indicator("binance", "BTC-USDT", "1m", RSI(length=14), 100))
+        self.assertEqual(0, len(rsi.values))
+
     def test_get_trading_pairs(self):
         self.mock_connector.trading_pairs = ["BTC-USDT"]
         trading_pairs = self.provider.get_trading_pairs("mock_connector")
@@ -91,6 +103,15 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         self.assertIsInstance(snapshot[0], pd.DataFrame)
         self.assertIsInstance(snapshot[1], pd.DataFrame)
 
+    def test_get_order_book_arrays(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[99, 1, 1], [98, 2, 1]], dtype=np.float64),
+                                        np.array([[101, 1, 1], [102, 2, 1]], dtype=np.float64))
+        self.mock_connector.get_order_book.return_value = order_book
+        bids, asks = self.provider.get_order_book_arrays("mock_connector", "BTC-USDT", depth=1)
+        np.testing.assert_array_equal(np.array([[99, 1, 1]]), bids)
+        np.testing.assert_array_equal(np.array([[101, 1, 1]]), asks)
+
     def test_get_price_for_quote_volume(self):
         self.mock_connector.get_order_book.return_value = MagicMock(
             get_price_for_quote_volume=MagicMock(return_value=OrderBookQueryResult(100, 2, 100, 2)))
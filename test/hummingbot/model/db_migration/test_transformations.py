@@ -1,7 +1,11 @@
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from hummingbot.model.db_migration.transformations import AddTradeFeeInQuote, ConvertPriceAndAmountColumnsToBigint
+from hummingbot.model.db_migration.transformations import (
+    AddTradeFeeInQuote,
+    BuildTradePerformanceTotals,
+    ConvertPriceAndAmountColumnsToBigint,
+)
 
 
 class ConvertPriceAndAmountColumnsToBigintTests(TestCase):
@@ -41,3 +45,19 @@ class AddTradeFeeInQuoteTests(TestCase):
 
     def test_to_version(self):
         self.assertEqual(20230516, AddTradeFeeInQuote(self).to_version)
+
+
+class BuildTradePerformanceTotalsTests(TestCase):
+    def test_name(self):
+        self.assertEqual("BuildTradePerformanceTotals", BuildTradePerformanceTotals(self).name)
+
+    def test_to_version(self):
+        self.assertEqual(20261018, BuildTradePerformanceTotals(self).to_version)
+
+    @patch("hummingbot.model.db_migration.transformations.TradePerformance.rebuild")
+    def test_apply_rebuilds_the_totals(self, rebuild_mock):
+        db_handle = MagicMock()
+        session = db_handle.get_new_session.return_value.__enter__.return_value
+
+        self.assertIs(db_handle, BuildTradePerformanceTotals(migrator=self).apply(db_handle))
+        rebuild_mock.assert_called_once_with(session)
@@ -0,0 +1,167 @@
+import os
+import tempfile
+import time
+from unittest import TestCase
+
+import numpy as np
+
+from hummingbot.model.market_data_chunk_store import MarketDataChunkReader, MarketDataChunkWriter, MarketDataSnapshot
+
+
+class MarketDataChunkStoreTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    @staticmethod
+    def snapshot(timestamp: float, levels: int = 3, trading_pair: str = "BTC-USDT") -> MarketDataSnapshot:
+        bids = np.array([[100 - timestamp - i, i + 1, 0] for i in range(levels)], dtype=np.float64)
+        asks = np.array([[101 + timestamp + i, i + 2, 0] for i in range(levels)], dtype=np.float64)
+        return MarketDataSnapshot(timestamp=timestamp, exchange="binance", trading_pair=trading_pair,
+                                  mid_price=100.5, best_bid=bids[0, 0], best_ask=asks[0, 0], bids=bids, asks=asks)
+
+    def market_files(self, trading_pair: str = "BTC-USDT"):
+        return sorted(os.listdir(os.path.join(self.directory.name, "binance", trading_pair)))
+
+    def test_chunks_rotate_by_rows(self):
+        writer = MarketDataChunkWriter(self.directory.name, depth=2, max_chunk_rows=3)
+        writer.start()
+        for timestamp in range(7):
+            writer.put(self.snapshot(timestamp))
+        self.assertTrue(writer.flush(timeout=5))
+        writer.stop()
+
+        self.assertEqual(3, writer.chunks_written)
+        self.assertEqual(["000000000000000-000000000002000.npz",
+                          "000000000003000-000000000005000.npz",
+                          "000000000006000-000000000006000.npz"], self.market_files())
+        data = MarketDataChunkReader(self.directory.name).read("binance", "BTC-USDT")
+        self.assertEqual(list(range(7)), data["timestamp"].tolist())
+        self.assertEqual((7, 2), data["bid_price"].shape)
+        self.assertEqual([100, 99], data["bid_price"][0].tolist())
+        self.assertEqual([107, 108], data["ask_price"][6].tolist())
+        self.assertEqual([2, 3], data["ask_amount"][3].tolist())
+
+    def test_chunks_rotate_by_duration(self):
+        writer = MarketDataChunkWriter(self.directory.name, depth=2, max_chunk_duration=10)
+        writer.start()
+        for timestamp in (0, 5, 10, 15, 25):
+            writer.put(self.snapshot(timestamp))
+        writer.stop()
+
+        self.assertEqual(["000000000000000-000000000005000.npz",
+                          "000000000010000-000000000015000.npz",
+                          "000000000025000-000000000025000.npz"], self.market_files())
+
+    def test_stop_writes_buffered_snapshots_of_every_market(self):
+        writer = MarketDataChunkWriter(self.directory.name, depth=2)
+        writer.start()
+        writer.put(self.snapshot(1))
+        writer.put(self.snapshot(1, trading_pair="ETH-USDT"))
+
+        writer.stop()
+
+        self.assertFalse(writer.is_running)
+        reader = MarketDataChunkReader(self.directory.name)
+        self.assertEqual([("binance", "BTC-USDT"), ("binance", "ETH-USDT")], reader.markets())
+        self.assertEqual([1], reader.read("binance", "ETH-USDT")["timestamp"].tolist())
+
+    def test_shallow_books_are_padded(self):
+        writer = MarketDataChunkWriter(self.directory.name, depth=3)
+        writer.start()
+        writer.put(self.snapshot(1, levels=1))
+        writer.stop()
+
+        data = MarketDataChunkReader(self.directory.name).read("binance", "BTC-USDT")
+        np.testing.assert_array_equal([[99, np.nan, np.nan]], data["bid_price"])
+        np.testing.assert_array_equal([[2, np.nan, np.nan]], data["ask_amount"])
+
+    def test_read_time_range(self):
+        writer = MarketDataChunkWriter(self.directory.name, depth=2, max_chunk_rows=4)
+        writer.start()
+        for timestamp in range(12):
+            writer.put(self.snapshot(timestamp))
+        writer.stop()
+        reader = MarketDataChunkReader(self.directory.name)
+
+        self.assertEqual(1, len(reader.chunk_paths("binance", "BTC-USDT", start=5, end=6)))
+        data = reader.read("binance", "BTC-USDT", start=3, end=8)
+        self.assertEqual([3, 4, 5, 6, 7, 8], data["timestamp"].tolist())
+        self.assertEqual((6, 2), data["bid_amount"].shape)
+        empty = reader.read("binance", "BTC-USDT", start=100)
+        self.assertEqual(0, len(empty["timestamp"]))
+        self.assertEqual(0, len(reader.read("binance", "unknown")["mid_price"]))
+
+    def test_read_chunks_recorded_with_different_depths(self):
+        for depth, timestamp in ((1, 1), (3, 2)):
+            writer = MarketDataChunkWriter(self.directory.name, depth=depth)
+            writer.start()
+            writer.put(self.snapshot(timestamp))
+            writer.stop()
+
+        data = MarketDataChunkReader(self.directory.name).read("binance", "BTC-USDT")
+
+        np.testing.assert_array_equal([[99, np.nan, np.nan], [98, 97, 96]], data["bid_price"])
+
+    def test_flush_interval_writes_segments_merged_on_stop(self):
+        writer = MarketDataChunkWriter(self.directory.name, depth=2, max_flush_interval=0.01)
+        writer.start()
+        writer.put(self.snapshot(1))
+        for _ in range(500):
+            if writer.segments_written == 1:
+                break
+            time.sleep(0.01)
+        writer.put(self.snapshot(2))
+        self.assertTrue(writer.flush(timeout=5))
+
+        self.assertEqual(["000000000001000-000000000001000.part.npz",
+                          "000000000002000-000000000002000.part.npz"], self.market_files())
+        self.assertEqual([1, 2], MarketDataChunkReader(self.directory.name).read("binance", "BTC-USDT")[
+            "timestamp"].tolist())
+
+        writer.put(self.snapshot(3))
+        writer.stop()
+
+        self.assertEqual(1, writer.chunks_written)
+        self.assertEqual(["000000000001000-000000000003000.npz"], self.market_files())
+        data = MarketDataChunkReader(self.directory.name).read("binance", "BTC-USDT")
+        self.assertEqual([1, 2, 3], data["timestamp"].tolist())
+        self.assertEqual([[99, 98], [98, 97], [97, 96]], data["bid_price"].tolist())
+
+    def test_full_chunk_merges_its_segments(self):
+        writer = MarketDataChunkWriter(self.directory.name, depth=2, max_chunk_rows=3)
+        writer.start()
+        writer.put(self.snapshot(0))
+        writer.put(self.snapshot(1))
+        self.assertTrue(writer.flush(timeout=5))
+        writer.put(self.snapshot(2))
+        writer.put(self.snapshot(3))
+        self.assertTrue(writer.flush(timeout=5))
+
+        self.assertEqual(["000000000000000-000000000002000.npz",
+                          "000000000003000-000000000003000.part.npz"], self.market_files())
+        writer.stop()
+        self.assertEqual(["000000000000000-000000000002000.npz",
+                          "000000000003000-000000000003000.npz"], self.market_files())
+
+    def test_read_skips_segments_merged_into_a_chunk(self):
+        writer = MarketDataChunkWriter(self.directory.name, depth=2)
+        writer.start()
+        writer.put(self.snapshot(1))
+        writer.put(self.snapshot(2))
+        self.assertTrue(writer.flush(timeout=5))
+        segment_path = os.path.join(self.directory.name, "binance", "BTC-USDT", self.market_files()[0])
+        with open(segment_path, "rb") as segment:
+            segment_content = segment.read()
+        writer.put(self.snapshot(3))
+        writer.stop()
+        # A segment left behind by a writer stopped between writing the chunk and removing its segments
+        with open(segment_path, "wb") as segment:
+            segment.write(segment_content)
+
+        reader = MarketDataChunkReader(self.directory.name)
+
+        self.assertEqual(1, len(reader.chunk_paths("binance", "BTC-USDT")))
+        self.assertEqual([1, 2, 3], reader.read("binance", "BTC-USDT")["timestamp"].tolist())
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import time
+from unittest import TestCase
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.funding_payment import FundingPayment
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.sql_write_queue import SQLWriteQueue
+
+
+class SQLWriteQueueTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.db_dir = tempfile.TemporaryDirectory()
+        # A file database, since every thread gets its own in-memory SQLite database.
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()),
+            SQLConnectionType.TRADE_FILLS,
+            db_path=os.path.join(self.db_dir.name, "test_write_queue.sqlite"),
+        )
+
+    def tearDown(self) -> None:
+        self.manager.engine.dispose()
+        self.db_dir.cleanup()
+        super().tearDown()
+
+    @staticmethod
+    def payment_write(timestamp: int):
+        payment = FundingPayment(timestamp=timestamp, config_file_path="test_config", market="test_market",
+                                 rate=0.01, symbol="COINALPHA-HBOT", amount=1.0)
+        return lambda session: session.add(payment)
+
+    def stored_timestamps(self):
+        with self.manager.get_new_session() as session:
+            return sorted(payment.timestamp for payment in session.query(FundingPayment).all())
+
+    def test_writes_are_batched(self):
+        write_queue = SQLWriteQueue(self.manager, max_batch_size=4, max_batch_latency=1.0)
+        for timestamp in range(10):
+            write_queue.put(self.payment_write(timestamp))
+        self.assertEqual(10, write_queue.metrics.queue_depth)
+
+        write_queue.start()
+        self.assertTrue(write_queue.flush(timeout=5))
+        write_queue.stop()
+
+        self.assertEqual(list(range(10)), self.stored_timestamps())
+        metrics = write_queue.metrics
+        self.assertEqual(0, metrics.queue_depth)
+        self.assertEqual(10, metrics.max_queue_depth)
+        self.assertEqual(10, metrics.writes_flushed)
+        self.assertEqual(3, metrics.batches_flushed)
+        self.assertGreater(metrics.max_flush_ms, 0)
+        self.assertEqual(metrics.writes_flushed, metrics.to_dict()["writes_flushed"])
+
+    def test_batch_is_committed_after_max_latency(self):
+        write_queue = SQLWriteQueue(self.manager, max_batch_size=100, max_batch_latency=0.05)
+        write_queue.start()
+        start = time.perf_counter()
+
+        write_queue.put(self.payment_write(1))
+        self.assertTrue(write_queue.flush(timeout=5))
+
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual([1], self.stored_timestamps())
+        write_queue.stop()
+
+    def test_flush_does_not_wait_for_max_latency(self):
+        write_queue = SQLWriteQueue(self.manager, max_batch_size=100, max_batch_latency=60)
+        write_queue.start()
+        write_queue.put(self.payment_write(1))
+
+        self.assertTrue(write_queue.flush(timeout=5))
+
+        self.assertEqual([1], self.stored_timestamps())
+        self.assertEqual(1, write_queue.metrics.batches_flushed)
+        write_queue.stop()
+
+    def test_stop_commits_queued_writes(self):
+        write_queue = SQLWriteQueue(self.manager, max_batch_size=100, max_batch_latency=60)
+        write_queue.start()
+        write_queue.put(self.payment_write(1))
+        write_queue.put(self.payment_write(2))
+
+        write_queue.stop()
+
+        self.assertFalse(write_queue.is_running)
+        self.assertEqual([1, 2], self.stored_timestamps())
+
+    def test_failed_write_does_not_drop_the_rest_of_the_batch(self):
+        def failing_write(session):
+            raise ValueError("invalid record")
+
+        write_queue = SQLWriteQueue(self.manager, max_batch_size=3, max_batch_latency=1.0)
+        write_queue.put(self.payment_write(1))
+        write_queue.put(failing_write)
+        write_queue.put(self.payment_write(2))
+
+        with self.assertLogs(SQLWriteQueue.logger(), level="ERROR"):
+            write_queue.start()
+            self.assertTrue(write_queue.flush(timeout=5))
+        write_queue.stop()
+
+        self.assertEqual([1, 2], self.stored_timestamps())
+        self.assertEqual(1, write_queue.metrics.write_errors)
+        self.assertEqual(2, write_queue.metrics.writes_flushed)
@@ -1,5 +1,16 @@
+from datetime import datetime
+from decimal import Decimal
 from unittest import TestCase
+from unittest.mock import patch
 
+import numpy as np
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.model.order import Order
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
 
 
@@ -37,3 +48,98 @@ class TradeFillTests(TestCase):
             "position", ]
 
         self.assertEqual(expected_attributes, TradeFill.attribute_names_for_file_export())
+
+
+class TradeFillStreamingTests(TestCase):
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def setUp(self, engine_mock) -> None:
+        super().setUp()
+        engine_mock.return_value = create_engine("sqlite:///:memory:")
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                session.add(Order(id="OID0", config_file_path="test_config", strategy="test_strategy",
+                                  market="binance", symbol="COINALPHA-HBOT", base_asset="COINALPHA",
+                                  quote_asset="HBOT", creation_timestamp=1_000, order_type="LIMIT", amount=1,
+                                  leverage=1, price=100, last_status="CREATED", last_update_timestamp=1_000))
+                for i in range(5):
+                    session.add(TradeFill(
+                        config_file_path="test_config" if i < 4 else "other_config",
+                        strategy="test_strategy",
+                        market="binance",
+                        symbol="COINALPHA-HBOT",
+                        base_asset="COINALPHA",
+                        quote_asset="HBOT",
+                        timestamp=(5 - i) * 60_000,
+                        order_id=f"OID{i}",
+                        trade_type="BUY" if i % 2 == 0 else "SELL",
+                        order_type="LIMIT",
+                        price=Decimal("100.5") + i,
+                        amount=Decimal("0.25"),
+                        leverage=1,
+                        trade_fee=AddedToCostTradeFee().to_json(),
+                        exchange_trade_id=f"EID{i}",
+                    ))
+
+    def test_iter_trade_chunks(self):
+        with self.manager.get_new_session() as session:
+            chunks = list(TradeFill.iter_trade_chunks(session,
+                                                      TradeFill.filters(config_file_path="test_config"),
+                                                      ["exchange_trade_id", "timestamp", "price"],
+                                                      chunk_size=3))
+
+        self.assertEqual([3, 1], [len(chunk) for chunk in chunks])
+        self.assertEqual(["EID3", "EID2", "EID1", "EID0"], [row.exchange_trade_id for chunk in chunks for row in chunk])
+        self.assertEqual(Decimal("103.5"), chunks[0][0].price)
+        self.assertEqual(("exchange_trade_id", "timestamp", "price"), tuple(chunks[0][0]._fields))
+
+    def test_iter_trade_chunks_newest_first(self):
+        with self.manager.get_new_session() as session:
+            chunks = list(TradeFill.iter_trade_chunks(session, columns=["exchange_trade_id"], chunk_size=3,
+                                                      descending=True))
+            pandas_chunks = list(TradeFill.iter_pandas_chunks(session, chunk_size=3, descending=True))
+
+        self.assertEqual(["EID0", "EID1", "EID2", "EID3", "EID4"],
+                         [row.exchange_trade_id for chunk in chunks for row in chunk])
+        self.assertEqual(["EID0", "EID1", "EID2", "EID3", "EID4"],
+                         [trade_id for chunk in pandas_chunks for trade_id in chunk.index])
+
+    def test_iter_trade_chunks_of_all_columns(self):
+        with self.manager.get_new_session() as session:
+            rows = [row for chunk in TradeFill.iter_trade_chunks(session, TradeFill.filters(start_time=300_000))
+                    for row in chunk]
+
+        self.assertEqual(["EID0"], [row.exchange_trade_id for row in rows])
+        self.assertEqual(len(TradeFill.__table__.c), len(rows[0]))
+        self.assertEqual({"fee_type": "AddedToCost", "percent": "0", "percent_token": None, "flat_fees": []},
+                         rows[0].trade_fee)
+
+    def test_iter_trade_arrays(self):
+        with self.manager.get_new_session() as session:
+            arrays = list(TradeFill.iter_trade_arrays(session,
+                                                      columns=["timestamp", "price", "trade_type",
+                                                               "trade_fee_in_quote"],
+                                                      chunk_size=4))
+
+        self.assertEqual([4, 1], [len(array) for array in arrays])
+        self.assertEqual(np.int64, arrays[0]["timestamp"].dtype)
+        self.assertEqual(np.float64, arrays[0]["price"].dtype)
+        self.assertEqual([60_000, 120_000, 180_000, 240_000], arrays[0]["timestamp"].tolist())
+        self.assertEqual([104.5, 103.5, 102.5, 101.5], arrays[0]["price"].tolist())
+        self.assertEqual(["BUY", "SELL", "BUY", "SELL"], arrays[0]["trade_type"].tolist())
+        self.assertTrue(np.isnan(arrays[1]["trade_fee_in_quote"][0]))
+
+    def test_iter_pandas_chunks_match_to_pandas(self):
+        with self.manager.get_new_session() as session:
+            trades = TradeFill.get_trades(session)
+            expected = TradeFill.to_pandas(trades)
+            chunks = list(TradeFill.iter_pandas_chunks(session, chunk_size=2))
+
+        self.assertEqual([2, 2, 1], [len(chunk) for chunk in chunks])
+        for i, chunk in enumerate(chunks):
+            self.assertTrue(expected.iloc[i * 2:i * 2 + 2].equals(chunk))
+        self.assertEqual("00:04:59", chunks[2].loc["EID0", "Age"])
+        self.assertEqual(datetime.fromtimestamp(300).strftime("%Y-%m-%d %H:%M:%S"), chunks[2].loc["EID0", "Timestamp"])
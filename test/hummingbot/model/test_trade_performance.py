@@ -0,0 +1,167 @@
+import asyncio
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import AsyncMock, patch
+
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.core.data_type.common import PositionAction
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+from hummingbot.model.trade_performance import PerformanceAggregate, TradePerformance
+
+HOUR_MS = TradePerformance.PERIOD_MS
+
+
+class TradePerformanceTests(TestCase):
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def setUp(self, engine_mock) -> None:
+        super().setUp()
+        engine_mock.return_value = create_engine("sqlite:///:memory:")
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        self.fill_count = 0
+
+    def trade_fill(self, timestamp: int, trade_type: str, price: str, amount: str, trade_fee=None,
+                   symbol: str = "COINALPHA-HBOT", config_file_path: str = "test_config.yml",
+                   position: str = PositionAction.NIL.value) -> TradeFill:
+        self.fill_count += 1
+        base, quote = symbol.split("-")
+        return TradeFill(
+            config_file_path=config_file_path,
+            strategy="test_strategy",
+            market="binance",
+            symbol=symbol,
+            base_asset=base,
+            quote_asset=quote,
+            timestamp=timestamp,
+            order_id=f"OID{self.fill_count}",
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=Decimal(price),
+            amount=Decimal(amount),
+            leverage=1,
+            trade_fee=(trade_fee or AddedToCostTradeFee()).to_json(),
+            exchange_trade_id=f"EID{self.fill_count}",
+            position=position,
+        )
+
+    def record(self, trade_fills):
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                for trade_fill in trade_fills:
+                    session.add(trade_fill)
+                    TradePerformance.add_trade_fill(session, trade_fill)
+
+    def stored_trade_fills(self):
+        with self.manager.get_new_session() as session:
+            return session.query(TradeFill).order_by(TradeFill.timestamp).all()
+
+    def aggregates(self, start_timestamp: int, config_file_path=None):
+        with self.manager.get_new_session() as session:
+            return TradePerformance.get_aggregates(session, start_timestamp, config_file_path)
+
+    @staticmethod
+    def metrics(coroutine) -> PerformanceMetrics:
+        with patch("hummingbot.client.performance.RateOracle.get_instance") as rate_oracle_mock:
+            rate_oracle_mock.return_value.stored_or_live_rate = AsyncMock(
+                side_effect=lambda pair: Decimal("3") if pair == "BNB-HBOT" else None)
+            return asyncio.new_event_loop().run_until_complete(coroutine)
+
+    def test_metrics_from_totals_match_metrics_from_trades(self):
+        self.record([
+            self.trade_fill(10 * HOUR_MS + 5, "BUY", "100.1234567", "2",
+                            AddedToCostTradeFee(percent=Decimal("0.001"),
+                                                flat_fees=[TokenAmount("BNB", Decimal("0.01"))])),
+            self.trade_fill(10 * HOUR_MS + 10, "SELL", "101", "1.5",
+                            DeductedFromReturnsTradeFee(percent=Decimal("0.002"))),
+            self.trade_fill(11 * HOUR_MS + 1, "BUY", "99.5", "0.25"),
+            self.trade_fill(12 * HOUR_MS, "SELL", "102", "0.5",
+                            DeductedFromReturnsTradeFee(percent=Decimal("0.002"))),
+        ])
+        balances = {"COINALPHA": Decimal("10"), "HBOT": Decimal("1000")}
+
+        aggregate = self.aggregates(0)[("binance", "COINALPHA-HBOT")]
+        from_totals = self.metrics(PerformanceMetrics.create_from_aggregate("COINALPHA-HBOT", aggregate, balances))
+        from_trades = self.metrics(PerformanceMetrics.create("COINALPHA-HBOT", self.stored_trade_fills(), balances))
+
+        self.assertFalse(aggregate.is_derivative)
+        for name in ("num_buys", "num_sells", "num_trades", "b_vol_base", "s_vol_base", "tot_vol_base",
+                     "b_vol_quote", "s_vol_quote", "tot_vol_quote", "avg_b_price", "avg_s_price", "avg_tot_price",
+                     "start_base_bal", "start_quote_bal", "start_price", "cur_price", "hold_value", "cur_value",
+                     "trade_pnl", "fee_in_quote", "total_pnl", "return_pct"):
+            self.assertEqual(getattr(from_trades, name), getattr(from_totals, name), name)
+        self.assertEqual(dict(from_trades.fees), dict(from_totals.fees))
+        self.assertEqual(Decimal("102"), from_totals.cur_price)
+
+    def test_totals_are_kept_by_hour(self):
+        self.record([
+            self.trade_fill(HOUR_MS + 1, "BUY", "100", "1"),
+            self.trade_fill(HOUR_MS + 2, "SELL", "101", "1"),
+            self.trade_fill(2 * HOUR_MS, "BUY", "102", "1"),
+            self.trade_fill(2 * HOUR_MS + 1, "BUY", "1", "1", symbol="OTHER-HBOT"),
+        ])
+
+        with self.manager.get_new_session() as session:
+            records = session.query(TradePerformance).order_by(TradePerformance.period_timestamp,
+                                                               TradePerformance.symbol).all()
+
+        self.assertEqual([(HOUR_MS, "COINALPHA-HBOT", 1, 1), (2 * HOUR_MS, "COINALPHA-HBOT", 1, 0),
+                          (2 * HOUR_MS, "OTHER-HBOT", 1, 0)],
+                         [(r.period_timestamp, r.symbol, r.num_buys, r.num_sells) for r in records])
+        self.assertEqual(Decimal("-1"), Decimal(records[0].s_vol_base))
+        self.assertEqual(Decimal("100"), records[0].start_price)
+        self.assertEqual(Decimal("101"), records[0].end_price)
+
+    def test_aggregates_read_the_fills_of_the_first_partial_hour(self):
+        self.record([
+            self.trade_fill(HOUR_MS + 1, "BUY", "100", "1"),
+            self.trade_fill(HOUR_MS + 10, "SELL", "101", "2"),
+            self.trade_fill(2 * HOUR_MS + 5, "BUY", "102", "4"),
+            self.trade_fill(2 * HOUR_MS + 6, "BUY", "102", "8", config_file_path="other_config.yml"),
+        ])
+
+        aggregate = self.aggregates(HOUR_MS + 5, "test_config")[("binance", "COINALPHA-HBOT")]
+
+        self.assertEqual(1, aggregate.num_buys)
+        self.assertEqual(1, aggregate.num_sells)
+        self.assertEqual(Decimal("4"), aggregate.b_vol_base)
+        self.assertEqual(Decimal("-2"), aggregate.s_vol_base)
+        self.assertEqual(HOUR_MS + 10, aggregate.start_timestamp)
+        self.assertEqual(Decimal("101"), aggregate.start_price)
+        self.assertEqual(Decimal("102"), aggregate.end_price)
+        self.assertEqual(3, self.aggregates(HOUR_MS)[("binance", "COINALPHA-HBOT")].num_buys)
+        self.assertEqual({}, self.aggregates(3 * HOUR_MS))
+
+    def test_derivative_totals(self):
+        aggregate = PerformanceAggregate()
+        aggregate.add_trade_fill(self.trade_fill(1, "BUY", "100", "1", position=PositionAction.OPEN.value))
+        aggregate.add_trade_fill(self.trade_fill(2, "SELL", "101", "1", position=PositionAction.CLOSE.value))
+
+        self.assertTrue(aggregate.is_derivative)
+        self.assertFalse(PerformanceAggregate().is_derivative)
+
+    def test_rebuild_from_recorded_fills(self):
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                for trade_fill in (self.trade_fill(1, "BUY", "100", "1"), self.trade_fill(HOUR_MS, "BUY", "101", "1")):
+                    session.add(trade_fill)
+                session.add(TradePerformance(config_file_path="stale", market="binance", symbol="COINALPHA-HBOT",
+                                             period_timestamp=0, start_timestamp=0, start_price=Decimal("1"),
+                                             end_timestamp=0, end_price=Decimal("1")))
+
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                TradePerformance.rebuild(session)
+
+        aggregate = self.aggregates(0)[("binance", "COINALPHA-HBOT")]
+        self.assertEqual(2, aggregate.num_buys)
+        self.assertEqual(Decimal("-201"), aggregate.b_vol_quote)
+        with self.manager.get_new_session() as session:
+            self.assertEqual(2, session.query(TradePerformance).count())
@@ -0,0 +1,128 @@
+import threading
+from unittest import TestCase
+
+from hummingbot.remote_iface.mqtt import COALESCING_MARKET_EVENT_TYPES, DROPPABLE_MARKET_EVENT_TYPES
+from hummingbot.remote_iface.mqtt_event_queue import MQTTEventQueue
+
+
+class MQTTEventQueueTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.published = []
+        self.publish_threads = set()
+
+    def publish(self, event_type, event):
+        self.publish_threads.add(threading.current_thread())
+        self.published.append((event_type, event))
+
+    def event_queue(self, **kwargs) -> MQTTEventQueue:
+        return MQTTEventQueue(self.publish,
+                              droppable_event_types=DROPPABLE_MARKET_EVENT_TYPES,
+                              coalescing_event_types=COALESCING_MARKET_EVENT_TYPES,
+                              **kwargs)
+
+    def test_events_are_published_in_batches_from_the_queue_thread(self):
+        event_queue = self.event_queue(max_batch_size=4)
+        # Queued before the thread starts, so they are all waiting for the first batch
+        for i in range(10):
+            event_queue.put("OrderFilled", i)
+        event_queue.start()
+
+        self.assertTrue(event_queue.flush(timeout=5))
+        event_queue.stop()
+
+        self.assertEqual([("OrderFilled", i) for i in range(10)], self.published)
+        self.assertNotIn(threading.current_thread(), self.publish_threads)
+        metrics = event_queue.metrics
+        self.assertEqual(10, metrics.events_published)
+        self.assertEqual(3, metrics.batches_published)
+        self.assertEqual(10, metrics.max_queue_depth)
+        self.assertEqual(0, metrics.queue_depth)
+        self.assertGreater(metrics.max_event_latency_ms, 0)
+
+    def test_droppable_events_are_dropped_first_when_full(self):
+        event_queue = self.event_queue(max_queue_size=3, coalesce_threshold=100)
+        event_queue.put("OrderFilled", 1)
+        event_queue.put("BuyOrderCreated", 2, order_id="OID1")
+        event_queue.put("OrderFilled", 3)
+        event_queue.put("OrderFilled", 4)
+        event_queue.put("OrderFilled", 5)
+
+        event_queue.start()
+        event_queue.stop()
+
+        # The created event went first, then the oldest event since no droppable one was left
+        self.assertEqual([("OrderFilled", 3), ("OrderFilled", 4), ("OrderFilled", 5)], self.published)
+        self.assertEqual(2, event_queue.metrics.events_dropped)
+
+    def test_cancelled_orders_are_coalesced_when_behind(self):
+        event_queue = self.event_queue(max_queue_size=10, coalesce_threshold=2)
+        event_queue.put("BuyOrderCreated", "created 1", order_id="OID1")
+        event_queue.put("OrderCancelled", "cancelled 1", order_id="OID1")
+        event_queue.put("SellOrderCreated", "created 2", order_id="OID2")
+        event_queue.put("OrderFilled", "filled 2", order_id="OID2")
+        event_queue.put("OrderCancelled", "cancelled 2", order_id="OID2")
+
+        event_queue.start()
+        event_queue.stop()
+
+        # Below the threshold the first cancellation is queued as usual
+        self.assertEqual([("BuyOrderCreated", "created 1"), ("OrderCancelled", "cancelled 1"),
+                          ("OrderFilled", "filled 2")], self.published)
+        self.assertEqual(2, event_queue.metrics.events_coalesced)
+
+    def test_publish_errors_are_counted(self):
+        def publish(event_type, event):
+            if event == 1:
+                raise ValueError("broker gone")
+            self.published.append((event_type, event))
+
+        event_queue = MQTTEventQueue(publish)
+        event_queue.put("OrderFilled", 1)
+        event_queue.put("OrderFilled", 2)
+        with self.assertLogs("hummingbot.remote_iface.mqtt_event_queue", level="ERROR"):
+            event_queue.start()
+            event_queue.stop()
+
+        self.assertEqual([("OrderFilled", 2)], self.published)
+        self.assertEqual(1, event_queue.metrics.publish_errors)
+        self.assertEqual(1, event_queue.metrics.events_published)
+        self.assertFalse(event_queue.is_running)
+
+    def test_metrics_to_dict(self):
+        event_queue = self.event_queue()
+        event_queue.start()
+        event_queue.put("OrderFilled", 1)
+        event_queue.stop()
+
+        metrics = event_queue.metrics.to_dict()
+        self.assertEqual(1, metrics["events_published"])
+        self.assertEqual(1.0, metrics["avg_batch_size"])
+        self.assertEqual(0, metrics["queue_depth"])
+
+    def test_stop_drops_the_events_left_after_the_timeout(self):
+        release = threading.Event()
+
+        def publish(event_type, event):
+            release.wait(5)
+            self.published.append((event_type, event))
+
+        event_queue = MQTTEventQueue(publish, max_batch_size=1)
+        event_queue.start()
+        for i in range(3):
+            event_queue.put("OrderFilled", i)
+
+        thread = event_queue._thread
+        with self.assertLogs("hummingbot.remote_iface.mqtt_event_queue", level="WARNING") as logs:
+            event_queue.stop(timeout=0.05)
+        self.assertFalse(event_queue.is_running)
+        release.set()
+        thread.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertIn("2 queued market events were dropped", logs.output[0])
+        self.assertEqual(2, event_queue.metrics.events_dropped)
+        self.assertEqual(0, event_queue.metrics.queue_depth)
+        self.assertTrue(event_queue.flush(timeout=5))
+        self.assertEqual([("OrderFilled", 0)], self.published)
@@ -515,7 +515,7 @@ class LiquidityMiningTest(unittest.TestCase):
         self.assertAlmostEqual(float(strategy.market_status_df().loc[0, 'Volatility'].strip('%')), 10.00, delta=0.1)
 
     @unittest.mock.patch('hummingbot.client.hummingbot_application.HummingbotApplication.main_application')
-    @unittest.mock.patch('hummingbot.client.hummingbot_application.HummingbotCLI')
+    @unittest.mock.patch('hummingbot.client.ui.hummingbot_cli.HummingbotCLI')
     def test_strategy_with_default_cfg_does_not_send_in_app_notifications(self, cli_class_mock,
                                                                           main_application_function_mock):
         messages = []
@@ -541,7 +541,7 @@ class LiquidityMiningTest(unittest.TestCase):
         self.assertEqual(len(messages), 0)
 
     @unittest.mock.patch('hummingbot.client.hummingbot_application.HummingbotApplication.main_application')
-    @unittest.mock.patch('hummingbot.client.hummingbot_application.HummingbotCLI')
+    @unittest.mock.patch('hummingbot.client.ui.hummingbot_cli.HummingbotCLI')
     def test_strategy_sends_in_app_notifications(self, cli_class_mock, main_application_function_mock):
         cli_logs = []
 
@@ -395,7 +395,7 @@ class StrategyBaseUnitTests(unittest.TestCase):
         self.assertEqual(10, len(self.strategy.track_restored_orders(self.market_info)))
 
     @unittest.mock.patch('hummingbot.client.hummingbot_application.HummingbotApplication.main_application')
-    @unittest.mock.patch('hummingbot.client.hummingbot_application.HummingbotCLI')
+    @unittest.mock.patch('hummingbot.client.ui.hummingbot_cli.HummingbotCLI')
     def test_notify_hb_app(self, cli_class_mock, main_application_function_mock):
         cli_logs = []
 
@@ -410,7 +410,7 @@ class StrategyBaseUnitTests(unittest.TestCase):
         self.assertIn("Test message", cli_logs)
 
     @unittest.mock.patch('hummingbot.client.hummingbot_application.HummingbotApplication.main_application')
-    @unittest.mock.patch('hummingbot.client.hummingbot_application.HummingbotCLI')
+    @unittest.mock.patch('hummingbot.client.ui.hummingbot_cli.HummingbotCLI')
     def test_notify_hb_app_with_timestamp(self, cli_class_mock, main_application_function_mock):
         cli_logs = []
 
@@ -109,3 +109,61 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_numpy_view(self):
+        buffer = RingBuffer(4)
+        self.assertEqual(0, len(buffer))
+        self.assertEqual(0, buffer.get_as_numpy_view().size)
+
+        for i in range(6):
+            buffer.add_value(i)
+        view = buffer.get_as_numpy_view()
+        self.assertTrue(np.array_equal(view, np.array([2, 3, 4, 5])))
+        self.assertEqual(4, len(buffer))
+        self.assertFalse(view.flags.writeable)
+
+        array = buffer.get_as_numpy_array()
+        buffer.add_value(6)
+        self.assertTrue(np.array_equal(array, np.array([2, 3, 4, 5])))
+        self.assertTrue(np.array_equal(buffer.get_as_numpy_view(), np.array([3, 4, 5, 6])))
+
+    def test_rolling_stats_match_the_values(self):
+        np.random.seed(0)
+        values = np.random.normal(100, 5, self.BUFFER_LENGTH * 5).astype(np.float32)
+        for i, value in enumerate(values):
+            self.buffer.add_value(value)
+            if self.buffer.is_full:
+                window = values[i - self.BUFFER_LENGTH + 1:i + 1].astype(np.float64)
+                self.assertAlmostEqual(np.mean(window), self.buffer.mean_value, 9)
+                self.assertAlmostEqual(np.var(window), self.buffer.variance, 9)
+                self.assertAlmostEqual(np.std(window), self.buffer.std_dev, 9)
+
+    def test_rolling_stats_with_values_not_finite(self):
+        for value in [1, np.nan] + [1] * (self.BUFFER_LENGTH - 2):
+            self.buffer.add_value(value)
+        self.assertTrue(np.isnan(self.buffer.mean_value))
+        self.assertTrue(np.isnan(self.buffer.variance))
+
+        # Once the nan left the buffer, the stats are back
+        self.buffer.add_value(1)
+        self.buffer.add_value(1)
+        self.assertEqual(1, self.buffer.mean_value)
+        self.assertEqual(0, self.buffer.variance)
+
+    def test_length_larger_than_int16(self):
+        length = 40_000
+        buffer = RingBuffer(length)
+        for i in range(length + 10):
+            buffer.add_value(i % 2)
+        self.assertEqual(length, len(buffer))
+        self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.arange(10, length + 10) % 2))
+        self.assertEqual(0.5, buffer.mean_value)
+        self.assertEqual(0.25, buffer.variance)
+
+    def test_length_change_keeps_the_last_values(self):
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(i)
+        self.buffer.length = 5
+        self.assertTrue(np.array_equal(self.buffer.get_as_numpy_array(), np.arange(self.BUFFER_LENGTH - 5, self.BUFFER_LENGTH)))
+        self.assertEqual(self.BUFFER_LENGTH - 3, self.buffer.mean_value)
+        self.assertEqual(2, self.buffer.variance)
@@ -22,3 +22,15 @@ class InstantVolatilityTest(unittest.TestCase):
             self.indicator.add_sample(sample)
 
         self.assertAlmostEqual(self.indicator.current_value, 14.068197250366211, 4)
+
+    def test_volatility_follows_the_sampling_buffer(self):
+        samples = np.random.normal(100, 10, 100)
+        self.indicator = InstantVolatilityIndicator(20, 1)
+
+        for i, sample in enumerate(samples):
+            if i == 50:
+                self.indicator.sampling_length = 10
+            self.indicator.add_sample(sample)
+            window = self.indicator._sampling_buffer.get_as_numpy_array()
+            expected = np.sqrt(np.sum(np.square(np.diff(window))) / window.size)
+            self.assertAlmostEqual(expected, self.indicator.current_value, 4)
@@ -256,3 +256,35 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def test_trades_leaving_the_sampling_buffer_are_not_fitted(self):
+        def curve_fn(t_, a_, b_):
+            return a_ * np.exp(-b_ * t_)
+
+        last_price = 1
+        trade_price_levels = [2, 3, 4, 5]
+        timestamp = self.start_timestamp
+
+        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1)
+        trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": last_price}]
+
+        for a, b in ((2, 0.1), (3, 0.2)):
+            timestamp += 1
+            for p in trade_price_levels:
+                trading_intensity_indicator.register_trade(OrderBookTradeEvent(
+                    trading_pair="COINALPHAHBOT",
+                    timestamp=timestamp,
+                    price=p,
+                    amount=curve_fn(p - last_price, a, b),
+                    type=TradeType.SELL,
+                ))
+            trading_intensity_indicator.calculate(timestamp)
+            trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": last_price}] + trading_intensity_indicator.last_quotes
+
+            alpha, kappa = trading_intensity_indicator.current_value
+            self.assertAlmostEqual(a, alpha, 10)
+            self.assertAlmostEqual(b, kappa, 10)
+
+        # The quotes before the last one matched to a trade are dropped
+        self.assertEqual([timestamp, timestamp, timestamp - 1],
+                         [quote["timestamp"] for quote in trading_intensity_indicator.last_quotes])
@@ -0,0 +1,59 @@
+import tempfile
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+
+START = 1_700_000_040
+END = START + 60 * 100
+
+
+def make_candles(first: int, last: int) -> np.ndarray:
+    timestamps = np.arange(first, last + 60, 60, dtype=float)
+    candles = np.zeros((len(timestamps), len(CandlesBase.columns)))
+    candles[:, 0] = timestamps
+    candles[:, 4] = timestamps / 1e6
+    return candles
+
+
+class BacktestingDataProviderTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.data_provider = BacktestingDataProvider(connectors={}, candles_store=CandlesStore(self.directory.name))
+        self.data_provider.update_backtesting_time(START, END)
+        self.config = CandlesConfig(connector="binance", trading_pair="ETH-USDT", interval="1m", max_records=10)
+
+    def tearDown(self):
+        self.directory.cleanup()
+        super().tearDown()
+
+    @patch("hummingbot.strategy_v2.backtesting.backtesting_data_provider.CandlesFactory.get_candle")
+    async def test_get_candles_feed_fetches_the_missing_candles_once(self, get_candle_mock: MagicMock):
+        candles_feed = MagicMock()
+        candles_feed.get_historical_candles = AsyncMock(
+            side_effect=lambda config: pd.DataFrame(make_candles(config.start_time, config.end_time),
+                                                    columns=CandlesBase.columns))
+        get_candle_mock.return_value = candles_feed
+
+        candles_df = await self.data_provider.get_candles_feed(self.config)
+
+        np.testing.assert_array_equal(make_candles(START - 600, END), candles_df.to_numpy())
+        candles_feed.get_historical_candles.assert_awaited_once()
+
+        # Another backtest on the same candles reads them from the store, without creating the candles feed
+        get_candle_mock.reset_mock()
+        data_provider = BacktestingDataProvider(connectors={}, candles_store=CandlesStore(self.directory.name))
+        data_provider.update_backtesting_time(START + 600, END)
+        await data_provider.initialize_candles_feed(self.config)
+
+        get_candle_mock.assert_not_called()
+        candles_df = data_provider.get_candles_df("binance", "ETH-USDT", "1m")
+        np.testing.assert_array_equal(make_candles(START + 600, END), candles_df.to_numpy())
@@ -0,0 +1,100 @@
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig, DCAMode
+from hummingbot.strategy_v2.executors.position_executor.data_types import (
+    PositionExecutorConfig,
+    TrailingStop,
+    TripleBarrierConfig,
+)
+from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, StopExecutorAction
+
+
+class SignalController:
+    """
+    Minimal controller that opens an executor on each non zero signal while none is active, and stops the active
+    ones when the signal is 2.
+    """
+
+    def __init__(self, candles: pd.DataFrame, features: pd.DataFrame):
+        self.config = SimpleNamespace(connector_name="binance", trading_pair="ETH-USDT", candles_config=[])
+        self.market_data_provider = SimpleNamespace(prices={}, _time=None,
+                                                    get_candles_df=lambda **kwargs: candles.copy())
+        self.processed_data = {"features": features}
+        self.executors_info = []
+        self.created = 0
+
+    def determine_executor_actions(self):
+        signal = self.processed_data["signal"]
+        active_executors = [executor for executor in self.executors_info if executor.is_active]
+        if signal == 2:
+            return [StopExecutorAction(executor_id=executor.id) for executor in active_executors]
+        if signal == 0 or len(active_executors) > 0:
+            return []
+        self.created += 1
+        timestamp = self.market_data_provider._time
+        price = self.market_data_provider.prices["binance_ETH-USDT"]
+        side = TradeType.BUY if signal > 0 else TradeType.SELL
+        if self.created % 3 == 0:
+            config = DCAExecutorConfig(
+                id=f"executor-{self.created}", timestamp=timestamp, connector_name="binance",
+                trading_pair="ETH-USDT", side=side, mode=DCAMode.MAKER,
+                amounts_quote=[Decimal(10), Decimal(20)],
+                prices=[price * Decimal("0.999"), price * Decimal("0.99")] if side == TradeType.BUY
+                else [price * Decimal("1.001"), price * Decimal("1.01")],
+                take_profit=Decimal("0.01"), stop_loss=Decimal("0.03"), time_limit=3600)
+        else:
+            config = PositionExecutorConfig(
+                id=f"executor-{self.created}", timestamp=timestamp, connector_name="binance",
+                trading_pair="ETH-USDT", side=side, amount=Decimal(1), entry_price=price,
+                triple_barrier_config=TripleBarrierConfig(
+                    stop_loss=Decimal("0.02"), take_profit=Decimal("0.015"), time_limit=1800,
+                    trailing_stop=TrailingStop(activation_price=Decimal("0.008"), trailing_delta=Decimal("0.002")),
+                    open_order_type=OrderType.MARKET if self.created % 2 == 0 else OrderType.LIMIT))
+        return [CreateExecutorAction(executor_config=config)]
+
+
+class BacktestingEngineBaseTests(IsolatedAsyncioWrapperTestCase):
+
+    @staticmethod
+    def market_data(rows: int = 1500):
+        random = np.random.default_rng(42)
+        timestamps = 1_700_000_000.0 + 60 * np.arange(rows)
+        close = 1000 * np.exp(np.cumsum(random.normal(0, 0.002, rows)))
+        candles = pd.DataFrame({
+            "timestamp": timestamps,
+            "open": np.r_[close[0], close[:-1]],
+            "high": close * (1 + random.uniform(0, 0.003, rows)),
+            "low": close * (1 - random.uniform(0, 0.003, rows)),
+            "close": close,
+            "volume": random.uniform(1, 10, rows),
+        })
+        features = pd.DataFrame({
+            "timestamp": timestamps,
+            "signal": random.choice([-1, 0, 0, 0, 1, 2], rows, p=[0.1, 0.3, 0.3, 0.19, 0.1, 0.01]),
+        })
+        return candles, features
+
+    async def run_engine(self, vectorized: bool):
+        candles, features = self.market_data()
+        engine = BacktestingEngineBase(vectorized=vectorized)
+        engine.controller = SignalController(candles, features)
+        engine.backtesting_resolution = "1m"
+        executors_info = await engine.simulate_execution(trade_cost=0.0006)
+        return executors_info, engine.summarize_results(executors_info, 1000)
+
+    async def test_vectorized_simulation_matches_row_simulation(self):
+        executors_info, results = await self.run_engine(vectorized=False)
+        vectorized_executors_info, vectorized_results = await self.run_engine(vectorized=True)
+
+        self.assertGreater(len(executors_info), 10)
+        self.assertEqual([executor_info.to_dict() for executor_info in executors_info],
+                         [executor_info.to_dict() for executor_info in vectorized_executors_info])
+        self.assertEqual(results, vectorized_results)
+        self.assertGreater(results["close_types"].get("EARLY_STOP", 0), 0)
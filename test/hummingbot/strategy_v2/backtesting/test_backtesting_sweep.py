@@ -0,0 +1,163 @@
+import unittest
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.backtesting_sweep import BacktestingSweep, attach_frame, share_frame
+from hummingbot.strategy_v2.controllers.controller_base import ControllerBase, ControllerConfigBase
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
+from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction
+
+START = 1_700_000_000
+END = START + 60 * 2000
+
+
+class SweepTestControllerConfig(ControllerConfigBase):
+    controller_name: str = "sweep_test"
+    connector_name: str = "binance"
+    trading_pair: str = "ETH-USDT"
+    total_amount_quote: Decimal = Decimal("1000")
+    stop_loss: Decimal = Decimal("0.02")
+    take_profit: Decimal = Decimal("0.02")
+    fail: bool = False
+
+
+class SweepTestController(ControllerBase):
+    """
+    Trades the crosses of the close price over its moving average on 5m candles.
+    """
+
+    def get_candles_config(self) -> List[CandlesConfig]:
+        return [CandlesConfig(connector=self.config.connector_name, trading_pair=self.config.trading_pair,
+                              interval="5m", max_records=20)]
+
+    async def update_processed_data(self):
+        if self.config.fail:
+            raise ValueError("Failing run")
+        candles = self.market_data_provider.get_candles_df(self.config.connector_name, self.config.trading_pair, "5m")
+        features = candles[["timestamp"]].copy()
+        features["signal"] = np.sign(candles["close"] - candles["close"].rolling(12).mean()).fillna(0)
+        self.processed_data = {"features": features, "signal": 0}
+
+    def determine_executor_actions(self):
+        signal = self.processed_data["signal"]
+        if signal == 0 or any(executor.is_active for executor in self.executors_info):
+            return []
+        return [CreateExecutorAction(executor_config=PositionExecutorConfig(
+            id=f"{self.config.id}-{self.market_data_provider.time()}",
+            timestamp=self.market_data_provider.time(),
+            connector_name=self.config.connector_name,
+            trading_pair=self.config.trading_pair,
+            side=TradeType.BUY if signal > 0 else TradeType.SELL,
+            entry_price=self.market_data_provider.prices[f"{self.config.connector_name}_{self.config.trading_pair}"],
+            amount=Decimal("1"),
+            triple_barrier_config=TripleBarrierConfig(stop_loss=self.config.stop_loss,
+                                                      take_profit=self.config.take_profit,
+                                                      time_limit=3600,
+                                                      open_order_type=OrderType.MARKET)))]
+
+
+def candles_df(interval: int, seed: int) -> pd.DataFrame:
+    random = np.random.default_rng(seed)
+    timestamps = np.arange(START - 60 * 300, END + 1, interval, dtype=float)
+    close = 1000 * np.exp(np.cumsum(random.normal(0, 0.002 * np.sqrt(interval / 60), len(timestamps))))
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "open": np.r_[close[0], close[:-1]],
+        "high": close * 1.002,
+        "low": close * 0.998,
+        "close": close,
+        "volume": random.uniform(1, 10, len(timestamps)),
+        "n_trades": random.integers(1, 100, len(timestamps)),
+    })
+
+
+class SharedFrameTests(unittest.TestCase):
+
+    def test_frame_round_trip(self):
+        df = candles_df(60, 1)
+        df["label"] = "candle"
+        shm, shared_frame = share_frame(df)
+        try:
+            attached_shm, attached_df = attach_frame(shared_frame)
+            pd.testing.assert_frame_equal(df, attached_df)
+            with self.assertRaises(ValueError):
+                attached_df["close"].to_numpy()[0] = 0
+            del attached_df
+            attached_shm.close()
+        finally:
+            shm.close()
+            shm.unlink()
+
+
+class BacktestingSweepTests(IsolatedAsyncioWrapperTestCase):
+
+    @staticmethod
+    def data_provider() -> BacktestingDataProvider:
+        data_provider = BacktestingDataProvider(connectors={})
+        data_provider.candles_feeds = {
+            "binance_ETH-USDT_1m": candles_df(60, 1),
+            "binance_ETH-USDT_5m": candles_df(300, 2),
+        }
+        data_provider.trading_rules = {"binance": {"ETH-USDT": None}}
+        return data_provider
+
+    def test_expand_grid(self):
+        base_config = SweepTestControllerConfig(id="sweep")
+
+        runs = BacktestingSweep.expand_grid(base_config, {"stop_loss": [0.01, 0.02], "take_profit": [0.03]})
+
+        self.assertEqual([{"stop_loss": 0.01, "take_profit": 0.03}, {"stop_loss": 0.02, "take_profit": 0.03}],
+                         [params for params, _ in runs])
+        self.assertEqual(["sweep_0", "sweep_1"], [config.id for _, config in runs])
+        self.assertEqual(Decimal("0.01"), runs[0][1].stop_loss)
+        with self.assertRaises(ValueError):
+            BacktestingSweep.expand_grid(base_config, {"unknown": [1]})
+
+    async def test_sweep_matches_sequential_backtests(self):
+        base_config = SweepTestControllerConfig(id="sweep")
+        param_grid = {
+            "stop_loss": [Decimal("0.005"), Decimal("0.02")],
+            "take_profit": [Decimal("0.005"), Decimal("0.02")],
+        }
+        sweep = BacktestingSweep(max_workers=2, backtesting_data_provider=self.data_provider())
+
+        results_df = await sweep.run(base_config, param_grid, START, END)
+
+        self.assertEqual(4, len(results_df))
+        for (params, config), (_, row) in zip(BacktestingSweep.expand_grid(base_config, param_grid),
+                                              results_df.iterrows()):
+            engine = BacktestingEngineBase()
+            engine.backtesting_data_provider = self.data_provider()
+            expected = (await engine.run_backtesting(config, START, END))["results"]
+            self.assertEqual(params["stop_loss"], row["stop_loss"])
+            self.assertEqual(config.id, row["config_id"])
+            self.assertGreater(expected["total_executors"], 0)
+            self.assertEqual(expected, {key: row[key] for key in expected})
+
+    async def test_failed_run_keeps_the_other_results(self):
+        base_config = SweepTestControllerConfig(id="sweep")
+        sweep = BacktestingSweep(max_workers=2, backtesting_data_provider=self.data_provider())
+
+        results_df = await sweep.run(base_config, {"fail": [False, True]}, START, END)
+
+        self.assertEqual(["sweep_0", "sweep_1"], results_df["config_id"].tolist())
+        self.assertTrue(pd.isna(results_df["error"][0]))
+        self.assertGreater(results_df["total_executors"][0], 0)
+        self.assertIn("Failing run", results_df["error"][1])
+        self.assertTrue(pd.isna(results_df["total_executors"][1]))
+
+    async def test_empty_grid_returns_empty_results(self):
+        sweep = BacktestingSweep(backtesting_data_provider=self.data_provider())
+
+        results_df = await sweep.run(SweepTestControllerConfig(id="sweep"), {"stop_loss": []}, START, END)
+
+        self.assertTrue(results_df.empty)
+        self.assertEqual(["stop_loss", "config_id"], list(results_df.columns))
@@ -489,6 +489,53 @@ class TestControllerBase(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(len(filtered), 1)
         self.assertEqual(filtered[0].id, "exec1")
 
+    def test_filter_executors_with_index_matches_list_filter(self):
+        """Test the indexed filter returns the same executors, in the same order, as filtering the list"""
+        executors = [
+            self.create_mock_executor_info(f"exec{i}", connector_name=["binance", "coinbase"][i % 2],
+                                           trading_pair=["BTC-USDT", "ETH-USDT", "SOL-USDT"][i % 3],
+                                           side=[TradeType.BUY, TradeType.SELL][i // 2 % 2], is_active=i % 5 != 0,
+                                           net_pnl_pct=Decimal(i) / 100)
+            for i in range(30)
+        ]
+        self.controller.executors_info = executors
+        executor_filters = [
+            ExecutorFilter(is_active=True),
+            ExecutorFilter(is_active=False, connector_names=["binance"]),
+            ExecutorFilter(sides=[TradeType.SELL], trading_pairs=["ETH-USDT", "SOL-USDT"]),
+            ExecutorFilter(executor_ids=["exec3", "exec4", "missing"], sides=[TradeType.BUY]),
+            ExecutorFilter(connector_names=["coinbase"], min_pnl_pct=Decimal("0.1"), max_pnl_pct=Decimal("0.2")),
+            ExecutorFilter(connector_names=[], trading_pairs=["BTC-USDT"]),
+            ExecutorFilter(connector_names=["kucoin"]),
+            ExecutorFilter(),
+        ]
+        for executor_filter in executor_filters:
+            self.assertEqual(self.controller._apply_executor_filter(executors, executor_filter),
+                             self.controller.filter_executors(executor_filter=executor_filter))
+        self.assertEqual("exec7", self.controller._find_executor_by_id("exec7").id)
+        self.assertIsNone(self.controller._find_executor_by_id("missing"))
+
+    def test_filter_executors_results_cached_until_executors_info_update(self):
+        """Test filter results are cached per executors_info update and are safe to modify"""
+        self.controller.executors_info = [
+            self.create_mock_executor_info("exec1", connector_name="binance"),
+            self.create_mock_executor_info("exec2", connector_name="coinbase"),
+        ]
+        index = self.controller.executor_index
+        active_executors = self.controller.get_active_executors(connector_names=["binance"])
+        active_executors.clear()
+        self.assertEqual(["exec1"], [e.id for e in self.controller.get_active_executors(connector_names=["binance"])])
+        self.assertIs(index, self.controller.executor_index)
+
+        # Appending to executors_info in place builds the index again
+        self.controller.executors_info.append(self.create_mock_executor_info("exec3", connector_name="binance"))
+        self.assertEqual(["exec1", "exec3"],
+                         [e.id for e in self.controller.get_active_executors(connector_names=["binance"])])
+
+        self.controller.executors_info = [self.create_mock_executor_info("exec4", connector_name="binance")]
+        self.assertIsNot(index, self.controller.executor_index)
+        self.assertEqual(["exec4"], [e.id for e in self.controller.get_active_executors(connector_names=["binance"])])
+
     # Tests for Trading API functionality
 
     def test_buy_market_order(self):
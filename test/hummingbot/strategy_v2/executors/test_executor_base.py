@@ -1,7 +1,7 @@
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from test.logger_mixin_for_test import LoggerMixinForTest
-from unittest.mock import MagicMock, PropertyMock
+from unittest.mock import MagicMock, PropertyMock, patch
 
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.exchange_py_base import ExchangePyBase
@@ -19,6 +19,7 @@ from hummingbot.strategy.strategy_v2_base import StrategyV2Base
 from hummingbot.strategy_v2.executors.data_types import ExecutorConfigBase
 from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
 from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
 
 
 class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
@@ -169,3 +170,30 @@ class TestExecutorBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
     def test_get_in_flight_order(self):
         in_flight_orders = self.component.get_in_flight_order("connector1", "OID-BUY-1")
         self.assertEqual(in_flight_orders, None)
+
+    @patch.object(ExecutorBase, "_build_executor_info", side_effect=lambda: MagicMock())
+    def test_executor_info_is_rebuilt_only_when_the_executor_changes(self, build_executor_info_mock: MagicMock):
+        executor_info = self.component.executor_info
+        self.assertIs(executor_info, self.component.executor_info)
+        build_executor_info_mock.assert_called_once()
+
+        self.component._fill_order_forwarder(MagicMock())
+        self.assertIsNot(executor_info, self.component.executor_info)
+        executor_info = self.component.executor_info
+
+        self.component.close_type = CloseType.EARLY_STOP
+        self.assertIsNot(executor_info, self.component.executor_info)
+        executor_info = self.component.executor_info
+
+        self.component._status = RunnableStatus.SHUTTING_DOWN
+        self.assertIsNot(executor_info, self.component.executor_info)
+        executor_info = self.component.executor_info
+
+        self.component.mark_dirty()
+        self.assertIsNot(executor_info, self.component.executor_info)
+        self.assertEqual(5, build_executor_info_mock.call_count)
+
+    def test_order_events_wake_the_executor_up(self):
+        self.component.scheduler = MagicMock()
+        self.component._fill_order_forwarder(MagicMock())
+        self.component.scheduler.wake.assert_called_once_with(self.component)
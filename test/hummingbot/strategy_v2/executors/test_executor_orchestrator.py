@@ -105,6 +105,8 @@ class TestExecutorOrchestrator(unittest.TestCase):
         ]
         self.orchestrator.execute_actions(actions)
         self.assertEqual(len(self.orchestrator.active_executors["test"]), 5)
+        for executor in self.orchestrator.active_executors["test"]:
+            self.assertIs(self.orchestrator.scheduler, executor.scheduler)
 
     def test_execute_actions_store_executor_active(self):
         position_executor = MagicMock(spec=PositionExecutor)
@@ -181,6 +183,61 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.assertEqual(report.realized_pnl_quote, Decimal(10))
         self.assertEqual(report.unrealized_pnl_quote, Decimal(10))
 
+    @patch.object(MarketsRecorder, "get_instance")
+    def test_generate_performance_report_keeps_done_executors_performance(self, markets_recorder_mock):
+        markets_recorder_mock.return_value = MagicMock(spec=MarketsRecorder)
+        config = PositionExecutorConfig(
+            timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
+        )
+
+        def executor_mock(executor_id: str, status: RunnableStatus, close_type: CloseType = None,
+                          net_pnl_quote: Decimal = Decimal(10)) -> MagicMock:
+            executor = MagicMock(spec=PositionExecutor)
+            executor.is_active = status != RunnableStatus.TERMINATED
+            executor.config = MagicMock(PositionExecutorConfig)
+            executor.config.id = executor_id
+            executor.executor_info = ExecutorInfo(
+                id=executor_id, timestamp=1234, type="position_executor", status=status, config=config,
+                close_type=close_type, filled_amount_quote=Decimal(100), net_pnl_quote=net_pnl_quote,
+                net_pnl_pct=Decimal(10), cum_fees_quote=Decimal(1), is_trading=False,
+                is_active=executor.is_active, custom_info={})
+            return executor
+
+        running = executor_mock("running", RunnableStatus.RUNNING)
+        take_profit = executor_mock("take_profit", RunnableStatus.TERMINATED, CloseType.TAKE_PROFIT)
+        stop_loss = executor_mock("stop_loss", RunnableStatus.TERMINATED, CloseType.STOP_LOSS, Decimal(-5))
+        self.orchestrator.active_executors["test"] = [running, take_profit, stop_loss]
+        self.orchestrator.cached_performance["test"] = PerformanceReport()
+
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+        self.assertEqual(Decimal(5), report.realized_pnl_quote)
+        self.assertEqual(Decimal(10), report.unrealized_pnl_quote)
+        self.assertEqual(Decimal(300), report.volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 1, CloseType.STOP_LOSS: 1}, report.close_type_counts)
+
+        # The running executor finishes, and its info is built again
+        running.executor_info = executor_mock("running", RunnableStatus.TERMINATED, CloseType.TAKE_PROFIT,
+                                              Decimal(20)).executor_info
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+        self.assertEqual(Decimal(25), report.realized_pnl_quote)
+        self.assertEqual(Decimal(0), report.unrealized_pnl_quote)
+        self.assertEqual({CloseType.TAKE_PROFIT: 2, CloseType.STOP_LOSS: 1}, report.close_type_counts)
+
+        # A stored executor moves from the done executors to the cached performance
+        self.orchestrator.execute_actions([StoreExecutorAction(executor_id="stop_loss", controller_id="test")])
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+        self.assertEqual(Decimal(25), report.realized_pnl_quote)
+        self.assertEqual(Decimal(300), report.volume_traded)
+        self.assertEqual({CloseType.TAKE_PROFIT: 2, CloseType.STOP_LOSS: 1}, report.close_type_counts)
+        self.assertEqual(Decimal(-5), self.orchestrator.cached_performance["test"].realized_pnl_quote)
+
+        # Done executors removed without being stored are not counted anymore
+        self.orchestrator.active_executors["test"] = [running]
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+        self.assertEqual(Decimal(15), report.realized_pnl_quote)
+        self.assertEqual({CloseType.TAKE_PROFIT: 1, CloseType.STOP_LOSS: 1}, report.close_type_counts)
+
     @patch("hummingbot.strategy_v2.executors.executor_orchestrator.MarketsRecorder.get_instance")
     def test_initialize_cached_performance(self, mock_get_instance: MagicMock):
         # Create mock markets recorder
@@ -25,3 +25,13 @@ class TestRunnableBase(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
         self.component.start()
         await asyncio.sleep(0.05)
         self.is_logged("Test", "error")
+
+    async def test_version_is_incremented_on_changes(self):
+        self.assertEqual(0, self.component.version)
+        self.component.mark_dirty()
+        self.assertEqual(1, self.component.version)
+
+        self.component.start()
+        await asyncio.sleep(0.05)
+        self.component.stop()
+        self.assertEqual(2, self.component.version)
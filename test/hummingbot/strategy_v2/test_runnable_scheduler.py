@@ -0,0 +1,182 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from test.logger_mixin_for_test import LoggerMixinForTest
+from typing import List
+
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.runnable_base import RunnableBase
+from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler
+
+
+class CountingRunnable(RunnableBase):
+    def __init__(self, name: str, update_interval: float, calls: List[str], task_duration: float = 0.0):
+        super().__init__(update_interval)
+        self.name = name
+        self.calls = calls
+        self.task_duration = task_duration
+        self.running_tasks = 0
+        self.max_running_tasks = 0
+
+    async def on_start(self):
+        self.calls.append(f"{self.name}:start")
+
+    async def control_task(self):
+        self.running_tasks += 1
+        self.max_running_tasks = max(self.max_running_tasks, self.running_tasks)
+        self.calls.append(self.name)
+        if self.task_duration > 0:
+            await asyncio.sleep(self.task_duration)
+        self.running_tasks -= 1
+
+    def on_stop(self):
+        self.calls.append(f"{self.name}:stop")
+
+
+class RunnableSchedulerTests(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
+
+    def setUp(self):
+        super().setUp()
+        self.scheduler = RunnableScheduler()
+        self.set_loggers(loggers=[self.scheduler.logger()])
+        self.calls: List[str] = []
+
+    def tearDown(self):
+        self.scheduler.stop()
+        super().tearDown()
+
+    def runnable(self, name: str, update_interval: float, task_duration: float = 0.0) -> CountingRunnable:
+        runnable = CountingRunnable(name, update_interval, self.calls, task_duration)
+        runnable.scheduler = self.scheduler
+        return runnable
+
+    async def test_runnables_are_run_at_their_own_interval(self):
+        fast = self.runnable("fast", 0.02)
+        slow = self.runnable("slow", 0.1)
+        fast.start()
+        slow.start()
+        self.assertIn(fast, self.scheduler)
+
+        await asyncio.sleep(0.25)
+        fast.stop()
+        slow.stop()
+        await asyncio.sleep(0.01)
+
+        self.assertEqual({"fast:start", "slow:start", "fast", "slow"}, set(self.calls[:4]))
+        self.assertLess(self.calls.index("fast:start"), self.calls.index("fast"))
+        self.assertGreaterEqual(self.calls.count("fast"), 8)
+        self.assertGreaterEqual(self.calls.count("slow"), 2)
+        self.assertLess(self.calls.count("slow"), self.calls.count("fast") / 2)
+        self.assertEqual(["fast:stop", "slow:stop"], [call for call in self.calls if call.endswith(":stop")])
+        self.assertNotIn(fast, self.scheduler)
+        self.assertEqual(RunnableStatus.TERMINATED, fast.status)
+        self.assertGreater(self.scheduler.metrics.avg_steps_per_pass, 1)
+        self.assertEqual(0, self.scheduler.metrics.overruns)
+
+    async def test_due_runnables_are_run_in_deadline_order(self):
+        runnables = [self.runnable(name, 10) for name in ("first", "second", "third")]
+        for runnable in runnables:
+            runnable.start()
+        await asyncio.sleep(0.01)
+        self.calls.clear()
+
+        for runnable in reversed(runnables):
+            self.scheduler.wake(runnable)
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(["third", "second", "first"], self.calls)
+        self.assertEqual(3, self.scheduler.metrics.wakeups)
+
+    async def test_wake_runs_the_control_task_right_away(self):
+        runnable = self.runnable("runnable", 10)
+        runnable.start()
+        await asyncio.sleep(0.01)
+        self.assertEqual(["runnable:start", "runnable"], self.calls)
+
+        runnable.wake()
+        await asyncio.sleep(0.01)
+        self.assertEqual(["runnable:start", "runnable", "runnable"], self.calls)
+
+        runnable.stop()
+        await asyncio.sleep(0.01)
+        self.assertEqual("runnable:stop", self.calls[-1])
+
+    async def test_overruns_are_counted_and_control_tasks_never_overlap(self):
+        runnable = self.runnable("runnable", 0.01, task_duration=0.03)
+        runnable.start()
+        await asyncio.sleep(0.005)
+        # Woken while its control task is running, it runs again right after
+        runnable.wake()
+        await asyncio.sleep(0.15)
+        runnable.stop()
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(1, runnable.max_running_tasks)
+        self.assertGreaterEqual(self.scheduler.metrics.overruns, 2)
+        self.assertGreaterEqual(self.scheduler.metrics.max_step_ms, 30)
+        self.assertEqual(self.scheduler.metrics.steps, self.calls.count("runnable"))
+
+    async def test_runnable_failing_to_start_is_removed(self):
+        runnable = self.runnable("runnable", 0.01)
+
+        async def on_start():
+            raise Exception("Test")
+
+        runnable.on_start = on_start
+        runnable.start()
+        await asyncio.sleep(0.05)
+
+        self.assertNotIn(runnable, self.scheduler)
+        self.assertEqual(["runnable:stop"], self.calls)
+        self.assertEqual(RunnableStatus.TERMINATED, runnable.status)
+        self.assertTrue(self.is_logged("ERROR", "Unexpected error starting CountingRunnable."))
+
+    async def test_runnable_failing_to_run_its_control_task_is_removed_and_stopped(self):
+        runnable = self.runnable("runnable", 0.01)
+
+        async def run_control_task():
+            raise Exception("Test")
+
+        runnable.run_control_task = run_control_task
+        runnable.start()
+        await asyncio.sleep(0.05)
+
+        self.assertNotIn(runnable, self.scheduler)
+        self.assertEqual(["runnable:start", "runnable:stop"], self.calls)
+        self.assertEqual(RunnableStatus.TERMINATED, runnable.status)
+        self.assertTrue(self.is_logged("ERROR", "Unexpected error running the control task of CountingRunnable."))
+
+    async def test_control_task_that_waited_once_keeps_its_own_task(self):
+        runnable = self.runnable("runnable", 0.01)
+        control_task = runnable.control_task
+
+        async def waiting_once_control_task():
+            await control_task()
+            if self.calls.count("runnable") == 2:
+                await asyncio.sleep(0)
+
+        runnable.control_task = waiting_once_control_task
+        runnable.start()
+        await asyncio.sleep(0.1)
+        runnable.stop()
+        await asyncio.sleep(0.02)
+
+        # The first run goes with on_start in its own task, the second one is inline and waits
+        self.assertGreaterEqual(self.calls.count("runnable"), 5)
+        self.assertEqual(1, self.scheduler.metrics.inline_steps)
+
+    async def test_control_tasks_not_waiting_are_run_inline(self):
+        quick = self.runnable("quick", 0.01)
+        waiting = self.runnable("waiting", 0.01, task_duration=0.001)
+        quick.start()
+        waiting.start()
+        await asyncio.sleep(0.1)
+        quick.stop()
+        waiting.stop()
+        await asyncio.sleep(0.02)
+
+        metrics = self.scheduler.metrics
+        self.assertGreater(metrics.inline_steps, 0)
+        # The waiting control task and the first run of each get their own task
+        self.assertLessEqual(metrics.inline_steps, self.calls.count("quick"))
+        self.assertLess(metrics.inline_steps, metrics.steps - self.calls.count("waiting"))
+        self.assertEqual(1, waiting.max_running_tasks)